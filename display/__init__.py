@@ -8,10 +8,12 @@ import time
 
 from setup import frames, colours, screen
 from utilities.animator import Animator
-from utilities.overhead import Overhead
+from utilities.overhead import Overhead, LOCAL_REFRESH_INTERVAL
 from utilities.audio import play_notification, get_player
+from utilities.wifi import WifiSupervisor, sync_time
+from utilities.snapshot import Snapshot, expire
 
-from scenes.weather import WeatherScene
+from scenes.weather import WeatherScene, cached_weather, restore_weather, weather_at
 from scenes.flightdetails import FlightDetailsScene
 from scenes.journey import JourneyScene
 from scenes.loadingpulse import LoadingPulseScene
@@ -25,6 +27,14 @@ try:
 except ImportError:
     BRIGHTNESS = 50
 
+try:
+    from config import PROFILE_ENABLED
+except ImportError:
+    PROFILE_ENABLED = False
+
+# Squawk codes that trigger the emergency chime (hijack, radio failure, emergency)
+EMERGENCY_SQUAWKS = ("7500", "7600", "7700")
+
 # Map driver type string to Interstate75 constant
 DRIVER_MAP = {
     "32x32": DISPLAY_INTERSTATE75_32X32,
@@ -45,6 +55,35 @@ def flights_match(flights_a, flights_b):
     return get_flight_keys(flights_a) == get_flight_keys(flights_b)
 
 
+def in_shown_order(shown, flights):
+    """
+    The same flights as those shown, newer values, in the shown order.
+
+    Lets a refresh that only moved the flights update them in place
+    without restarting the carousel. Flights are matched as flights_match
+    compares them.
+    """
+    remaining = list(flights)
+    ordered = []
+    for old in shown:
+        key = (old.get("callsign", ""), old.get("origin", ""), old.get("destination", ""))
+        for i, f in enumerate(remaining):
+            if (f.get("callsign", ""), f.get("origin", ""), f.get("destination", "")) == key:
+                ordered.append(remaining.pop(i))
+                break
+        else:
+            ordered.append(old)
+    return ordered + remaining
+
+
+def has_emergency(flights):
+    """Check if any flight is squawking an emergency code"""
+    for f in flights:
+        if str(f.get("squawk", "")) in EMERGENCY_SQUAWKS:
+            return True
+    return False
+
+
 class Display(
     WeatherScene,
     FlightDetailsScene,
@@ -62,7 +101,7 @@ class Display(
     a unified interface for rendering flight data on the LED matrix.
     """
 
-    def __init__(self, i75=None):
+    def __init__(self, i75=None, boot_ticks=None):
         # Setup Interstate 75 display
         # Use DRIVER_TYPE from screen.py (may differ from logical dimensions)
         display_const = DRIVER_MAP.get(screen.DRIVER_TYPE, DISPLAY_INTERSTATE75_64X32)
@@ -93,7 +132,9 @@ class Display(
         # From WeatherScene
         self._weather_data = None
         self._weather_position = self.width
-        self._last_weather_fetch = 0
+        self._ticker_weather = None
+        self._ticker_segments = ()
+        self._ticker_width = 0
         self._last_temperature_str = None
 
         # From ClockScene
@@ -104,6 +145,18 @@ class Display(
 
         # From PlaneDetailsScene
         self.plane_position = self.width
+        self._plane_text_flight = None
+        self._plane_text = ""
+
+        # From LoadingPulseScene
+        self._loading_pulse_lit = False
+
+        # Framebuffer dirty tracking - scenes set this when they draw so
+        # sync only pushes to the HUB75 driver when something changed
+        self._dirty = True
+        self._idle_frames = 0
+        # The weather ticker redrew (pushed, but doesn't count as activity)
+        self._ticker_moved = False
 
         # Button debounce tracking
         self._last_button_a_time = 0
@@ -112,17 +165,102 @@ class Display(
         # Start looking for planes
         self.overhead = Overhead()
 
+        # Last flights/weather on flash, shown (as stale) straight after boot
+        self.snapshot = Snapshot()
+        # Restored before the clock was set - its age is judged after NTP
+        self._undated_snapshot = None
+
+        # Keep WiFi up in the background; fetches are skipped while it's down.
+        # The join is started by run() so the idle screen shows first
+        self.wifi = WifiSupervisor(on_connect=self._on_wifi_up)
+        self._time_synced = False
+
+        # Last flight list rebuild from a live LAN source (see local_feed)
+        self._local_refresh = 0
+
+        # Boot latency tracking (ms since main() started)
+        self._boot_ticks = time.ticks_ms() if boot_ticks is None else boot_ticks
+        self._first_flight_shown = False
+
         # Initialize animator explicitly (MicroPython super() can be unreliable with MI)
         Animator.__init__(self)
 
         # Set frame delay
         self.delay = frames.PERIOD
 
+        # Optional per-keyframe timing (report with 'p' over serial)
+        if PROFILE_ENABLED:
+            self.enable_profiler()
+
     def draw_square(self, x0, y0, x1, y1, colour):
         """Draw a filled rectangle"""
         pen = self.display.create_pen(colour.red, colour.green, colour.blue)
         self.display.set_pen(pen)
         self.display.rectangle(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+        self._dirty = True
+
+    def _boot_log(self, event):
+        """Log a boot milestone relative to the start of main()"""
+        print(f"Boot: {event} at {time.ticks_diff(time.ticks_ms(), self._boot_ticks)}ms")
+
+    def _on_wifi_up(self):
+        """Link came up - sync time once, then fetch without waiting for the next poll"""
+        if not self._time_synced:
+            self._boot_log("WiFi up")
+            get_player().play_bing_bong()
+            self._time_synced = sync_time()
+            self._boot_log("NTP done")
+            if self._time_synced:
+                self._expire_snapshot()
+
+        if not self.overhead.processing and not self.overhead.following:
+            self.i75.set_led(50, 50, 0)  # Yellow - fetching
+            self.overhead.grab_data()
+            self.check_for_loaded_data(0)
+        self.weather_refresh(0)
+        self.weather_fetch()
+
+    def _restore_snapshot(self):
+        """Load the warm-start snapshot. Returns True if it had flights to show."""
+        snapshot = self.snapshot.load()
+        if snapshot is None:
+            return False
+        if not expire(snapshot, time.time()):
+            self._undated_snapshot = snapshot
+
+        if snapshot["forecast"] is not None:
+            restore_weather(snapshot["forecast"], snapshot["weather_time"])
+            self._weather_data = weather_at(snapshot["forecast"], time.time())
+
+        # Shown without a chime; the first fetch is compared against these
+        flights = snapshot["flights"]
+        self.overhead.restore(flights, snapshot["last_fetch"], snapshot["failures"])
+        self._data = self.overhead.flights
+
+        self._boot_log(f"snapshot restored ({len(flights)} flights, stale)")
+        return len(flights) > 0
+
+    def _expire_snapshot(self):
+        """Clock now set - drop what was restored if the snapshot turns out too old"""
+        snapshot = self._undated_snapshot
+        if snapshot is None:
+            return
+        forecast = snapshot["forecast"]
+        if not expire(snapshot, time.time()):
+            return
+        self._undated_snapshot = None
+
+        age = time.time() - snapshot["saved_at"]
+        if forecast is not None and snapshot["forecast"] is None and cached_weather()[0] is forecast:
+            restore_weather(None, 0)
+            self._weather_data = None
+            print(f"Snapshot: forecast from {age}s ago has run out, dropped")
+        if not snapshot["flights"] and self.overhead.stale and self._data:
+            self.overhead.restore([], snapshot["last_fetch"], snapshot["failures"])
+            self._data = []
+            self._data_index = 0
+            self.reset_scene()
+            print(f"Snapshot: flights from {age}s ago dropped")
 
     def _draw_idle_screen(self):
         """Draw initial idle screen with clock and date"""
@@ -174,6 +312,7 @@ class Display(
             return
         self.display.set_pen(self.display.create_pen(0, 0, 0))
         self.display.clear()
+        self._dirty = True
 
     @Animator.KeyFrame.add(frames.PER_SECOND * 5)
     def check_for_loaded_data(self, count):
@@ -188,7 +327,10 @@ class Display(
             # Check if data has changed (callsigns OR origin/destination)
             data_is_different = not flights_match(self._data, new_data)
 
-            if data_is_different:
+            if not data_is_different:
+                # Same flights, newer positions (a local receiver refresh)
+                self._data = in_shown_order(self._data, new_data)
+            else:
                 self._data_index = 0
                 self._data_all_looped = False
                 self._data = new_data
@@ -196,8 +338,14 @@ class Display(
                 # Update LED to show data status
                 if len(new_data) > 0:
                     self.i75.set_led(0, 50, 0)  # Green - has flights
+                    if not self._first_flight_shown:
+                        self._first_flight_shown = True
+                        self._boot_log("first flight frame")
                     # Play notification sound for new flights
-                    play_notification()
+                    if has_emergency(new_data):
+                        play_notification("emergency")
+                    else:
+                        play_notification()
                 else:
                     self.i75.set_led(0, 0, 50)  # Blue - no flights
 
@@ -209,19 +357,50 @@ class Display(
 
     @Animator.KeyFrame.add(1)
     def sync(self, count):
-        """Update display every frame"""
-        self.i75.update()
+        """Push the framebuffer to the panel if any scene drew into it"""
+        if self._dirty:
+            self.i75.update()
+            self._dirty = False
+            self._idle_frames = 0
+            self._ticker_moved = False
+            self.frame_stride = 1
+            return
+
+        # Nothing changed but the weather ticker - after a while drop into
+        # idle mode, which keeps keyframe timing but runs the loop less
+        # often (the ticker then moves a stride at a time)
+        if self._ticker_moved:
+            self.i75.update()
+            self._ticker_moved = False
+        self._idle_frames += self.frame_stride
+        if self._idle_frames >= frames.IDLE_AFTER_FRAMES:
+            self.frame_stride = frames.IDLE_FRAME_STRIDE
 
     @Animator.KeyFrame.add(1)
     def check_buttons(self, count):
-        """Check for button presses with debouncing"""
+        """Check for button presses - poll_input() covers the frames idle mode skips"""
+        if self._read_buttons():
+            self._idle_frames = 0
+            self.frame_stride = 1
+
+    def poll_input(self):
+        """Check the buttons between idle frames - a press leaves idle mode"""
+        if self._read_buttons():
+            self._idle_frames = 0
+            return True
+        return False
+
+    def _read_buttons(self):
+        """Act on button presses with debouncing. Returns True if one was handled."""
         now = time.ticks_ms()
         debounce_ms = 300  # 300ms debounce
+        pressed = False
 
         if self.i75.switch_pressed(SWITCH_A):
             if time.ticks_diff(now, self._last_button_a_time) > debounce_ms:
                 self._last_button_a_time = now
                 play_notification()
+                pressed = True
 
         if self.i75.switch_pressed(SWITCH_B):
             if time.ticks_diff(now, self._last_button_b_time) > debounce_ms:
@@ -234,10 +413,63 @@ class Display(
                     self.i75.set_led(0, 50, 0)  # Green
                 else:
                     self.i75.set_led(50, 0, 0)  # Red
+                pressed = True
+
+        return pressed
+
+    @Animator.KeyFrame.add(frames.PER_SECOND * 60)
+    def save_snapshot(self, count):
+        """Persist flights/weather for warm start (throttled, skipped if unchanged)"""
+        if self.overhead.stale:
+            return
+        forecast, weather_time = cached_weather()
+        self.snapshot.save(
+            self.overhead.flights, forecast, weather_time,
+            self.overhead.last_fetch, self.overhead.failures,
+        )
+
+    @Animator.KeyFrame.add(1)
+    def wifi_watch(self, count):
+        """Drive background reconnects (cheap - the link is checked every few frames)"""
+        self.wifi.poll()
+
+    @Animator.KeyFrame.add(1)
+    def local_feed(self, count):
+        """
+        Keep the LAN receiver sources current, and the shown flights with
+        them every LOCAL_REFRESH_INTERVAL - without waiting for the next
+        fetch or for the carousel to finish its loop
+        """
+        if not self.wifi.connected:
+            return
+        overhead = self.overhead
+        overhead.poll_local()
+        now = time.time()
+        if now - self._local_refresh >= LOCAL_REFRESH_INTERVAL and not overhead.following:
+            self._local_refresh = now
+            if overhead.refresh_local():
+                self.check_for_loaded_data(0)
+
+    @Animator.KeyFrame.add(1)
+    def panel_link(self, count):
+        """Share flights and weather with the other panels of a wall (multicast)"""
+        if self.overhead.multicast is None or not self.wifi.connected:
+            return
+        forecast, weather_time = cached_weather()
+        if self.overhead.share(self._data, forecast, weather_time):
+            # Show the leader's flights from this frame, as the leader does
+            self.check_for_loaded_data(0)
+        if self.overhead.multicast.forecast_time > weather_time:
+            self.weather_refresh(0)
 
     @Animator.KeyFrame.add(frames.PER_SECOND * 30)
     def grab_new_data(self, count):
         """Fetch new flight data periodically"""
+        # No point trying while the link is down - keep showing what we have.
+        # A follower panel gets its flights from the leader instead
+        if not self.wifi.connected or self.overhead.following:
+            return
+
         # Only grab if not already processing and previous data has been shown
         if not self.overhead.processing and (
             self._data_all_looped or len(self._data) <= 1
@@ -245,6 +477,8 @@ class Display(
             # Show loading indicator
             self.i75.set_led(50, 50, 0)  # Yellow - fetching
             self.overhead.grab_data()
+            # The forecast table, if stale, in the same pause
+            self.weather_fetch()
 
     def run(self):
         """Start the main display loop"""
@@ -252,11 +486,15 @@ class Display(
             print("FlightTracker starting...")
             print("Press CTRL-C to stop")
 
-            # Draw initial idle screen immediately (before data fetch)
-            self._draw_idle_screen()
+            # Show the last flights from flash if there were any, otherwise
+            # draw the idle screen immediately (before data fetch)
+            if not self._restore_snapshot():
+                self._draw_idle_screen()
+                self._boot_log("idle screen")
 
-            # Initial data fetch (this may take a few seconds)
-            self.overhead.grab_data()
+            # Join in the background - time sync and the first fetch
+            # happen in _on_wifi_up as soon as the link is up
+            self.wifi.start()
 
             # Start animation loop
             self.play()
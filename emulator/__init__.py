@@ -0,0 +1,78 @@
+# Host-side emulation of the Interstate 75 W for benchmarking and golden tests
+#
+# Provides PicoGraphics on a NumPy framebuffer, stand-ins for the
+# interstate75, machine, network and ntptime modules, and a virtual clock
+# so the real Display/scenes code runs unmodified on CPython.
+#
+# Usage (from the repository root):
+#     import emulator
+#     emulator.install()
+#     from display import Display
+#
+# or run the bundled harness: python -m emulator --help
+
+import os
+import ssl
+import sys
+
+from emulator.clock import VirtualClock, DEFAULT_EPOCH
+
+MODULES_DIR = os.path.join(os.path.dirname(__file__), "modules")
+
+# Shared emulator state, used by the stub modules
+virtual_clock = None
+frame_hooks = []     # callables(picographics) run on every i75.update()
+switches = {}        # switch id -> pressed (bool)
+wifi = {
+    "ssid": "emulated",
+    "connect_delay_ms": 0,  # virtual time before a join succeeds
+    "up": True,             # link state; clear to simulate a drop
+}
+
+
+def install(epoch=DEFAULT_EPOCH):
+    """
+    Make the device modules importable on the host.
+
+    Must be called before importing display, scenes or main.
+
+    Args:
+        epoch: Unix time the virtual clock starts at
+
+    Returns:
+        The VirtualClock driving time.sleep/time.time/ticks_*
+    """
+    global virtual_clock
+    if virtual_clock is None:
+        virtual_clock = VirtualClock(epoch)
+        virtual_clock.install()
+        if MODULES_DIR not in sys.path:
+            sys.path.insert(0, MODULES_DIR)
+        ssl.wrap_socket = wrap_socket
+        # The stdlib 'secrets' module shadows the device credentials file,
+        # which is fine - wifi.py falls back to empty credentials
+    return virtual_clock
+
+
+def wrap_socket(sock, server_side=False, key=None, cert=None, cert_reqs=0, cadata=None,
+                server_hostname=None, do_handshake=True):
+    """
+    MicroPython's ssl.wrap_socket on CPython's ssl (which dropped it).
+
+    As on the board the peer's certificate isn't checked, so the emulator
+    runs the device's TLS path against a self-signed stand-in
+    (python -m emulator.fakeapi --tls) as well as the real APIs.
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER if server_side else ssl.PROTOCOL_TLS_CLIENT)
+    if not server_side:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if cert is not None:
+        context.load_cert_chain(cert, key)
+    return context.wrap_socket(sock, server_side=server_side, server_hostname=server_hostname,
+                               do_handshake_on_connect=do_handshake)
+
+
+def press(switch, pressed=True):
+    """Simulate holding (or releasing) a button"""
+    switches[switch] = pressed
@@ -0,0 +1,236 @@
+# Headless FlightTracker run in accelerated virtual time
+#
+#   python -m emulator --scenario flights --frames 600 --out sim_out --gif sim_out/run.gif
+#   python -m emulator --scenario idle --golden tests/golden/idle --png-every 50
+#   python -m emulator --sbs 127.0.0.1:30003 --api 127.0.0.1:8080 --report
+#   python -m emulator --multicast leader & python -m emulator --multicast follower
+#
+# Frames are what the panel shows (the framebuffer at the last i75.update()).
+# Exits non-zero if a golden comparison fails.
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import emulator
+from emulator import fixtures
+from emulator.images import write_png, read_png, write_gif
+
+_perf_ns = time.perf_counter_ns
+_real_sleep = time.sleep
+
+
+def _real_ticks_us():
+    return _perf_ns() // 1000
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m emulator", description=__doc__)
+    parser.add_argument("--scenario", choices=("idle", "flights"), default="flights")
+    parser.add_argument("--frames", type=int, default=600, help="animator frames to run")
+    parser.add_argument("--epoch", type=int, default=emulator.DEFAULT_EPOCH,
+                        help="virtual start time (unix seconds, UTC)")
+    parser.add_argument("--live", action="store_true",
+                        help="use the real network fetches instead of fixtures")
+    parser.add_argument("--api", metavar="HOST:PORT",
+                        help="fetch live from a stand-in server (python -m emulator.fakeapi); "
+                             "plain HTTP, which skips the device's TLS path, unless --api-tls")
+    parser.add_argument("--api-tls", action="store_true",
+                        help="the --api stand-in serves TLS (python -m emulator.fakeapi --tls), "
+                             "so fetches go through the TLS handshake as on the board")
+    parser.add_argument("--beast", metavar="HOST:PORT",
+                        help="decode a receiver's raw Mode S (Beast) feed as the local receiver")
+    parser.add_argument("--sbs", metavar="HOST:PORT",
+                        help="use a BaseStation feed (python -m emulator.fakesbs) as the local receiver")
+    parser.add_argument("--receiver", metavar="HOST:PORT",
+                        help="poll /data/aircraft.json on a stand-in (python -m emulator.fakeapi)")
+    parser.add_argument("--relay", metavar="HOST:PORT",
+                        help="take flights and weather from a LAN relay (python -m relay)")
+    parser.add_argument("--multicast", choices=("leader", "follower"),
+                        help="join a multi-panel wall over loopback multicast (run one of each)")
+    parser.add_argument("--out", help="directory for PNG frames")
+    parser.add_argument("--png-every", type=int, default=10, help="save every Nth frame")
+    parser.add_argument("--scale", type=int, default=8, help="PNG/GIF upscale factor")
+    parser.add_argument("--gif", help="write an animated GIF of every frame")
+    parser.add_argument("--golden", help="directory of golden PNGs to compare against")
+    parser.add_argument("--update-golden", action="store_true",
+                        help="write the current frames into --golden")
+    parser.add_argument("--report", action="store_true",
+                        help="print per-keyframe and per-frame cost tables")
+    return parser.parse_args(argv)
+
+
+def _use_fixtures(display, scenario):
+    """Serve canned flights/weather instead of hitting the network"""
+    from scenes import weather
+
+    clock = emulator.install()
+    weather.fetch_forecast = lambda lat, lon, units="metric": fixtures.weather_forecast(clock.time())
+
+    overhead = display.overhead
+    flights = fixtures.FLIGHTS if scenario == "flights" else []
+
+    def grab_data():
+        overhead._data = [dict(f) for f in flights]
+        overhead._new_data = True
+        overhead._processing = False
+        overhead._last_fetch = clock.time()
+
+    overhead.grab_data = grab_data
+
+
+def run(args):
+    clock = emulator.install(args.epoch)
+
+    from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32, DISPLAY_INTERSTATE75_64X64
+    from setup import screen
+    import utilities.animator as animator
+    from display import Display
+
+    if args.api:
+        from utilities.https import set_api_override
+        host, _, port = args.api.partition(":")
+        set_api_override(host, int(port or 8080), tls=args.api_tls)
+        args.live = True
+
+    # Measure real CPU time, not virtual time
+    animator.ticks_us = _real_ticks_us
+    animator.ticks_diff = lambda a, b: a - b
+
+    driver = DISPLAY_INTERSTATE75_64X64 if screen.DRIVER_TYPE == "64x64" else DISPLAY_INTERSTATE75_64X32
+    i75 = Interstate75(display=driver)
+    display = Display(i75=i75)
+    if args.report:
+        display.enable_profiler()
+    if args.beast:
+        from utilities.overhead import BeastSource
+        host, _, port = args.beast.partition(":")
+        display.overhead.beast = BeastSource(host, int(port or 30005))
+        args.live = True
+    if args.sbs:
+        from utilities.overhead import SbsSource
+        host, _, port = args.sbs.partition(":")
+        display.overhead.sbs = SbsSource(host, int(port or 30003))
+        args.live = True
+    if args.receiver:
+        from utilities.overhead import ReceiverSource
+        host, _, port = args.receiver.partition(":")
+        display.overhead.receiver = ReceiverSource(host, int(port or 8080))
+        args.live = True
+    if args.relay:
+        from utilities.overhead import RelaySource
+        host, _, port = args.relay.partition(":")
+        display.overhead.relay = RelaySource(host, int(port or 30100))
+        args.live = True
+    if args.multicast:
+        from utilities.multicast import MulticastLink
+        display.overhead.multicast = MulticastLink(args.multicast, interface="127.0.0.1")
+        if args.multicast == "follower":
+            args.live = True  # flights come from the leader, never from fixtures
+    if not args.live:
+        _use_fixtures(display, args.scenario)
+
+    shown = [None]
+
+    def capture(graphics):
+        shown[0] = graphics.fb[:screen.HEIGHT, :screen.WIDTH].copy()
+
+    emulator.frame_hooks.append(capture)
+
+    # Same start-up as Display.run(): idle screen, then a background join
+    # whose link-up callback syncs time and runs the first fetch
+    from utilities import wifi
+    if not wifi.WIFI_SSID:
+        wifi.WIFI_SSID = emulator.wifi["ssid"]
+    # Keep snapshot writes out of the working tree (and out of later runs)
+    display.snapshot.path = os.path.join(tempfile.gettempdir(), "flighttracker_snapshot.bin")
+    display.snapshot.temp_path = display.snapshot.path + ".tmp"
+    display._draw_idle_screen()
+    display.wifi.start()
+
+    # Receivers and other panels run in real time - keep virtual time in step
+    realtime = args.beast or args.sbs or args.receiver or args.relay or args.multicast
+
+    frames = []
+    costs = []
+    saved = {}
+    start_virtual = clock.now_us
+
+    while display.frame < args.frames:
+        frame_no = display.frame
+        t0 = _perf_ns()
+        display.step()
+        costs.append((_perf_ns() - t0) // 1000)
+        display.wait(clock.sleep)
+        if realtime:
+            _real_sleep(max(0, display.delay * (display.frame - frame_no) - (_perf_ns() - t0) / 1e9))
+
+        if args.gif:
+            frames.append(shown[0])
+        if args.png_every and frame_no % args.png_every == 0:
+            saved[frame_no] = shown[0]
+
+    elapsed_virtual = (clock.now_us - start_virtual) / 1e6
+    failures = _outputs(args, frames, saved)
+    _report(args, display, costs, elapsed_virtual)
+    return 1 if failures else 0
+
+
+def _outputs(args, frames, saved):
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for frame_no, frame in saved.items():
+            write_png(os.path.join(args.out, f"frame_{frame_no:05d}.png"), frame, args.scale)
+        print(f"Wrote {len(saved)} PNG frames to {args.out}")
+
+    if args.gif and write_gif(args.gif, frames, args.scale):
+        print(f"Wrote {len(frames)} frame GIF to {args.gif}")
+
+    failures = 0
+    if args.golden:
+        if args.update_golden:
+            os.makedirs(args.golden, exist_ok=True)
+        for frame_no, frame in saved.items():
+            path = os.path.join(args.golden, f"frame_{frame_no:05d}.png")
+            if args.update_golden:
+                write_png(path, frame)
+                continue
+            if not os.path.exists(path):
+                print(f"golden missing: {path}")
+                failures += 1
+                continue
+            expected = read_png(path)
+            if expected.shape != frame.shape or (expected != frame).any():
+                diff = (expected != frame).any(axis=2).sum() if expected.shape == frame.shape else -1
+                print(f"golden mismatch: frame {frame_no} ({diff} pixels differ)")
+                failures += 1
+        if args.update_golden:
+            print(f"Updated {len(saved)} golden frames in {args.golden}")
+        else:
+            print(f"Golden: {len(saved) - failures}/{len(saved)} frames match")
+    return failures
+
+
+def _report(args, display, costs, elapsed_virtual):
+    if not costs:
+        return
+    ordered = sorted(costs)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+    print(
+        f"{len(costs)} loop iterations, {display.frame} frames, "
+        f"{elapsed_virtual:.1f}s virtual, {display.i75.updates} panel updates"
+    )
+    print(
+        f"Step cost (host us): mean {sum(costs) // len(costs)}  "
+        f"p50 {pick(0.5)}  p95 {pick(0.95)}  max {ordered[-1]}"
+    )
+    if args.report and display.profiler is not None:
+        display.profiler.report()
+
+
+if __name__ == "__main__":
+    sys.exit(run(_parse_args(sys.argv[1:])))
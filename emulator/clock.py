@@ -0,0 +1,104 @@
+# Virtual clock for the host emulator
+# Replaces the MicroPython time functions so the display runs in virtual time
+
+import time as _time
+
+# MicroPython ticks wrap at 2**30 on most ports
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
+
+# Default start: Wed 1 Jan 2025 12:00:00 UTC (deterministic golden frames)
+DEFAULT_EPOCH = 1735732800
+
+
+class VirtualClock:
+    """
+    Monotonic virtual time in microseconds.
+
+    sleep() advances the clock instantly instead of blocking, so a run of
+    thousands of frames takes as long as the rendering work alone.
+    Timer callbacks registered with call_every() fire as time advances.
+    """
+
+    def __init__(self, epoch=DEFAULT_EPOCH):
+        self.epoch = epoch
+        self.now_us = 0
+        self._timers = []  # [next_due_us, period_us, callback]
+
+    # -- time advance -------------------------------------------------------
+
+    def advance_us(self, us):
+        """Move time forward, firing any timers that fall due"""
+        target = self.now_us + int(us)
+        while True:
+            due = None
+            for timer in self._timers:
+                if timer[0] <= target and (due is None or timer[0] < due[0]):
+                    due = timer
+            if due is None:
+                break
+            self.now_us = due[0]
+            due[0] += due[1]
+            due[2]()
+        self.now_us = target
+
+    def call_every(self, period_us, callback):
+        """Register a periodic callback, returns a handle for cancel()"""
+        timer = [self.now_us + int(period_us), int(period_us), callback]
+        self._timers.append(timer)
+        return timer
+
+    def cancel(self, handle):
+        if handle in self._timers:
+            self._timers.remove(handle)
+
+    # -- MicroPython time API -----------------------------------------------
+
+    def time(self):
+        return self.epoch + self.now_us // 1000000
+
+    def time_ns(self):
+        return self.epoch * 1000000000 + self.now_us * 1000
+
+    def localtime(self, secs=None):
+        if secs is None:
+            secs = self.time()
+        return _time.gmtime(secs)
+
+    def sleep(self, seconds):
+        self.advance_us(seconds * 1000000)
+
+    def sleep_ms(self, ms):
+        self.advance_us(ms * 1000)
+
+    def sleep_us(self, us):
+        self.advance_us(us)
+
+    def ticks_us(self):
+        return self.now_us & TICKS_MAX
+
+    def ticks_ms(self):
+        return (self.now_us // 1000) & TICKS_MAX
+
+    def ticks_cpu(self):
+        return self.ticks_us()
+
+    @staticmethod
+    def ticks_add(ticks, delta):
+        return (ticks + delta) & TICKS_MAX
+
+    @staticmethod
+    def ticks_diff(end, start):
+        diff = (end - start) & TICKS_MAX
+        if diff >= TICKS_HALFPERIOD:
+            diff -= TICKS_PERIOD
+        return diff
+
+    def install(self, module=_time):
+        """Patch the MicroPython-only and sleep/time functions onto `module`"""
+        for name in (
+            "time", "time_ns", "localtime", "sleep", "sleep_ms", "sleep_us",
+            "ticks_us", "ticks_ms", "ticks_cpu", "ticks_add", "ticks_diff",
+        ):
+            setattr(module, name, getattr(self, name))
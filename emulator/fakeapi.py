@@ -0,0 +1,419 @@
+# Local stand-in for the FR24, airplanes.live and Open-Meteo APIs, and a
+# LAN receiver's /data/aircraft.json
+#
+#   python -m emulator.fakeapi --port 8080 --aircraft 40 --latency-ms 150 \
+#       --bandwidth 20000 --chunk 512 --error-rate 0.05
+#
+# Point the tracker at it with API_OVERRIDE_HOST/API_OVERRIDE_PORT in
+# config.py (or utilities.https.set_api_override on the host). Responses are
+# replayed from --record-dir when a recording exists, otherwise synthesised
+# from a seeded random traffic model so runs are repeatable.
+#
+# Plain HTTP by default, which https_get then uses in place of TLS. With
+# --tls the server speaks TLS on a throwaway self-signed certificate (made
+# with the openssl command), so API_OVERRIDE_TLS keeps https_get on its
+# TLS path; a LAN receiver's aircraft.json is plain HTTP, so serve that
+# from a second, plain instance.
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+FR24_PATH = "/zones/fcgi/feed.js"
+AIRPLANES_PREFIX = "/v2/point"
+RECEIVER_PATH = "/data/aircraft.json"
+OPENMETEO_PATH = "/v1/forecast"
+
+# Recording file names in --record-dir
+RECORDINGS = {
+    "fr24": "feed.js.json",
+    "airplanes": "point.json",
+    "weather": "forecast.json",
+    "receiver": "aircraft.json",
+}
+
+TYPES = ("A320", "A20N", "A321", "B738", "B38M", "E190", "DH8D", "AT76", "B789", "A359")
+AIRPORTS = ("GLA", "EDI", "LHR", "LGW", "DUB", "AMS", "CDG", "FRA", "BHX", "MAN", "")
+AIRLINES = (("BAW", "BA"), ("EZY", "U2"), ("RYR", "FR"), ("LOG", "LM"), ("KLM", "KL"), ("AFR", "AF"))
+
+
+class FaultConfig:
+    """Network conditions applied to every response"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, bandwidth=0, chunk=0,
+                 truncate_rate=0.0, error_rate=0.0, reset_rate=0.0, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth = bandwidth        # bytes/s, 0 = unlimited
+        self.chunk = chunk                # chunked transfer size, 0 = off
+        self.truncate_rate = truncate_rate
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+
+class TrafficModel:
+    """Deterministic aircraft moving around a centre point"""
+
+    def __init__(self, count=30, centre=(55.8642, -4.2518), radius_deg=0.5, seed=1):
+        rnd = random.Random(seed)
+        self.start = time.time()
+        self.aircraft = []
+        for i in range(count):
+            prefix, iata = AIRLINES[i % len(AIRLINES)]
+            number = rnd.randint(10, 9999)
+            self.aircraft.append({
+                "id": f"{0x3a000000 + i:x}",
+                "hex": f"{0x400000 + rnd.randint(0, 0x3ffff):06x}",
+                "lat0": centre[0] + rnd.uniform(-radius_deg, radius_deg),
+                "lon0": centre[1] + rnd.uniform(-radius_deg, radius_deg) * 1.7,
+                "track": rnd.randint(0, 359),
+                "speed": rnd.randint(140, 480),
+                "alt": rnd.randint(20, 400) * 100,
+                "vs": rnd.choice((-1280, -640, 0, 0, 640, 1920)),
+                "type": rnd.choice(TYPES),
+                "reg": "G-" + "".join(rnd.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4)),
+                "callsign": f"{prefix}{number}",
+                "flight": f"{iata}{number}",
+                "origin": rnd.choice(AIRPORTS),
+                "destination": rnd.choice(AIRPORTS),
+                "squawk": f"{rnd.randint(0, 7777):04d}",
+            })
+
+    def positions(self):
+        """Yield (aircraft, lat, lon) at the current time"""
+        elapsed_h = (time.time() - self.start) / 3600
+        for ac in self.aircraft:
+            dist_deg = ac["speed"] * elapsed_h / 60  # knots -> degrees (1/60 per nm)
+            rad = math.radians(ac["track"])
+            lat = ac["lat0"] + dist_deg * math.cos(rad)
+            lon = ac["lon0"] + dist_deg * math.sin(rad) / max(0.2, math.cos(math.radians(lat)))
+            yield ac, lat, lon
+
+    def fr24(self, bounds=None):
+        feed = {"full_count": len(self.aircraft), "version": 4}
+        now = int(time.time())
+        for ac, lat, lon in self.positions():
+            if bounds and not (bounds[1] <= lat <= bounds[0] and bounds[2] <= lon <= bounds[3]):
+                continue
+            feed[ac["id"]] = [
+                ac["hex"].upper(), round(lat, 4), round(lon, 4), ac["track"], ac["alt"],
+                ac["speed"], ac["squawk"], "F-EGPF1", ac["type"], ac["reg"], now,
+                ac["origin"], ac["destination"], ac["flight"], 0, ac["vs"],
+                ac["callsign"], 0, ac["callsign"][:3],
+            ]
+        feed["stats"] = {"total": {"ads-b": len(self.aircraft)}}
+        return feed
+
+    def airplanes(self, centre=None, radius_nm=None):
+        ac_list = []
+        for ac, lat, lon in self.positions():
+            if centre and radius_nm:
+                dlat = (lat - centre[0]) * 60
+                dlon = (lon - centre[1]) * 60 * math.cos(math.radians(centre[0]))
+                if math.hypot(dlat, dlon) > radius_nm:
+                    continue
+            ac_list.append({
+                "hex": ac["hex"], "type": "adsb_icao", "flight": ac["callsign"] + " ",
+                "r": ac["reg"], "t": ac["type"], "alt_baro": ac["alt"],
+                "gs": ac["speed"], "track": ac["track"], "baro_rate": ac["vs"],
+                "squawk": ac["squawk"], "lat": round(lat, 5), "lon": round(lon, 5),
+                "messages": 1000, "seen": 0.1, "rssi": -20.0,
+            })
+        return {"ac": ac_list, "msg": "No error", "now": int(time.time() * 1000),
+                "total": len(ac_list), "ctime": int(time.time() * 1000), "ptime": 1}
+
+    def receiver(self):
+        """A receiver's aircraft.json: rewritten once a second, one aircraft per line"""
+        now = int(time.time())
+        messages = int((now - int(self.start)) * len(self.aircraft) * 6)
+        lines = [
+            json.dumps(ac, separators=(",", ":"))
+            for ac in self.airplanes()["ac"]
+        ]
+        return (
+            f'{{ "now" : {now}.0,\n  "messages" : {messages},\n  "aircraft" : [\n'
+            + ",\n".join(lines)
+            + "\n  ]\n}\n"
+        )
+
+
+def synthetic_weather(query):
+    hours = int(query.get("forecast_hours", ["1"])[0] or 1)
+    days = int(query.get("forecast_days", ["1"])[0] or 1)
+    unixtime = query.get("timeformat", [""])[0] == "unixtime"
+    now = int(time.time()) // 3600 * 3600
+    hourly_time = [now + 3600 * h for h in range(hours)]
+    daily_time = [now // 86400 * 86400 + 86400 * d for d in range(days)]
+    if not unixtime:
+        fmt = lambda t: time.strftime("%Y-%m-%dT%H:%M", time.gmtime(t))
+        hourly_time = [fmt(t) for t in hourly_time]
+        daily_time = [fmt(t)[:10] for t in daily_time]
+
+    temps = [round(9 + 4 * math.sin(h / 24 * 2 * math.pi), 1) for h in range(hours)]
+    return {
+        "latitude": float(query.get("latitude", ["0"])[0]),
+        "longitude": float(query.get("longitude", ["0"])[0]),
+        "current": {
+            "time": hourly_time[0], "interval": 900, "temperature_2m": temps[0],
+            "weather_code": 3, "wind_speed_10m": 17.3, "wind_direction_10m": 240,
+            "relative_humidity_2m": 78,
+        },
+        "hourly": {
+            "time": hourly_time,
+            "temperature_2m": temps,
+            "weather_code": [(3, 2, 61, 80)[h % 4] for h in range(hours)],
+            "wind_speed_10m": [round(12 + (h % 7) * 1.5, 1) for h in range(hours)],
+            "wind_direction_10m": [(230 + h * 5) % 360 for h in range(hours)],
+            "relative_humidity_2m": [70 + h % 20 for h in range(hours)],
+            "precipitation_probability": [(h * 13) % 100 for h in range(hours)],
+        },
+        "daily": {
+            "time": daily_time,
+            "temperature_2m_max": [13.5 + d for d in range(days)],
+            "temperature_2m_min": [5.2 + d for d in range(days)],
+        },
+    }
+
+
+def self_signed_context(common_name="localhost"):
+    """
+    Server-side TLS context on a new self-signed certificate.
+
+    The key and certificate are made with the openssl command in a
+    temporary directory, removed once loaded.
+
+    Raises:
+        OSError: openssl isn't installed or failed
+    """
+    workdir = tempfile.mkdtemp(prefix="fakeapi-tls-")
+    try:
+        key = os.path.join(workdir, "key.pem")
+        cert = os.path.join(workdir, "cert.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=" + common_name, "-keyout", key, "-out", cert],
+            check=True, capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        return context
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        raise OSError(f"can't make a self-signed certificate with openssl: {e}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+class FakeApiServer:
+    """Threaded stand-in server with fault injection and request statistics"""
+
+    def __init__(self, host="127.0.0.1", port=0, traffic=None, faults=None, record_dir=None, tls=False):
+        self.traffic = traffic or TrafficModel()
+        self.faults = faults or FaultConfig()
+        self.record_dir = record_dir
+        self.tls = tls
+        self.stats = {"requests": 0, "bytes": 0, "errors": 0, "truncated": 0, "resets": 0}
+        self._stats_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        if tls:
+            # Handshake in the request thread, so a stalled client holds up only itself
+            self.httpd.socket = self_signed_context().wrap_socket(
+                self.httpd.socket, server_side=True, do_handshake_on_connect=False,
+            )
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.httpd.server_address
+
+    def count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _recording(self, kind):
+        if not self.record_dir:
+            return None
+        path = os.path.join(self.record_dir, RECORDINGS[kind])
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        return None
+
+    def body_for(self, path, query):
+        """Return (status, body bytes) for a request path"""
+        if path == FR24_PATH:
+            body = self._recording("fr24")
+            if body is None:
+                bounds = None
+                if "bounds" in query:
+                    bounds = [float(v) for v in query["bounds"][0].split(",")]
+                body = json.dumps(self.traffic.fr24(bounds)).encode()
+            return 200, body
+        if path.startswith(AIRPLANES_PREFIX):
+            body = self._recording("airplanes")
+            if body is None:
+                parts = path[len(AIRPLANES_PREFIX):].strip("/").split("/")
+                centre = radius = None
+                if len(parts) == 3:
+                    centre = (float(parts[0]), float(parts[1]))
+                    radius = float(parts[2])
+                body = json.dumps(self.traffic.airplanes(centre, radius)).encode()
+            return 200, body
+        if path == RECEIVER_PATH:
+            body = self._recording("receiver")
+            if body is None:
+                body = self.traffic.receiver().encode()
+            return 200, body
+        if path == OPENMETEO_PATH:
+            body = self._recording("weather")
+            if body is None:
+                body = json.dumps(synthetic_weather(query)).encode()
+            return 200, body
+        return 404, b'{"error": "not found"}'
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, fmt, *args):
+                pass
+
+            def setup(self):
+                if server.tls:
+                    self.request.do_handshake()
+                BaseHTTPRequestHandler.setup(self)
+
+            def do_GET(self):
+                server.count("requests")
+                faults = server.faults
+                delay = faults.latency_ms
+                if faults.jitter_ms:
+                    with faults.lock:
+                        delay += faults.random.uniform(0, faults.jitter_ms)
+                if delay:
+                    time.sleep(delay / 1000)
+
+                if faults.roll(faults.reset_rate):
+                    server.count("resets")
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    self.close_connection = True
+                    return
+
+                if faults.roll(faults.error_rate):
+                    server.count("errors")
+                    status, body = 503, b'{"error": "injected"}'
+                else:
+                    url = urlsplit(self.path)
+                    status, body = server.body_for(url.path, parse_qs(url.query))
+
+                if status == 200 and faults.roll(faults.truncate_rate):
+                    server.count("truncated")
+                    with faults.lock:
+                        body = body[:faults.random.randint(0, max(0, len(body) - 1))]
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if faults.chunk:
+                    self.send_header("Transfer-Encoding", "chunked")
+                else:
+                    self.send_header("Content-Length", str(len(body)))
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                try:
+                    self._send_body(body, faults)
+                except OSError:
+                    pass
+
+            def _send_body(self, body, faults):
+                step = faults.chunk or 1460
+                for pos in range(0, len(body), step):
+                    piece = body[pos:pos + step]
+                    if faults.chunk:
+                        piece = b"%x\r\n" % len(piece) + piece + b"\r\n"
+                    self.wfile.write(piece)
+                    server.count("bytes", len(piece))
+                    if faults.bandwidth:
+                        time.sleep(len(piece) / faults.bandwidth)
+                if faults.chunk:
+                    self.wfile.write(b"0\r\n\r\n")
+
+        return Handler
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog="python -m emulator.fakeapi", description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--aircraft", type=int, default=30)
+    parser.add_argument("--centre", default="55.8642,-4.2518", help="lat,lon of synthetic traffic")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--record-dir", help="replay feed.js.json / point.json / forecast.json / aircraft.json")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--bandwidth", type=int, default=0, help="bytes per second")
+    parser.add_argument("--chunk", type=int, default=0, help="chunked transfer size in bytes")
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--tls", action="store_true",
+                        help="serve TLS on a self-signed certificate (needs the openssl command)")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    lat, lon = (float(v) for v in args.centre.split(","))
+    server = FakeApiServer(
+        args.host, args.port,
+        traffic=TrafficModel(args.aircraft, (lat, lon), seed=args.seed),
+        faults=FaultConfig(
+            args.latency_ms, args.jitter_ms, args.bandwidth, args.chunk,
+            args.truncate_rate, args.error_rate, args.reset_rate, args.seed,
+        ),
+        record_dir=args.record_dir,
+        tls=args.tls,
+    )
+    host, port = server.address
+    scheme = "https" if args.tls else "http"
+    print(f"Fake API listening on {scheme}://{host}:{port} (Ctrl-C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print("Served: " + ", ".join(f"{k}={v}" for k, v in server.stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Local stand-in for a receiver's BaseStation (SBS-1) feed on port 30003
+#
+#   python -m emulator.fakesbs --port 30003 --rate 500 --aircraft 40
+#   python -m emulator.fakesbs --record sbs_capture.txt --rate 1000
+#
+# Point the tracker at it with SBS_HOST/SBS_PORT in config.py (or
+# --sbs 127.0.0.1:30003 to the emulator). Every client gets the same
+# stream at --rate messages per second: a recorded capture (one MSG line
+# per line, e.g. from `nc receiver 30003 > sbs_capture.txt`) replayed in a
+# loop, or lines synthesised from the fake API's traffic model.
+
+import argparse
+import socket
+import threading
+import time
+
+from emulator.fakeapi import TrafficModel
+
+# Types sent per synthetic aircraft, in turn: identity, position,
+# velocity, squawk - roughly the mix a real receiver produces
+SYNTHETIC_TYPES = (3, 4, 3, 1, 3, 4, 6)
+
+
+def sbs_line(msg_type, hex_ident, callsign="", altitude="", speed="", track="",
+             lat="", lon="", vertical_rate="", squawk="", ground=0):
+    """Format one BaseStation MSG line (22 fields, CRLF terminated)"""
+    now = time.gmtime()
+    date = time.strftime("%Y/%m/%d", now)
+    clock = time.strftime("%H:%M:%S.000", now)
+    fields = (
+        "MSG", msg_type, 1, 1, hex_ident.upper(), 1, date, clock, date, clock,
+        callsign, altitude, speed, track, lat, lon, vertical_rate, squawk,
+        0, 0, 0, ground,
+    )
+    return (",".join(str(f) for f in fields) + "\r\n").encode()
+
+
+def synthetic_lines(traffic):
+    """Endless SBS lines for the traffic model's aircraft"""
+    step = 0
+    while True:
+        msg_type = SYNTHETIC_TYPES[step % len(SYNTHETIC_TYPES)]
+        step += 1
+        for ac, lat, lon in traffic.positions():
+            if msg_type == 1:
+                yield sbs_line(1, ac["hex"], callsign=ac["callsign"])
+            elif msg_type == 3:
+                yield sbs_line(3, ac["hex"], altitude=ac["alt"],
+                               lat=f"{lat:.5f}", lon=f"{lon:.5f}")
+            elif msg_type == 4:
+                yield sbs_line(4, ac["hex"], speed=ac["speed"], track=ac["track"],
+                               vertical_rate=ac["vs"])
+            else:
+                yield sbs_line(6, ac["hex"], altitude=ac["alt"], squawk=ac["squawk"])
+
+
+def recorded_lines(path):
+    """Endless replay of a capture file's MSG lines"""
+    with open(path, "rb") as f:
+        lines = [line.rstrip(b"\r\n") + b"\r\n" for line in f if line.startswith(b"MSG,")]
+    if not lines:
+        raise ValueError(f"no MSG lines in {path}")
+    while True:
+        yield from lines
+
+
+class FakeSbsServer:
+    """Threaded TCP server pacing SBS lines to every connected client"""
+
+    def __init__(self, host="127.0.0.1", port=0, rate=500, traffic=None, record=None):
+        self.rate = rate
+        self.traffic = traffic or TrafficModel()
+        self.record = record
+        self.stats = {"clients": 0, "messages": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        self._listener = socket.socket()
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((host, port))
+        self._listener.listen(4)
+        self._running = False
+
+    @property
+    def address(self):
+        return self._listener.getsockname()
+
+    def start(self):
+        self._running = True
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._running = False
+        try:
+            self._listener.close()
+        except OSError:
+            pass
+
+    def _accept(self):
+        while self._running:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.stats["clients"] += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        lines = recorded_lines(self.record) if self.record else synthetic_lines(self.traffic)
+        # Send in 10 ms batches so high rates don't need a syscall per line
+        batch = max(1, self.rate // 100)
+        interval = batch / self.rate
+        next_send = time.perf_counter()
+        try:
+            while self._running:
+                data = b"".join(next(lines) for _ in range(batch))
+                conn.sendall(data)
+                with self._lock:
+                    self.stats["messages"] += batch
+                    self.stats["bytes"] += len(data)
+                next_send += interval
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog="python -m emulator.fakesbs", description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=30003)
+    parser.add_argument("--rate", type=int, default=500, help="messages per second")
+    parser.add_argument("--aircraft", type=int, default=30)
+    parser.add_argument("--centre", default="55.8642,-4.2518", help="lat,lon of synthetic traffic")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--record", help="replay MSG lines from a capture file")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    lat, lon = (float(v) for v in args.centre.split(","))
+    server = FakeSbsServer(
+        args.host, args.port, args.rate,
+        traffic=TrafficModel(args.aircraft, (lat, lon), seed=args.seed),
+        record=args.record,
+    )
+    host, port = server.address
+    print(f"Fake SBS feed on {host}:{port} at {args.rate} msg/s (Ctrl-C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print("Served: " + ", ".join(f"{k}={v}" for k, v in server.stats.items()))
+
+
+if __name__ == "__main__":
+    main()
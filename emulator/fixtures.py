@@ -0,0 +1,68 @@
+# Canned data for offline emulator runs
+
+# Overhead.data entries (as produced by Overhead.grab_data)
+FLIGHTS = [
+    {
+        "plane": "A320",
+        "origin": "GLA",
+        "destination": "LHR",
+        "vertical_speed": 1280,
+        "altitude": 12450,
+        "velocity": 312,
+        "heading": 135,
+        "callsign": "BAW1483",
+        "flight_number": "BA1483",
+    },
+    {
+        "plane": "B38M",
+        "origin": "DUB",
+        "destination": "GLA",
+        "vertical_speed": -960,
+        "altitude": 6200,
+        "velocity": 245,
+        "heading": 62,
+        "callsign": "RYR3YK",
+        "flight_number": "FR812",
+    },
+    {
+        "plane": "DH8D",
+        "origin": "GLA",
+        "destination": "",
+        "vertical_speed": 0,
+        "altitude": 18000,
+        "velocity": 280,
+        "heading": 310,
+        "callsign": "LOG6NL",
+        "flight_number": "",
+    },
+]
+
+# Current readings (weather_at() result)
+WEATHER = {
+    "temperature": 11.4,
+    "temp_high": 13.2,
+    "temp_low": 6.8,
+    "weather_code": 3,
+    "wind_speed": 19.5,
+    "wind_direction": 245,
+    "humidity": 81,
+    "rain_probability": 35,
+}
+
+
+def weather_forecast(now, hours=48, days=3):
+    """fetch_forecast() table that reads as WEATHER at every hour"""
+    first_hour = now // 3600 * 3600
+    first_day = now // 86400 * 86400
+    return {
+        "time": first_hour,
+        "temperature": [WEATHER["temperature"]] * hours,
+        "weather_code": [WEATHER["weather_code"]] * hours,
+        "wind_speed": [WEATHER["wind_speed"]] * hours,
+        "wind_direction": [WEATHER["wind_direction"]] * hours,
+        "humidity": [WEATHER["humidity"]] * hours,
+        "rain_probability": [WEATHER["rain_probability"]] * hours,
+        "daily_time": [first_day + 86400 * d for d in range(days)],
+        "temp_high": [WEATHER["temp_high"]] * days,
+        "temp_low": [WEATHER["temp_low"]] * days,
+    }
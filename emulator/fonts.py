@@ -0,0 +1,148 @@
+# Bitmap fonts for the host PicoGraphics emulator
+#
+# The glyphs are read from the Pimoroni bitmap font headers
+# (pimoroni-pico/libraries/bitmap_fonts/font*_data.hpp) so rendering matches
+# the device pixel for pixel. Point PIMORONI_FONTS at that directory, or pass
+# it to load_fonts(). Without the headers the built-in glyphs in glyphs.py
+# are used - same line heights and readable text, but not pixel exact.
+
+import os
+import re
+
+from emulator.glyphs import font_tables
+
+# PicoGraphics font name -> header file and C symbol
+FONT_SOURCES = {
+    "bitmap6": ("font6_data.hpp", "font6"),
+    "bitmap8": ("font8_data.hpp", "font8"),
+    "bitmap14": ("font14_data.hpp", "font14"),
+    "bitmap14_outline": ("font14_outline_data.hpp", "font14_outline"),
+}
+
+FIRST_CHAR = 32
+NUM_CHARS = 96 + 64  # ASCII 32-127 plus the 64 accented glyphs
+
+
+class BitmapFont:
+    """
+    A PicoGraphics bitmap font.
+
+    Glyphs are column-major: each column is `bytes_per_column` bytes with
+    the least significant bit of the first byte at the top row.
+    """
+
+    def __init__(self, name, height, max_width, widths, data, source):
+        self.name = name
+        self.height = height
+        self.max_width = max_width
+        self.widths = widths
+        self.data = data
+        self.source = source
+        self.bytes_per_column = (height + 7) // 8
+        self._glyph_cache = {}
+
+    def _index(self, ch):
+        code = ord(ch)
+        if code < FIRST_CHAR or code - FIRST_CHAR >= len(self.widths):
+            return None
+        return code - FIRST_CHAR
+
+    def width(self, ch):
+        index = self._index(ch)
+        return 0 if index is None else self.widths[index]
+
+    def glyph(self, ch):
+        """Return a list of (x, y) set pixels for a character"""
+        cached = self._glyph_cache.get(ch)
+        if cached is not None:
+            return cached
+
+        pixels = []
+        index = self._index(ch)
+        if index is not None:
+            stride = self.max_width * self.bytes_per_column
+            base = index * stride
+            for cx in range(self.widths[index]):
+                column = 0
+                for b in range(self.bytes_per_column):
+                    offset = base + cx * self.bytes_per_column + b
+                    if offset < len(self.data):
+                        column |= self.data[offset] << (8 * b)
+                for cy in range(self.height):
+                    if column & (1 << cy):
+                        pixels.append((cx, cy))
+
+        self._glyph_cache[ch] = pixels
+        return pixels
+
+
+def _parse_header(text, symbol):
+    """Extract height, max_width, widths and data from a font header"""
+    start = text.find(symbol)
+    if start == -1:
+        return None
+    body = text[start:]
+
+    def field(name):
+        match = re.search(r"\." + name + r"\s*=\s*(\d+)", body)
+        return int(match.group(1)) if match else None
+
+    def array(name):
+        match = re.search(r"\." + name + r"\s*=\s*\{(.*?)\}", body, re.S)
+        if not match:
+            return None
+        values = re.sub(r"//[^\n]*|/\*.*?\*/", "", match.group(1), flags=re.S)
+        return [int(v, 0) for v in re.findall(r"0x[0-9a-fA-F]+|\d+", values)]
+
+    height = field("height")
+    max_width = field("max_width")
+    widths = array("widths")
+    data = array("data")
+    if not (height and max_width and widths and data):
+        return None
+    return height, max_width, widths, data
+
+
+def _builtin_font(name):
+    """Built-in approximation of a PicoGraphics font (see glyphs.py)"""
+    height, max_width, widths, data = font_tables(name)
+    return BitmapFont(name, height, max_width, widths, data, "built-in")
+
+
+def load_fonts(path=None):
+    """
+    Load every PicoGraphics bitmap font.
+
+    Args:
+        path: Directory with the Pimoroni font headers (defaults to the
+              PIMORONI_FONTS environment variable)
+
+    Returns:
+        Dict of font name -> BitmapFont
+    """
+    if path is None:
+        path = os.environ.get("PIMORONI_FONTS")
+
+    fonts = {}
+    missing = []
+    for name, (filename, symbol) in FONT_SOURCES.items():
+        parsed = None
+        if path:
+            try:
+                with open(os.path.join(path, filename)) as f:
+                    parsed = _parse_header(f.read(), symbol)
+            except OSError:
+                parsed = None
+        if parsed:
+            height, max_width, widths, data = parsed
+            fonts[name] = BitmapFont(name, height, max_width, widths, data, filename)
+        else:
+            fonts[name] = _builtin_font(name)
+            missing.append(name)
+
+    if missing and path:
+        print(
+            "Emulator: no font headers for " + ", ".join(missing)
+            + " in " + path + ", using the built-in glyphs"
+        )
+    return fonts
@@ -0,0 +1,309 @@
+# Built-in glyphs for the emulator's PicoGraphics fonts
+# Used when the Pimoroni font headers aren't available (see fonts.py), so a
+# default run draws readable text with the device's line heights.
+#
+# Glyphs are drawn here as rows of "#" (set) and "." (clear), top row
+# first, separated by spaces; missing rows at the bottom are blank. Each
+# glyph is trimmed to its inked columns, so widths are proportional as on
+# the device.
+#   bitmap8   5x7 capitals and digits, descenders in the 8th row
+#   bitmap6   3x5 capitals and digits (a few letters wider), 6th row for
+#             descenders
+#   bitmap14  bitmap8 scaled to 14 rows and about 1.6x wider
+#   bitmap14_outline  the one pixel ring around bitmap14 (clipped to 14 rows)
+#
+# The shapes are not copies of the Pimoroni tables, so text lines up
+# within a pixel or two of the device but is not pixel exact; point
+# PIMORONI_FONTS at the real headers for that.
+
+GLYPHS_8 = {
+    "!": "..#.. ..#.. ..#.. ..#.. ..... ..... ..#..",
+    '"': ".#.#. .#.#. .#.#.",
+    "#": ".#.#. .#.#. ##### .#.#. ##### .#.#. .#.#.",
+    "$": "..#.. .#### #.#.. .###. ..#.# ####. ..#..",
+    "%": "##... ##..# ...#. ..#.. .#... #..## ...##",
+    "&": ".##.. #..#. #.#.. .#... #.#.# #..#. .##.#",
+    "'": "..#.. ..#.. .....",
+    "(": "...#. ..#.. .#... .#... .#... ..#.. ...#.",
+    ")": ".#... ..#.. ...#. ...#. ...#. ..#.. .#...",
+    "*": "..... ..#.. #.#.# .###. #.#.# ..#.. .....",
+    "+": "..... ..#.. ..#.. ##### ..#.. ..#.. .....",
+    ",": "..... ..... ..... ..... .##.. ..#.. .#...",
+    "-": "..... ..... ..... ##### ..... ..... .....",
+    ".": "..... ..... ..... ..... ..... .##.. .##..",
+    "/": "..... ....# ...#. ..#.. .#... #.... .....",
+    "0": ".###. #...# #..## #.#.# ##..# #...# .###.",
+    "1": "..#.. .##.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "2": ".###. #...# ....# ...#. ..#.. .#... #####",
+    "3": "##### ...#. ..#.. ...#. ....# #...# .###.",
+    "4": "...#. ..##. .#.#. #..#. ##### ...#. ...#.",
+    "5": "##### #.... ####. ....# ....# #...# .###.",
+    "6": "..##. .#... #.... ####. #...# #...# .###.",
+    "7": "##### ....# ...#. ..#.. .#... .#... .#...",
+    "8": ".###. #...# #...# .###. #...# #...# .###.",
+    "9": ".###. #...# #...# .#### ....# ...#. .##..",
+    ":": "..... .##.. .##.. ..... .##.. .##.. .....",
+    ";": "..... .##.. .##.. ..... .##.. ..#.. .#...",
+    "<": "...#. ..#.. .#... #.... .#... ..#.. ...#.",
+    "=": "..... ..... ##### ..... ##### ..... .....",
+    ">": ".#... ..#.. ...#. ....# ...#. ..#.. .#...",
+    "?": ".###. #...# ....# ...#. ..#.. ..... ..#..",
+    "@": ".###. #...# ....# .##.# #.#.# #.#.# .###.",
+    "A": ".###. #...# #...# #...# ##### #...# #...#",
+    "B": "####. #...# #...# ####. #...# #...# ####.",
+    "C": ".###. #...# #.... #.... #.... #...# .###.",
+    "D": "###.. #..#. #...# #...# #...# #..#. ###..",
+    "E": "##### #.... #.... ####. #.... #.... #####",
+    "F": "##### #.... #.... ####. #.... #.... #....",
+    "G": ".###. #...# #.... #.### #...# #...# .####",
+    "H": "#...# #...# #...# ##### #...# #...# #...#",
+    "I": ".###. ..#.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "J": "..### ...#. ...#. ...#. ...#. #..#. .##..",
+    "K": "#...# #..#. #.#.. ##... #.#.. #..#. #...#",
+    "L": "#.... #.... #.... #.... #.... #.... #####",
+    "M": "#...# ##.## #.#.# #.#.# #...# #...# #...#",
+    "N": "#...# #...# ##..# #.#.# #..## #...# #...#",
+    "O": ".###. #...# #...# #...# #...# #...# .###.",
+    "P": "####. #...# #...# ####. #.... #.... #....",
+    "Q": ".###. #...# #...# #...# #.#.# #..#. .##.#",
+    "R": "####. #...# #...# ####. #.#.. #..#. #...#",
+    "S": ".#### #.... #.... .###. ....# ....# ####.",
+    "T": "##### ..#.. ..#.. ..#.. ..#.. ..#.. ..#..",
+    "U": "#...# #...# #...# #...# #...# #...# .###.",
+    "V": "#...# #...# #...# #...# #...# .#.#. ..#..",
+    "W": "#...# #...# #...# #.#.# #.#.# #.#.# .#.#.",
+    "X": "#...# #...# .#.#. ..#.. .#.#. #...# #...#",
+    "Y": "#...# #...# #...# .#.#. ..#.. ..#.. ..#..",
+    "Z": "##### ....# ...#. ..#.. .#... #.... #####",
+    "[": "###.. #.... #.... #.... #.... #.... ###..",
+    "\\": "..... #.... .#... ..#.. ...#. ....# .....",
+    "]": "..### ....# ....# ....# ....# ....# ..###",
+    "^": "..#.. .#.#. #...#",
+    "_": "..... ..... ..... ..... ..... ..... #####",
+    "`": ".#... ..#..",
+    "a": "..... ..... .###. ....# .#### #...# .####",
+    "b": "#.... #.... #.##. ##..# #...# #...# ####.",
+    "c": "..... ..... .###. #.... #.... #...# .###.",
+    "d": "....# ....# .##.# #..## #...# #...# .####",
+    "e": "..... ..... .###. #...# ##### #.... .###.",
+    "f": "..##. .#..# .#... ###.. .#... .#... .#...",
+    "g": "..... ..... .#### #...# #...# .#### ....# .###.",
+    "h": "#.... #.... #.##. ##..# #...# #...# #...#",
+    "i": "..#.. ..... .##.. ..#.. ..#.. ..#.. .###.",
+    "j": "...#. ..... ..##. ...#. ...#. ...#. #..#. .##..",
+    "k": "#.... #.... #..#. #.#.. ##... #.#.. #..#.",
+    "l": ".##.. ..#.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "m": "..... ..... ##.#. #.#.# #.#.# #...# #...#",
+    "n": "..... ..... #.##. ##..# #...# #...# #...#",
+    "o": "..... ..... .###. #...# #...# #...# .###.",
+    "p": "..... ..... ####. #...# #...# ####. #.... #....",
+    "q": "..... ..... .##.# #..## #...# .#### ....# ....#",
+    "r": "..... ..... #.##. ##..# #.... #.... #....",
+    "s": "..... ..... .###. #.... .###. ....# ####.",
+    "t": ".#... .#... ###.. .#... .#... .#..# ..##.",
+    "u": "..... ..... #...# #...# #...# #..## .##.#",
+    "v": "..... ..... #...# #...# #...# .#.#. ..#..",
+    "w": "..... ..... #...# #...# #.#.# #.#.# .#.#.",
+    "x": "..... ..... #...# .#.#. ..#.. .#.#. #...#",
+    "y": "..... ..... #...# #...# #...# .#### ....# .###.",
+    "z": "..... ..... ##### ...#. ..#.. .#... #####",
+    "{": "...#. ..#.. ..#.. .#... ..#.. ..#.. ...#.",
+    "|": "..#.. ..#.. ..#.. ..#.. ..#.. ..#.. ..#..",
+    "}": ".#... ..#.. ..#.. ...#. ..#.. ..#.. .#...",
+    "~": "..... ..... .#... #.#.# ...#.",
+}
+
+GLYPHS_6 = {
+    "!": "# # # . #",
+    '"': "#.# #.#",
+    "#": "#.# ### #.# ### #.#",
+    "$": ".## ##. .#. .## ##.",
+    "%": "#.# ..# .#. #.. #.#",
+    "&": ".#. #.# .#. #.# .##",
+    "'": "# #",
+    "(": ".# #. #. #. .#",
+    ")": "#. .# .# .# #.",
+    "*": "... #.# .#. #.#",
+    "+": "... .#. ### .#.",
+    ",": ". . . . # #",
+    "-": "... ... ###",
+    ".": ". . . . #",
+    "/": "..# ..# .#. #.. #..",
+    "0": "### #.# #.# #.# ###",
+    "1": ".#. ##. .#. .#. ###",
+    "2": "##. ..# .#. #.. ###",
+    "3": "##. ..# .#. ..# ##.",
+    "4": "#.# #.# ### ..# ..#",
+    "5": "### #.. ##. ..# ##.",
+    "6": ".## #.. ### #.# ###",
+    "7": "### ..# .#. #.. #..",
+    "8": "### #.# ### #.# ###",
+    "9": "### #.# ### ..# ##.",
+    ":": ". # . # .",
+    ";": ".. .# .. .# #.",
+    "<": "..# .#. #.. .#. ..#",
+    "=": "... ### ... ###",
+    ">": "#.. .#. ..# .#. #..",
+    "?": "##. ..# .#. ... .#.",
+    "@": ".#. #.# ### #.. .##",
+    "A": ".#. #.# ### #.# #.#",
+    "B": "##. #.# ##. #.# ##.",
+    "C": ".## #.. #.. #.. .##",
+    "D": "##. #.# #.# #.# ##.",
+    "E": "### #.. ##. #.. ###",
+    "F": "### #.. ##. #.. #..",
+    "G": ".## #.. #.# #.# .##",
+    "H": "#.# #.# ### #.# #.#",
+    "I": "### .#. .#. .#. ###",
+    "J": "..# ..# ..# #.# .#.",
+    "K": "#.# #.# ##. #.# #.#",
+    "L": "#.. #.. #.. #.. ###",
+    "M": "#...# ##.## #.#.# #...# #...#",
+    "N": "#..# ##.# #.## #..# #..#",
+    "O": ".#. #.# #.# #.# .#.",
+    "P": "##. #.# ##. #.. #..",
+    "Q": ".#. #.# #.# ##. .##",
+    "R": "##. #.# ##. #.# #.#",
+    "S": ".## #.. .#. ..# ##.",
+    "T": "### .#. .#. .#. .#.",
+    "U": "#.# #.# #.# #.# ###",
+    "V": "#.# #.# #.# #.# .#.",
+    "W": "#...# #...# #.#.# #.#.# .#.#.",
+    "X": "#.# #.# .#. #.# #.#",
+    "Y": "#.# #.# .#. .#. .#.",
+    "Z": "### ..# .#. #.. ###",
+    "[": "## #. #. #. ##",
+    "\\": "#.. #.. .#. ..# ..#",
+    "]": "## .# .# .# ##",
+    "^": ".#. #.#",
+    "_": "... ... ... ... ###",
+    "`": "#. .#",
+    "a": "... .## #.# #.# .##",
+    "b": "#.. ##. #.# #.# ##.",
+    "c": "... .## #.. #.. .##",
+    "d": "..# .## #.# #.# .##",
+    "e": "... .#. ### #.. .##",
+    "f": ".## #.. ### #.. #..",
+    "g": "... .## #.# .## ..# ##.",
+    "h": "#.. ##. #.# #.# #.#",
+    "i": "# . # # #",
+    "j": ".# .. .# .# .# #.",
+    "k": "#.. #.# ##. ##. #.#",
+    "l": "# # # # #",
+    "m": "..... ##.#. #.#.# #.#.# #.#.#",
+    "n": "... ##. #.# #.# #.#",
+    "o": "... .#. #.# #.# .#.",
+    "p": "... ##. #.# #.# ##. #..",
+    "q": "... .## #.# #.# .## ..#",
+    "r": "... #.# ##. #.. #..",
+    "s": "... .## #.. ..# ##.",
+    "t": ".#. ### .#. .#. .##",
+    "u": "... #.# #.# #.# .##",
+    "v": "... #.# #.# #.# .#.",
+    "w": "..... #...# #.#.# #.#.# .#.#.",
+    "x": "... #.# .#. .#. #.#",
+    "y": "... #.# #.# .## ..# ##.",
+    "z": "... ### .#. #.. ###",
+    "{": ".## .#. ##. .#. .##",
+    "|": "# # # # #",
+    "}": "##. .#. .## .#. ##.",
+    "~": ".... .#.# #.#.",
+}
+
+# bitmap8 rows -> bitmap14 rows (top and descender rows stay single)
+ROWS_14 = (1, 2, 2, 2, 2, 2, 2, 1)
+
+# Space width (pixels) per font
+SPACE_WIDTH = {"bitmap6": 2, "bitmap8": 3, "bitmap14": 5, "bitmap14_outline": 6}
+
+
+def _columns(art):
+    """Glyph art to a list of column bitmasks (bit 0 = top row)"""
+    rows = art.split()
+    width = max(len(row) for row in rows)
+    columns = []
+    for x in range(width):
+        column = 0
+        for y, row in enumerate(rows):
+            if x < len(row) and row[x] == "#":
+                column |= 1 << y
+        columns.append(column)
+    return columns
+
+
+def _trim(columns):
+    """Drop the blank columns either side of a glyph"""
+    columns = list(columns)
+    while columns and not columns[0]:
+        columns.pop(0)
+    while columns and not columns[-1]:
+        columns.pop()
+    return columns
+
+
+def _scale_14(columns):
+    """
+    bitmap8 columns to bitmap14: ROWS_14 vertically, and the outer and
+    centre columns of the 5 column grid doubled (8 wide, even stems)
+    """
+    scaled = []
+    for x, column in enumerate(columns):
+        tall = 0
+        y = 0
+        for row, repeat in enumerate(ROWS_14):
+            if column & (1 << row):
+                tall |= ((1 << repeat) - 1) << y
+            y += repeat
+        scaled.extend([tall] * (2 if x % 2 == 0 else 1))
+    return scaled
+
+
+def _outline(columns, height):
+    """One pixel ring around a glyph (one column wider on each side)"""
+    mask = (1 << height) - 1
+    padded = [0] + columns + [0]
+    ring = []
+    for x in range(len(padded)):
+        grown = 0
+        for nx in (x - 1, x, x + 1):
+            if 0 <= nx < len(padded):
+                column = padded[nx]
+                grown |= column | (column << 1) | (column >> 1)
+        ring.append(grown & mask & ~padded[x])
+    return ring
+
+
+def font_tables(name):
+    """
+    Font tables in the layout of the Pimoroni headers.
+
+    Returns:
+        (height, max_width, widths, data) - widths for characters 32-126,
+        data column-major, max_width columns of bytes per glyph
+    """
+    if name == "bitmap6":
+        height, glyphs, make = 6, GLYPHS_6, _columns
+    elif name == "bitmap8":
+        height, glyphs, make = 8, GLYPHS_8, _columns
+    elif name == "bitmap14":
+        height, glyphs, make = 14, GLYPHS_8, lambda art: _scale_14(_columns(art))
+    elif name == "bitmap14_outline":
+        height, glyphs = 14, GLYPHS_8
+        make = lambda art: _outline(_trim(_scale_14(_columns(art))), 14)
+    else:
+        raise ValueError("unknown font: " + name)
+
+    table = [[0] * SPACE_WIDTH[name]]
+    for code in range(33, 127):
+        table.append(_trim(make(glyphs[chr(code)])))
+
+    bytes_per_column = (height + 7) // 8
+    max_width = max(len(columns) for columns in table)
+    widths = [len(columns) for columns in table]
+    data = []
+    for columns in table:
+        for x in range(max_width):
+            column = columns[x] if x < len(columns) else 0
+            for b in range(bytes_per_column):
+                data.append((column >> (8 * b)) & 0xFF)
+    return height, max_width, widths, data
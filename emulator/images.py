@@ -0,0 +1,79 @@
+# Frame export for the host emulator (PNG always, GIF when Pillow is installed)
+
+import struct
+import zlib
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def _chunk(kind, data):
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def upscale(frame, scale):
+    """Nearest-neighbour upscale so single LEDs are visible"""
+    if scale <= 1:
+        return frame
+    return np.repeat(np.repeat(frame, scale, axis=0), scale, axis=1)
+
+
+def write_png(path, frame, scale=1):
+    """Write a (height, width, 3) uint8 frame as an RGB PNG"""
+    frame = np.ascontiguousarray(upscale(frame, scale), dtype=np.uint8)
+    height, width = frame.shape[:2]
+    raw = b"".join(b"\x00" + frame[y].tobytes() for y in range(height))
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(_chunk(b"IDAT", zlib.compress(raw, 9)))
+        f.write(_chunk(b"IEND", b""))
+
+
+def read_png(path):
+    """Read a PNG written by write_png back into a (height, width, 3) array"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("not a PNG: " + path)
+    pos = 8
+    width = height = 0
+    idat = b""
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b"IHDR":
+            width, height, depth, colour = struct.unpack(">IIBB", body[:10])
+            if depth != 8 or colour != 2:
+                raise ValueError("only 8-bit RGB PNGs are supported")
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+    raw = zlib.decompress(idat)
+    stride = width * 3 + 1
+    rows = []
+    for y in range(height):
+        if raw[y * stride] != 0:
+            raise ValueError("only unfiltered PNGs are supported")
+        rows.append(np.frombuffer(raw[y * stride + 1:(y + 1) * stride], dtype=np.uint8))
+    return np.stack(rows).reshape(height, width, 3)
+
+
+def write_gif(path, frames, scale=1, frame_ms=100):
+    """Write an animated GIF (requires Pillow). Returns False if unavailable."""
+    if Image is None:
+        print("GIF export needs Pillow (pip install pillow) - skipped")
+        return False
+    images = [Image.fromarray(upscale(frame, scale)) for frame in frames]
+    if not images:
+        return False
+    images[0].save(
+        path, save_all=True, append_images=images[1:],
+        duration=frame_ms, loop=0, optimize=False,
+    )
+    return True
@@ -0,0 +1,37 @@
+# Emulated Pimoroni interstate75 module
+
+import emulator
+from emulator.picographics import PicoGraphics
+
+DISPLAY_INTERSTATE75_32X32 = (32, 32)
+DISPLAY_INTERSTATE75_64X32 = (64, 32)
+DISPLAY_INTERSTATE75_96X32 = (96, 32)
+DISPLAY_INTERSTATE75_128X32 = (128, 32)
+DISPLAY_INTERSTATE75_64X64 = (64, 64)
+DISPLAY_INTERSTATE75_128X64 = (128, 64)
+DISPLAY_INTERSTATE75_192X64 = (192, 64)
+DISPLAY_INTERSTATE75_256X64 = (256, 64)
+
+SWITCH_A = 0
+SWITCH_B = 1
+
+
+class Interstate75:
+    """Interstate 75 W with a PicoGraphics framebuffer and frame capture"""
+
+    def __init__(self, display=DISPLAY_INTERSTATE75_64X32, **kwargs):
+        self.width, self.height = display
+        self.display = PicoGraphics(self.width, self.height)
+        self.led = (0, 0, 0)
+        self.updates = 0
+
+    def update(self, buffer=None):
+        self.updates += 1
+        for hook in emulator.frame_hooks:
+            hook(self.display)
+
+    def set_led(self, r, g, b):
+        self.led = (r, g, b)
+
+    def switch_pressed(self, switch):
+        return emulator.switches.get(switch, False)
@@ -0,0 +1,112 @@
+# Emulated MicroPython machine module (RTC, Pin, PWM, Timer)
+
+import time
+
+import emulator
+
+
+def _clock():
+    return emulator.install()
+
+
+class RTC:
+    """Real-time clock backed by the emulator's virtual clock"""
+
+    def datetime(self, value=None):
+        if value is not None:
+            return None
+        t = time.gmtime(_clock().time())
+        # (year, month, day, weekday, hour, minute, second, subsecond)
+        return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_wday,
+                t.tm_hour, t.tm_min, t.tm_sec, 0)
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, pin, mode=None, pull=None, value=None):
+        self.pin = pin
+        self._value = value or 0
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+
+class PWM:
+    """PWM output that records every frequency and duty change"""
+
+    def __init__(self, pin, freq=None, duty_u16=None):
+        self.pin = pin
+        self._freq = freq or 0
+        self._duty = duty_u16 or 0
+        self.log = []  # (ticks_us, freq, duty)
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = value
+        self.log.append((_clock().ticks_us(), self._freq, self._duty))
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+        self.log.append((_clock().ticks_us(), self._freq, self._duty))
+
+    def deinit(self):
+        self._duty = 0
+
+
+class Timer:
+    """Virtual-time periodic/one-shot timer"""
+
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self._handle = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        self.deinit()
+        if freq > 0:
+            period_us = 1000000 // freq
+        else:
+            period_us = period * 1000
+
+        def fire():
+            if mode == Timer.ONE_SHOT:
+                self.deinit()
+            if callback is not None:
+                callback(self)
+
+        self._handle = _clock().call_every(period_us, fire)
+
+    def deinit(self):
+        if self._handle is not None:
+            _clock().cancel(self._handle)
+            self._handle = None
+
+
+def freq(value=None):
+    return 150000000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def unique_id():
+    return b"\xe6\x61\x44\x10\x43\x2a\x2b\x2c"
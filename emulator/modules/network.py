@@ -0,0 +1,68 @@
+# Emulated MicroPython network module (WLAN)
+
+import emulator
+
+STA_IF = 0
+AP_IF = 1
+
+STAT_IDLE = 0
+STAT_CONNECTING = 1
+STAT_WRONG_PASSWORD = -3
+STAT_NO_AP_FOUND = -2
+STAT_CONNECT_FAIL = -1
+STAT_GOT_IP = 3
+
+
+class WLAN:
+    """Station interface whose link state follows emulator.wifi"""
+
+    def __init__(self, interface=STA_IF):
+        self._active = False
+        self._connect_started = None
+        self._ssid = None
+
+    def active(self, value=None):
+        if value is None:
+            return self._active
+        self._active = bool(value)
+
+    def config(self, *args, **kwargs):
+        if args:
+            key = args[0]
+            if key == "ssid":
+                return self._ssid or ""
+            if key == "channel":
+                return 6
+            if key == "mac":
+                return b"\x28\xcd\xc1\x00\x00\x01"
+            return None
+
+    def connect(self, ssid=None, key=None, bssid=None, channel=None):
+        self._ssid = ssid
+        self._connect_started = emulator.install().ticks_ms()
+
+    def disconnect(self):
+        self._connect_started = None
+
+    def status(self, *args):
+        if self._connect_started is None:
+            return STAT_IDLE
+        wanted = emulator.wifi["ssid"]
+        if not emulator.wifi["up"] or (wanted and self._ssid != wanted):
+            return STAT_NO_AP_FOUND
+        clock = emulator.install()
+        waited = clock.ticks_diff(clock.ticks_ms(), self._connect_started)
+        if waited < emulator.wifi["connect_delay_ms"]:
+            return STAT_CONNECTING
+        return STAT_GOT_IP
+
+    def isconnected(self):
+        return self.status() == STAT_GOT_IP
+
+    def ifconfig(self, *args):
+        return ("192.168.0.75", "255.255.255.0", "192.168.0.1", "192.168.0.1")
+
+    def scan(self):
+        if not emulator.wifi["up"]:
+            return []
+        return [(emulator.wifi["ssid"].encode(), b"\x02\x00\x00\x00\x00\x01", 6, -50, 3, False)]
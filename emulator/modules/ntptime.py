@@ -0,0 +1,15 @@
+# Emulated MicroPython ntptime module - the virtual clock is already UTC
+
+import emulator
+
+host = "pool.ntp.org"
+timeout = 1
+
+
+def time():
+    return emulator.install().time()
+
+
+def settime():
+    if not emulator.wifi["up"]:
+        raise OSError("ETIMEDOUT")
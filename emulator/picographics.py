@@ -0,0 +1,176 @@
+# PicoGraphics emulation on a NumPy framebuffer
+# Implements the subset of the PicoGraphics API used by the FlightTracker scenes
+
+import numpy as np
+
+from emulator.fonts import load_fonts
+
+_fonts = None
+
+
+def _get_fonts():
+    global _fonts
+    if _fonts is None:
+        _fonts = load_fonts()
+    return _fonts
+
+
+class PicoGraphics:
+    """
+    RGB888 PicoGraphics on a (height, width, 3) uint8 array.
+
+    Drawing semantics follow the Pimoroni C++ implementation: pens are packed
+    RGB888 ints, rectangles and pixels are clipped, horizontal and vertical
+    lines exclude their end point and text advances by glyph width plus
+    letter spacing, all multiplied by scale.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.fb = np.zeros((height, width, 3), dtype=np.uint8)
+        self._pen = (0, 0, 0)
+        self._font = _get_fonts()["bitmap8"]
+        self.draw_calls = 0
+
+    # -- pens -----------------------------------------------------------------
+
+    def create_pen(self, r, g, b):
+        return ((int(r) & 0xFF) << 16) | ((int(g) & 0xFF) << 8) | (int(b) & 0xFF)
+
+    def set_pen(self, pen):
+        self._pen = ((pen >> 16) & 0xFF, (pen >> 8) & 0xFF, pen & 0xFF)
+
+    def get_bounds(self):
+        return (self.width, self.height)
+
+    def set_font(self, font):
+        fonts = _get_fonts()
+        if font not in fonts:
+            raise ValueError("unknown font: " + str(font))
+        self._font = fonts[font]
+
+    # -- primitives -------------------------------------------------------------
+
+    def clear(self):
+        self.draw_calls += 1
+        self.fb[:, :] = self._pen
+
+    def pixel(self, x, y):
+        self.draw_calls += 1
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.fb[y, x] = self._pen
+
+    def _span(self, x, y, length):
+        if y < 0 or y >= self.height or length <= 0:
+            return
+        x0 = max(x, 0)
+        x1 = min(x + length, self.width)
+        if x1 > x0:
+            self.fb[y, x0:x1] = self._pen
+
+    def _fill(self, x, y, w, h):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        if x1 > x0 and y1 > y0:
+            self.fb[y0:y1, x0:x1] = self._pen
+
+    def rectangle(self, x, y, w, h):
+        self.draw_calls += 1
+        self._fill(int(x), int(y), int(w), int(h))
+
+    def line(self, x1, y1, x2, y2):
+        self.draw_calls += 1
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+
+        # Fast horizontal line
+        if y1 == y2:
+            start = min(x1, x2)
+            self._span(start, y1, max(x1, x2) - start)
+            return
+
+        # Fast vertical line
+        if x1 == x2:
+            start = min(y1, y2)
+            self._fill(x1, start, 1, max(y1, y2) - start)
+            return
+
+        # General line in 16.16 fixed point, as PicoGraphics does it
+        dx = x2 - x1
+        dy = y2 - y1
+        if abs(dx) > abs(dy):
+            steps = abs(dx)
+            sx = -1 if dx < 0 else 1
+            sy = int((dy << 16) / steps)
+            x = x1
+            y = y1 << 16
+            for _ in range(steps):
+                if 0 <= x < self.width and 0 <= (y >> 16) < self.height:
+                    self.fb[y >> 16, x] = self._pen
+                y += sy
+                x += sx
+        else:
+            steps = abs(dy)
+            sy = -1 if dy < 0 else 1
+            sx = int((dx << 16) / steps)
+            y = y1
+            x = x1 << 16
+            for _ in range(steps):
+                if 0 <= (x >> 16) < self.width and 0 <= y < self.height:
+                    self.fb[y, x >> 16] = self._pen
+                y += sy
+                x += sx
+
+    # -- text -------------------------------------------------------------------
+
+    def measure_text(self, text, scale=2, spacing=1, fixed_width=False):
+        font = self._font
+        width = 0
+        for ch in str(text):
+            if fixed_width:
+                width += font.max_width * scale
+            else:
+                width += font.width(ch) * scale
+            width += spacing * scale
+        return width
+
+    def _character(self, ch, x, y, scale):
+        for cx, cy in self._font.glyph(ch):
+            self._fill(x + cx * scale, y + cy * scale, scale, scale)
+
+    def text(self, text, x, y, wordwrap=2147483647, scale=2, angle=0, spacing=1, fixed_width=False):
+        self.draw_calls += 1
+        if angle:
+            raise NotImplementedError("rotated text is not emulated")
+
+        font = self._font
+        x, y, scale = int(x), int(y), int(scale)
+        co = 0
+        lo = 0
+        line_height = (font.height + 1) * scale
+
+        for line in str(text).split("\n"):
+            words = line.split(" ")
+            for i, word in enumerate(words):
+                word_width = self.measure_text(word, scale, spacing, fixed_width)
+                if i and co + word_width > wordwrap:
+                    co = 0
+                    lo += line_height
+                for ch in word:
+                    self._character(ch, x + co, y + lo, scale)
+                    co += (font.max_width if fixed_width else font.width(ch)) * scale
+                    co += spacing * scale
+                if i < len(words) - 1:
+                    co += (font.width(" ") + spacing) * scale
+            co = 0
+            lo += line_height
+
+    # -- unused by the scenes but harmless to support -----------------------
+
+    def set_backlight(self, brightness):
+        pass
+
+    def update(self):
+        pass
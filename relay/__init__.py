@@ -0,0 +1,7 @@
+# LAN relay for a fleet of displays - run on any CPython host on the LAN:
+#
+#     python -m relay --port 30100
+#
+# and set RELAY_HOST in each display's config.py. See relay/server.py.
+
+from relay.server import RelayServer
@@ -0,0 +1,46 @@
+# python -m relay - run the LAN relay until Ctrl-C
+#
+#   python -m relay --port 30100 --interval 30
+#   python -m relay --api 127.0.0.1:8080     # upstream from emulator.fakeapi
+
+import argparse
+import asyncio
+
+from relay.server import RelayServer
+from utilities.https import set_api_override
+from utilities.overhead import FLIGHT_POLL_INTERVAL, RELAY_PORT
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog="python -m relay", description=__doc__)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=RELAY_PORT)
+    parser.add_argument("--interval", type=float, default=FLIGHT_POLL_INTERVAL,
+                        help="seconds between upstream flight fetches")
+    parser.add_argument("--api", metavar="HOST:PORT",
+                        help="send upstream requests to a stand-in (python -m emulator.fakeapi)")
+    return parser.parse_args()
+
+
+async def _serve(args):
+    relay = await RelayServer(args.host, args.port, args.interval).start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await relay.stop()
+        print("Relay: " + ", ".join(f"{k}={v}" for k, v in relay.stats.items()))
+
+
+def main():
+    args = _parse_args()
+    if args.api:
+        host, _, port = args.api.partition(":")
+        set_api_override(host, int(port or 8080))
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
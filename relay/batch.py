@@ -0,0 +1,231 @@
+# Columnar (NumPy) view cutting for the LAN relay
+# With hundreds of subscribers and a wide upstream box, cutting each view
+# with the scalar cut_view() is subscribers x aircraft dict lookups and
+# distance calls per fetch. Here the fetch is held as float64 columns
+# (lat, lon, altitude, ECEF position) and every view is cut in blocks of
+# subscribers (one row per watch zone of a subscriber that has several):
+# zone, altitude and flight filter masks (and a geofence's polygon test
+# for the rows in its box), squared ECEF distance to each home, and a
+# per-row top-k with argpartition. A filter is run over the rows once per fetch however many
+# subscribers share it. Flight dicts are only built for the rows some
+# subscriber is sent.
+#
+# NumPy is optional on the relay host: relay/server.py falls back to
+# cut_view() without it. Never imported on a display.
+
+import json
+import math
+
+import numpy as np
+
+from utilities.flightfilter import FLIGHT_FIELDS, FR24_FIELDS, compile_filter
+from utilities.overhead import EARTH_RADIUS_KM, MAX_FLIGHT_LOOKUP, flight_from_fr24
+from relay.views import view_parts
+
+CUT_BLOCK = 64              # subscribers per block (block x aircraft floats in flight)
+DEG2RAD = math.pi / 180
+FEET_TO_KM = 0.0003048
+
+
+def _ecef(lat, lon, radius):
+    """
+    Cartesian position as distance_from_flight_to_home computes it.
+
+    Args:
+        lat, lon: Arrays in degrees
+        radius: Array of distances from the earth's centre (km)
+
+    Returns:
+        (n, 3) array
+    """
+    lat = lat * DEG2RAD
+    lon = lon * DEG2RAD
+    cos_lat = np.cos(lat)
+    return np.stack((
+        radius * cos_lat * np.sin(lon),
+        radius * np.sin(lat),
+        radius * cos_lat * np.cos(lon),
+    ), axis=1)
+
+
+class FlightColumns:
+    """
+    One upstream fetch as columns, with flight dicts built on demand.
+
+    Build with from_fr24() (raw feed JSON) or from_flights() (flight dicts
+    from any other source). Row order is the feed's order, so a view
+    without a home lists flights as cut_view() would.
+    """
+
+    def __init__(self, keys, rows, converter, lat, lon, alt):
+        self.keys = keys
+        self._rows = rows
+        self._converter = converter
+        self._flights = {}
+        self._masks = {}    # filter (as JSON) -> rows passing it
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.alt = np.asarray(alt, dtype=np.float64)
+        self.xyz = _ecef(self.lat, self.lon, self.alt * FEET_TO_KM + EARTH_RADIUS_KM)
+        self.norm2 = np.einsum("ij,ij->i", self.xyz, self.xyz)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_fr24(cls, data):
+        """
+        Columns straight from an FR24 feed response, skipping the same
+        entries flight_from_fr24() does.
+        """
+        keys = []
+        rows = []
+        for key, val in data.items():
+            if (isinstance(val, list) and len(val) >= 17 and not val[14]
+                    and val[1] is not None and val[2] is not None):
+                keys.append(key)
+                rows.append(val)
+        try:
+            lat = [float(r[1]) for r in rows]
+            lon = [float(r[2]) for r in rows]
+            alt = [int(r[4] or 0) for r in rows]
+        except (ValueError, TypeError):
+            # A malformed entry - let the scalar parser decide row by row
+            flights = [flight_from_fr24(k, v) for k, v in zip(keys, rows)]
+            return cls.from_flights([f for f in flights if f is not None])
+        return cls(keys, rows, flight_from_fr24, lat, lon, alt)
+
+    @classmethod
+    def from_flights(cls, flights):
+        """Columns over flight dicts (airplanes.live, tests)"""
+        return cls(
+            [f["id"] for f in flights],
+            flights,
+            None,
+            [f.get("lat") for f in flights],   # None -> NaN, outside every zone
+            [f.get("lon") for f in flights],
+            [f.get("altitude", 0) for f in flights],
+        )
+
+    def flight(self, i):
+        """Flight dict for row i, built once"""
+        flight = self._flights.get(i)
+        if flight is None:
+            if self._converter is None:
+                flight = self._rows[i]
+            else:
+                flight = self._converter(self.keys[i], self._rows[i])
+            self._flights[i] = flight
+        return flight
+
+    def filter_mask(self, spec):
+        """
+        Rows passing a flight filter, computed once per distinct filter.
+
+        Raw FR24 rows are tested as the device's FR24 parser tests them,
+        flight dicts as the streaming feeds do.
+        """
+        key = json.dumps(spec, sort_keys=True)
+        mask = self._masks.get(key)
+        if mask is None:
+            keep = compile_filter(spec, FLIGHT_FIELDS if self._converter is None else FR24_FIELDS)
+            if keep is None:
+                mask = np.ones(len(self.keys), dtype=bool)
+            else:
+                mask = np.fromiter((keep(row) for row in self._rows), dtype=bool, count=len(self.keys))
+            self._masks[key] = mask
+        return mask
+
+    def cut_views(self, views, block=CUT_BLOCK):
+        """
+        Cut every view at once - the batch equivalent of cut_view().
+
+        Args:
+            views: Subscriber view dicts (see relay/server.py)
+            block: View parts (subscribers, or their watch zones) per array pass
+
+        Returns:
+            List of dicts of flight id -> flight, one per view
+        """
+        cut = [{} for _ in views]
+        if len(self.keys) == 0:
+            return cut
+
+        # One row of the block per view part (per watch zone, see relay/views.py)
+        parts = []
+        owners = []
+        for owner, view in enumerate(views):
+            for part in view_parts(view):
+                parts.append(part)
+                owners.append(owner)
+
+        for start in range(0, len(parts), block):
+            rows = self._cut_block(parts[start:start + block])
+            for owner, row in zip(owners[start:start + block], rows):
+                flights = cut[owner]
+                for i in row:
+                    key = self.keys[i]
+                    if key not in flights:
+                        flight = self.flight(i)
+                        if flight is not None:
+                            flights[key] = flight
+        return cut
+
+    def _cut_block(self, views):
+        """Row indices per view (or view part), nearest first"""
+        zones = np.array(
+            [(v["zone"]["tl_y"], v["zone"]["tl_x"], v["zone"]["br_y"], v["zone"]["br_x"]) for v in views],
+            dtype=np.float64,
+        )
+        alts = np.array(
+            [(v.get("min_altitude", 0), v.get("max_altitude", 100000)) for v in views],
+            dtype=np.float64,
+        )
+        limits = [min(v.get("limit", MAX_FLIGHT_LOOKUP), len(self.keys)) for v in views]
+
+        lat = self.lat[None, :]
+        lon = self.lon[None, :]
+        alt = self.alt[None, :]
+        inside = (
+            (zones[:, 2:3] <= lat) & (lat <= zones[:, 0:1])
+            & (zones[:, 1:2] <= lon) & (lon <= zones[:, 3:4])
+            & (alts[:, 0:1] < alt) & (alt < alts[:, 1:2])
+        )
+        for i, v in enumerate(views):
+            if v.get("filter"):
+                inside[i] &= self.filter_mask(v["filter"])
+            fence = v.get("_fence")
+            if fence is not None:
+                # Polygon test only for the rows inside its box
+                for j in np.flatnonzero(inside[i]):
+                    inside[i, j] = fence.contains(float(self.lat[j]), float(self.lon[j]))
+
+        # Squared distance to home; a view without a home ranks by feed order
+        homes = [v.get("home") for v in views]
+        has_home = np.array([bool(h) for h in homes])
+        rank = np.empty(inside.shape, dtype=np.float64)
+        rank[:] = np.arange(len(self.keys), dtype=np.float64)
+        if has_home.any():
+            h = np.array([h if h else (0.0, 0.0, 0.0) for h in homes], dtype=np.float64)
+            hxyz = _ecef(h[:, 0], h[:, 1], h[:, 2])
+            d2 = (np.einsum("ij,ij->i", hxyz, hxyz)[:, None] + self.norm2[None, :]
+                  - 2.0 * (hxyz @ self.xyz.T))
+            rank[has_home] = d2[has_home]
+        rank[~inside] = np.inf
+
+        kmax = max(limits)
+        if kmax <= 0:
+            return [[] for _ in views]
+        if kmax < rank.shape[1]:
+            nearest = np.argpartition(rank, kmax - 1, axis=1)[:, :kmax]
+        else:
+            nearest = np.broadcast_to(np.arange(rank.shape[1]), rank.shape)
+        order = np.take_along_axis(rank, nearest, axis=1).argsort(axis=1, kind="stable")
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        ranked = np.take_along_axis(rank, nearest, axis=1)
+
+        result = []
+        for i, limit in enumerate(limits):
+            count = int(np.isfinite(ranked[i, :limit]).sum())
+            result.append(nearest[i, :count].tolist())
+        return result
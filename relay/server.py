@@ -0,0 +1,391 @@
+# LAN relay: one CPython host fetches flights and weather, many displays
+# subscribe over a persistent TCP connection
+#
+# Each display (utilities/overhead.py RelaySource) opens a connection and
+# sends its view as one JSON line:
+#
+#   {"zone": {"tl_y": .., "tl_x": .., "br_y": .., "br_x": ..},
+#    "home": [lat, lon, radius], "min_altitude": 0, "max_altitude": 45000,
+#    "limit": 5, "units": "metric", "filter": {FLIGHT_FILTER},
+#    "zones": [{"name": .., "zone": {..}, "home": [..], "points": [..]}, ..]}
+#
+# The relay fetches the bounding box of every subscriber's zone once per
+# interval with the device's own fetch/parse functions, cuts each view
+# (zone, altitude limits and flight filter, then the nearest `limit`
+# flights to home, or to each watch zone's home - see relay/views.py) and
+# sends only what changed since that subscriber's last update, as JSON
+# lines:
+#
+#   {"t": "set", "f": {flight}}          flight entered the view
+#   {"t": "upd", "id": .., "f": {..}}    changed fields of a flight
+#   {"t": "del", "id": ..}               flight left the view
+#   {"t": "sync", "seq": n, "time": ..}  end of one fetch's changes
+#   {"t": "wx", "k": field, "v": ..}     one field of the forecast table
+#   {"t": "wxend", "time": ..}           forecast complete (fetch time)
+#   {"t": "ping"}                        upstream still healthy
+#
+# A new connection starts from an empty view, so its first batch is the
+# whole view. Every line stays well under the device's 2 KB receive buffer.
+# Pings are only sent while the last upstream fetch succeeded, so displays
+# fall back to fetching for themselves when the relay can't.
+#
+# With NumPy installed the fetch is kept as columns and every view is cut
+# in one batch (relay/batch.py). Without it a grid index over subscriber
+# zones (utilities/zones.py) hands each subscriber only the flights in its
+# zone, so cut_view() never scans the whole fetch.
+
+import asyncio
+import json
+import time
+
+from utilities.https import https_get_json
+from utilities.overhead import (
+    FLIGHT_POLL_INTERVAL, FR24_HOST, MAX_FLIGHT_LOOKUP, RELAY_PORT,
+    distance_from_flight_to_home, fetch_flights_airplanes_live, fetch_flights_fr24, fr24_path, in_zone,
+)
+from utilities.zones import ZoneIndex, union_zone
+from scenes.weather import WEATHER_RETRY_SECONDS, WEATHER_REVALIDATE_SECONDS, fetch_forecast
+from relay.views import prepare_view, view_parts
+
+try:
+    from relay.batch import FlightColumns
+except ImportError:
+    FlightColumns = None    # no NumPy - cut each view with cut_view()
+
+PING_SECONDS = 5            # heartbeat while upstream is healthy
+HELLO_TIMEOUT = 5           # seconds for a new client to send its view
+MAX_BACKLOG = 64 * 1024     # unsent bytes before a slow client is dropped
+
+
+def cut_view(flights, view):
+    """
+    One subscriber's flights: inside its zone and altitude limits, passing
+    its filter, nearest first. The filter runs before the nearest `limit`
+    are taken, so a display that only wants some flights still gets up to
+    `limit` of them. A view with watch zones gets the nearest `limit` of
+    each zone (see relay/views.py).
+
+    Args:
+        flights: Flight dicts from the upstream fetch
+        view: Subscriber view dict (see module comment)
+
+    Returns:
+        Dict of flight id -> flight, at most view["limit"] entries per
+        watch zone
+    """
+    cut = {}
+    for part in view_parts(view):
+        for flight in _cut_part(flights, part):
+            cut[flight["id"]] = flight
+    return cut
+
+
+def _cut_part(flights, part):
+    """Flights for one part of a view (see relay/views.py), nearest first"""
+    zone = part["zone"]
+    min_alt = part.get("min_altitude", 0)
+    max_alt = part.get("max_altitude", 100000)
+    keep = part["_keep"]
+    fence = part.get("_fence")
+    inside = [
+        f for f in flights
+        if in_zone(f, zone) and min_alt < f.get("altitude", 0) < max_alt and (keep is None or keep(f))
+        and (fence is None or fence.contains(f["lat"], f["lon"]))
+    ]
+    home = part.get("home")
+    if home:
+        inside.sort(key=lambda f: distance_from_flight_to_home(f, home))
+    return inside[:part.get("limit", MAX_FLIGHT_LOOKUP)]
+
+
+def view_changes(sent, current):
+    """
+    Messages turning the flights last sent into the current view.
+
+    Returns:
+        List of set/upd/del message dicts (empty if nothing changed)
+    """
+    messages = []
+    for key, flight in current.items():
+        old = sent.get(key)
+        if old is None:
+            messages.append({"t": "set", "f": flight})
+            continue
+        changed = {k: v for k, v in flight.items() if old.get(k) != v}
+        if changed:
+            messages.append({"t": "upd", "id": key, "f": changed})
+    for key in sent:
+        if key not in current:
+            messages.append({"t": "del", "id": key})
+    return messages
+
+
+def zone_within(zone, outer):
+    """True if zone lies inside outer (None covers nothing)"""
+    return outer is not None and (
+        zone["tl_y"] <= outer["tl_y"] and zone["br_y"] >= outer["br_y"]
+        and zone["tl_x"] >= outer["tl_x"] and zone["br_x"] <= outer["br_x"]
+    )
+
+
+def encode(messages):
+    """JSON lines for a list of message dicts"""
+    return "".join(json.dumps(m, separators=(",", ":")) + "\n" for m in messages).encode()
+
+
+class Subscriber:
+    """One connected display and what it has been sent"""
+
+    def __init__(self, writer, view):
+        self.writer = writer
+        self.view = view
+        self.peer = writer.get_extra_info("peername")
+        self.sent = {}
+        self.forecast_time = 0
+        self.bytes = 0
+
+    @property
+    def weather_key(self):
+        """Forecast this display needs: (lat, lon, units), to 0.1 degree so neighbours share one"""
+        home = self.view.get("home")
+        if not home:
+            return None
+        return (round(home[0], 1), round(home[1], 1), self.view.get("units", "metric"))
+
+    def send(self, messages):
+        """Queue messages; False if the client has fallen too far behind"""
+        if self.writer.is_closing():
+            return False
+        if self.writer.transport.get_write_buffer_size() > MAX_BACKLOG:
+            print(f"Relay: dropping slow client {self.peer}")
+            self.writer.close()
+            return False
+        data = encode(messages)
+        self.writer.write(data)
+        self.bytes += len(data)
+        return True
+
+
+class RelayServer:
+    """
+    Asyncio relay serving every subscriber from one upstream fetch.
+
+    Upstream calls are the device's own blocking fetch functions, run in
+    the default executor so slow APIs never stall client I/O.
+    """
+
+    def __init__(self, host="0.0.0.0", port=RELAY_PORT, interval=FLIGHT_POLL_INTERVAL, batch=True):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.batch = batch and FlightColumns is not None
+        self.subscribers = []
+        self.flights = FlightColumns.from_flights([]) if self.batch else []
+        self.index = None if self.batch else ZoneIndex()   # subscriber -> zone
+        self._buckets = {}      # subscriber -> flights in its zone, from the last fetch
+        self._fetched_zone = None
+        self.healthy = False
+        self.seq = 0
+        self.forecasts = {}     # weather key -> (forecast, fetched, retry_at)
+        self._forecast_pending = {}
+        self.stats = {"fetches": 0, "fetch_failures": 0, "weather_fetches": 0, "clients": 0}
+        self._server = None
+        self._tasks = []
+        self._wake = None
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def start(self):
+        self._wake = asyncio.Event()
+        self._server = await asyncio.start_server(self._client, self.host, self.port)
+        self._tasks = [
+            asyncio.ensure_future(self._fetch_loop()),
+            asyncio.ensure_future(self._ping_loop()),
+        ]
+        print(f"Relay: listening on {self.address[0]}:{self.address[1]}, fetching every {self.interval}s"
+              f"{' (batch)' if self.batch else ''}")
+        return self
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._server.close()
+        for sub in self.subscribers:
+            sub.writer.close()
+        await self._server.wait_closed()
+
+    async def _client(self, reader, writer):
+        try:
+            line = await asyncio.wait_for(reader.readline(), HELLO_TIMEOUT)
+            view = prepare_view(json.loads(line))
+        except (asyncio.TimeoutError, ValueError, KeyError, TypeError) as e:
+            if not isinstance(e, asyncio.TimeoutError):
+                print(f"Relay: rejected view from {writer.get_extra_info('peername')}: {e}")
+            writer.close()
+            return
+
+        sub = Subscriber(writer, view)
+        self.subscribers.append(sub)
+        if self.index is not None:
+            self.index.add_zone(sub, view["zone"])
+        self.stats["clients"] += 1
+        print(f"Relay: {sub.peer} subscribed ({len(self.subscribers)} connected)")
+
+        if self.healthy and zone_within(view["zone"], self._fetched_zone):
+            # Upstream already covers this view - answer at once
+            self._update(sub)
+        else:
+            self._wake.set()
+        await self._send_weather(sub)
+
+        try:
+            while await reader.read(256):
+                pass  # nothing else is expected from a display
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.subscribers.remove(sub)
+            if self.index is not None:
+                self.index.remove_zone(sub)
+                self._buckets.pop(sub, None)
+            writer.close()
+            print(f"Relay: {sub.peer} left ({len(self.subscribers)} connected)")
+
+    async def _fetch_loop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            if self.subscribers:
+                zone = union_zone([s.view["zone"] for s in self.subscribers])
+                flights, ok = await loop.run_in_executor(None, self._fetch, zone)
+                self.stats["fetches"] += 1
+                if ok:
+                    self.flights = flights
+                    if self.index is not None:
+                        self._buckets = self._bucket(flights)
+                    self._fetched_zone = zone
+                    self.healthy = True
+                    self.seq += 1
+                    subs = list(self.subscribers)
+                    for sub, current in zip(subs, self._cut(subs)):
+                        self._update(sub, current)
+                else:
+                    self.stats["fetch_failures"] += 1
+                    self.healthy = False
+                for sub in list(self.subscribers):
+                    await self._send_weather(sub)
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fetch(self, zone):
+        """FR24, then airplanes.live if FR24 errors (as fetch_flights_in_zone)"""
+        if self.batch:
+            return self._fetch_columns(zone)
+        flights, ok = fetch_flights_fr24(zone)
+        if not ok:
+            flights = fetch_flights_airplanes_live(zone)
+            ok = bool(flights)
+        return flights, ok
+
+    @staticmethod
+    def _fetch_columns(zone):
+        """As _fetch, but the FR24 response goes straight into columns"""
+        try:
+            data = https_get_json(FR24_HOST, fr24_path(zone), timeout=15)
+            if data is not None:
+                columns = FlightColumns.from_fr24(data)
+                print(f"FR24 returned {len(columns)} aircraft")
+                return columns, True
+            print("FR24 error: no response")
+        except Exception as e:
+            print(f"FR24 error: {e}")
+        flights = fetch_flights_airplanes_live(zone)
+        return FlightColumns.from_flights(flights), bool(flights)
+
+    def _bucket(self, flights):
+        """Flights per subscriber zone, one grid lookup per aircraft"""
+        buckets = {sub: [] for sub in self.index.zones}
+        seen = {}
+        for flight in flights:
+            lat = flight.get("lat")
+            lon = flight.get("lon")
+            if lat is None or lon is None:
+                continue
+            seen[flight["id"]] = True
+            for sub in self.index.move(flight["id"], lat, lon):
+                buckets[sub].append(flight)
+        self.index.retain(seen)
+        return buckets
+
+    def _cut(self, subs):
+        """Each subscriber's current flights (see cut_view)"""
+        if self.batch:
+            return self.flights.cut_views([sub.view for sub in subs])
+        # A subscriber that joined since the last fetch has no bucket yet
+        return [cut_view(self._buckets.get(sub, self.flights), sub.view) for sub in subs]
+
+    def _update(self, sub, current=None):
+        """Send a subscriber what changed in its view"""
+        if current is None:
+            current = self._cut([sub])[0]
+        messages = view_changes(sub.sent, current)
+        messages.append({"t": "sync", "seq": self.seq, "time": int(time.time())})
+        if sub.send(messages):
+            sub.sent = current
+
+    async def _forecast(self, key):
+        """
+        Forecast for a weather key, fetched once however many subscribers want it.
+
+        Returns:
+            (forecast or None, fetch time)
+        """
+        forecast, fetched, retry_at = self.forecasts.get(key, (None, 0, 0))
+        now = time.time()
+        if now - fetched <= WEATHER_REVALIDATE_SECONDS or now < retry_at:
+            return forecast, fetched
+
+        pending = self._forecast_pending.get(key)
+        if pending is not None:
+            await pending
+        else:
+            pending = asyncio.get_event_loop().run_in_executor(None, fetch_forecast, *key)
+            self._forecast_pending[key] = pending
+            self.stats["weather_fetches"] += 1
+            try:
+                fresh = await pending
+            finally:
+                del self._forecast_pending[key]
+            if fresh is None:
+                self.forecasts[key] = (forecast, fetched, now + WEATHER_RETRY_SECONDS)
+            else:
+                self.forecasts[key] = (fresh, int(now), 0)
+        forecast, fetched, _ = self.forecasts.get(key, (None, 0, 0))
+        return forecast, fetched
+
+    async def _send_weather(self, sub):
+        """Send the subscriber its forecast if it hasn't had this one"""
+        key = sub.weather_key
+        if key is None:
+            return
+        forecast, fetched = await self._forecast(key)
+        if forecast is None or sub.forecast_time == fetched:
+            return
+        messages = [{"t": "wx", "k": k, "v": v} for k, v in forecast.items()]
+        messages.append({"t": "wxend", "time": fetched})
+        if sub.send(messages):
+            sub.forecast_time = fetched
+
+    async def _ping_loop(self):
+        while True:
+            await asyncio.sleep(PING_SECONDS)
+            if self.healthy:
+                for sub in list(self.subscribers):
+                    sub.send(({"t": "ping"},))
+
@@ -0,0 +1,71 @@
+# Subscriber views for the LAN relay, shared by the scalar cut
+# (relay/server.py cut_view) and the NumPy one (relay/batch.py)
+#
+# A display with several watch zones lists them in its view:
+#
+#   "zones": [{"name": .., "zone": {tl_y, tl_x, br_y, br_x}, "home": [lat, lon, r]}, ..]
+#
+# Each watch zone is cut as a view part of its own - its nearest `limit`
+# flights to its own home - and the display is sent the union, so aircraft
+# in a distant watch zone are not crowded out by those near the main home.
+# The display ranks the union as it ranks its own fetch
+# (Overhead.in_watch_zones, by distance to the nearest home of the zones a
+# flight is in), and a flight among its nearest `limit` overall is always
+# among the nearest `limit` of the zone whose home it is closest to, so the
+# union is exactly what the display would have picked.
+#
+# A geofence is a watch zone with "points" as well: its box finds the
+# candidates and the polygon decides, as on the display, so flights in
+# the box but outside the fence don't take its places.
+
+from utilities.flightfilter import compile_filter
+from utilities.geofence import Geofence
+from utilities.overhead import MAX_FLIGHT_LOOKUP
+
+
+def prepare_view(view):
+    """
+    Check a subscriber's view and compile it, once on subscribe.
+
+    Adds "_keep" (the compiled flight filter) and "_parts" (see
+    view_parts), with a Geofence as "_fence" on a geofence's part.
+
+    Returns:
+        The view
+
+    Raises:
+        KeyError, TypeError: No zone, or a watch zone without one
+        ValueError: The filter doesn't compile (see utilities/flightfilter.py),
+            or a geofence has fewer than 3 points
+    """
+    view["zone"]["tl_y"]  # a view without a zone is useless
+    view["_keep"] = compile_filter(view.get("filter"))
+
+    parts = []
+    for entry in view.get("zones") or ():
+        part = {
+            "zone": entry["zone"],
+            "home": entry.get("home") or view.get("home"),
+            "min_altitude": view.get("min_altitude", 0),
+            "max_altitude": view.get("max_altitude", 100000),
+            "limit": view.get("limit", MAX_FLIGHT_LOOKUP),
+            "filter": view.get("filter"),
+            "_keep": view["_keep"],
+            "_fence": Geofence(entry["points"], entry.get("name", "")) if entry.get("points") else None,
+        }
+        part["zone"]["tl_y"]
+        parts.append(part)
+    view["_parts"] = parts or [view]
+    return view
+
+
+def view_parts(view):
+    """
+    The parts a view is cut as: one per watch zone, or the view itself.
+
+    Each part has the keys of a view without watch zones; a subscriber is
+    sent the union of its parts' cuts.
+    """
+    if "_parts" not in view:
+        prepare_view(view)
+    return view["_parts"]
@@ -69,3 +69,4 @@ class ClockScene:
                 CLOCK_POSITION[1],
                 scale=CLOCK_FONT_SCALE
             )
+            self._dirty = True
@@ -73,3 +73,4 @@ class DateScene:
                 DATE_POSITION[1],
                 scale=DATE_FONT_SCALE
             )
+            self._dirty = True
@@ -7,28 +7,52 @@ from setup import colours, screen
 # Layout constants
 LOADING_PULSE_POSITION = (screen.WIDTH - 2, 1)
 LOADING_PULSE_COLOUR = colours.WHITE
+LOADING_STALE_COLOUR = colours.ORANGE_DARK  # steady while showing snapshot data
 
 
 class LoadingPulseScene:
     def __init__(self):
         super().__init__()
+        self._loading_pulse_lit = False
 
     @Animator.KeyFrame.add(1)
     def loading_pulse(self, count):
         """Flash a pixel to indicate loading activity"""
+        # Steady marker while the flights shown are from the warm-start snapshot
+        if self.overhead.stale and not self.overhead.processing:
+            if not self._loading_pulse_lit:
+                pen = self.display.create_pen(
+                    LOADING_STALE_COLOUR.red,
+                    LOADING_STALE_COLOUR.green,
+                    LOADING_STALE_COLOUR.blue
+                )
+                self.display.set_pen(pen)
+                self.display.pixel(
+                    LOADING_PULSE_POSITION[0],
+                    LOADING_PULSE_POSITION[1]
+                )
+                self._loading_pulse_lit = True
+                self._dirty = True
+            return
+
         # Only show when processing
         if not self.overhead.processing:
-            # Clear the indicator
-            black_pen = self.display.create_pen(0, 0, 0)
-            self.display.set_pen(black_pen)
-            self.display.pixel(
-                LOADING_PULSE_POSITION[0],
-                LOADING_PULSE_POSITION[1]
-            )
+            # Clear the indicator (only if it was left lit)
+            if self._loading_pulse_lit:
+                black_pen = self.display.create_pen(0, 0, 0)
+                self.display.set_pen(black_pen)
+                self.display.pixel(
+                    LOADING_PULSE_POSITION[0],
+                    LOADING_PULSE_POSITION[1]
+                )
+                self._loading_pulse_lit = False
+                self._dirty = True
             return
 
         # Pulse on/off
-        if count % 2:
+        self._loading_pulse_lit = bool(count % 2)
+        self._dirty = True
+        if self._loading_pulse_lit:
             pen = self.display.create_pen(
                 LOADING_PULSE_COLOUR.red,
                 LOADING_PULSE_COLOUR.green,
@@ -2,6 +2,7 @@
 # Ported from FlightTracker for Interstate 75 W
 
 from utilities.animator import Animator
+from utilities.flashtable import FlashTable
 from setup import colours, fonts, screen
 
 # Layout constants - matching original project
@@ -12,164 +13,24 @@ PLANE_TEXT_HEIGHT = 9
 PLANE_FONT = fonts.REGULAR
 PLANE_FONT_SCALE = fonts.REGULAR_SCALE
 
+# Configuration
+try:
+    from config import JOURNEY_CITY_TICKER
+except ImportError:
+    JOURNEY_CITY_TICKER = False  # prefix the ticker with "Origin > Destination" cities
+
+try:
+    from config import ROUTE_INFO_ENABLED
+except ImportError:
+    ROUTE_INFO_ENABLED = True    # route length and time to destination
+
+# ICAO type designator -> friendly name, on flash (see tools/build_tables.py)
+AIRCRAFT_TYPES_FILE = "data/aircraft_types.bin"
+_aircraft_types = FlashTable(AIRCRAFT_TYPES_FILE)
+
 # Compass directions (8 directions, 45 deg each)
 COMPASS_DIRECTIONS = ["North", "NE", "East", "SE", "South", "SW", "West", "NW"]
 
-# Aircraft type code to friendly name lookup
-# Common commercial aircraft types
-AIRCRAFT_NAMES = {
-    # Boeing
-    "B731": "Boeing 737-100",
-    "B732": "Boeing 737-200",
-    "B733": "Boeing 737-300",
-    "B734": "Boeing 737-400",
-    "B735": "Boeing 737-500",
-    "B736": "Boeing 737-600",
-    "B737": "Boeing 737-700",
-    "B738": "Boeing 737-800",
-    "B739": "Boeing 737-900",
-    "B37M": "Boeing 737 MAX 7",
-    "B38M": "Boeing 737 MAX 8",
-    "B39M": "Boeing 737 MAX 9",
-    "B3XM": "Boeing 737 MAX 10",
-    "B741": "Boeing 747-100",
-    "B742": "Boeing 747-200",
-    "B743": "Boeing 747-300",
-    "B744": "Boeing 747-400",
-    "B748": "Boeing 747-8",
-    "B752": "Boeing 757-200",
-    "B753": "Boeing 757-300",
-    "B762": "Boeing 767-200",
-    "B763": "Boeing 767-300",
-    "B764": "Boeing 767-400",
-    "B772": "Boeing 777-200",
-    "B773": "Boeing 777-300",
-    "B77L": "Boeing 777-200LR",
-    "B77W": "Boeing 777-300ER",
-    "B778": "Boeing 777-8",
-    "B779": "Boeing 777-9",
-    "B788": "Boeing 787-8 Dreamliner",
-    "B789": "Boeing 787-9 Dreamliner",
-    "B78X": "Boeing 787-10 Dreamliner",
-    # Airbus
-    "A124": "Antonov An-124",
-    "A139": "AgustaWestland AW139",
-    "A140": "Antonov An-140",
-    "A148": "Antonov An-148",
-    "A158": "Antonov An-158",
-    "A19N": "Airbus A319neo",
-    "A20N": "Airbus A320neo",
-    "A21N": "Airbus A321neo",
-    "A221": "Airbus A220-100",
-    "A223": "Airbus A220-300",
-    "A306": "Airbus A300-600",
-    "A310": "Airbus A310",
-    "A318": "Airbus A318",
-    "A319": "Airbus A319",
-    "A320": "Airbus A320",
-    "A321": "Airbus A321",
-    "A332": "Airbus A330-200",
-    "A333": "Airbus A330-300",
-    "A338": "Airbus A330-800neo",
-    "A339": "Airbus A330-900neo",
-    "A342": "Airbus A340-200",
-    "A343": "Airbus A340-300",
-    "A345": "Airbus A340-500",
-    "A346": "Airbus A340-600",
-    "A359": "Airbus A350-900",
-    "A35K": "Airbus A350-1000",
-    "A380": "Airbus A380",
-    "A388": "Airbus A380-800",
-    # Embraer
-    "E135": "Embraer ERJ-135",
-    "E145": "Embraer ERJ-145",
-    "E170": "Embraer E170",
-    "E175": "Embraer E175",
-    "E190": "Embraer E190",
-    "E195": "Embraer E195",
-    "E290": "Embraer E190-E2",
-    "E295": "Embraer E195-E2",
-    # Bombardier/De Havilland
-    "CRJ1": "Bombardier CRJ-100",
-    "CRJ2": "Bombardier CRJ-200",
-    "CRJ7": "Bombardier CRJ-700",
-    "CRJ9": "Bombardier CRJ-900",
-    "CRJX": "Bombardier CRJ-1000",
-    "DH8A": "De Havilland Dash 8-100",
-    "DH8B": "De Havilland Dash 8-200",
-    "DH8C": "De Havilland Dash 8-300",
-    "DH8D": "De Havilland Dash 8-400",
-    # ATR
-    "AT43": "ATR 42-300",
-    "AT45": "ATR 42-500",
-    "AT46": "ATR 42-600",
-    "AT72": "ATR 72-200",
-    "AT75": "ATR 72-500",
-    "AT76": "ATR 72-600",
-    # Other commercial
-    "B461": "BAe 146-100",
-    "B462": "BAe 146-200",
-    "B463": "BAe 146-300",
-    "RJ85": "Avro RJ85",
-    "RJ1H": "Avro RJ100",
-    "F100": "Fokker 100",
-    "F70": "Fokker 70",
-    "MD11": "McDonnell Douglas MD-11",
-    "MD80": "McDonnell Douglas MD-80",
-    "MD82": "McDonnell Douglas MD-82",
-    "MD83": "McDonnell Douglas MD-83",
-    "MD87": "McDonnell Douglas MD-87",
-    "MD88": "McDonnell Douglas MD-88",
-    "MD90": "McDonnell Douglas MD-90",
-    "DC10": "McDonnell Douglas DC-10",
-    # Business jets
-    "C525": "Cessna CitationJet",
-    "C550": "Cessna Citation II",
-    "C560": "Cessna Citation V",
-    "C56X": "Cessna Citation Excel",
-    "C680": "Cessna Citation Sovereign",
-    "C750": "Cessna Citation X",
-    "CL30": "Bombardier Challenger 300",
-    "CL35": "Bombardier Challenger 350",
-    "CL60": "Bombardier Challenger 600",
-    "GL5T": "Bombardier Global 5000",
-    "GL7T": "Bombardier Global 7500",
-    "GLEX": "Bombardier Global Express",
-    "G150": "Gulfstream G150",
-    "G280": "Gulfstream G280",
-    "GLF4": "Gulfstream G-IV",
-    "GLF5": "Gulfstream G-V",
-    "GLF6": "Gulfstream G650",
-    "LJ35": "Learjet 35",
-    "LJ45": "Learjet 45",
-    "LJ60": "Learjet 60",
-    "FA7X": "Dassault Falcon 7X",
-    "F900": "Dassault Falcon 900",
-    "F2TH": "Dassault Falcon 2000",
-    "PC12": "Pilatus PC-12",
-    "PC24": "Pilatus PC-24",
-    "PRM1": "Beechcraft Premier I",
-    "BE40": "Beechcraft Beechjet 400",
-    # Military/cargo
-    "C17": "Boeing C-17 Globemaster",
-    "C130": "Lockheed C-130 Hercules",
-    "C5": "Lockheed C-5 Galaxy",
-    "A400": "Airbus A400M Atlas",
-    "KC10": "McDonnell Douglas KC-10",
-    "KC35": "Boeing KC-135 Stratotanker",
-    "E3CF": "Boeing E-3 Sentry AWACS",
-    "P8": "Boeing P-8 Poseidon",
-    # Helicopters
-    "S92": "Sikorsky S-92",
-    "S76": "Sikorsky S-76",
-    "EC35": "Eurocopter EC135",
-    "EC45": "Eurocopter EC145",
-    "AS32": "Eurocopter AS332 Super Puma",
-    "H160": "Airbus H160",
-    "R44": "Robinson R44",
-    "R66": "Robinson R66",
-}
-
 # Arrow dimensions for vertical speed indicator
 ARROW_WIDTH = 5
 ARROW_HEIGHT = 7
@@ -182,6 +43,8 @@ class PlaneDetailsScene:
         super().__init__()
         self.plane_position = screen.WIDTH
         self._data_all_looped = False
+        self._plane_text_flight = None
+        self._plane_text = ""
 
     def _draw_arrow(self, x, y, pointing_up):
         """Draw a triangular arrow at position (x, y)"""
@@ -225,15 +88,32 @@ class PlaneDetailsScene:
             self.display.pixel(x + 2, y + 6)
 
     def _build_plane_text(self, flight):
-        """Build the scrolling text with plane, speed, heading, and altitude (no arrow)"""
+        """Build the scrolling text: cities, airline, plane, country, speed, heading, route (no altitude/arrow)"""
         parts = []
 
+        # Origin/destination cities
+        if JOURNEY_CITY_TICKER:
+            origin_city = flight.get("origin_city", "")
+            destination_city = flight.get("destination_city", "")
+            if origin_city or destination_city:
+                parts.append(f"{origin_city or '?'} > {destination_city or '?'}")
+
+        # Operator, from the callsign prefix
+        airline = flight.get("airline", "")
+        if airline:
+            parts.append(airline)
+
         # Aircraft type - look up friendly name or use code
         plane_code = flight.get("plane", "")
         if plane_code:
-            plane_name = AIRCRAFT_NAMES.get(plane_code.upper(), plane_code)
+            plane_name = _aircraft_types.text(plane_code.upper(), plane_code)
             parts.append(plane_name)
 
+        # Country of registration, from the ICAO address block
+        country = flight.get("country", "")
+        if country:
+            parts.append(country)
+
         # Speed (knots)
         speed = flight.get("velocity", 0)
         if speed:
@@ -247,6 +127,15 @@ class PlaneDetailsScene:
             index = int((heading + 22.5) / 45) % 8
             parts.append(COMPASS_DIRECTIONS[index])
 
+        # Route length and time to destination
+        if ROUTE_INFO_ENABLED:
+            route_km = flight.get("route_km")
+            if route_km:
+                parts.append(f"{route_km}km")
+            eta = flight.get("eta")
+            if eta is not None:
+                parts.append(f"ETA {eta // 60}h{eta % 60:02d}" if eta >= 60 else f"ETA {eta}m")
+
         return "  ".join(parts) if parts else ""
 
     def _build_altitude_text(self, flight):
@@ -264,7 +153,12 @@ class PlaneDetailsScene:
             return
 
         flight = self._data[self._data_index]
-        plane_text = self._build_plane_text(flight)
+
+        # The text only changes with the flight - build it once per flight
+        if flight is not self._plane_text_flight:
+            self._plane_text = self._build_plane_text(flight)
+            self._plane_text_flight = flight
+        plane_text = self._plane_text
         altitude_text = self._build_altitude_text(flight)
         vertical_speed = flight.get("vertical_speed", 0)
 
@@ -2,10 +2,11 @@
 # Ported from FlightTracker for Interstate 75 W
 
 import time
+from array import array
 
 from utilities.animator import Animator
 from utilities.https import https_get_json
-from setup import colours, fonts, screen
+from setup import colours, fonts, frames, screen
 
 # Configuration
 try:
@@ -28,8 +29,15 @@ if TEMPERATURE_UNITS not in ("metric", "imperial"):
 # Open-Meteo API (free, no API key required)
 OPENMETEO_HOST = "api.open-meteo.com"
 OPENMETEO_PATH = "/v1/forecast"
-WEATHER_RETRIES = 3
-WEATHER_REFRESH_SECONDS = 300  # 5 minutes
+
+# One request fetches an hourly table; "current" readings are served from
+# it as the clock advances. Revalidating it is a blocking HTTPS request, so
+# it is only done where the display already waits on the network (see
+# WeatherScene.weather_fetch), never from a keyframe of its own
+FORECAST_HOURS = 48
+FORECAST_DAYS = 3               # daily high/low covering the hourly window
+WEATHER_REVALIDATE_SECONDS = 3 * 3600
+WEATHER_RETRY_SECONDS = 300     # wait after a failed fetch (old table kept)
 
 # Layout constants - static temperature top right
 TEMPERATURE_FONT = fonts.XLARGE
@@ -94,96 +102,195 @@ TEMPERATURE_COLOURS = (
     (30, colours.ORANGE),
 )
 
-# Cache for weather data
+# Gap between ticker segments
+TICKER_SPACING = "  "
+
+
+def _gradient_colour(temp):
+    """Interpolate TEMPERATURE_COLOURS for a temperature"""
+    min_temp = TEMPERATURE_COLOURS[0][0]
+    max_temp = TEMPERATURE_COLOURS[1][0]
+    min_colour = TEMPERATURE_COLOURS[0][1]
+    max_colour = TEMPERATURE_COLOURS[1][1]
+
+    for i in range(1, len(TEMPERATURE_COLOURS) - 1):
+        if temp > TEMPERATURE_COLOURS[i][0]:
+            min_temp = TEMPERATURE_COLOURS[i][0]
+            max_temp = TEMPERATURE_COLOURS[i + 1][0]
+            min_colour = TEMPERATURE_COLOURS[i][1]
+            max_colour = TEMPERATURE_COLOURS[i + 1][1]
+
+    if temp > max_temp:
+        ratio = 1
+    elif temp > min_temp:
+        ratio = (temp - min_temp) / (max_temp - min_temp)
+    else:
+        ratio = 0
+
+    return colours.Color(
+        min_colour.red + int((max_colour.red - min_colour.red) * ratio),
+        min_colour.green + int((max_colour.green - min_colour.green) * ratio),
+        min_colour.blue + int((max_colour.blue - min_colour.blue) * ratio),
+    )
+
+
+# Temperature colours packed as 0xRRGGBB every 0.1 degree across the
+# gradient (Open-Meteo reports one decimal place). Temperatures outside
+# it clamp to the end colours, as the gradient itself does
+TEMPERATURE_LUT_SCALE = 10
+TEMPERATURE_LUT_MIN = TEMPERATURE_COLOURS[0][0] * TEMPERATURE_LUT_SCALE
+TEMPERATURE_LUT = array("L", [
+    (c.red << 16) | (c.green << 8) | c.blue
+    for c in (
+        _gradient_colour(t / TEMPERATURE_LUT_SCALE)
+        for t in range(TEMPERATURE_LUT_MIN, TEMPERATURE_COLOURS[-1][0] * TEMPERATURE_LUT_SCALE + 1)
+    )
+])
+
+
+# Cached forecast table - see fetch_forecast() for the layout
 _weather_cache = {
-    "data": None,
-    "timestamp": 0,
-    "ttl": 300  # 5 minutes
+    "forecast": None,
+    "timestamp": 0,     # when the table was fetched
+    "retry_at": 0,      # no fetch attempts before this after a failure
 }
 
 
-def grab_weather_data(lat, lon, units="metric"):
-    """
-    Get comprehensive weather data from Open-Meteo API.
+def cached_weather():
+    """Cached forecast and its fetch time, for the warm-start snapshot"""
+    return _weather_cache["forecast"], _weather_cache["timestamp"]
 
-    Returns dict with: temperature, temp_high, temp_low, condition, rain_probability,
-                       wind_speed, wind_direction, humidity
-    """
-    now = time.time()
 
-    # Return cached data if still valid
-    if (_weather_cache["data"] is not None and
-            now - _weather_cache["timestamp"] < _weather_cache["ttl"]):
-        return _weather_cache["data"]
+def restore_weather(forecast, timestamp):
+    """Seed the cache from a warm-start snapshot (revalidated when stale)"""
+    _weather_cache["forecast"] = forecast
+    _weather_cache["timestamp"] = timestamp
+
+
+def fetch_forecast(lat, lon, units="metric"):
+    """
+    Fetch the hourly forecast table from Open-Meteo (single attempt).
 
+    Returns dict with "time" (epoch of the first hour), hourly lists
+    temperature, weather_code, wind_speed, wind_direction, humidity and
+    rain_probability, and daily lists daily_time, temp_high, temp_low -
+    or None on failure.
+    """
     # Open-Meteo uses temperature_unit parameter
     temp_unit = "celsius" if units == "metric" else "fahrenheit"
     wind_unit = "kmh" if units == "metric" else "mph"
 
-    # Request current weather, daily high/low, and hourly precipitation probability
     path = (
         f"{OPENMETEO_PATH}"
         f"?latitude={lat}"
         f"&longitude={lon}"
-        f"&current=temperature_2m,weather_code,wind_speed_10m,wind_direction_10m,relative_humidity_2m"
+        f"&hourly=temperature_2m,weather_code,wind_speed_10m,wind_direction_10m,"
+        f"relative_humidity_2m,precipitation_probability"
         f"&daily=temperature_2m_max,temperature_2m_min"
-        f"&hourly=precipitation_probability"
-        f"&forecast_days=1"
-        f"&forecast_hours=1"
+        f"&forecast_hours={FORECAST_HOURS}"
+        f"&forecast_days={FORECAST_DAYS}"
+        f"&timeformat=unixtime"
         f"&temperature_unit={temp_unit}"
         f"&wind_speed_unit={wind_unit}"
     )
 
-    retries = WEATHER_RETRIES
-
-    while retries > 0:
-        try:
-            data = https_get_json(OPENMETEO_HOST, path)
-            if data and "current" in data:
-                current = data["current"]
-
-                # Get precipitation probability from hourly (first hour)
-                rain_prob = 0
-                if "hourly" in data and "precipitation_probability" in data["hourly"]:
-                    probs = data["hourly"]["precipitation_probability"]
-                    if probs and len(probs) > 0:
-                        rain_prob = probs[0] or 0
-
-                # Get daily high/low
-                temp_high = None
-                temp_low = None
-                if "daily" in data:
-                    daily = data["daily"]
-                    if "temperature_2m_max" in daily and daily["temperature_2m_max"]:
-                        temp_high = daily["temperature_2m_max"][0]
-                    if "temperature_2m_min" in daily and daily["temperature_2m_min"]:
-                        temp_low = daily["temperature_2m_min"][0]
-
-                weather = {
-                    "temperature": current.get("temperature_2m"),
-                    "temp_high": temp_high,
-                    "temp_low": temp_low,
-                    "weather_code": current.get("weather_code", 0),
-                    "wind_speed": current.get("wind_speed_10m", 0),
-                    "wind_direction": current.get("wind_direction_10m", 0),
-                    "humidity": current.get("relative_humidity_2m", 0),
-                    "rain_probability": rain_prob,
-                }
-
-                _weather_cache["data"] = weather
-                _weather_cache["timestamp"] = now
-
-                condition = WMO_CONDITIONS.get(weather["weather_code"], "Unknown")
-                unit_str = "km/h" if units == "metric" else "mph"
-                print("Weather: " + str(weather["temperature"]) + "deg (H:" + str(temp_high) + " L:" + str(temp_low) + "), " + condition + ", Wind " + str(weather["wind_speed"]) + unit_str + ", Rain " + str(rain_prob) + "%, Humidity " + str(weather["humidity"]) + "%")
-
-                return weather
-        except Exception as e:
-            print(f"Open-Meteo error: {e}")
-        retries -= 1
-        time.sleep(0.5)
-
-    return None
+    try:
+        data = https_get_json(OPENMETEO_HOST, path)
+        hourly = data["hourly"]
+        daily = data["daily"]
+        if not hourly["time"] or not daily["time"]:
+            return None
+        return {
+            "time": hourly["time"][0],
+            "temperature": hourly["temperature_2m"],
+            "weather_code": hourly["weather_code"],
+            "wind_speed": hourly["wind_speed_10m"],
+            "wind_direction": hourly["wind_direction_10m"],
+            "humidity": hourly["relative_humidity_2m"],
+            "rain_probability": hourly["precipitation_probability"],
+            "daily_time": daily["time"],
+            "temp_high": daily["temperature_2m_max"],
+            "temp_low": daily["temperature_2m_min"],
+        }
+    except Exception as e:
+        print(f"Open-Meteo error: {e}")
+        return None
+
+
+def weather_at(forecast, now):
+    """
+    Weather readings for a moment in time from the forecast table.
+
+    Times outside the table are clamped to its first/last entry, so an
+    old table keeps serving its nearest values.
+
+    Returns dict with: temperature, temp_high, temp_low, weather_code,
+                       wind_speed, wind_direction, humidity, rain_probability
+    """
+    hour = (now - forecast["time"]) // 3600
+    hour = int(min(max(hour, 0), len(forecast["temperature"]) - 1))
+
+    day = 0
+    daily_time = forecast["daily_time"]
+    while day + 1 < len(daily_time) and daily_time[day + 1] <= now:
+        day += 1
+
+    return {
+        "temperature": forecast["temperature"][hour],
+        "temp_high": forecast["temp_high"][day],
+        "temp_low": forecast["temp_low"][day],
+        "weather_code": forecast["weather_code"][hour] or 0,
+        "wind_speed": forecast["wind_speed"][hour] or 0,
+        "wind_direction": forecast["wind_direction"][hour] or 0,
+        "humidity": forecast["humidity"][hour] or 0,
+        "rain_probability": forecast["rain_probability"][hour] or 0,
+    }
+
+
+def weather_stale(now=None):
+    """True if the forecast should be revalidated (and a retry is allowed)"""
+    if now is None:
+        now = time.time()
+    if now < _weather_cache["retry_at"]:
+        return False
+    age = now - _weather_cache["timestamp"]
+    # A negative age means the clock moved back (e.g. before NTP) - refetch
+    return _weather_cache["forecast"] is None or age < 0 or age > WEATHER_REVALIDATE_SECONDS
+
+
+def revalidate_weather(lat, lon, units="metric"):
+    """Refetch the forecast table, keeping the old one if the fetch fails (blocks)"""
+    now = time.time()
+    forecast = fetch_forecast(lat, lon, units)
+    if forecast is None:
+        _weather_cache["retry_at"] = now + WEATHER_RETRY_SECONDS
+        return False
+
+    _weather_cache["forecast"] = forecast
+    _weather_cache["timestamp"] = now
+    _weather_cache["retry_at"] = 0
+
+    weather = weather_at(forecast, now)
+    condition = WMO_CONDITIONS.get(weather["weather_code"], "Unknown")
+    unit_str = "km/h" if units == "metric" else "mph"
+    print("Weather: " + str(len(forecast["temperature"])) + "h forecast, now " + str(weather["temperature"]) + "deg (H:" + str(weather["temp_high"]) + " L:" + str(weather["temp_low"]) + "), " + condition + ", Wind " + str(weather["wind_speed"]) + unit_str + ", Rain " + str(weather["rain_probability"]) + "%, Humidity " + str(weather["humidity"]) + "%")
+    return True
+
+
+def grab_weather_data(lat, lon, units="metric"):
+    """
+    Get current weather, revalidating the forecast table first if stale.
+
+    Returns dict with: temperature, temp_high, temp_low, condition, rain_probability,
+                       wind_speed, wind_direction, humidity (None if never fetched)
+    """
+    if weather_stale():
+        revalidate_weather(lat, lon, units)
+
+    forecast = _weather_cache["forecast"]
+    if forecast is None:
+        return None
+    return weather_at(forecast, time.time())
 
 
 class WeatherScene:
@@ -191,8 +298,10 @@ class WeatherScene:
         super().__init__()
         self._weather_data = None
         self._weather_position = screen.WIDTH
-        self._last_weather_fetch = 0
         self._last_temperature_str = None
+        self._ticker_weather = None
+        self._ticker_segments = ()
+        self._ticker_width = 0
 
     def colour_gradient(self, colour_A, colour_B, ratio):
         """Interpolate between two colours"""
@@ -202,27 +311,14 @@ class WeatherScene:
         return colours.Color(r, g, b)
 
     def temperature_to_colour(self, temp):
-        """Map temperature to colour"""
-        min_temp = TEMPERATURE_COLOURS[0][0]
-        max_temp = TEMPERATURE_COLOURS[1][0]
-        min_colour = TEMPERATURE_COLOURS[0][1]
-        max_colour = TEMPERATURE_COLOURS[1][1]
-
-        for i in range(1, len(TEMPERATURE_COLOURS) - 1):
-            if temp > TEMPERATURE_COLOURS[i][0]:
-                min_temp = TEMPERATURE_COLOURS[i][0]
-                max_temp = TEMPERATURE_COLOURS[i + 1][0]
-                min_colour = TEMPERATURE_COLOURS[i][1]
-                max_colour = TEMPERATURE_COLOURS[i + 1][1]
-
-        if temp > max_temp:
-            ratio = 1
-        elif temp > min_temp:
-            ratio = (temp - min_temp) / (max_temp - min_temp)
-        else:
-            ratio = 0
-
-        return self.colour_gradient(min_colour, max_colour, ratio)
+        """Map temperature to colour (nearest 0.1 degree, via the LUT)"""
+        index = round(temp * TEMPERATURE_LUT_SCALE) - TEMPERATURE_LUT_MIN
+        if index < 0:
+            index = 0
+        elif index >= len(TEMPERATURE_LUT):
+            index = len(TEMPERATURE_LUT) - 1
+        rgb = TEMPERATURE_LUT[index]
+        return colours.Color(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
 
     def wind_to_colour(self, speed):
         """Map wind speed to colour"""
@@ -231,17 +327,83 @@ class WeatherScene:
                 return WIND_COLOURS[i][1]
         return WIND_COLOURS[0][1]
 
-    def _draw_weather_segment(self, text, x, y, colour, font, scale):
-        """Draw a text segment and return its width"""
-        pen = self.display.create_pen(
-            int(colour.red),
-            int(colour.green),
-            int(colour.blue)
-        )
-        self.display.set_pen(pen)
-        self.display.set_font(font)
-        self.display.text(text, x, y, scale=scale)
-        return self.display.measure_text(text, scale=scale)
+    def _pen(self, colour):
+        return self.display.create_pen(colour.red, colour.green, colour.blue)
+
+    def _build_weather_ticker(self, weather):
+        """
+        Precompose the scrolling weather line.
+
+        Returns:
+            (segments, total_width) - segments are (text, pen, x_offset, width)
+        """
+        self.display.set_font(SCROLL_FONT)
+        spacing = self.display.measure_text(TICKER_SPACING, scale=SCROLL_FONT_SCALE)
+        parts = []
+
+        # Condition (white)
+        condition = WMO_CONDITIONS.get(weather.get("weather_code", 0), "")
+        if condition:
+            parts.append((condition, colours.WHITE))
+
+        # High/Low temperatures
+        temp_high = weather.get("temp_high")
+        temp_low = weather.get("temp_low")
+        if temp_high is not None and temp_low is not None:
+            parts.append((f"H:{round(temp_high)}", self.temperature_to_colour(temp_high)))
+            parts.append((f"L:{round(temp_low)}", self.temperature_to_colour(temp_low)))
+
+        # Rain probability (blue)
+        parts.append((f"{weather.get('rain_probability', 0)}%Rain", colours.BLUE_LIGHT))
+
+        # Wind speed and direction (colour based on speed)
+        wind_speed = weather.get("wind_speed", 0)
+        dir_index = int((weather.get("wind_direction", 0) + 22.5) / 45) % 8
+        wind_unit = "km/h" if TEMPERATURE_UNITS == "metric" else "mph"
+        parts.append((
+            str(int(wind_speed)) + wind_unit + " " + WIND_DIRECTIONS[dir_index],
+            self.wind_to_colour(wind_speed),
+        ))
+
+        # Humidity (cyan)
+        parts.append((f"{weather.get('humidity', 0)}%RH", colours.CYAN))
+
+        segments = []
+        offset = 0
+        for text, colour in parts:
+            width = self.display.measure_text(text, scale=SCROLL_FONT_SCALE)
+            segments.append((text, self._pen(colour), offset, width))
+            offset += width + spacing
+
+        # No gap after the last segment
+        return tuple(segments), offset - spacing
+
+    def weather_fetch(self):
+        """
+        Revalidate the forecast table if it is stale.
+
+        This is a blocking HTTPS request (the TLS handshake alone takes
+        most of a second on the board), so it is called only where the
+        display is already stopped for the network: straight after a
+        flight fetch and when the link comes up. A follower panel gets its
+        table from the leader instead.
+        """
+        if not self.wifi.connected or self.overhead.following or not weather_stale():
+            return
+        if revalidate_weather(WEATHER_LAT, WEATHER_LON, TEMPERATURE_UNITS):
+            self._weather_data = weather_at(_weather_cache["forecast"], time.time())
+
+    @Animator.KeyFrame.add(frames.PER_SECOND * 60)
+    def weather_refresh(self, count):
+        """Move the current reading along the forecast table (no network access)"""
+        forecast, fetched = self.overhead.pushed_forecast()
+        if fetched > _weather_cache["timestamp"]:
+            # Newer table from the LAN relay or the lead panel
+            restore_weather(forecast, fetched)
+
+        forecast = _weather_cache["forecast"]
+        if forecast is not None:
+            self._weather_data = weather_at(forecast, time.time())
 
     @Animator.KeyFrame.add(1)
     def temperature_static(self, count):
@@ -251,12 +413,6 @@ class WeatherScene:
             self._last_temperature_str = None
             return
 
-        # Refresh weather data periodically
-        now = time.time()
-        if self._weather_data is None or (now - self._last_weather_fetch) > WEATHER_REFRESH_SECONDS:
-            self._weather_data = grab_weather_data(WEATHER_LAT, WEATHER_LON, TEMPERATURE_UNITS)
-            self._last_weather_fetch = now
-
         if self._weather_data is None:
             return
 
@@ -283,13 +439,7 @@ class WeatherScene:
             )
 
         # Draw new temperature
-        temp_colour = self.temperature_to_colour(temp)
-        pen = self.display.create_pen(
-            int(temp_colour.red),
-            int(temp_colour.green),
-            int(temp_colour.blue)
-        )
-        self.display.set_pen(pen)
+        self.display.set_pen(self._pen(self.temperature_to_colour(temp)))
         self.display.set_font(TEMPERATURE_FONT)
         self.display.text(
             temp_str,
@@ -299,6 +449,7 @@ class WeatherScene:
         )
 
         self._last_temperature_str = temp_str
+        self._dirty = True
 
     @Animator.KeyFrame.add(1)
     def weather_scroll(self, count):
@@ -311,6 +462,10 @@ class WeatherScene:
         if self._weather_data is None:
             return
 
+        # The ticker alone doesn't hold off idle mode (see Display.sync):
+        # its redraws go out through _ticker_moved, not _dirty
+        dirty = self._dirty
+
         # Clear the scrolling area (middle row only)
         self.draw_square(
             0,
@@ -320,68 +475,30 @@ class WeatherScene:
             colours.BLACK,
         )
 
-        self.display.set_font(SCROLL_FONT)
-        x_pos = self._weather_position
-        y_pos = SCROLL_Y_POS
-
-        # Build and draw weather segments with different colours
-        total_width = 0
-        spacing = self.display.measure_text("  ", scale=SCROLL_FONT_SCALE)
-
-        # Condition (white)
-        weather_code = self._weather_data.get("weather_code", 0)
-        condition = WMO_CONDITIONS.get(weather_code, "")
-        if condition:
-            width = self._draw_weather_segment(condition, x_pos, y_pos, colours.WHITE, SCROLL_FONT, SCROLL_FONT_SCALE)
-            x_pos += width + spacing
-            total_width += width + spacing
-
-        # High/Low temperatures
-        temp_high = self._weather_data.get("temp_high")
-        temp_low = self._weather_data.get("temp_low")
-        if temp_high is not None and temp_low is not None:
-            # High in orange/red
-            high_text = f"H:{round(temp_high)}"
-            high_colour = self.temperature_to_colour(temp_high)
-            width = self._draw_weather_segment(high_text, x_pos, y_pos, high_colour, SCROLL_FONT, SCROLL_FONT_SCALE)
-            x_pos += width + spacing
-            total_width += width + spacing
-
-            # Low in blue
-            low_text = f"L:{round(temp_low)}"
-            low_colour = self.temperature_to_colour(temp_low)
-            width = self._draw_weather_segment(low_text, x_pos, y_pos, low_colour, SCROLL_FONT, SCROLL_FONT_SCALE)
-            x_pos += width + spacing
-            total_width += width + spacing
-
-        # Rain probability (blue)
-        rain_prob = self._weather_data.get("rain_probability", 0)
-        rain_text = f"{rain_prob}%Rain"
-        width = self._draw_weather_segment(rain_text, x_pos, y_pos, colours.BLUE_LIGHT, SCROLL_FONT, SCROLL_FONT_SCALE)
-        x_pos += width + spacing
-        total_width += width + spacing
-
-        # Wind speed and direction (colour based on speed)
-        wind_speed = self._weather_data.get("wind_speed", 0)
-        wind_dir = self._weather_data.get("wind_direction", 0)
-        # Convert degrees to compass direction
-        dir_index = int((wind_dir + 22.5) / 45) % 8
-        wind_compass = WIND_DIRECTIONS[dir_index]
-        wind_unit = "km/h" if TEMPERATURE_UNITS == "metric" else "mph"
-        wind_text = str(int(wind_speed)) + wind_unit + " " + wind_compass
-        wind_colour = self.wind_to_colour(wind_speed)
-        width = self._draw_weather_segment(wind_text, x_pos, y_pos, wind_colour, SCROLL_FONT, SCROLL_FONT_SCALE)
-        x_pos += width + spacing
-        total_width += width + spacing
+        # Rebuild the ticker only when the readings change
+        if self._weather_data is not self._ticker_weather:
+            if self._weather_data != self._ticker_weather:
+                self._ticker_segments, self._ticker_width = \
+                    self._build_weather_ticker(self._weather_data)
+            self._ticker_weather = self._weather_data
 
-        # Humidity (cyan)
-        humidity = self._weather_data.get("humidity", 0)
-        humidity_text = f"{humidity}%RH"
-        width = self._draw_weather_segment(humidity_text, x_pos, y_pos, colours.CYAN, SCROLL_FONT, SCROLL_FONT_SCALE)
-        total_width += width
-
-        # Handle scrolling
-        self._weather_position -= 1
-
-        if self._weather_position + total_width < 0:
+        self.display.set_font(SCROLL_FONT)
+        x_base = self._weather_position
+        for text, pen, offset, width in self._ticker_segments:
+            x_pos = x_base + offset
+            # Skip segments scrolled off either edge
+            if x_pos >= screen.WIDTH:
+                break
+            if x_pos + width < 0:
+                continue
+            self.display.set_pen(pen)
+            self.display.text(text, x_pos, SCROLL_Y_POS, scale=SCROLL_FONT_SCALE)
+
+        self._dirty = dirty
+        self._ticker_moved = True
+
+        # Handle scrolling - a pixel per frame, also across an idle stride
+        self._weather_position -= self.frame_stride
+
+        if self._weather_position + self._ticker_width < 0:
             self._weather_position = screen.WIDTH
@@ -3,3 +3,10 @@
 
 PERIOD = 0.1  # 100ms per frame (10 FPS)
 PER_SECOND = int(1 / PERIOD)  # 10 frames per second
+
+# Idle mode - when nothing has been drawn for IDLE_AFTER_FRAMES frames the
+# animator advances IDLE_FRAME_STRIDE frames per loop (2 FPS) until a scene
+# draws again or a button is pressed. The buttons are still read every
+# PERIOD in between (Animator.wait / Display.poll_input)
+IDLE_AFTER_FRAMES = PER_SECOND * 2
+IDLE_FRAME_STRIDE = 5
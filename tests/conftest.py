@@ -0,0 +1,8 @@
+# Host-side tests for the device modules - run from the repository root:
+#
+#   python -m pytest -q tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
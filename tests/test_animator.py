@@ -0,0 +1,81 @@
+# Animator idle mode: input is read every frame period between strides
+
+from utilities.animator import Animator, keyframe
+
+
+class _Scene(Animator):
+    def __init__(self):
+        self.ticks = 0
+        self.presses = []   # poll_input() results to hand out, in order
+        self.polls = 0
+        Animator.__init__(self)
+
+    @keyframe(1)
+    def tick(self, count):
+        self.ticks += 1
+
+    @keyframe(10)
+    def every_second(self, count):
+        pass
+
+    def poll_input(self):
+        self.polls += 1
+        return self.presses.pop(0) if self.presses else False
+
+
+def _sleeper(log):
+    return lambda seconds: log.append(seconds)
+
+
+def test_full_rate_wait_polls_nothing():
+    scene = _Scene()
+    slept = []
+    scene.step()
+    scene.wait(_sleeper(slept))
+    assert slept == [scene.delay]
+    assert scene.polls == 0
+
+
+def test_idle_wait_polls_input_every_period():
+    scene = _Scene()
+    scene.step()
+    scene.frame_stride = 5
+    scene.step()
+    slept = []
+    scene.wait(_sleeper(slept))
+    assert slept == [scene.delay] * 5
+    assert scene.polls == 4             # between each of the five periods
+    assert scene.frame == 6 and scene.frame_stride == 5
+
+
+def test_input_leaves_idle_mode_without_losing_time():
+    scene = _Scene()
+    scene.step()                        # frame 0 (resets)
+    scene.step()                        # frame 1
+    scene.frame_stride = 5
+    scene.step()                        # frame 2, next loop would be frame 7
+    scene.presses = [False, True]
+    slept = []
+    scene.wait(_sleeper(slept))
+
+    assert len(slept) == 2              # woke after the second period
+    assert scene.frame == 4             # two periods after frame 2
+    assert scene.frame_stride == 1
+    ticks = scene.ticks
+    scene.step()
+    assert scene.ticks == ticks + 1     # divisor-1 keyframes run on the next frame
+
+
+def test_profiler_records_every_step():
+    class _Sparse(Animator):
+        @keyframe(10)
+        def every_second(self, count):
+            pass
+
+    scene = _Sparse()
+    profiler = scene.enable_profiler()
+    for _ in range(30):
+        scene.step()
+    frame_slot = len(profiler.names)
+    assert profiler._calls[frame_slot] == 30            # empty frames included
+    assert profiler._calls[profiler.names.index("every_second")] == 2
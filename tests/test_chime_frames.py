@@ -0,0 +1,93 @@
+# Chimes play from the audio Timer while the display animates: a frame
+# never waits on playback and the sound queue stays bounded (utilities/audio.py)
+#
+# The emulator patches the time module for the whole process, so the run
+# happens in a subprocess; Timer callbacks and PWM writes only happen while
+# the display sleeps between frames, as on the board.
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+SCRIPT = r"""
+import sys
+sys.path.insert(0, sys.argv[1])
+
+import emulator
+clock = emulator.install()
+
+from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32
+from display import Display
+from emulator import fixtures
+from scenes import weather
+from utilities.audio import QUEUE_MAX, get_player
+
+weather.fetch_forecast = lambda lat, lon, units="metric": fixtures.weather_forecast(clock.time())
+display = Display(i75=Interstate75(display=DISPLAY_INTERSTATE75_64X32))
+display.snapshot.save = lambda *args: None
+overhead = display.overhead
+
+
+def grab_data():
+    overhead._data = [dict(f) for f in fixtures.FLIGHTS]
+    overhead._new_data = True
+    overhead._processing = False
+    overhead._last_fetch = clock.time()
+
+
+overhead.grab_data = grab_data
+grab_data()
+player = get_player()
+player._enabled = True  # without touching the saved setting
+
+ticks = [0]
+tick = player._tick
+
+
+def counted_tick(timer):
+    ticks[0] += 1
+    tick(timer)
+
+
+player._tick = counted_tick
+
+blocked = 0
+longest_queue = 0
+playing = 0
+for frame in range(600):
+    # Every second, ask for more than the queue holds
+    if frame % 10 == 0:
+        for name in ("new_flight", "emergency", "new_flight"):
+            player.play(name)
+        player.play_tone(880, 200)
+        longest_queue = max(longest_queue, len(player._queue))
+    before = clock.now_us
+    display.step()
+    if clock.now_us != before:
+        blocked += 1
+    longest_queue = max(longest_queue, len(player._queue))
+    playing += player.playing
+    display.wait(clock.sleep)
+    longest_queue = max(longest_queue, len(player._queue))
+
+print("RESULT", display.frame, blocked, longest_queue, QUEUE_MAX, playing, ticks[0])
+"""
+
+
+def test_chime_plays_without_blocking_a_frame(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, os.path.abspath(ROOT)],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = [line for line in result.stdout.splitlines() if line.startswith("RESULT")]
+    assert lines, result.stdout[-2000:]
+    frame, blocked, longest_queue, queue_max, playing, ticks = (int(v) for v in lines[0].split()[1:])
+
+    assert frame >= 590               # every loop stepped the animator
+    assert blocked == 0               # no step() spent (virtual) time waiting
+    assert 0 < longest_queue <= queue_max
+    assert playing > 300              # the sound really played under the frames
+    assert ticks > 1000               # audio Timer callbacks ran between them
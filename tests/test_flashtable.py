@@ -0,0 +1,62 @@
+# FlashTable on damaged files: every lookup misses, nothing raises and the
+# file isn't left open (utilities/flashtable.py)
+
+import struct
+
+import pytest
+
+from utilities import flashtable
+from utilities.flashtable import HEADER, MAGIC, FlashTable, pack_key
+
+
+def _table(records, key_size=3, value_size=4):
+    body = b"".join(pack_key(k, key_size) + v for k, v in sorted(records.items()))
+    return struct.pack(HEADER, MAGIC, key_size, 0, value_size, len(records)) + body
+
+
+GOOD = _table({"BAW": b"BA\0\0", "EZY": b"U2\0\0", "RYR": b"FR\0\0"})
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Files the table opens"""
+    files = []
+
+    def tracking_open(path, mode="r"):
+        f = open(path, mode)
+        files.append(f)
+        return f
+
+    monkeypatch.setattr(flashtable, "open", tracking_open, raising=False)
+    return files
+
+
+def test_good_table(tmp_path, opened):
+    path = tmp_path / "good.bin"
+    path.write_bytes(GOOD)
+    table = FlashTable(str(path))
+    assert table.lookup("EZY") == b"U2\0\0"
+    assert table.lookup("KLM") is None
+    assert len(opened) == 1 and not opened[0].closed
+
+
+@pytest.mark.parametrize("data, reason", [
+    (b"", "truncated header"),
+    (GOOD[:7], "truncated header"),
+    (b"XXXX" + GOOD[4:], "bad magic"),
+    (GOOD[:-2], "truncated records"),
+], ids=["empty", "short-header", "bad-magic", "short-records"])
+def test_damaged_table_misses_and_closes(tmp_path, opened, capsys, data, reason):
+    path = tmp_path / "damaged.bin"
+    path.write_bytes(data)
+    table = FlashTable(str(path))
+    assert table.lookup("BAW") is None
+    assert table.lookup("EZY") is None      # not retried
+    assert reason in capsys.readouterr().out
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_missing_table(tmp_path, capsys):
+    table = FlashTable(str(tmp_path / "missing.bin"))
+    assert table.lookup("BAW") is None
+    assert "unavailable" in capsys.readouterr().out
@@ -0,0 +1,76 @@
+# FLIGHT_FILTER compilation (utilities/flightfilter.py)
+
+import pytest
+
+from utilities.flightfilter import FR24_FIELDS, compile_filter
+
+
+def _flight(callsign="BAW123", aircraft_type="A320", altitude=12000, squawk="1234"):
+    return {"callsign": callsign, "aircraft_type": aircraft_type, "altitude": altitude,
+            "velocity": 300, "vertical_speed": 0, "squawk": squawk}
+
+
+def test_squawk_ints_match_string_codes():
+    keep = compile_filter({"squawk": (7700, "7600")})
+    assert keep(_flight(squawk="7700"))
+    assert keep(_flight(squawk="7600"))
+    assert not keep(_flight(squawk="1234"))
+
+
+def test_squawk_int_keeps_leading_zeros():
+    keep = compile_filter({"squawk": 17})
+    assert keep(_flight(squawk="0017"))
+    assert not keep(_flight(squawk="17"))
+
+
+def test_squawk_on_fr24_rows():
+    keep_row = compile_filter({"squawk": 7700}, FR24_FIELDS)
+    row = [0] * 19
+    row[6] = "7700"
+    assert keep_row(row)
+    row[6] = "2000"
+    assert not keep_row(row)
+
+
+def test_not_excludes_matches():
+    keep = compile_filter({"not": {"airline": "RYR"}})
+    assert keep(_flight(callsign="BAW1"))
+    assert not keep(_flight(callsign="RYR1"))
+
+
+@pytest.mark.parametrize("spec", [
+    {"not": {}},
+    {"not": {"zone": "home"}},
+    {"not": {"altitude": (None, None)}},
+])
+def test_empty_not_is_rejected(spec):
+    with pytest.raises(ValueError):
+        compile_filter(spec)
+
+
+@pytest.mark.parametrize("spec", [
+    {"any": []},
+    {"any": [{}]},
+    {"any": [{"squawk": "7700"}, {}]},
+])
+def test_empty_any_is_rejected(spec):
+    with pytest.raises(ValueError):
+        compile_filter(spec)
+
+
+def test_any_matches_either():
+    keep = compile_filter({"any": [{"squawk": "7700"}, {"type": "A388"}]})
+    assert keep(_flight(squawk="7700"))
+    assert keep(_flight(aircraft_type="A388"))
+    assert not keep(_flight())
+
+
+def test_overhead_falls_back_to_altitude_band(capsys):
+    from utilities.overhead import MAX_ALTITUDE, compile_flight_filter
+
+    keep, keep_row, zones, spec = compile_flight_filter({"not": {}})
+    assert "Filter:" in capsys.readouterr().out
+    assert set(spec) == {"altitude"}
+    assert keep(_flight(altitude=12000))
+    assert not keep(_flight(altitude=MAX_ALTITUDE + 1000))
+    assert zones is None
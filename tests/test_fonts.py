@@ -0,0 +1,38 @@
+# Emulator fonts without the Pimoroni headers (emulator/fonts.py, glyphs.py)
+
+import pytest
+
+from emulator.fonts import load_fonts
+
+FONTS = load_fonts(path="")
+PRINTABLE = [chr(code) for code in range(33, 127)]
+
+
+@pytest.mark.parametrize("name, height", [
+    ("bitmap6", 6), ("bitmap8", 8), ("bitmap14", 14), ("bitmap14_outline", 14),
+])
+def test_builtin_fonts_keep_the_device_line_heights(name, height):
+    font = FONTS[name]
+    assert font.source == "built-in"
+    assert font.height == height
+    assert font.width(" ") > 0 and font.glyph(" ") == []
+    for ch in PRINTABLE:
+        pixels = font.glyph(ch)
+        assert pixels, ch
+        assert all(0 <= x < font.width(ch) and 0 <= y < height for x, y in pixels), ch
+
+
+@pytest.mark.parametrize("name", ["bitmap6", "bitmap8", "bitmap14"])
+def test_letters_and_digits_are_distinct(name):
+    font = FONTS[name]
+    chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    shapes = {ch: tuple(sorted(font.glyph(ch))) for ch in chars}
+    assert len(set(shapes.values())) == len(chars)
+
+
+def test_descenders_use_the_bottom_row():
+    for name in ("bitmap6", "bitmap8"):
+        font = FONTS[name]
+        for ch in "gjpqy":
+            assert max(y for _, y in font.glyph(ch)) == font.height - 1, (name, ch)
+        assert max(y for _, y in font.glyph("A")) < font.height - 1
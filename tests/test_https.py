@@ -0,0 +1,46 @@
+# https_get against the TLS stand-in (emulator/fakeapi.py --tls): the
+# override keeps the TLS path, with the API's own SNI and Host header
+
+import shutil
+import ssl
+
+import pytest
+
+import emulator
+from emulator.fakeapi import FR24_PATH, FakeApiServer
+from utilities import https
+
+pytestmark = pytest.mark.skipif(shutil.which("openssl") is None, reason="needs the openssl command")
+
+
+@pytest.fixture
+def tls_server(monkeypatch):
+    monkeypatch.setattr(ssl, "wrap_socket", emulator.wrap_socket, raising=False)
+    server = FakeApiServer(tls=True).start()
+    yield server
+    server.stop()
+    https.set_api_override(None)
+
+
+def test_tls_override_keeps_the_tls_path(tls_server, monkeypatch):
+    wrapped = []
+    wrap = ssl.wrap_socket
+
+    def recording_wrap(sock, **kwargs):
+        wrapped.append(kwargs.get("server_hostname"))
+        return wrap(sock, **kwargs)
+
+    monkeypatch.setattr(ssl, "wrap_socket", recording_wrap)
+    https.set_api_override(*tls_server.address, tls=True)
+    feed = https.https_get_json("data-cloud.flightradar24.com", FR24_PATH)
+
+    assert wrapped == ["data-cloud.flightradar24.com"]
+    assert feed["full_count"] == 30
+    assert tls_server.stats["requests"] == 1
+
+
+def test_plain_override_cannot_talk_to_a_tls_stand_in(tls_server, capsys):
+    # Without tls=True the request goes out as plain HTTP and never arrives
+    https.set_api_override(*tls_server.address)
+    assert https.https_get("data-cloud.flightradar24.com", FR24_PATH, timeout=2) is None
+    assert tls_server.stats["requests"] == 0
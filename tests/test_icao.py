@@ -0,0 +1,75 @@
+# ICAO 24-bit address -> country (utilities/icao.py)
+
+import pytest
+
+from utilities.icao import COUNTRIES, RANGE_END, RANGE_START, country_for_address, country_for_icao
+
+
+@pytest.mark.parametrize("icao, country", [
+    ("A00001", "United States"),     # N1, the first N-number
+    ("A4F2C1", "United States"),     # an N-number in the middle of the block
+    ("AFFFFF", "United States"),     # last US address
+    ("400000", "United Kingdom"),    # first G- address
+    ("43FFFF", "United Kingdom"),    # last G- address
+    ("3C6444", "Germany"),           # D-
+    ("3C0000", "Germany"),
+    ("7C0000", "Australia"),         # first VH- address
+    ("7C7A3F", "Australia"),
+    ("4CA7B5", "Ireland"),
+    ("440000", "Austria"),           # next block after the UK's
+])
+def test_known_addresses(icao, country):
+    assert country_for_icao(icao) == country
+
+
+def test_first_table_entry():
+    assert RANGE_START[0] == 0x004000
+    assert country_for_address(0x004000) == "Zimbabwe"
+    assert country_for_address(0x0043FF) == "Zimbabwe"
+    assert country_for_address(0x003FFF) == ""      # before the first block
+    assert country_for_address(0x000000) == ""
+    assert country_for_address(0x004400) == ""      # gap after it
+
+
+def test_last_table_entry():
+    assert RANGE_END[-1] == 0xE94FFF
+    assert country_for_address(0xE94000) == "Bolivia"
+    assert country_for_address(0xE94FFF) == "Bolivia"
+    assert country_for_address(0xE93FFF) == ""      # gap before it
+    assert country_for_address(0xE95000) == ""      # after the last block
+    assert country_for_address(0xFFFFFF) == ""
+
+
+@pytest.mark.parametrize("address", [
+    0x500400,   # between San Marino and Albania
+    0x200000,   # below Namibia
+    0xF00000,   # ICAO reserved
+])
+def test_unallocated(address):
+    assert country_for_address(address) == ""
+
+
+def test_every_block_edge_matches_a_linear_scan():
+    def linear(address):
+        for start, end, country in zip(RANGE_START, RANGE_END, COUNTRIES):
+            if start <= address <= end:
+                return country
+        return ""
+
+    for start, end in zip(RANGE_START, RANGE_END):
+        for address in (start - 1, start, end, end + 1):
+            assert country_for_address(address) == linear(address)
+
+
+def test_table_sorted_and_disjoint():
+    for i in range(1, len(RANGE_START)):
+        assert RANGE_END[i - 1] < RANGE_START[i]
+
+
+@pytest.mark.parametrize("icao", ["", None, "~A00001", "A0001", "ZZZZZZ"])
+def test_bad_hex(icao):
+    assert country_for_icao(icao) == ""
+
+
+def test_lower_case_hex():
+    assert country_for_icao("a00001") == "United States"
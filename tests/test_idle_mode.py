@@ -0,0 +1,87 @@
+# Clock/weather mode drops to the idle stride with the weather ticker still
+# scrolling at its full speed (display sync, scenes/weather.py weather_scroll)
+#
+# The emulator patches the time module for the whole process, so the run
+# happens in a subprocess; it prints the loop's step and panel update counts
+# and how far the ticker scrolled.
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+SCRIPT = r"""
+import sys
+sys.path.insert(0, sys.argv[1])
+
+import emulator
+clock = emulator.install()
+
+from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32
+from display import Display
+from emulator import fixtures
+from scenes import weather
+from setup import frames
+from utilities import wifi
+
+weather.fetch_forecast = lambda lat, lon, units="metric": fixtures.weather_forecast(clock.time())
+display = Display(i75=Interstate75(display=DISPLAY_INTERSTATE75_64X32))
+display.snapshot.save = lambda *args: None
+overhead = display.overhead
+
+
+def grab_data():
+    overhead._data = []
+    overhead._new_data = True
+    overhead._processing = False
+    overhead._last_fetch = clock.time()
+
+
+overhead.grab_data = grab_data
+wifi.WIFI_SSID = emulator.wifi["ssid"]
+display._draw_idle_screen()
+display.wifi.start()
+
+# Past start-up, with the forecast in and the ticker scrolling
+for _ in range(100):
+    display.step()
+    display.wait(clock.sleep)
+
+start_frame = display.frame
+start_updates = display.i75.updates
+steps = 0
+idle_steps = 0
+scrolled = 0
+position = display._weather_position
+while display.frame - start_frame < 3000:
+    display.step()
+    steps += 1
+    idle_steps += display.frame_stride == frames.IDLE_FRAME_STRIDE
+    moved = position - display._weather_position
+    scrolled += moved if moved >= 0 else display.frame_stride  # wrapped to the right edge
+    position = display._weather_position
+    display.wait(clock.sleep)
+
+print("RESULT", display.frame - start_frame, steps, idle_steps, display.i75.updates - start_updates, scrolled)
+"""
+
+
+def test_clock_weather_mode_runs_at_the_idle_stride(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, os.path.abspath(ROOT)],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = [line for line in result.stdout.splitlines() if line.startswith("RESULT")]
+    assert lines, result.stdout[-2000:]
+    print(lines[0])
+    frame_count, steps, idle_steps, updates, scrolled = (int(v) for v in lines[0].split()[1:])
+
+    # Mostly at IDLE_FRAME_STRIDE (5) - the clock's minute change runs at
+    # full rate for a couple of seconds
+    assert steps < frame_count * 0.3
+    assert idle_steps > steps * 0.8
+    assert updates <= steps
+    # The ticker still moves a pixel per frame, a stride at a time
+    assert abs(scrolled - frame_count) <= 5
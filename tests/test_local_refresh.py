@@ -0,0 +1,99 @@
+# A local receiver's positions reach the screen within seconds (display
+# local_feed -> Overhead.refresh_local), run on the emulator
+#
+# The emulator patches the time module for the whole process, so the run
+# happens in a subprocess; it prints the virtual seconds between the feed
+# sending a new altitude and the display showing it.
+
+import os
+import subprocess
+import sys
+
+from utilities.overhead import LOCAL_REFRESH_INTERVAL
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+SCRIPT = r"""
+import socket
+import sys
+import time
+
+real_sleep = time.sleep
+sys.path.insert(0, sys.argv[1])
+
+import emulator
+clock = emulator.install()
+
+from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32
+from display import Display
+from emulator import fixtures
+from emulator.fakesbs import sbs_line
+from scenes import weather
+from utilities import wifi
+from utilities.overhead import SbsSource
+
+weather.fetch_forecast = lambda lat, lon, units="metric": fixtures.weather_forecast(clock.time())
+wifi.WIFI_SSID = emulator.wifi["ssid"]
+
+listener = socket.socket()
+listener.bind(("127.0.0.1", 0))
+listener.listen(1)
+
+display = Display(i75=Interstate75(display=DISPLAY_INTERSTATE75_64X32))
+display.snapshot.save = lambda *args: None
+overhead = display.overhead
+overhead.sbs = SbsSource("127.0.0.1", listener.getsockname()[1])
+overhead.sbs.keep = overhead.keep
+zone = overhead.fetch_zone
+lat = (zone["tl_y"] + zone["br_y"]) / 2
+lon = (zone["tl_x"] + zone["br_x"]) / 2
+
+overhead.sbs.poll()
+feed, _ = listener.accept()
+
+
+def send(altitude):
+    feed.sendall(sbs_line(1, "400ABC", callsign="BAW1")
+                 + sbs_line(3, "400ABC", altitude=altitude, lat=f"{lat:.5f}", lon=f"{lon:.5f}"))
+
+
+def shown():
+    data = display._data
+    return data[display._data_index]["altitude"] if data else None
+
+
+# Feed live before the link comes up, so the first fetch is the receiver's
+send(10000)
+while not overhead.sbs.live:
+    real_sleep(0.001)
+    overhead.sbs.poll()
+
+display._draw_idle_screen()
+display.wifi.start()
+sent_at = None
+for frame in range(600):
+    display.step()
+    display.wait(clock.sleep)
+    real_sleep(0.001)   # let the socket deliver
+    if sent_at is None and shown() == 10000 and frame > 50:
+        send(12000)
+        sent_at = clock.time()
+    elif sent_at is not None and shown() == 12000:
+        print("SHOWN_AFTER", clock.time() - sent_at, "FRAME", frame)
+        break
+else:
+    print("NEVER_SHOWN", shown())
+"""
+
+
+def test_new_receiver_position_is_shown_within_seconds(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, os.path.abspath(ROOT)],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = [line for line in result.stdout.splitlines() if line.startswith(("SHOWN_AFTER", "NEVER_SHOWN"))]
+    assert lines and lines[0].startswith("SHOWN_AFTER"), result.stdout[-2000:]
+    seconds = int(lines[0].split()[1])
+    # Well inside the 30 s fetch keyframe and without the carousel finishing a loop
+    assert seconds <= LOCAL_REFRESH_INTERVAL + 1
@@ -0,0 +1,55 @@
+# Multicast leader set-up on ports without the optional socket options
+
+import socket
+
+from utilities import multicast
+from utilities.multicast import MulticastLink
+
+
+def test_leader_without_multicast_options(monkeypatch, capsys):
+    # As MicroPython's lwIP sockets: no IP_MULTICAST_TTL / IP_MULTICAST_IF
+    monkeypatch.delattr(socket, "IP_MULTICAST_TTL")
+    monkeypatch.delattr(socket, "IP_MULTICAST_IF")
+    link = MulticastLink("leader", interface="127.0.0.1")
+    try:
+        out = capsys.readouterr().out
+        assert "IP_MULTICAST_TTL not supported" in out
+        assert "IP_MULTICAST_IF not supported" in out
+        link.publish([], 0, None, 0)
+    finally:
+        link.close()
+
+
+def test_leader_option_error_is_not_fatal(monkeypatch, capsys):
+    class _Socket:
+        def __init__(self, *args):
+            self.options = []
+
+        def setsockopt(self, level, option, value):
+            if option == socket.IP_MULTICAST_IF:
+                raise OSError(22, "EINVAL")
+            self.options.append(option)
+
+        def setblocking(self, flag):
+            pass
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(multicast.socket, "socket", _Socket)
+    link = MulticastLink("leader", interface="10.0.0.2")
+    assert link._sock.options == [socket.IP_MULTICAST_TTL]
+    assert "IP_MULTICAST_IF not set" in capsys.readouterr().out
+
+
+def test_overhead_survives_a_failed_link(monkeypatch, capsys):
+    from utilities import overhead
+
+    def broken(*args, **kwargs):
+        raise OSError(19, "ENODEV")
+
+    monkeypatch.setattr(overhead, "MULTICAST_ROLE", "leader")
+    monkeypatch.setattr(overhead, "MulticastLink", broken)
+    tracker = overhead.Overhead()
+    assert tracker.multicast is None
+    assert "Multicast: setup failed" in capsys.readouterr().out
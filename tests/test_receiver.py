@@ -0,0 +1,200 @@
+# ReceiverSource: incremental aircraft.json transfers and the flight filter
+
+import json
+import socket
+import threading
+import time
+
+from utilities import overhead
+from utilities.overhead import ReceiverSource, compile_flight_filter
+
+
+def _aircraft_json(aircraft, now=1700000000.0, messages=1000):
+    """aircraft.json as readsb writes it: header lines, then one aircraft per line"""
+    lines = [f'{{ "now" : {now},', f'  "messages" : {messages},', '  "aircraft" : [']
+    lines += [json.dumps(ac) + ("," if i < len(aircraft) - 1 else "") for i, ac in enumerate(aircraft)]
+    lines += ["  ]", "}"]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _record(hex_code, altitude, flight="BAW123"):
+    return {"hex": hex_code, "flight": flight, "lat": 51.5, "lon": -1.0,
+            "alt_baro": altitude, "gs": 300, "track": 90, "t": "A320"}
+
+
+def _response(body, status="200 OK"):
+    return (f"HTTP/1.0 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+
+
+class _Server:
+    """One-shot HTTP server on localhost answering each connection with a canned response"""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self._listener = socket.socket()
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(4)
+        self.port = self._listener.getsockname()[1]
+        self.requests = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        for response in self._responses:
+            conn, _ = self._listener.accept()
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += conn.recv(1024)
+            self.requests.append(request)
+            for pos in range(0, len(response), 700):  # split across reads
+                conn.sendall(response[pos:pos + 700])
+            conn.close()
+
+    def close(self):
+        self._listener.close()
+
+
+def _transfer(receiver, seconds=1.5):
+    """Start a transfer and poll it, frame by frame, until it finishes"""
+    receiver._last_poll = 0
+    receiver.poll()
+    deadline = time.time() + seconds
+    while receiver._sock is not None:
+        assert time.time() < deadline, "transfer did not finish"
+        time.sleep(0.001)
+        receiver.poll()
+
+
+def test_line_path_applies_filter():
+    body = _aircraft_json([_record("400001", 12000), _record("400002", 60000)])
+    server = _Server([_response(body)])
+    try:
+        receiver = ReceiverSource("127.0.0.1", server.port)
+        receiver.keep = compile_flight_filter(None)[0]   # MIN/MAX_ALTITUDE band only
+        _transfer(receiver)
+    finally:
+        server.close()
+
+    assert server.requests[0].startswith(b"GET /data/aircraft.json HTTP/1.0\r\n")
+    assert receiver.parsed == 1 and receiver.errors == 0
+    assert [f["id"] for f in receiver.aircraft] == ["400001"]
+    assert [f["id"] for f in receiver.flights(overhead.ZONE_DEFAULT)] == ["400001"]
+    assert receiver.live
+
+
+def test_line_path_without_filter_keeps_everything():
+    body = _aircraft_json([_record("400001", 12000), _record("400002", 60000)])
+    server = _Server([_response(body)])
+    try:
+        receiver = ReceiverSource("127.0.0.1", server.port)
+        _transfer(receiver)
+    finally:
+        server.close()
+
+    assert [f["id"] for f in receiver.aircraft] == ["400001", "400002"]
+
+
+def test_unchanged_counters_skip_the_aircraft():
+    first = _aircraft_json([_record("400001", 12000)])
+    second = _aircraft_json([_record("400002", 12000)])  # same now/messages
+    server = _Server([_response(first), _response(second)])
+    try:
+        receiver = ReceiverSource("127.0.0.1", server.port)
+        _transfer(receiver)
+        _transfer(receiver)
+    finally:
+        server.close()
+
+    assert receiver.parsed == 1 and receiver.skipped == 1
+    assert [f["id"] for f in receiver.aircraft] == ["400001"]
+
+
+def test_truncated_file_keeps_the_previous_aircraft():
+    good = _aircraft_json([_record("400001", 12000)])
+    cut = _aircraft_json([_record("400002", 12000), _record("400003", 12000)], now=1700000001.0)
+    cut = cut[:cut.index(b"400003")]
+    server = _Server([_response(good), _response(cut)])
+    try:
+        receiver = ReceiverSource("127.0.0.1", server.port)
+        _transfer(receiver)
+        receiver._next_attempt = 0
+        _transfer(receiver)
+    finally:
+        server.close()
+
+    assert receiver.parsed == 1 and receiver.errors == 1
+    assert [f["id"] for f in receiver.aircraft] == ["400001"]
+
+
+def test_http_error_backs_off():
+    server = _Server([_response(b"{}", status="404 Not Found")])
+    try:
+        receiver = ReceiverSource("127.0.0.1", server.port)
+        _transfer(receiver)
+    finally:
+        server.close()
+
+    assert receiver.errors == 1 and receiver.parsed == 0
+    assert receiver._next_attempt > 0
+    assert not receiver.live
+
+
+def test_unreachable_receiver_never_blocks():
+    # Nothing listening: the connect fails or is refused without waiting
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    listener.close()
+
+    receiver = ReceiverSource("127.0.0.1", port)
+    _transfer(receiver)
+
+    assert receiver.errors == 1
+    receiver._last_poll = 0
+    receiver.poll()     # within the backoff - nothing is attempted
+    assert receiver.polls == 1
+
+
+def test_stalled_receiver_times_out_without_blocking_a_frame(monkeypatch):
+    # Accepts the connection but never answers
+    monkeypatch.setattr(overhead, "RECEIVER_TIMEOUT", 0.2)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    try:
+        receiver = ReceiverSource("127.0.0.1", listener.getsockname()[1])
+        longest = 0
+        receiver.poll()
+        deadline = time.time() + 2
+        while receiver._sock is not None and time.time() < deadline:
+            start = time.perf_counter()
+            receiver.poll()
+            longest = max(longest, time.perf_counter() - start)
+            time.sleep(0.005)
+    finally:
+        listener.close()
+
+    assert receiver._sock is None and receiver.errors == 1
+    assert longest < 0.05
+
+
+def test_each_poll_reaches_the_shown_flights():
+    # Overhead.refresh_local is what the display runs every LOCAL_REFRESH_INTERVAL
+    first = _aircraft_json([_record("400001", 12000)])
+    second = _aircraft_json([_record("400001", 14000)], now=1700000002.0, messages=1040)
+    server = _Server([_response(first), _response(second)])
+    tracker = overhead.Overhead()
+    tracker.receiver = ReceiverSource("127.0.0.1", server.port)
+    tracker.receiver.keep = tracker.keep
+    shown = []
+    try:
+        for _ in range(2):
+            _transfer(tracker.receiver)
+            assert tracker.refresh_local()
+            assert tracker.new_data
+            shown.append([(f["callsign"], f["altitude"]) for f in tracker.data])
+    finally:
+        server.close()
+
+    assert shown == [[("BAW123", 12000)], [("BAW123", 14000)]]
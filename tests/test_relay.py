@@ -0,0 +1,172 @@
+# LAN relay view cutting (relay/server.py cut_view, relay/batch.py) and the
+# view a display sends it (utilities/overhead.py RelaySource)
+
+import json
+import random
+
+import pytest
+
+from relay.server import cut_view, prepare_view
+from utilities.overhead import (
+    MAX_ALTITUDE, MAX_FLIGHT_LOOKUP, MIN_ALTITUDE, RelaySource, compile_flight_filter,
+    distance_from_flight_to_home, in_zone, watch_zones,
+)
+from utilities.zones import union_zone
+
+ZONE = {"tl_y": 52.0, "tl_x": -2.0, "br_y": 51.0, "br_x": 0.0}
+HOME = [51.5, -1.0, 6371]
+
+
+def _fr24_row(lat, lon, callsign, altitude=12000, aircraft_type="A320", squawk="1234"):
+    """FR24 feed row (see flight_from_fr24)"""
+    return ["400000", lat, lon, 90, altitude, 300, squawk, "", aircraft_type, "G-ABCD",
+            0, "LHR", "GLA", callsign, 0, 0, callsign, 0, ""]
+
+
+def _feed(rows):
+    return {f"id{i}": row for i, row in enumerate(rows)}
+
+
+def _flights(feed):
+    from utilities.overhead import flight_from_fr24
+    return [flight_from_fr24(k, v) for k, v in feed.items()]
+
+
+def _sixth_nearest_match():
+    """Six flights east of home, nearest first; only the farthest is EasyJet"""
+    rows = [_fr24_row(51.5, -1.0 + 0.1 * i, "BAW%d" % i) for i in range(5)]
+    rows.append(_fr24_row(51.5, -0.45, "EZY6"))
+    return _feed(rows)
+
+
+def _view(**extra):
+    view = {"zone": dict(ZONE), "home": list(HOME), "min_altitude": 0, "max_altitude": 45000,
+            "limit": MAX_FLIGHT_LOOKUP}
+    view.update(extra)
+    return view
+
+
+def test_unfiltered_view_takes_the_nearest():
+    feed = _sixth_nearest_match()
+    cut = cut_view(_flights(feed), _view())
+    assert sorted(cut) == ["id0", "id1", "id2", "id3", "id4"]
+
+
+def test_filter_runs_before_the_nearest_are_taken():
+    feed = _sixth_nearest_match()
+    cut = cut_view(_flights(feed), _view(filter={"airline": ["EZY"]}))
+    assert list(cut) == ["id5"]
+
+
+def test_invalid_filter_is_rejected_on_subscribe():
+    with pytest.raises(ValueError):
+        prepare_view(_view(filter={"not": {}}))
+
+
+@pytest.mark.parametrize("source", ["fr24", "flights"])
+def test_batch_cut_matches_scalar_with_a_filter(source):
+    batch = pytest.importorskip("relay.batch")
+    feed = _sixth_nearest_match()
+    if source == "fr24":
+        columns = batch.FlightColumns.from_fr24(feed)
+    else:
+        columns = batch.FlightColumns.from_flights(_flights(feed))
+    views = [_view(), _view(filter={"airline": ["EZY"]}), _view(filter={"squawk": 7700})]
+    cuts = columns.cut_views(views)
+    assert sorted(cuts[0]) == ["id0", "id1", "id2", "id3", "id4"]
+    assert list(cuts[1]) == ["id5"]
+    assert cuts[2] == {}
+
+
+def test_display_sends_its_compiled_filter():
+    keep, keep_row, zones, spec = compile_flight_filter({"airline": ("EZY",), "type": {"A320"}})
+    relay = RelaySource("127.0.0.1", 1, zone=ZONE, home=HOME, flight_filter=spec)
+    view = prepare_view(json.loads(relay._hello))
+    assert view["filter"]["airline"] == ["EZY"]
+    assert view["filter"]["altitude"] == [MIN_ALTITUDE, MAX_ALTITUDE]
+    cut = cut_view(_flights(_sixth_nearest_match()), view)
+    assert list(cut) == ["id5"]
+
+
+# Watch zones: London (the main home) and Manchester, fetched as one box
+WATCH = [
+    {"name": "london", "zone": {"tl_y": 51.8, "tl_x": -0.6, "br_y": 51.2, "br_x": 0.4}},
+    {"name": "manchester", "zone": {"tl_y": 53.6, "tl_x": -2.6, "br_y": 53.2, "br_x": -2.0}},
+]
+
+
+def _watch_view(watch):
+    relay = RelaySource("127.0.0.1", 1, zone=union_zone([w["zone"] for w in watch]),
+                        home=watch[0]["home"], watch=watch)
+    return prepare_view(json.loads(relay._hello))
+
+
+def _display_pick(flights, watch):
+    """The display's own ranking (Overhead.in_watch_zones), nearest MAX_FLIGHT_LOOKUP ids"""
+    ranked = []
+    for f in flights:
+        homes = [
+            w["home"] for w in watch
+            if in_zone(f, w["zone"]) and ("fence" not in w or w["fence"].contains(f["lat"], f["lon"]))
+        ]
+        if homes:
+            ranked.append((min(distance_from_flight_to_home(f, h) for h in homes), f["id"]))
+    ranked.sort()
+    return [key for _, key in ranked[:MAX_FLIGHT_LOOKUP]]
+
+
+def test_distant_watch_zone_keeps_its_flights():
+    watch = watch_zones(WATCH, [])
+    rows = [_fr24_row(51.5, -0.1 + 0.01 * i, "BAW%d" % i) for i in range(6)]
+    rows.append(_fr24_row(53.35, -2.27, "EZY7"))     # over Manchester
+    feed = _feed(rows)
+    view = _watch_view(watch)
+
+    # The view's main home alone would take the five nearest London
+    assert "id6" not in cut_view(_flights(feed), _view(zone=view["zone"], home=watch[0]["home"]))
+
+    cut = cut_view(_flights(feed), view)
+    assert "id6" in cut
+    assert _display_pick(cut.values(), watch) == _display_pick(_flights(feed), watch)
+
+
+# Triangle under an approach path: its box's south-east corner is outside it
+FENCE = {"name": "approach", "points": [(52.4, -1.8), (52.4, -1.0), (51.9, -1.8)],
+         "home": [51.95, -1.0, 6371]}
+
+
+def test_geofence_flights_survive_the_cut():
+    watch = watch_zones([], [FENCE])
+    # Five aircraft in the fence's box but outside the polygon, nearer its home...
+    rows = [_fr24_row(51.95 + 0.01 * i, -1.05 - 0.01 * i, "BAW%d" % i) for i in range(5)]
+    rows.append(_fr24_row(52.3, -1.5, "EZY5"))      # ...and one inside it, farther away
+    feed = _feed(rows)
+    view = _watch_view(watch)
+    assert view["zones"][0]["points"] == [list(p) for p in FENCE["points"]]
+
+    assert list(cut_view(_flights(feed), view)) == ["id5"]
+    batch = pytest.importorskip("relay.batch")
+    assert list(batch.FlightColumns.from_fr24(feed).cut_views([view])[0]) == ["id5"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_watch_zone_union_gives_the_display_its_own_pick(seed):
+    rng = random.Random(seed)
+    watch = watch_zones(WATCH + [
+        {"name": "overlap", "zone": {"tl_y": 52.0, "tl_x": -1.0, "br_y": 51.4, "br_x": 0.0}},
+    ], [FENCE])
+    box = union_zone([w["zone"] for w in watch])
+    rows = [
+        _fr24_row(rng.uniform(box["br_y"], box["tl_y"]), rng.uniform(box["tl_x"], box["br_x"]),
+                  "BAW%d" % i, altitude=rng.randint(1000, 40000))
+        for i in range(300)
+    ]
+    feed = _feed(rows)
+    expected = _display_pick(_flights(feed), watch)
+
+    view = _watch_view(watch)
+    assert _display_pick(cut_view(_flights(feed), view).values(), watch) == expected
+
+    batch = pytest.importorskip("relay.batch")
+    cut = batch.FlightColumns.from_fr24(feed).cut_views([view, _view()])[0]
+    assert _display_pick(cut.values(), watch) == expected
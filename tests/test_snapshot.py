@@ -0,0 +1,126 @@
+# Warm-start snapshot age bound and restored flight records
+# (utilities/snapshot.py expire, utilities/overhead.py restored_record)
+
+import os
+import struct
+import subprocess
+import sys
+
+from utilities import snapshot
+from utilities.overhead import Overhead, flight_record, restored_record
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+NOW = 1760000000
+
+FLIGHT = {"icao": "400abc", "aircraft_type": "A320", "origin": "GLA", "destination": "LHR",
+          "callsign": "BAW1483", "flight_number": "BA1483", "altitude": 12450,
+          "vertical_speed": 1280, "velocity": 312, "heading": 135, "squawk": "4521",
+          "lat": 55.0, "lon": -3.5}
+
+
+def _forecast(first_hour, hours=48):
+    return {
+        "time": first_hour,
+        "temperature": [10.0] * hours, "wind_speed": [12.0] * hours, "wind_direction": [240] * hours,
+        "weather_code": [3] * hours, "humidity": [80] * hours, "rain_probability": [20] * hours,
+        "daily_time": [first_hour, first_hour + 86400], "temp_high": [13.0, 14.0], "temp_low": [6.0, 7.0],
+    }
+
+
+def _decoded(saved_at, forecast_from=None):
+    buf = snapshot.encode([flight_record(FLIGHT)], _forecast(forecast_from or saved_at), saved_at, saved_at, 0)
+    decoded = snapshot.decode(buf[:4] + struct.pack("<I", saved_at) + buf[8:])
+    assert decoded["saved_at"] == saved_at
+    return decoded
+
+
+def test_recent_snapshot_is_kept():
+    decoded = _decoded(NOW - 60)
+    assert snapshot.expire(decoded, NOW)
+    assert len(decoded["flights"]) == 1 and decoded["forecast"] is not None
+
+
+def test_old_flights_are_dropped_but_a_covering_forecast_kept():
+    decoded = _decoded(NOW - snapshot.SNAPSHOT_MAX_AGE - 1)
+    assert snapshot.expire(decoded, NOW)
+    assert decoded["flights"] == [] and decoded["forecast"] is not None
+
+
+def test_forecast_past_its_window_is_dropped():
+    decoded = _decoded(NOW - 3 * 86400)
+    assert snapshot.expire(decoded, NOW)
+    assert decoded["flights"] == [] and decoded["forecast"] is None
+
+
+def test_unset_clock_cannot_age_a_snapshot():
+    # After a power-off the RTC restarts behind saved_at until NTP sets it
+    decoded = _decoded(NOW)
+    assert not snapshot.expire(decoded, NOW - 5 * 365 * 86400)
+    assert len(decoded["flights"]) == 1 and decoded["forecast"] is not None
+
+
+def test_restored_flights_render_as_fetched_ones():
+    fetched = flight_record(FLIGHT)
+    decoded = snapshot.decode(snapshot.encode([fetched], None, 0, 0, 0))
+    restored = restored_record(decoded["flights"][0])
+
+    assert restored["origin_city"] and restored["destination_city"]
+    assert {k: v for k, v in restored.items() if k != "eta"} == {k: v for k, v in fetched.items() if k != "eta"}
+    assert restored["eta"] is None   # needs a position, back with the first fetch
+
+    tracker = Overhead()
+    tracker.restore(decoded["flights"], 0, 0)
+    assert tracker.flights == [restored] and tracker.stale
+
+
+SCRIPT = r"""
+import sys
+sys.path.insert(0, sys.argv[1])
+import os
+os.chdir(sys.argv[1])   # data/ tables
+
+import emulator
+clock = emulator.install()
+
+from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32
+from display import Display
+from emulator import fixtures
+from utilities import snapshot
+
+path = sys.argv[2]
+saved_at = clock.time() + int(sys.argv[3])    # ahead of the clock: not set since power-up
+buf = snapshot.encode(fixtures.FLIGHTS, None, 0, saved_at, 0)
+with open(path, "wb") as f:
+    f.write(buf[:4] + saved_at.to_bytes(4, "little") + buf[8:])
+
+display = Display(i75=Interstate75(display=DISPLAY_INTERSTATE75_64X32))
+display.snapshot = snapshot.Snapshot(path=path, temp_path=path + ".tmp")
+print("RESTORED", display._restore_snapshot(), len(display._data), display._data[0]["origin_city"])
+
+# NTP sets the clock: the snapshot is judged on its real age
+clock.advance_us((int(sys.argv[3]) + int(sys.argv[4])) * 1000000)
+display._expire_snapshot()
+print("AFTER_NTP", len(display._data), len(display.overhead.flights))
+"""
+
+
+def _run(tmp_path, clock_behind, age_after_ntp):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, os.path.abspath(ROOT), str(tmp_path / "snapshot.bin"),
+         str(clock_behind), str(age_after_ntp)],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return {line.split()[0]: line.split()[1:] for line in result.stdout.splitlines()
+            if line.startswith(("RESTORED", "AFTER_NTP"))}
+
+
+def test_display_drops_old_flights_once_the_clock_is_set(tmp_path):
+    out = _run(tmp_path, 3600, 2 * 3600)
+    assert out["RESTORED"][:2] == ["True", "3"] and out["RESTORED"][2] == "Glasgow"
+    assert out["AFTER_NTP"] == ["0", "0"]
+
+
+def test_display_keeps_a_recent_snapshot_once_the_clock_is_set(tmp_path):
+    out = _run(tmp_path, 3600, 120)
+    assert out["AFTER_NTP"] == ["3", "3"]
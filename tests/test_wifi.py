@@ -0,0 +1,134 @@
+# WifiSupervisor rejoin order: the cached AP first, then the same network unpinned
+
+import importlib
+import sys
+import types
+
+import pytest
+
+STAT_NO_AP_FOUND = -2
+STAT_GOT_IP = 3
+
+
+class _WLAN:
+    """Station whose network only answers at the listed BSSIDs (None: any)"""
+
+    def __init__(self, aps):
+        self.aps = aps
+        self.connects = []
+        self._status = 0
+        self._bssid = None
+
+    def active(self, value=None):
+        return True
+
+    def config(self, *args, **kwargs):
+        if args == ("bssid",):
+            return self._bssid
+        if args == ("channel",):
+            return 11
+        return None
+
+    def connect(self, ssid, key, bssid=None, channel=None):
+        self.connects.append((ssid, bssid and bssid.hex(), channel))
+        found = [ap for ap in self.aps.get(ssid, ()) if bssid is None or ap == bssid]
+        self._bssid = found[0] if found else None
+        self._status = STAT_GOT_IP if found else STAT_NO_AP_FOUND
+
+    def disconnect(self):
+        self._status = 0
+
+    def status(self):
+        return self._status
+
+    def isconnected(self):
+        return self._status == STAT_GOT_IP
+
+    def ifconfig(self):
+        return ("10.0.0.2", "255.255.255.0", "10.0.0.1", "10.0.0.1")
+
+
+class _Clock:
+    """ticks_* for the host, advanced by hand"""
+
+    def __init__(self):
+        self.ms = 0
+
+    def ticks_ms(self):
+        return self.ms
+
+    def ticks_add(self, ticks, delta):
+        return ticks + delta
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+
+@pytest.fixture
+def wifi(monkeypatch, tmp_path):
+    network = types.SimpleNamespace(STA_IF=0, WLAN=None)
+    monkeypatch.setitem(sys.modules, "network", network)
+    monkeypatch.setitem(sys.modules, "ntptime", types.SimpleNamespace(settime=lambda: None))
+    monkeypatch.delitem(sys.modules, "utilities.wifi", raising=False)
+    module = importlib.import_module("utilities.wifi")
+    monkeypatch.setattr(module, "time", _Clock())
+    monkeypatch.setattr(module, "WIFI_CACHE_FILE", str(tmp_path / "wifi_cache.json"))
+    monkeypatch.setattr(module, "WIFI_SSID", "home")
+    monkeypatch.setattr(module, "WIFI_PASSWORD", "secret")
+    monkeypatch.setattr(module, "WIFI_SSID_FALLBACK", "phone")
+    monkeypatch.setattr(module, "WIFI_PASSWORD_FALLBACK", "secret2")
+    yield module
+    # Bound to the stand-in network module: don't leave it for other tests
+    sys.modules.pop("utilities.wifi", None)
+
+
+def _supervisor(wifi, aps, cache):
+    wifi._save_cache(cache)
+    wifi.network.WLAN = lambda interface: _WLAN(aps)
+    return wifi.WifiSupervisor()
+
+
+def _run(wifi, supervisor, seconds):
+    """Poll every frame (100 ms) for a while"""
+    for _ in range(seconds * 10):
+        wifi.time.ms += 100
+        supervisor.poll()
+
+
+OLD_AP = "aabbccddeeff"
+NEW_AP = bytes.fromhex("112233445566")
+
+
+def test_cached_ap_is_joined_directly(wifi):
+    supervisor = _supervisor(wifi, {"home": [bytes.fromhex(OLD_AP)]},
+                             {"ssid": "home", "bssid": OLD_AP, "channel": 6})
+    supervisor.start()
+    _run(wifi, supervisor, 1)
+
+    assert supervisor.connected
+    assert supervisor.wlan.connects == [("home", OLD_AP, 6)]
+
+
+def test_stale_bssid_retries_the_same_network_unpinned(wifi):
+    # The AP was replaced: "home" is still there, at a new BSSID
+    supervisor = _supervisor(wifi, {"home": [NEW_AP], "phone": [bytes.fromhex(OLD_AP)]},
+                             {"ssid": "home", "bssid": OLD_AP, "channel": 6})
+    supervisor.start()
+    _run(wifi, supervisor, 5)
+
+    assert supervisor.connected
+    assert supervisor.wlan.connects == [("home", OLD_AP, 6), ("home", None, None)]
+    assert supervisor.failed_attempts == 1
+    # The new AP is cached for the next rejoin
+    assert wifi._load_cache() == {"ssid": "home", "bssid": NEW_AP.hex(), "channel": 11}
+
+
+def test_missing_network_still_falls_back(wifi):
+    supervisor = _supervisor(wifi, {"phone": [NEW_AP]},
+                             {"ssid": "home", "bssid": OLD_AP, "channel": 6})
+    supervisor.start()
+    _run(wifi, supervisor, 5)
+
+    assert supervisor.connected
+    assert [c[:2] for c in supervisor.wlan.connects] == [("home", OLD_AP), ("home", None), ("phone", None)]
+    assert wifi._load_cache()["ssid"] == "phone"
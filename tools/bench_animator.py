@@ -0,0 +1,224 @@
+# Host microbenchmark for the Animator keyframe dispatch
+# Run from the repository root with CPython:
+#
+#   python tools/bench_animator.py
+#   python tools/bench_animator.py --chime --device-factor 60
+#
+# Compares the compiled (divisor, offset) buckets against the original
+# per-frame scan over every keyframe, for 10-100 registered keyframes.
+#
+# --chime runs the real Display on the emulator (canned flights) instead,
+# once silent and once with the new-flight chime queued every
+# CHIME_EVERY_S, and reports each frame's busy time - the keyframes plus
+# the audio timer callbacks that fire during its period - the frames that
+# overrun the PERIOD budget, and how many of those only the callbacks
+# pushed over it. --device-factor scales host times to a rough RP2040
+# estimate (host jitter is scaled too, so compare the two runs, not the
+# absolute overrun counts).
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utilities.animator import Animator, keyframe
+
+FRAMES = 3000
+CHIME_FRAMES = 600
+CHIME_EVERY_S = 2       # the new-flight chime lasts about 1.6 s
+CHIME_WARMUP = 100      # frames run first (boot chime, first flight screen)
+# Divisors roughly matching the real scenes: every frame, every other
+# frame, once a second, every 5 s and every 30 s at 10 FPS
+DIVISORS = (1, 2, 10, 50, 300)
+
+
+def _make_keyframe(divisor):
+    @keyframe(divisor)
+    def method(self, count):
+        self.calls += 1
+    return method
+
+
+def build_class(count):
+    """Create an Animator subclass with `count` keyframes"""
+    attrs = {}
+    for i in range(count):
+        attrs[f"kf_{i:03d}"] = _make_keyframe(DIVISORS[i % len(DIVISORS)])
+
+    def __init__(self):
+        self.calls = 0
+        Animator.__init__(self)
+
+    attrs["__init__"] = __init__
+    return type(f"Bench{count}", (Animator,), attrs)
+
+
+def legacy_step(anim, props_by_name):
+    """The original play() loop body: scan every keyframe every frame"""
+    frame = anim.frame
+    for name, method in anim.keyframes:
+        props = props_by_name[name]
+        if frame == 0:
+            if props["divisor"] == 0:
+                method()
+        if (
+            frame > 0
+            and props["divisor"]
+            and not ((frame - props["offset"]) % props["divisor"])
+        ):
+            if method(props["count"]):
+                props["count"] = 0
+            else:
+                props["count"] += 1
+    anim.frame += 1
+
+
+def bench(count):
+    cls = build_class(count)
+
+    anim = cls()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        anim.step()
+    compiled = time.perf_counter() - start
+    compiled_calls = anim.calls
+
+    anim = cls()
+    props_by_name = {}
+    for name, _ in anim.keyframes:
+        props = dict(anim._get_props(name))
+        props["count"] = 0
+        props_by_name[name] = props
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        legacy_step(anim, props_by_name)
+    legacy = time.perf_counter() - start
+
+    assert anim.calls == compiled_calls, "dispatch mismatch"
+
+    per_frame = lambda t: t / FRAMES * 1e6
+    print(
+        f"{count:4d} keyframes  legacy {per_frame(legacy):7.2f} us/frame  "
+        f"compiled {per_frame(compiled):7.2f} us/frame  "
+        f"({legacy / compiled:4.1f}x, {compiled_calls / FRAMES:5.1f} calls/frame)"
+    )
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chime", action="store_true", help="frame timing with audio playback")
+    parser.add_argument("--frames", type=int, default=CHIME_FRAMES, help="frames per --chime run")
+    parser.add_argument("--device-factor", type=float, default=0, help="host-to-device slowdown (0 = off)")
+    return parser.parse_args()
+
+
+def _chime_display():
+    """Display on the emulator with canned flights, and its audio player"""
+    import emulator
+    clock = emulator.install()
+
+    from interstate75 import Interstate75, DISPLAY_INTERSTATE75_64X32
+    from display import Display
+    from emulator import fixtures
+    from scenes import weather
+    from utilities.audio import get_player
+
+    weather.fetch_forecast = lambda lat, lon, units="metric": fixtures.weather_forecast(clock.time())
+    display = Display(i75=Interstate75(display=DISPLAY_INTERSTATE75_64X32))
+    display.snapshot.save = lambda *args: None
+    overhead = display.overhead
+
+    def grab_data():
+        overhead._data = [dict(f) for f in fixtures.FLIGHTS]
+        overhead._new_data = True
+        overhead._processing = False
+        overhead._last_fetch = clock.time()
+
+    overhead.grab_data = grab_data
+    grab_data()
+
+    player = get_player()
+    player._enabled = True  # without touching the saved setting
+    return clock, display, player
+
+
+def chime_timing(frames, device_factor):
+    clock, display, player = _chime_display()
+
+    # Time every audio timer callback (the Timer picks up the instance attribute)
+    tick = player._tick
+    spent = [0]
+
+    def timed_tick(timer):
+        start = time.perf_counter()
+        tick(timer)
+        spent[0] += time.perf_counter() - start
+
+    player._tick = timed_tick
+
+    # Past start-up, with the boot chime finished
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        for _ in range(CHIME_WARMUP):
+            display.step()
+            display.wait(clock.sleep)
+    finally:
+        sys.stdout = real_stdout
+    player._queue = []
+    player._stop()
+
+    factor = device_factor or 1
+    unit = "device ms (est.)" if device_factor else "host ms"
+    budget = display.delay * 1000
+    print(f"Frame busy time over {frames} frames in {unit}, budget {budget:.0f} ms per frame")
+    print(f"{'run':<8} {'playing':>8} {'p50':>7} {'p95':>7} {'max':>7} {'audio/frame':>12} {'overruns':>9} "
+          f"{'by audio':>9}")
+    for label, chime in (("silent", False), ("chime", True)):
+        busy = []
+        by_audio = 0    # frames only the audio callbacks pushed over budget
+        playing = 0
+        audio = 0.0
+        next_chime = clock.time()
+        sys.stdout = open(os.devnull, "w")
+        try:
+            for _ in range(frames):
+                if chime and clock.time() >= next_chime:
+                    player.play("new_flight")
+                    next_chime = clock.time() + CHIME_EVERY_S
+                start = time.perf_counter()
+                display.step()
+                step = time.perf_counter() - start
+                before = spent[0]
+                playing += player.playing
+                display.wait(clock.sleep)
+                busy.append((step + spent[0] - before) * 1000 * factor)
+                if step * 1000 * factor <= budget < busy[-1]:
+                    by_audio += 1
+                audio += spent[0] - before
+        finally:
+            sys.stdout = real_stdout
+        player._queue = []
+        player._stop()
+
+        busy.sort()
+        pick = lambda q: busy[min(len(busy) - 1, int(len(busy) * q))]
+        overruns = sum(1 for b in busy if b > budget)
+        print(f"{label:<8} {playing / frames:>8.0%} {pick(0.5):>7.2f} {pick(0.95):>7.2f} {busy[-1]:>7.2f} "
+              f"{audio / frames * 1000 * factor:>12.3f} {overruns:>9} {by_audio:>9}")
+
+
+def main():
+    args = _parse_args()
+    if args.chime:
+        chime_timing(args.frames, args.device_factor)
+        return
+    print(f"Animator dispatch, {FRAMES} frames")
+    for count in (10, 25, 50, 100):
+        bench(count)
+
+
+if __name__ == "__main__":
+    main()
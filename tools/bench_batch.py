@@ -0,0 +1,108 @@
+# Scalar vs NumPy batch view cutting on the LAN relay
+# Run from the repository root with CPython and NumPy:
+#
+#   python tools/bench_batch.py --aircraft 20000 --subscribers 500
+#   python tools/bench_batch.py --scalar-sample 50    # time 50 scalar cuts, extrapolate
+#
+# Builds one FR24 feed response of --aircraft rows over a wide box (the
+# fake API's traffic model) and --subscribers views scattered over it, each
+# with its own zone, altitude limits and home. Times one fetch's worth of
+# work both ways: the scalar path (flight_from_fr24 for every row, then
+# cut_view per subscriber) and the batch path (FlightColumns.from_fr24,
+# then cut_views). Reports the speedup and how many subscribers' flight
+# lists differ between the two.
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import TrafficModel
+from relay.batch import FlightColumns
+from relay.server import cut_view
+from utilities.overhead import EARTH_RADIUS_KM, flight_from_fr24
+
+CENTRE = (54.0, -3.0)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--aircraft", type=int, default=20000)
+    parser.add_argument("--subscribers", type=int, default=500)
+    parser.add_argument("--spread", type=float, default=6.0, help="traffic radius (degrees latitude)")
+    parser.add_argument("--limit", type=int, default=5, help="flights per view")
+    parser.add_argument("--scalar-sample", type=int, default=0,
+                        help="time only this many scalar cuts and extrapolate (0 = all)")
+    parser.add_argument("--repeat", type=int, default=3, help="batch runs (best is reported)")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _views(count, spread, limit, rng):
+    """Subscriber views scattered over the traffic"""
+    views = []
+    for i in range(count):
+        lat = CENTRE[0] + rng.uniform(-spread, spread) * 0.8
+        lon = CENTRE[1] + rng.uniform(-spread, spread) * 1.3
+        size = rng.uniform(0.2, 1.0)
+        view = {
+            "zone": {"tl_y": lat + size, "tl_x": lon - size * 1.6, "br_y": lat - size, "br_x": lon + size * 1.6},
+            "min_altitude": rng.choice((0, 0, 1000, 5000)),
+            "max_altitude": rng.choice((45000, 45000, 20000)),
+            "limit": limit,
+        }
+        if i % 20:  # a few displays without a home location
+            view["home"] = [lat + rng.uniform(-0.1, 0.1), lon + rng.uniform(-0.1, 0.1), EARTH_RADIUS_KM]
+        views.append(view)
+    return views
+
+
+def _scalar(data, views):
+    """Relay without NumPy: parse every row, cut each view"""
+    flights = []
+    for key, val in data.items():
+        flight = flight_from_fr24(key, val)
+        if flight is not None:
+            flights.append(flight)
+    return [cut_view(flights, view) for view in views]
+
+
+def _batch(data, views):
+    return FlightColumns.from_fr24(data).cut_views(views)
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    data = TrafficModel(args.aircraft, CENTRE, radius_deg=args.spread, seed=args.seed).fr24()
+    views = _views(args.subscribers, args.spread, args.limit, rng)
+
+    scalar_views = views[:args.scalar_sample] if args.scalar_sample else views
+    start = time.perf_counter()
+    scalar = _scalar(data, scalar_views)
+    scalar_s = (time.perf_counter() - start) * len(views) / len(scalar_views)
+
+    batch_s = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        batch = _batch(data, views)
+        elapsed = time.perf_counter() - start
+        batch_s = elapsed if batch_s is None else min(batch_s, elapsed)
+
+    differ = sum(
+        1 for a, b in zip(scalar, batch)
+        if list(a) != list(b) or any(a[k] != b[k] for k in a)
+    )
+    shown = sum(len(v) for v in batch)
+    print(f"{args.aircraft} aircraft, {args.subscribers} subscribers, limit {args.limit}")
+    print(f"  scalar   {scalar_s * 1000:8.1f} ms per fetch"
+          f"{f' (extrapolated from {len(scalar_views)})' if args.scalar_sample else ''}")
+    print(f"  batch    {batch_s * 1000:8.1f} ms per fetch  ({scalar_s / batch_s:.1f}x)")
+    print(f"  flights sent {shown}, views differing {differ}/{len(scalar_views)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# Decode rate and accuracy of the Beast (raw Mode S) feed decoder
+# Run from the repository root with CPython:
+#
+#   python tools/bench_beast.py --aircraft 40 --messages 200000
+#
+# Checks utilities/modes.py against the reference messages from "The
+# 1090MHz Riddle", then encodes DF17 frames (identification, even/odd
+# airborne position, velocity) for the fake API's traffic model, wraps
+# them in Beast framing with escapes, and pushes the byte stream through
+# BeastSource in 2 KB reads exactly as poll() would. Reports host
+# messages per second, the decoded position error against the truth, and
+# an RP2350 estimate scaled by --device-factor (MicroPython bytecode on a
+# 150 MHz Cortex-M33 against CPython on a desktop core; measure on a
+# board to replace it).
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import TrafficModel
+from utilities import modes, overhead
+
+# (hex message, what it should decode to) from The 1090MHz Riddle
+REFERENCE_IDENT = "8D4840D6202CC371C32CE0576098"
+REFERENCE_EVEN = "8D40621D58C382D690C8AC2863A7"
+REFERENCE_ODD = "8D40621D58C386435CC412692AD6"
+REFERENCE_VELOCITY = "8D485020994409940838175B284F"
+
+CALLSIGN_CODES = {c: i for i, c in enumerate(modes.CALLSIGN_CHARS.decode()) if c != "#"}
+
+
+def _crc(body):
+    """24-bit Mode S parity of the first 11 bytes"""
+    crc = 0
+    for b in body:
+        crc ^= b << 16
+        for _ in range(8):
+            crc = ((crc << 1) ^ modes.CRC_POLY) if crc & 0x800000 else (crc << 1)
+            crc &= 0xFFFFFF
+    return crc
+
+
+def _message(address, me):
+    """DF17 message bytes for a 56-bit ME field"""
+    body = bytes([0x8D, address >> 16 & 0xFF, address >> 8 & 0xFF, address & 0xFF]) + me.to_bytes(7, "big")
+    return body + _crc(body).to_bytes(3, "big")
+
+
+def encode_ident(address, callsign):
+    me = 4 << 51
+    for i, c in enumerate(callsign.upper().ljust(8)[:8]):
+        me |= CALLSIGN_CODES.get(c, 32) << (42 - 6 * i)
+    return _message(address, me)
+
+
+def _nl(lat):
+    if abs(lat) >= 87:
+        return 1
+    a = 1 - math.cos(math.pi / 30)
+    b = math.cos(math.pi / 180 * abs(lat)) ** 2
+    return int(math.floor(2 * math.pi / math.acos(1 - a / b)))
+
+
+def encode_position(address, lat, lon, altitude, odd):
+    dlat = 360 / (60 - odd)
+    yz = int(math.floor(modes.CPR_MAX * (lat % dlat) / dlat + 0.5))
+    rlat = dlat * (yz / modes.CPR_MAX + math.floor(lat / dlat))
+    dlon = 360 / max(_nl(rlat) - odd, 1)
+    xz = int(math.floor(modes.CPR_MAX * (lon % dlon) / dlon + 0.5))
+    n = (altitude + 1000) // 25
+    alt = ((n & 0x7F0) << 1) | 0x10 | (n & 0xF)
+    me = (11 << 51) | (alt << 36) | (odd << 34) | ((yz & 0x1FFFF) << 17) | (xz & 0x1FFFF)
+    return _message(address, me)
+
+
+def encode_velocity(address, speed, track, vertical_rate):
+    vx = round(speed * math.sin(math.radians(track)))
+    vy = round(speed * math.cos(math.radians(track)))
+    vr = min(abs(vertical_rate) // 64 + 1, 511)
+    me = (19 << 51) | (1 << 48)
+    me |= (vx < 0) << 42 | (min(abs(vx), 1022) + 1) << 32
+    me |= (vy < 0) << 31 | (min(abs(vy), 1022) + 1) << 21
+    me |= (vertical_rate < 0) << 19 | vr << 10
+    return _message(address, me)
+
+
+def beast_frame(message):
+    """Long Mode S Beast frame with a zero timestamp, doubling any 0x1a"""
+    payload = bytes(6) + b"\x80" + message
+    return b"\x1a\x33" + payload.replace(b"\x1a", b"\x1a\x1a")
+
+
+def _check_reference():
+    """Decode the reference messages, raising if any field disagrees"""
+    track = overhead.new_beast_track(0)
+    callsign = bytearray(8)
+    msg = bytes.fromhex(REFERENCE_IDENT)
+    assert modes.crc_ok(msg)
+    modes.decode_callsign(msg, callsign)
+    assert callsign == b"KLM1023 ", callsign
+
+    for name, odd in ((REFERENCE_EVEN, 0), (REFERENCE_ODD, 1)):
+        msg = bytes.fromhex(name)
+        track["cpr_lat%d" % odd] = ((msg[6] & 3) << 15) | (msg[7] << 7) | (msg[8] >> 1)
+        track["cpr_lon%d" % odd] = ((msg[8] & 1) << 16) | (msg[9] << 8) | msg[10]
+    assert modes.cpr_global(track, False)
+    assert (track["lat_e5"], track["lon_e5"]) == (5225720, 391937), track
+    assert modes.decode_altitude(bytes.fromhex(REFERENCE_EVEN)) == 38000
+
+    modes.decode_velocity(bytes.fromhex(REFERENCE_VELOCITY), track)
+    assert (track["velocity"], track["heading"], track["vertical_speed"]) == (159, 183, -832), track
+    print("Reference messages: identification, CPR pair, altitude and velocity OK")
+
+
+def _stream(traffic, count):
+    """Beast bytes for count messages, and each aircraft's true position"""
+    frames = []
+    truth = {}
+    step = 0
+    while len(frames) < count:
+        for ac, lat, lon in traffic.positions():
+            address = int(ac["hex"], 16)
+            kind = step % 4
+            if kind == 0:
+                message = encode_ident(address, ac["callsign"])
+            elif kind == 3:
+                message = encode_velocity(address, ac["speed"], ac["track"], ac["vs"])
+            else:
+                message = encode_position(address, lat, lon, ac["alt"], kind - 1)
+                truth[address] = (lat, lon)
+            frames.append(beast_frame(message))
+        step += 1
+    return b"".join(frames[:count]), truth
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--aircraft", type=int, default=40)
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--device-factor", type=float, default=60,
+                        help="host/RP2350 speed ratio for the device estimate")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    _check_reference()
+
+    zone = overhead.ZONE_DEFAULT
+    centre = ((zone["tl_y"] + zone["br_y"]) / 2, (zone["tl_x"] + zone["br_x"]) / 2)
+    data, truth = _stream(TrafficModel(args.aircraft, centre, seed=args.seed), args.messages)
+
+    source = overhead.BeastSource(None, home=centre)
+    size = len(source._buffer)
+    start = time.perf_counter()
+    for offset in range(0, len(data), size):
+        chunk = data[offset:offset + size]
+        source._buffer[:len(chunk)] = chunk
+        source._fill = len(chunk)
+        source._consume(0)
+    elapsed = time.perf_counter() - start
+
+    errors = [
+        math.hypot(
+            (t["lat_e5"] / 1e5 - truth[a][0]) * 111320,
+            (t["lon_e5"] / 1e5 - truth[a][1]) * 111320 * math.cos(math.radians(truth[a][0])),
+        )
+        for a, t in source.tracks.items() if t["lat_e5"] is not None
+    ]
+    rate = source.frames / elapsed
+    print(
+        f"{source.frames} frames ({len(data)} bytes), {len(source.tracks)} tracks, "
+        f"{source.positions} positions, bad CRC {source.bad_crc}"
+    )
+    print(f"Position error vs truth: max {max(errors):.1f} m over {len(errors)} aircraft")
+    print(f"Host:   {rate:10.0f} msg/s  ({elapsed / source.frames * 1e6:.2f} us/msg)")
+    print(f"RP2350: {rate / args.device_factor:10.0f} msg/s  (estimate, host / {args.device_factor:g})")
+
+
+if __name__ == "__main__":
+    main()
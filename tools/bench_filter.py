@@ -0,0 +1,139 @@
+# Compiled flight filter vs interpreting the FLIGHT_FILTER dict per flight
+# Run from the repository root with CPython:
+#
+#   python tools/bench_filter.py --aircraft 5000
+#   python tools/bench_filter.py --device-factor 60
+#
+# Builds one FR24 feed response (the fake API's traffic model) and, for a
+# few example filters, times per aircraft:
+#   interpreted  walk the filter dict for every flight, in the order written
+#   compiled     utilities/flightfilter.py predicate on flight dicts
+#   parse+interp flight_from_fr24 for every row, then interpret (filter last)
+#   parse+row    compiled FR24-row predicate inside the parse loop, so only
+#                matching rows become flight dicts (as fetch_flights_fr24)
+# and checks all four keep the same flights. --device-factor scales host
+# times to a rough RP2040 estimate.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import TrafficModel
+from utilities.flightfilter import FR24_FIELDS, compile_filter
+from utilities.overhead import flight_from_fr24
+
+FILTERS = {
+    "altitude band": {"altitude": (0, 45000)},
+    "airline + band": {"altitude": (5000, 30000), "airline": ("BAW", "EZY")},
+    "emergencies": {"altitude": (0, 45000), "squawk": ("7500", "7600", "7700")},
+    "descending jets": {
+        "altitude": (1000, 15000), "speed": (150, None), "vertical": "descending",
+        "type": ("A320", "A20N", "A321", "B738", "B38M"), "not": {"airline": "RYR"},
+    },
+    "any of": {"any": [{"squawk": "7700"}, {"type": ("B789", "A359"), "altitude": (None, 10000)}]},
+}
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--aircraft", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per test (best is reported)")
+    parser.add_argument("--device-factor", type=float, default=0, help="host-to-device slowdown (0 = off)")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def interpret(spec, f):
+    """Reference evaluation: dispatch on every key of the dict, every time"""
+    for name, value in spec.items():
+        if name == "airline":
+            prefixes = (value,) if isinstance(value, str) else value
+            callsign = (f["callsign"] or "").upper()
+            if not any(callsign.startswith(p.upper()) for p in prefixes):
+                return False
+        elif name == "type":
+            types = (value,) if isinstance(value, str) else value
+            if (f["aircraft_type"] or "").strip().upper() not in [t.upper() for t in types]:
+                return False
+        elif name == "squawk":
+            squawks = (value,) if isinstance(value, str) else value
+            if (f["squawk"] or "").strip() not in squawks:
+                return False
+        elif name in ("altitude", "speed"):
+            v = f["altitude" if name == "altitude" else "velocity"] or 0
+            low, high = value
+            if (low is not None and v <= low) or (high is not None and v >= high):
+                return False
+        elif name == "vertical":
+            vs = f["vertical_speed"] or 0
+            if (value == "climbing" and vs <= 0) or (value == "descending" and vs >= 0) or (
+                    value == "level" and vs != 0):
+                return False
+        elif name == "any":
+            if not any(interpret(sub, f) for sub in value):
+                return False
+        elif name == "not":
+            if interpret(value, f):
+                return False
+    return True
+
+
+def _best(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    args = _parse_args()
+    data = TrafficModel(args.aircraft, (54.0, -3.0), radius_deg=3.0, seed=args.seed).fr24()
+    rows = [(k, v) for k, v in data.items() if isinstance(v, list)]
+    flights = [flight_from_fr24(k, v) for k, v in rows]
+    flights = [f for f in flights if f is not None]
+
+    factor = args.device_factor or 1
+    unit = "device us (est.)" if args.device_factor else "host us"
+    print(f"{len(rows)} aircraft, per aircraft in {unit}")
+    print(f"{'filter':<16} {'kept':>6} {'interpreted':>12} {'compiled':>9} {'speedup':>8} "
+          f"{'parse+interp':>13} {'parse+row':>10} {'speedup':>8} {'agree':>6}")
+    for label, spec in FILTERS.items():
+        keep = compile_filter(spec)
+        keep_row = compile_filter(spec, FR24_FIELDS)
+
+        interp_s, expected = _best(lambda: [f for f in flights if interpret(spec, f)], args.repeat)
+        compiled_s, got = _best(lambda: [f for f in flights if keep(f)], args.repeat)
+
+        def parse_then_interpret():
+            parsed = [flight_from_fr24(k, v) for k, v in rows]
+            return [f for f in parsed if f is not None and interpret(spec, f)]
+
+        def parse_with_row_filter():
+            kept = []
+            for k, v in rows:
+                if keep_row(v):
+                    flight = flight_from_fr24(k, v)
+                    if flight is not None:
+                        kept.append(flight)
+            return kept
+
+        slow_s, slow = _best(parse_then_interpret, args.repeat)
+        fast_s, fast = _best(parse_with_row_filter, args.repeat)
+
+        ids = [f["id"] for f in expected]
+        agree = ids == [f["id"] for f in got] == [f["id"] for f in slow] == [f["id"] for f in fast]
+        n = len(rows)
+        print(f"{label:<16} {len(expected):>6} {interp_s * 1e6 / n * factor:>12.2f} "
+              f"{compiled_s * 1e6 / n * factor:>9.2f} {interp_s / compiled_s:>7.1f}x "
+              f"{slow_s * 1e6 / n * factor:>13.2f} {fast_s * 1e6 / n * factor:>10.2f} "
+              f"{slow_s / fast_s:>7.1f}x {'yes' if agree else 'NO':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# Point-in-polygon cost of the geofence edge table
+# Run from the repository root with CPython:
+#
+#   python tools/bench_geofence.py
+#   python tools/bench_geofence.py --vertices 10 50 200 --aircraft 5000 --device-factor 60
+#
+# For each vertex count builds a random star-shaped polygon about 0.5
+# degrees across (an approach corridor is far smaller; this is the harder
+# case) and scatters --aircraft positions over twice its bounding box.
+# Times three tests per aircraft:
+#   textbook  ray casting over every edge, slope computed per edge (floats)
+#   slopes    edges and slopes precomputed, bounding-box early-out (floats)
+#   geofence  utilities/geofence.py - integer edge table in bands
+# and counts where geofence disagrees with the textbook answer (only
+# points within the integer grid step of an edge can differ).
+# --device-factor scales host times to a rough RP2040 estimate.
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utilities.geofence import Geofence
+
+CENTRE = (51.47, -0.45)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vertices", type=int, nargs="+", default=[10, 25, 50, 100, 200])
+    parser.add_argument("--aircraft", type=int, default=5000)
+    parser.add_argument("--radius", type=float, default=0.25, help="polygon radius (degrees)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per test (best is reported)")
+    parser.add_argument("--device-factor", type=float, default=0, help="host-to-device slowdown (0 = off)")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _polygon(vertices, radius, rng):
+    """Star-shaped polygon: sorted angles, random radii"""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(vertices))
+    return [
+        (CENTRE[0] + r * math.sin(a), CENTRE[1] + r * 1.6 * math.cos(a))
+        for a, r in ((a, radius * rng.uniform(0.4, 1.0)) for a in angles)
+    ]
+
+
+def _textbook(points, lat, lon):
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        yi, xi = points[i]
+        yj, xj = points[j]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _slope_table(points):
+    """(y0, y1, x0, slope) per non-horizontal edge, and the bounding box"""
+    edges = []
+    for i in range(len(points)):
+        y0, x0 = points[i - 1]
+        y1, x1 = points[i]
+        if y0 == y1:
+            continue
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+        edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0)))
+    lats = [p[0] for p in points]
+    lons = [p[1] for p in points]
+    return edges, (min(lats), max(lats), min(lons), max(lons))
+
+
+def _slopes(table, lat, lon):
+    edges, (south, north, west, east) = table
+    if not (south <= lat <= north and west <= lon <= east):
+        return False
+    inside = False
+    for y0, y1, x0, slope in edges:
+        if y0 <= lat < y1 and lon < x0 + (lat - y0) * slope:
+            inside = not inside
+    return inside
+
+
+def _time(test, positions, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [test(lat, lon) for lat, lon in positions]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6 / len(positions), result
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    factor = args.device_factor or 1
+    unit = "device us (est.)" if args.device_factor else "host us"
+    print(f"{args.aircraft} aircraft over twice the polygon's bounding box, per aircraft in {unit}")
+    print(f"{'vertices':>8} {'inside':>7} {'textbook':>9} {'slopes':>8} {'geofence':>9} "
+          f"{'speedup':>8} {'grid m':>7} {'differ':>7}")
+    for vertices in args.vertices:
+        points = _polygon(vertices, args.radius, rng)
+        fence = Geofence(points)
+        table = _slope_table(points)
+        span_lat = (fence.north - fence.south) / 100000
+        span_lon = (fence.east - fence.west) / 100000
+        positions = [
+            (CENTRE[0] + rng.uniform(-span_lat, span_lat), CENTRE[1] + rng.uniform(-span_lon, span_lon))
+            for _ in range(args.aircraft)
+        ]
+
+        textbook_us, expected = _time(lambda lat, lon: _textbook(points, lat, lon), positions, args.repeat)
+        slopes_us, _ = _time(lambda lat, lon: _slopes(table, lat, lon), positions, args.repeat)
+        fence_us, got = _time(fence.contains, positions, args.repeat)
+
+        differ = sum(1 for a, b in zip(expected, got) if a != b)
+        grid_m = (1 << fence.shift) * 1.11  # 1e-5 degree of latitude is about 1.11 m
+        print(f"{vertices:>8} {sum(expected) / len(expected):>7.1%} {textbook_us * factor:>9.2f} "
+              f"{slopes_us * factor:>8.2f} {fence_us * factor:>9.2f} {textbook_us / fence_us:>7.1f}x "
+              f"{grid_m:>7.1f} {differ:>7}")
+
+
+if __name__ == "__main__":
+    main()
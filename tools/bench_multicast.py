@@ -0,0 +1,148 @@
+# Sync latency and loss recovery of the multi-panel multicast link
+# Run from the repository root with CPython (loopback multicast, no LAN needed):
+#
+#   python tools/bench_multicast.py --followers 4 --flights 5 --seconds 20
+#   python tools/bench_multicast.py --flights 20 --drop 0.2
+#
+# Runs a leader and --followers MulticastLinks in one process on 127.0.0.1,
+# stepping them in 100 ms frames as the display does (leader publishes,
+# then each follower polls). The leader shows a new flight set every
+# --change-every frames. Reports datagrams per set, how many frames each
+# follower lagged behind the leader, and, with --drop, how long the
+# periodic repeats took to recover lost datagrams.
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utilities import multicast
+from utilities.multicast import MulticastLink
+
+AIRPORTS = ("GLA", "EDI", "LHR", "LGW", "DUB", "AMS", "CDG", "FRA", "BHX", "MAN")
+AIRLINES = (("BAW", "British Airways"), ("EZY", "easyJet"), ("RYR", "Ryanair"), ("KLM", "KLM"))
+
+
+def _flight_set(rng, count):
+    """Flights shaped like Overhead.grab_data output"""
+    flights = []
+    for _ in range(count):
+        code, airline = rng.choice(AIRLINES)
+        number = rng.randint(1, 9999)
+        flights.append({
+            "plane": rng.choice(("Airbus A320neo", "Boeing 737-800", "Embraer E190")),
+            "origin": rng.choice(AIRPORTS),
+            "destination": rng.choice(AIRPORTS),
+            "callsign": f"{code}{number}",
+            "flight_number": f"{code[:2]}{number}",
+            "airline": airline,
+            "country": rng.choice(("United Kingdom", "Ireland", "Netherlands")),
+            "squawk": f"{rng.randint(0, 7777):04d}",
+            "altitude": rng.randint(20, 400) * 100,
+            "vertical_speed": rng.choice((-640, 0, 640)),
+            "velocity": rng.randint(200, 480),
+            "heading": rng.randint(0, 359),
+        })
+    return flights
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--followers", type=int, default=4)
+    parser.add_argument("--flights", type=int, default=5, help="flights per set")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--change-every", type=int, default=150, help="frames between new flight sets")
+    parser.add_argument("--drop", type=float, default=0.0, help="fraction of datagrams to drop")
+    parser.add_argument("--frame-ms", type=float, default=100)
+    parser.add_argument("--port", type=int, default=multicast.MULTICAST_PORT)
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")  # silence the link's startup logging
+    try:
+        leader = MulticastLink("leader", port=args.port, interface="127.0.0.1")
+        followers = [
+            MulticastLink("follower", port=args.port, interface="127.0.0.1")
+            for _ in range(args.followers)
+        ]
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+    # Drop datagrams on the leader's side to exercise the repeats
+    send = leader._sock.sendto
+    loss = random.Random(args.seed + 1)
+    dropped = [0]
+
+    def lossy_sendto(data, addr):
+        if loss.random() < args.drop:
+            dropped[0] += 1
+            return len(data)
+        return send(data, addr)
+
+    class LossySocket:
+        def __init__(self, sock):
+            self._sock = sock
+
+        def __getattr__(self, name):
+            return getattr(self._sock, name)
+
+        sendto = staticmethod(lossy_sendto)
+
+    leader._sock = LossySocket(leader._sock)
+
+    frames = int(args.seconds * 1000 / args.frame_ms)
+    shown = None
+    shown_frame = 0
+    lags = []
+    waiting = {}
+    datagrams = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        if frame % args.change_every == 0:
+            shown = _flight_set(rng, args.flights)
+            shown_frame = frame
+            waiting = {i: True for i in range(len(followers))}
+            sent = leader.sent
+        leader.publish(shown, time.time(), None, 0)
+        if frame == shown_frame:
+            datagrams.append(leader.sent - sent)
+
+        for i, follower in enumerate(followers):
+            if follower.poll() and waiting.get(i) and follower.flights == shown:
+                lags.append(frame - shown_frame)
+                waiting[i] = False
+
+        delay = args.frame_ms / 1000 - (time.perf_counter() - start)
+        if delay > 0:
+            time.sleep(delay)
+
+    sets = len(datagrams)
+    missed = sets * len(followers) - len(lags)
+    print(f"{len(followers)} followers, {sets} flight sets of {args.flights}, "
+          f"{args.frame_ms:g} ms frames, drop {args.drop:.0%}")
+    print(f"  datagrams per set   {max(datagrams)} (payload cap {multicast.MULTICAST_DATAGRAM} bytes)")
+    print(f"  datagrams sent {leader.sent}, dropped {dropped[0]}, bad {sum(f.bad for f in followers)}")
+    if lags:
+        lags.sort()
+        same = sum(1 for lag in lags if lag == 0)
+        print(f"  in sync same frame  {same}/{len(lags)}  "
+              f"lag p95 {lags[int(len(lags) * 0.95)]} frames  max {lags[-1]} frames")
+    print(f"  never received      {missed}")
+
+    leader.close()
+    for follower in followers:
+        follower.close()
+
+
+if __name__ == "__main__":
+    main()
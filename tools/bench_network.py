@@ -0,0 +1,154 @@
+# Throughput/latency numbers for the network-heavy code paths
+# Run from the repository root with CPython:
+#
+#   python tools/bench_network.py --runs 20 --aircraft 200 --latency-ms 120 --bandwidth 40000
+#
+# Starts the fake API server in-process, points utilities/https.py at it
+# and times fetch_flights_fr24, fetch_flights_airplanes_live, a local
+# receiver's aircraft.json poll (full parse, and skipped because its
+# counters didn't move), grab_weather_data and a full Overhead.grab_data
+# under the given conditions. The receiver transfer is non-blocking, so
+# its longest single poll() - the most it adds to one frame - is shown too.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import FakeApiServer, FaultConfig, TrafficModel
+from utilities import https
+from utilities import overhead
+from scenes import weather
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--aircraft", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--bandwidth", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _time_path(name, func, runs, server):
+    """Run func() `runs` times and print latency and throughput"""
+    latencies = []
+    ok = 0
+    items = 0
+    bytes_before = server.stats["bytes"]
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if result:
+            ok += 1
+            items += len(result) if isinstance(result, (list, dict)) else 1
+    latencies.sort()
+    total_s = sum(latencies) / 1000
+    sent = server.stats["bytes"] - bytes_before
+    pick = lambda q: latencies[min(len(latencies) - 1, int(len(latencies) * q))]
+    print(
+        f"{name:<22} ok {ok:>3}/{runs:<3} p50 {pick(0.5):7.1f}ms  p95 {pick(0.95):7.1f}ms  "
+        f"max {latencies[-1]:7.1f}ms  {sent / total_s / 1024:7.1f} KiB/s  "
+        f"{items / total_s:7.1f} items/s"
+    )
+
+
+def main():
+    args = _parse_args()
+    centre = (
+        (overhead.ZONE_DEFAULT["tl_y"] + overhead.ZONE_DEFAULT["br_y"]) / 2,
+        (overhead.ZONE_DEFAULT["tl_x"] + overhead.ZONE_DEFAULT["br_x"]) / 2,
+    )
+    server = FakeApiServer(
+        traffic=TrafficModel(args.aircraft, centre, seed=args.seed),
+        faults=FaultConfig(
+            args.latency_ms, 0, args.bandwidth, args.chunk,
+            args.truncate_rate, args.error_rate, 0.0, args.seed,
+        ),
+    ).start()
+    host, port = server.address
+    https.set_api_override(host, port)
+    print(f"Fake API on {host}:{port}, {args.aircraft} aircraft, {args.runs} runs per path")
+
+    # Silence the per-request logging of the code under test
+    real_stdout = sys.stdout
+    devnull = open(os.devnull, "w")
+
+    def quiet(func):
+        def run():
+            sys.stdout = devnull
+            try:
+                return func()
+            finally:
+                sys.stdout = real_stdout
+        return run
+
+    def fr24():
+        flights, success = overhead.fetch_flights_fr24(overhead.ZONE_DEFAULT)
+        return flights if success else None
+
+    def airplanes():
+        return overhead.fetch_flights_airplanes_live(overhead.ZONE_DEFAULT)
+
+    def forecast():
+        weather._weather_cache["forecast"] = None
+        weather._weather_cache["retry_at"] = 0
+        return weather.grab_weather_data(weather.WEATHER_LAT, weather.WEATHER_LON)
+
+    receiver = overhead.ReceiverSource(host, port)
+
+    longest_poll = [0.0]
+
+    def receiver_transfer():
+        # One whole transfer, polled back to back as the frame loop would
+        receiver._last_poll = 0
+        receiver._next_attempt = 0
+        while True:
+            start = time.perf_counter()
+            receiver.poll()
+            longest_poll[0] = max(longest_poll[0], time.perf_counter() - start)
+            if receiver._sock is None:
+                break
+
+    def receiver_parse():
+        receiver._counters = None
+        parsed = receiver.parsed
+        receiver_transfer()
+        return receiver.aircraft if receiver.parsed > parsed else None
+
+    def receiver_unchanged():
+        # Polled again within the same receiver second - should be skipped
+        skipped = receiver.skipped
+        receiver_transfer()
+        return receiver.skipped > skipped
+
+    tracker = overhead.Overhead()
+
+    def grab():
+        tracker.grab_data()
+        return tracker._data
+
+    try:
+        _time_path("fetch_flights_fr24", quiet(fr24), args.runs, server)
+        _time_path("fetch_airplanes_live", quiet(airplanes), args.runs, server)
+        _time_path("receiver aircraft.json", quiet(receiver_parse), args.runs, server)
+        _time_path("receiver unchanged", quiet(receiver_unchanged), args.runs, server)
+        print(f"{'receiver poll()':<22} longest single call (one frame) {longest_poll[0] * 1000:.2f}ms")
+        _time_path("grab_weather_data", quiet(forecast), args.runs, server)
+        _time_path("Overhead.grab_data", quiet(grab), args.runs, server)
+    finally:
+        server.stop()
+        devnull.close()
+
+    print("Server: " + ", ".join(f"{k}={v}" for k, v in server.stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Upstream load and per-display traffic of the LAN relay
+# Run from the repository root with CPython:
+#
+#   python tools/bench_relay.py --clients 20 --seconds 10 --interval 2
+#
+# Starts the fake API as the one upstream, a relay in front of it, and
+# --clients RelaySource instances with their own zones and homes scattered
+# over the default zone, each polled once per 100 ms frame as the display
+# does. Reports upstream requests against what the displays would have
+# made fetching for themselves, bytes each display received, time to the
+# first view, the host cost of a poll, and whether every display's flights
+# match what the relay cut for its view.
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import FakeApiServer, TrafficModel
+from relay.server import RelayServer
+from utilities import overhead
+from utilities.https import set_api_override
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--interval", type=float, default=2, help="relay fetch interval (seconds)")
+    parser.add_argument("--aircraft", type=int, default=60)
+    parser.add_argument("--frame-ms", type=float, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _client_views(count, rng):
+    """(zone, home) per simulated display, scattered over the default zone"""
+    zone = overhead.ZONE_DEFAULT
+    views = []
+    for _ in range(count):
+        lat = rng.uniform(zone["br_y"] + 0.2, zone["tl_y"] - 0.2)
+        lon = rng.uniform(zone["tl_x"] + 0.3, zone["br_x"] - 0.3)
+        size = rng.uniform(0.2, 0.5)
+        views.append((
+            {"tl_y": lat + size, "tl_x": lon - size * 1.6, "br_y": lat - size, "br_x": lon + size * 1.6},
+            [lat, lon, overhead.EARTH_RADIUS_KM],
+        ))
+    return views
+
+
+def _start_relay(interval):
+    """Relay on its own event loop thread; returns (relay, loop)"""
+    loop = asyncio.new_event_loop()
+    relay = RelayServer("127.0.0.1", 0, interval)
+    loop.run_until_complete(relay.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return relay, loop
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    zone = overhead.ZONE_DEFAULT
+    centre = ((zone["tl_y"] + zone["br_y"]) / 2, (zone["tl_x"] + zone["br_x"]) / 2)
+
+    upstream = FakeApiServer(traffic=TrafficModel(args.aircraft, centre, radius_deg=1.0, seed=args.seed))
+    requests = {"flights": 0, "weather": 0}
+    body_for = upstream.body_for
+
+    def counting_body_for(path, query):
+        requests["weather" if path == "/v1/forecast" else "flights"] += 1
+        return body_for(path, query)
+
+    upstream.body_for = counting_body_for
+    upstream.start()
+    set_api_override(*upstream.address)
+
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")  # silence per-fetch logging
+    try:
+        relay, loop = _start_relay(args.interval)
+        host, port = relay.address
+        clients = [
+            overhead.RelaySource(host, port, zone=z, home=h)
+            for z, h in _client_views(args.clients, rng)
+        ]
+
+        start = time.perf_counter()
+        first_view = [None] * len(clients)
+        costs = []
+        next_frame = start
+        while time.perf_counter() - start < args.seconds:
+            for i, client in enumerate(clients):
+                t0 = time.perf_counter()
+                client.poll()
+                costs.append((time.perf_counter() - t0) * 1e6)
+                if first_view[i] is None and client.live:
+                    first_view[i] = time.perf_counter() - start
+            next_frame += args.frame_ms / 1000
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        # Drain what is in flight, then compare each display's flights with
+        # the relay's cut of its view as last sent
+        time.sleep(0.2)
+        for client in clients:
+            client.poll()
+        mismatched = 0
+        by_port = {sub.peer[1]: sub for sub in relay.subscribers}
+        received = []
+        for client in clients:
+            sub = by_port[client._sock.getsockname()[1]]
+            expected = sub.sent
+            if set(client.tracks) != set(expected) or any(
+                client.tracks[k] != expected[k] for k in expected
+            ):
+                mismatched += 1
+            received.append(sub.bytes)
+            client.close()
+
+        asyncio.run_coroutine_threadsafe(relay.stop(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        upstream.stop()
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+    fetches = relay.stats["fetches"]
+    costs.sort()
+    ready = [t for t in first_view if t is not None]
+    print(f"{args.clients} displays, {args.seconds:g}s, relay fetch every {args.interval:g}s, "
+          f"{args.aircraft} aircraft upstream")
+    print(f"  upstream requests   flights {requests['flights']}  weather {requests['weather']}  "
+          f"(displays alone: ~{args.clients * max(1, fetches)} flight fetches, {args.clients} forecasts)")
+    print(f"  views               {len(ready)}/{args.clients} live, first view after "
+          f"{max(ready) * 1000 if ready else 0:.0f} ms (slowest), {mismatched} mismatched")
+    print(f"  bytes per display   mean {sum(received) / len(received):.0f}  max {max(received)}  "
+          f"(upstream sent {upstream.stats['bytes']} in total)")
+    print(f"  poll p50 {costs[len(costs) // 2]:.0f}us  p95 {costs[int(len(costs) * 0.95)]:.0f}us  "
+          f"max {costs[-1]:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Ingest rate and per-poll cost of the local receiver BaseStation feed
+# Run from the repository root with CPython:
+#
+#   python tools/bench_sbs.py --rates 100,500,1000 --seconds 5
+#   python tools/bench_sbs.py --record sbs_capture.txt --rates 1000
+#
+# Starts the fake SBS feed in-process at each rate and drives an SbsSource
+# against it the way the display does - one poll() per 100 ms frame - then
+# reports messages applied against messages sent, dropped lines, track
+# count, position age and the host cost of each poll.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from emulator.fakeapi import TrafficModel
+from emulator.fakesbs import FakeSbsServer
+from utilities import overhead
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rates", default="100,500,1000", help="messages per second, comma separated")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--aircraft", type=int, default=40)
+    parser.add_argument("--frame-ms", type=float, default=100)
+    parser.add_argument("--record", help="replay MSG lines from a capture file")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _run(rate, args, centre):
+    server = FakeSbsServer(
+        rate=rate, traffic=TrafficModel(args.aircraft, centre, seed=args.seed),
+        record=args.record,
+    ).start()
+    host, port = server.address
+    source = overhead.SbsSource(host, port)
+
+    costs = []
+    end = time.perf_counter() + args.seconds
+    next_frame = time.perf_counter()
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        source.poll()
+        costs.append((time.perf_counter() - start) * 1e6)
+        next_frame += args.frame_ms / 1000
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    # One last drain so messages in flight at the end aren't counted as lost
+    source.poll()
+    server.stop()
+    source.close()
+
+    now = time.time()
+    ages = [now - t["position_time"] for t in source.tracks.values() if t["position_time"]]
+    costs.sort()
+    pick = lambda q: costs[min(len(costs) - 1, int(len(costs) * q))]
+    return (
+        f"{rate:>5} msg/s  applied {source.messages:>6}/{server.stats['messages']:<6} "
+        f"bad {source.bad_lines:<3} overflow {source.overflows:<3} tracks {len(source.tracks):<4} "
+        f"pos age max {max(ages) if ages else 0:4.1f}s  "
+        f"poll p50 {pick(0.5):6.0f}us  p95 {pick(0.95):6.0f}us  max {costs[-1]:6.0f}us"
+    )
+
+
+def main():
+    args = _parse_args()
+    centre = (
+        (overhead.ZONE_DEFAULT["tl_y"] + overhead.ZONE_DEFAULT["br_y"]) / 2,
+        (overhead.ZONE_DEFAULT["tl_x"] + overhead.ZONE_DEFAULT["br_x"]) / 2,
+    )
+    print(f"{args.aircraft} aircraft, {args.seconds}s per rate, one poll per {args.frame_ms:g}ms")
+
+    real_stdout = sys.stdout
+    devnull = open(os.devnull, "w")
+    try:
+        for rate in (int(r) for r in args.rates.split(",")):
+            # Silence the connect/drop logging of the code under test
+            sys.stdout = devnull
+            try:
+                line = _run(rate, args, centre)
+            finally:
+                sys.stdout = real_stdout
+            print(line)
+    finally:
+        devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Lookup cost and memory of the on-flash tables versus an in-RAM dict
+# Run from the repository root with CPython:
+#
+#   python tools/bench_tables.py --lookups 20000
+#
+# For each table in tools/build_tables.py, times dict.get against
+# FlashTable with its MRU cache disabled (every lookup is a binary search
+# on the file) and enabled (a realistic few-flights-at-a-time key mix),
+# and reports the heap each one holds at rest.
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from build_tables import TABLES, DATA_DIR, read_rows
+from utilities.flashtable import FlashTable
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--miss-rate", type=float, default=0.1,
+                        help="fraction of lookups for keys not in the table")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _heap(build):
+    """Bytes still allocated by build() once it returns"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def _time(label, func, keys):
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed / len(keys) * 1e6:8.2f} us/lookup")
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+
+    for name, (key_column, _, _, _) in TABLES.items():
+        path = os.path.join(DATA_DIR, name + ".bin")
+        rows = read_rows(os.path.join(DATA_DIR, name + ".csv"))
+        key_columns = key_column if isinstance(key_column, tuple) else (key_column,)
+        columns = [c for c in rows[0] if c not in key_columns]
+        keys = [row[c].strip().upper() for row in rows for c in key_columns if row[c].strip()]
+
+        mapping, dict_bytes = _heap(
+            lambda: {
+                row[c].strip().upper(): tuple(row[v] for v in columns)
+                for row in rows for c in key_columns if row[c].strip()
+            }
+        )
+        table, table_bytes = _heap(lambda: FlashTable(path, cache_size=0))
+        table.lookup(keys[0])  # open the file and read the header
+
+        # Uniform keys (cold) and a handful of repeating keys (as on the panel)
+        cold = [
+            "ZZZZ"[:len(keys[0])] if rng.random() < args.miss_rate else rng.choice(keys)
+            for _ in range(args.lookups)
+        ]
+        working_set = rng.sample(keys, min(5, len(keys)))
+        warm = [rng.choice(working_set) for _ in range(args.lookups)]
+
+        print(f"{name}: {len(keys)} records, {os.path.getsize(path)} bytes on flash")
+        print(f"  {'dict heap':<24} {dict_bytes:8d} bytes")
+        print(f"  {'FlashTable heap':<24} {table_bytes:8d} bytes")
+        _time("dict.get", mapping.get, cold)
+        _time("FlashTable (no cache)", table.lookup, cold)
+        print(f"  {'reads per search':<24} {table.reads / args.lookups:8.1f}")
+        table.cache_size = 8
+        _time("FlashTable (MRU, warm)", table.lookup, warm)
+        table.close()
+
+
+if __name__ == "__main__":
+    main()
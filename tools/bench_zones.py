@@ -0,0 +1,124 @@
+# Scaling of the watch zone grid index against testing every zone
+# Run from the repository root with CPython:
+#
+#   python tools/bench_zones.py
+#   python tools/bench_zones.py --zones 1 10 100 1000 --aircraft 150 5000 --steps 20
+#   python tools/bench_zones.py --cell 0.5 --device-factor 60
+#
+# For each (zones, aircraft) pair: zones of 0.2-1.5 degrees scattered over
+# a 10 x 16 degree area, aircraft moving through it at airliner speeds,
+# stepped --steps times by --step-seconds. Times the naive test (every
+# aircraft against every zone) and ZoneIndex.move() per aircraft update,
+# and checks that both give the same zones. --device-factor scales host
+# times to a rough RP2040 estimate.
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utilities.zones import ZONE_CELL_DEG, ZoneIndex, zone_contains
+
+AREA = (50.0, -8.0, 60.0, 8.0)  # south, west, north, east
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, nargs="+", default=[1, 3, 10, 100, 500])
+    parser.add_argument("--aircraft", type=int, nargs="+", default=[150, 1000, 5000])
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--step-seconds", type=float, default=5, help="time between position updates")
+    parser.add_argument("--cell", type=float, default=ZONE_CELL_DEG)
+    parser.add_argument("--device-factor", type=float, default=0, help="host-to-device slowdown (0 = off)")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def _zones(count, rng):
+    zones = {}
+    for i in range(count):
+        lat = rng.uniform(AREA[0] + 1, AREA[2] - 1)
+        lon = rng.uniform(AREA[1] + 1, AREA[3] - 1)
+        size = rng.uniform(0.1, 0.75)
+        zones[i] = {"tl_y": lat + size, "tl_x": lon - size * 1.6, "br_y": lat - size, "br_x": lon + size * 1.6}
+    return zones
+
+
+def _aircraft(count, rng):
+    """[lat, lon, dlat/s, dlon/s] per aircraft"""
+    aircraft = []
+    for _ in range(count):
+        lat = rng.uniform(AREA[0], AREA[2])
+        lon = rng.uniform(AREA[1], AREA[3])
+        knots = rng.uniform(150, 480)
+        track = math.radians(rng.uniform(0, 360))
+        deg_s = knots / 3600 / 60
+        aircraft.append([lat, lon, deg_s * math.cos(track), deg_s * math.sin(track) / math.cos(math.radians(lat))])
+    return aircraft
+
+
+def _naive(zones, lat, lon):
+    return tuple(zone_id for zone_id, zone in zones.items() if zone_contains(zone, lat, lon))
+
+
+def _run(zone_count, aircraft_count, args, rng):
+    zones = _zones(zone_count, rng)
+    aircraft = _aircraft(aircraft_count, rng)
+
+    start = time.perf_counter()
+    index = ZoneIndex(zones, cell=args.cell)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    naive_s = index_s = 0.0
+    updates = inside = mismatched = 0
+    for _ in range(args.steps):
+        for ac in aircraft:
+            ac[0] += ac[2] * args.step_seconds
+            ac[1] += ac[3] * args.step_seconds
+
+        start = time.perf_counter()
+        expected = [_naive(zones, ac[0], ac[1]) for ac in aircraft]
+        naive_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = [index.move(i, ac[0], ac[1]) for i, ac in enumerate(aircraft)]
+        index_s += time.perf_counter() - start
+
+        for a, b in zip(expected, got):
+            if sorted(a) != sorted(b):
+                mismatched += 1
+            inside += bool(a)
+        updates += len(aircraft)
+
+    return {
+        "build_ms": build_ms,
+        "cells": len(index._cells),
+        "naive_us": naive_s * 1e6 / updates,
+        "index_us": index_s * 1e6 / updates,
+        "inside": inside / updates,
+        "mismatched": mismatched,
+    }
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    factor = args.device_factor or 1
+    unit = "device us (est.)" if args.device_factor else "host us"
+    print(f"cell {args.cell} deg, {args.steps} steps of {args.step_seconds:g}s, per aircraft update in {unit}")
+    print(f"{'zones':>6} {'aircraft':>8} {'cells':>7} {'build ms':>9} {'naive':>8} {'index':>8} "
+          f"{'speedup':>8} {'in zone':>8} {'mismatch':>9}")
+    for zone_count in args.zones:
+        for aircraft_count in args.aircraft:
+            r = _run(zone_count, aircraft_count, args, rng)
+            print(f"{zone_count:>6} {aircraft_count:>8} {r['cells']:>7} {r['build_ms'] * factor:>9.1f} "
+                  f"{r['naive_us'] * factor:>8.2f} {r['index_us'] * factor:>8.2f} "
+                  f"{r['naive_us'] / r['index_us']:>7.1f}x {r['inside']:>8.1%} {r['mismatched']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Build the on-flash lookup tables in data/ from their CSV sources
+# Run from the repository root with CPython after editing a CSV:
+#
+#   python tools/build_tables.py            # rebuild every table
+#   python tools/build_tables.py aircraft_types
+#
+# Copy the resulting data/*.bin files to the device along with the code.
+# See utilities/flashtable.py for the file layout.
+
+import csv
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utilities.flashtable import MAGIC, HEADER, pack_key
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _text(column, size):
+    """Value encoder for one NUL-padded UTF-8 text column"""
+    def encode(row):
+        text = row[column].strip()
+        raw = text.encode()
+        # Trim whole characters so multi-byte UTF-8 isn't split
+        while len(raw) > size:
+            text = text[:-1]
+            raw = text.encode()
+        return raw + b"\0" * (size - len(raw))
+    return encode
+
+
+def _airport(row):
+    """City (20 bytes NUL-padded) followed by lat, lon as float32"""
+    return _text("city", 20)(row) + struct.pack("<ff", float(row["lat"]), float(row["lon"]))
+
+
+# name -> (key column(s), key size, value size, encoder(row) -> bytes)
+# A tuple of key columns stores the row under each non-empty code
+TABLES = {
+    "aircraft_types": ("code", 4, 32, _text("name", 32)),
+    "airlines": ("icao", 3, 24, _text("name", 24)),
+    "airports": (("iata", "icao"), 4, 28, _airport),
+}
+
+
+def read_rows(path):
+    """CSV rows as dicts, skipping '#' comment lines"""
+    with open(path, newline="", encoding="utf-8") as f:
+        lines = [line for line in f if not line.startswith("#")]
+    return list(csv.DictReader(lines))
+
+
+def build_table(rows, key_column, key_size, value_size, encode):
+    """
+    Pack rows into table bytes.
+
+    Returns:
+        (bytes, count)
+    """
+    key_columns = key_column if isinstance(key_column, tuple) else (key_column,)
+    records = {}
+    for row in rows:
+        value = encode(row)
+        assert len(value) == value_size
+        for column in key_columns:
+            key = row[column].strip().upper()
+            if not key:
+                continue
+            packed = pack_key(key, key_size)
+            if packed is None:
+                raise ValueError(f"key {key!r} longer than {key_size} bytes")
+            if packed in records:
+                print(f"  duplicate key {key!r}, keeping the first")
+                continue
+            records[packed] = value
+
+    body = b"".join(k + records[k] for k in sorted(records))
+    header = struct.pack(HEADER, MAGIC, key_size, 0, value_size, len(records))
+    return header + body, len(records)
+
+
+def main():
+    names = sys.argv[1:] or list(TABLES)
+    for name in names:
+        key_column, key_size, value_size, encode = TABLES[name]
+        source = os.path.join(DATA_DIR, name + ".csv")
+        target = os.path.join(DATA_DIR, name + ".bin")
+        data, count = build_table(
+            read_rows(source), key_column, key_size, value_size, encode
+        )
+        with open(target, "wb") as f:
+            f.write(data)
+        print(f"{name}: {count} records, {len(data)} bytes -> {os.path.relpath(target)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Airport lookups for Interstate 75 W
+# IATA/ICAO code -> city and position, from an on-flash table, plus
+# great-circle route distance and time to destination
+
+import math
+import struct
+
+from utilities.flashtable import FlashTable, text_value
+
+# Airport code -> city, lat, lon (see tools/build_tables.py)
+AIRPORTS_FILE = "data/airports.bin"
+_airports = FlashTable(AIRPORTS_FILE)
+
+CITY_SIZE = 20
+EARTH_RADIUS_KM = 6371
+KNOTS_TO_KMH = 1.852
+
+
+def airport(code):
+    """
+    Look up an airport by IATA or ICAO code.
+
+    Returns:
+        Tuple of (city, lat, lon), or None if unknown
+    """
+    if not code:
+        return None
+    value = _airports.lookup(code.upper())
+    if value is None:
+        return None
+    lat, lon = struct.unpack_from("<ff", value, CITY_SIZE)
+    return (text_value(value[:CITY_SIZE]), lat, lon)
+
+
+def city(code):
+    """City name for an airport code ("" if unknown)"""
+    found = airport(code)
+    return found[0] if found else ""
+
+
+def great_circle_km(lat1, lon1, lat2, lon2):
+    """Haversine distance between two points in km"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+def route_info(origin, destination, lat=None, lon=None, speed_kts=0):
+    """
+    Route length and time remaining for a flight.
+
+    Args:
+        origin, destination: Airport codes
+        lat, lon: Current aircraft position (for the remaining distance)
+        speed_kts: Ground speed in knots
+
+    Returns:
+        Tuple of (route_km, eta_minutes) - either is None if unknown
+    """
+    dest = airport(destination)
+    if dest is None:
+        return (None, None)
+
+    route_km = None
+    orig = airport(origin)
+    if orig is not None:
+        route_km = int(great_circle_km(orig[1], orig[2], dest[1], dest[2]))
+
+    eta_minutes = None
+    if lat is not None and lon is not None and speed_kts and speed_kts > 50:
+        remaining_km = great_circle_km(lat, lon, dest[1], dest[2])
+        eta_minutes = int(remaining_km / (speed_kts * KNOTS_TO_KMH) * 60)
+
+    return (route_km, eta_minutes)
@@ -3,12 +3,19 @@
 
 import time
 
+from utilities.profiler import FrameProfiler, ticks_us, ticks_diff
+
 DELAY_DEFAULT = 0.1  # 100ms default delay
 
 # Global registry for keyframe metadata
-# MicroPython can have issues setting attributes on functions
+# MicroPython can have issues setting attributes on functions, so the
+# decorated function object itself is used as the key. This keeps two
+# scenes with identically named methods from overwriting each other.
 _keyframe_registry = {}
 
+# Default properties for methods that aren't registered keyframes
+_DEFAULT_PROPS = {"divisor": 1, "offset": 0}
+
 
 def keyframe(divisor, offset=0):
     """
@@ -19,23 +26,33 @@ def keyframe(divisor, offset=0):
         offset: Frame offset before first run
     """
     def decorator(func):
-        # Use function name as key for the registry
-        key = func.__name__
-        _keyframe_registry[key] = {
+        _keyframe_registry[func] = {
             "divisor": divisor,
             "offset": offset,
-            "count": 0
         }
         return func
     return decorator
 
 
+def _first_due(divisor, offset):
+    """First frame (>= 1) on which a keyframe with this divisor/offset runs"""
+    first = offset % divisor
+    if first == 0:
+        first = divisor
+    return first
+
+
 class Animator:
     """
     Keyframe-based animation system for MicroPython.
 
     Uses decorator pattern to register methods that run at specific intervals.
     Divisor determines how often a method runs (every N frames).
+
+    Keyframes are compiled once at start-up into per-instance buckets grouped
+    by (divisor, offset). Each bucket tracks the next frame it is due, so a
+    frame only compares one integer per bucket and calls only the keyframes
+    that are actually due.
     """
 
     # Alias for backwards compatibility with @Animator.KeyFrame.add syntax
@@ -48,56 +65,186 @@ class Animator:
         self._delay = DELAY_DEFAULT
         self._reset_scene = True
 
+        # Frames advanced per loop - raised in idle mode to drop the frame
+        # rate without changing the real-time period of any keyframe
+        self.frame_stride = 1
+
+        # Compiled dispatch tables
+        self._props = {}            # method name -> props for this instance
+        self._entries = []          # [method, count, slot] per periodic keyframe
+        self._reset_methods = ()    # divisor == 0 keyframes, in order
+        self._buckets = []          # [next_due, divisor, entry indexes]
+        self._due_cache = {}        # bucket bitmask -> tuple of entries
+
+        # Optional frame-time profiler (see enable_profiler)
+        self.profiler = None
+
         self._register_keyframes()
+        self._compile_keyframes()
 
     def _register_keyframes(self):
         """Find and register all methods that are keyframes"""
+        cls = type(self)
         for methodname in dir(self):
-            if methodname in _keyframe_registry:
-                method = getattr(self, methodname)
-                if callable(method):
-                    self.keyframes.append((methodname, method))
+            func = getattr(cls, methodname, None)
+            try:
+                props = _keyframe_registry.get(func)
+            except TypeError:
+                # Unhashable class attribute - can't be a keyframe
+                continue
+            if props is None:
+                continue
+            method = getattr(self, methodname)
+            if callable(method):
+                self.keyframes.append((methodname, method))
+                self._props[methodname] = props
+
+    def _compile_keyframes(self):
+        """Build the reset list and (divisor, offset) buckets"""
+        resets = []
+        groups = {}
+
+        for slot, (name, method) in enumerate(self.keyframes):
+            props = self._props[name]
+            divisor = props["divisor"]
+            if divisor == 0:
+                resets.append(method)
+                continue
+
+            # Entries keep registration order so merged frames run in the
+            # same order as the original single-list scan
+            index = len(self._entries)
+            self._entries.append([method, 0, slot])
+
+            key = (divisor, props["offset"])
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(index)
+
+        self._reset_methods = tuple(resets)
+
+        for (divisor, offset), indexes in groups.items():
+            self._buckets.append(
+                [_first_due(divisor, offset), divisor, tuple(indexes)]
+            )
 
     def _get_props(self, name):
         """Get keyframe properties by method name"""
-        return _keyframe_registry.get(name, {"divisor": 1, "offset": 0, "count": 0})
+        return self._props.get(name, _DEFAULT_PROPS)
+
+    def _due_entries(self, mask):
+        """Return the entries for a set of due buckets, in registration order"""
+        entries = self._due_cache.get(mask)
+        if entries is None:
+            indexes = []
+            for bit in range(len(self._buckets)):
+                if mask & (1 << bit):
+                    indexes.extend(self._buckets[bit][2])
+            indexes.sort()
+            entries = tuple(self._entries[i] for i in indexes)
+            self._due_cache[mask] = entries
+        return entries
+
+    def enable_profiler(self, budget_us=None):
+        """
+        Start recording keyframe and frame timings.
+
+        Args:
+            budget_us: Frame budget for overrun counting (defaults to delay)
+        """
+        if budget_us is None:
+            budget_us = int(self._delay * 1000000)
+        self.profiler = FrameProfiler(
+            [name for name, _ in self.keyframes], budget_us
+        )
+        print("Profiler: enabled, send 'p' for report, 'r' to reset")
+        return self.profiler
 
     def reset_scene(self):
         """Reset all keyframes with divisor == 0"""
-        for name, method in self.keyframes:
-            props = self._get_props(name)
-            if props["divisor"] == 0:
+        for method in self._reset_methods:
+            method()
+
+    def step(self):
+        """Run every keyframe that is due on the current frame, then advance"""
+        frame = self.frame
+        profiler = self.profiler
+        if profiler is not None:
+            frame_start = ticks_us()
+
+        # If divisor == 0 then only run once on first loop
+        if frame == 0:
+            for method in self._reset_methods:
                 method()
+        else:
+            mask = 0
+            bit = 1
+            for bucket in self._buckets:
+                if bucket[0] <= frame:
+                    mask |= bit
+                    bucket[0] += bucket[1]
+                    # Catch up if frames were skipped
+                    while bucket[0] <= frame:
+                        bucket[0] += bucket[1]
+                bit <<= 1
+
+            if mask:
+                if profiler is None:
+                    for entry in self._due_entries(mask):
+                        if entry[0](entry[1]):
+                            entry[1] = 0
+                        else:
+                            entry[1] += 1
+                else:
+                    self._run_profiled(self._due_entries(mask))
+
+        # Every step is a frame sample, empty ones included, so the
+        # histogram is the distribution the loop actually sees
+        if profiler is not None:
+            profiler.record_frame(ticks_diff(ticks_us(), frame_start))
+            profiler.poll_serial()
+
+        self._reset_scene = False
+        self.frame = frame + self.frame_stride
+
+    def _run_profiled(self, entries):
+        """Run due entries while recording per-keyframe time"""
+        profiler = self.profiler
+        for entry in entries:
+            start = ticks_us()
+            if entry[0](entry[1]):
+                entry[1] = 0
+            else:
+                entry[1] += 1
+            profiler.record(entry[2], ticks_diff(ticks_us(), start))
+
+    def wait(self, sleep=time.sleep):
+        """
+        Sleep until the next step is due.
+
+        In idle mode (frame_stride > 1) the wait is split into single frame
+        periods with poll_input() after each, so input is still read at the
+        full frame rate. Input ends idle mode at once: the frame counter is
+        wound back to the frames actually slept, keeping keyframe timing.
+        """
+        stride = self.frame_stride
+        for slept in range(1, stride):
+            sleep(self._delay)
+            if self.poll_input():
+                self.frame -= stride - slept
+                self.frame_stride = 1
+                return
+        sleep(self._delay)
+
+    def poll_input(self):
+        """Read input between idle frames. Returns True to leave idle mode."""
+        return False
 
     def play(self):
         """Main animation loop - runs forever"""
         while True:
-            for name, method in self.keyframes:
-                props = self._get_props(name)
-
-                # If divisor == 0 then only run once on first loop
-                if self.frame == 0:
-                    if props["divisor"] == 0:
-                        method()
-
-                # Otherwise perform normal operation
-                if (
-                    self.frame > 0
-                    and props["divisor"]
-                    and not (
-                        (self.frame - props["offset"])
-                        % props["divisor"]
-                    )
-                ):
-                    result = method(props["count"])
-                    if result:
-                        props["count"] = 0
-                    else:
-                        props["count"] += 1
-
-            self._reset_scene = False
-            self.frame += 1
-            time.sleep(self._delay)
+            self.step()
+            self.wait()
 
     @property
     def delay(self):
@@ -1,10 +1,15 @@
 # PWM Audio player for Interstate 75 W
 # Plays tones with attack/decay envelopes for realistic chime sounds
+#
+# Playback is driven by a machine.Timer callback stepping through duty-cycle
+# tables compiled from utilities/chimes.py at start-up, so starting a sound
+# returns immediately and the display keeps animating while it plays.
 
-from machine import Pin, PWM
-from time import sleep_ms
+from machine import Pin, PWM, Timer
 import json
 
+from utilities.chimes import TICK_MS, compile_all, tone_table
+
 # Configuration - which GPIO pin has a speaker/buzzer connected
 try:
     from config import AUDIO_PIN
@@ -14,6 +19,9 @@ except ImportError:
 # Persistent settings file
 SETTINGS_FILE = "audio_settings.json"
 
+# Maximum sounds waiting behind the one playing (repeats are merged)
+QUEUE_MAX = 2
+
 
 def _load_settings():
     """Load audio settings from persistent storage"""
@@ -34,7 +42,12 @@ def _save_settings(settings):
 
 
 class AudioPlayer:
-    """PWM-based audio player with envelope shaping"""
+    """
+    PWM-based audio player with envelope shaping.
+
+    Sounds are tuples of (frequency, duty table) segments. A timer fires every
+    TICK_MS and writes the next duty value, so play calls never block.
+    """
 
     def __init__(self, pin=None):
         self.pin_num = pin if pin is not None else AUDIO_PIN
@@ -42,6 +55,19 @@ class AudioPlayer:
         # Load enabled state from persistent storage
         settings = _load_settings()
         self._enabled = settings.get("enabled", True)
+
+        # Precomputed sounds (see utilities/chimes.py)
+        self._sounds = compile_all()
+
+        # Playback state (touched from the timer callback)
+        self._timer = None
+        self._queue = []
+        self._current = None      # name of the sound playing
+        self._segments = None
+        self._segment_index = 0
+        self._table = None
+        self._pos = 0
+
         print(f"Audio: initialized, enabled={self._enabled}")
 
     def _init_pwm(self):
@@ -56,69 +82,97 @@ class AudioPlayer:
             self.pwm.deinit()
             self.pwm = None
 
-    def _play_tone_with_envelope(self, freq, duration_ms):
-        """
-        Play a tone with attack/decay envelope for realistic chime sound.
+    def _start_segment(self, index):
+        """Switch to segment `index` of the current sound"""
+        freq, table = self._segments[index]
+        self._segment_index = index
+        self._table = table
+        self._pos = 0
+        if freq:
+            self.pwm.freq(freq)
+        else:
+            self.pwm.duty_u16(0)
 
-        Args:
-            freq: Frequency in Hz
-            duration_ms: Total duration in milliseconds
-        """
-        self.pwm.freq(freq)
-
-        # Quick attack (~35ms)
-        attack_time = 35
-        steps = 15
-        for i in range(steps):
-            self.pwm.duty_u16(int((i / steps) * 32768))
-            sleep_ms(attack_time // steps)
-
-        # Long decay - exponential falloff
-        decay_time = duration_ms - attack_time
-        steps = 60
-        for i in range(steps):
-            t = i / steps
-            # Approximate bell/chime envelope curve
-            level = (1 - t) ** 1.5
-            self.pwm.duty_u16(int(level * 32768))
-            sleep_ms(decay_time // steps)
-
-        self.pwm.duty_u16(0)
+    def _start_next(self):
+        """Start the next queued sound, or stop the timer. Returns True if playing."""
+        if not self._queue:
+            self._stop()
+            return False
+        name, segments = self._queue.pop(0)
+        self._current = name
+        self._segments = segments
+        self._init_pwm()
+        self._start_segment(0)
+        return True
+
+    def _tick(self, timer):
+        """Timer callback - write one duty value, advancing segments/sounds"""
+        if self._table is None:
+            return
+        if self._pos >= len(self._table):
+            if self._segment_index + 1 < len(self._segments):
+                self._start_segment(self._segment_index + 1)
+            elif not self._start_next():
+                return
+        self.pwm.duty_u16(self._table[self._pos])
+        self._pos += 1
+
+    def _stop(self):
+        """Stop playback and release the timer and PWM"""
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+        self._current = None
+        self._segments = None
+        self._table = None
+        self._cleanup_pwm()
+
+    def _enqueue(self, name, segments):
+        """Queue a sound without blocking. Returns False if dropped or merged."""
+        if not self._enabled:
+            return False
+        # Merge repeats: the same sound already playing or waiting plays once
+        if name is not None and (name == self._current or
+                                 any(queued == name for queued, _ in self._queue)):
+            return False
+        if len(self._queue) >= QUEUE_MAX:
+            return False
+
+        self._queue.append((name, segments))
+        if self._timer is None:
+            self._start_next()
+            self._timer = Timer(period=TICK_MS, mode=Timer.PERIODIC, callback=self._tick)
+        return True
+
+    def play(self, name):
+        """Start a named sound in the background"""
+        segments = self._sounds.get(name)
+        if segments is None:
+            print(f"Audio: unknown sound {name}")
+            return False
+        return self._enqueue(name, segments)
 
     def play_tone(self, frequency, duration_ms):
         """
-        Play a simple tone (no envelope).
+        Play a simple tone (no envelope) in the background.
 
         Args:
             frequency: Tone frequency in Hz
             duration_ms: Duration in milliseconds
         """
-        if not self._enabled:
-            return
-
-        self._init_pwm()
-        try:
-            self.pwm.freq(frequency)
-            self.pwm.duty_u16(32768)  # 50% duty cycle
-            sleep_ms(duration_ms)
-        finally:
-            self._cleanup_pwm()
+        return self._enqueue(None, ((frequency, tone_table(duration_ms)),))
 
     def play_bing_bong(self):
         """Play a realistic bing-bong doorbell chime"""
         if not self._enabled:
             print("Audio: disabled, skipping bing-bong")
             return
+        if self.play("new_flight"):
+            print("Audio: playing bing-bong")
 
-        print("Audio: playing bing-bong")
-        self._init_pwm()
-        try:
-            # D5 down to B4 - minor third interval (like real doorbells)
-            self._play_tone_with_envelope(587, 750)   # Bing (D5)
-            sleep_ms(225)                              # Gap
-            self._play_tone_with_envelope(494, 670)   # Bong (B4)
-        finally:
-            self._cleanup_pwm()
+    @property
+    def playing(self):
+        return self._timer is not None
 
     def enable(self):
         """Enable audio playback and save setting"""
@@ -129,7 +183,8 @@ class AudioPlayer:
     def disable(self):
         """Disable audio playback and save setting"""
         self._enabled = False
-        self._cleanup_pwm()
+        self._queue = []
+        self._stop()
         _save_settings({"enabled": False})
         print("Audio: disabled")
 
@@ -156,7 +211,10 @@ def get_player():
         _player = AudioPlayer()
     return _player
 
-def play_notification():
-    """Play the notification sound for new flights"""
+def play_notification(name="new_flight"):
+    """Play a notification chime (returns immediately)"""
     player = get_player()
-    player.play_bing_bong()
+    if name == "new_flight":
+        player.play_bing_bong()
+    else:
+        player.play(name)
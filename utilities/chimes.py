@@ -0,0 +1,142 @@
+# Chime definitions for Interstate 75 W
+# Declarative notes/durations/envelopes compiled to PWM duty tables
+#
+# A chime is a tuple of steps:
+#     (note, duration_ms, envelope)   - a tone, note is a name ("D5") or Hz
+#     (None, duration_ms)             - a silent gap
+#
+# compile_chime() turns it into (frequency, array('H')) segments with one
+# duty value per playback tick. All floating point work happens here, once,
+# so playback is plain table lookups with exact timing.
+
+from array import array
+
+# Playback resolution - one duty table entry per timer tick
+TICK_MS = 5
+
+# Full-scale duty for a 50% square wave
+DUTY_MAX = 32768
+
+# Equal temperament note frequencies (Hz)
+NOTES = {
+    "C4": 262, "D4": 294, "E4": 330, "F4": 349, "G4": 392, "A4": 440, "B4": 494,
+    "C5": 523, "D5": 587, "E5": 659, "F5": 698, "G5": 784, "A5": 880, "B5": 988,
+    "C6": 1047, "D6": 1175, "E6": 1319, "F6": 1397, "G6": 1568, "A6": 1760,
+}
+
+# Envelope shapes: (attack_ms, release_ms, decay exponent)
+# exponent None = hold full level between attack and release
+ENVELOPES = {
+    "bell": (35, 0, 1.5),     # quick strike, long ringing decay
+    "pluck": (5, 0, 3.0),     # short percussive
+    "flat": (5, 5, None),     # square beep with click-free edges
+    "swell": (0, 0, -1),      # rise to the midpoint, fall to silence
+}
+
+# Built-in chimes
+CHIMES = {
+    # D5 down to B4 - minor third interval (like real doorbells)
+    "new_flight": (
+        ("D5", 750, "bell"),
+        (None, 225),
+        ("B4", 670, "bell"),
+    ),
+    # Squawk 7500/7600/7700 - urgent alternating two-tone
+    "emergency": (
+        ("A5", 180, "flat"), ("E5", 180, "flat"),
+        ("A5", 180, "flat"), ("E5", 180, "flat"),
+        ("A5", 180, "flat"), ("E5", 360, "flat"),
+    ),
+    # Short acknowledgement for button presses
+    "click": (
+        ("C6", 40, "pluck"),
+    ),
+}
+
+# User-defined chimes in config.py override/extend the built-ins
+try:
+    from config import CHIMES as _USER_CHIMES
+    CHIMES.update(_USER_CHIMES)
+except ImportError:
+    pass
+
+# Shared tables - identical (duration, envelope) steps reuse one array
+_table_cache = {}
+
+
+def envelope_table(duration_ms, envelope="bell"):
+    """Duty values for one note, one per tick, ending in silence"""
+    key = (duration_ms, envelope)
+    table = _table_cache.get(key)
+    if table is not None:
+        return table
+
+    attack_ms, release_ms, exponent = ENVELOPES[envelope]
+    ticks = max(1, duration_ms // TICK_MS)
+    attack = min(ticks, attack_ms // TICK_MS)
+    release = min(ticks - attack, release_ms // TICK_MS)
+    body = ticks - attack - release
+    table = array("H", [0] * (ticks + 1))
+
+    for i in range(attack):
+        table[i] = int((i / attack) * DUTY_MAX)
+
+    for i in range(body):
+        t = i / body
+        if exponent is None:
+            level = 1.0
+        elif exponent < 0:
+            level = 1 - abs(2 * t - 1)
+        else:
+            level = (1 - t) ** exponent
+        table[attack + i] = int(level * DUTY_MAX)
+
+    for i in range(release):
+        table[attack + body + i] = int((1 - (i + 1) / release) * DUTY_MAX)
+
+    # Trailing zero silences the note before the next segment
+    _table_cache[key] = table
+    return table
+
+
+def silence_table(duration_ms):
+    """All-zero table for a gap"""
+    key = (duration_ms, None)
+    table = _table_cache.get(key)
+    if table is None:
+        table = array("H", [0] * max(1, duration_ms // TICK_MS))
+        _table_cache[key] = table
+    return table
+
+
+def tone_table(duration_ms):
+    """Constant full duty for a plain tone"""
+    return array("H", [DUTY_MAX] * max(1, duration_ms // TICK_MS))
+
+
+def compile_chime(steps):
+    """
+    Compile a chime definition into playback segments.
+
+    Args:
+        steps: Tuple of (note, duration_ms, envelope) or (None, duration_ms)
+
+    Returns:
+        Tuple of (frequency_hz, array('H')) - frequency 0 is a gap
+    """
+    segments = []
+    for step in steps:
+        note = step[0]
+        duration_ms = step[1]
+        if note is None:
+            segments.append((0, silence_table(duration_ms)))
+            continue
+        freq = NOTES[note] if isinstance(note, str) else int(note)
+        envelope = step[2] if len(step) > 2 else "bell"
+        segments.append((freq, envelope_table(duration_ms, envelope)))
+    return tuple(segments)
+
+
+def compile_all():
+    """Compile every chime (call at boot to keep first playback instant)"""
+    return {name: compile_chime(steps) for name, steps in CHIMES.items()}
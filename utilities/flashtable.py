@@ -0,0 +1,167 @@
+# Sorted fixed-record lookup tables stored on flash
+# Built on the host by tools/build_tables.py, read here by binary search
+#
+# File layout (little endian):
+#     header  magic "FTB1"  key_size(B)  reserved(B)  value_size(H)  count(I)
+#     records count x (key, value), sorted by key
+#
+# Keys are ASCII, NUL-padded to key_size. Values are value_size raw bytes;
+# what they mean is up to the table (NUL-padded text, packed structs...).
+#
+# A lookup costs about log2(count) seek + readinto calls into one
+# preallocated record buffer. Nothing of the table is held in RAM apart
+# from a small most-recently-used cache of results.
+
+import struct
+
+MAGIC = b"FTB1"
+HEADER = "<4sBBHI"
+HEADER_SIZE = struct.calcsize(HEADER)
+
+
+def pack_key(key, key_size):
+    """Encode a key as NUL-padded ASCII bytes (None if it doesn't fit)"""
+    raw = key.encode()
+    if len(raw) > key_size:
+        return None
+    return raw + b"\0" * (key_size - len(raw))
+
+
+def text_value(value):
+    """Decode a NUL-padded text value"""
+    end = value.find(b"\0")
+    if end >= 0:
+        value = value[:end]
+    return value.decode()
+
+
+class FlashTable:
+    """
+    Read-only sorted table with binary search and an MRU cache.
+
+    The file is opened on first use and kept open. If it is missing or not
+    a table, every lookup returns None so callers can fall back to raw codes.
+    """
+
+    def __init__(self, path, cache_size=8):
+        self.path = path
+        self.cache_size = cache_size
+        self._file = None
+        self._failed = False
+        self.key_size = 0
+        self.value_size = 0
+        self.count = 0
+        self._record = None
+        self._key = None
+        self._cache = []    # [(key_str, value_bytes)], most recent first
+        self.reads = 0
+
+    def _open(self):
+        """Open the file and read the header (once)"""
+        if self._file is not None:
+            return True
+        if self._failed:
+            return False
+        f = None
+        try:
+            f = open(self.path, "rb")
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                raise ValueError("truncated header")
+            magic, key_size, _, value_size, count = struct.unpack(HEADER, header)
+            if magic != MAGIC:
+                raise ValueError("bad magic")
+            if f.seek(0, 2) < HEADER_SIZE + count * (key_size + value_size):
+                raise ValueError("truncated records")
+        except (OSError, ValueError) as e:
+            print(f"Table {self.path} unavailable: {e}")
+            if f is not None:
+                f.close()
+            self._failed = True
+            return False
+
+        self._file = f
+        self.key_size = key_size
+        self.value_size = value_size
+        self.count = count
+        self._record = bytearray(key_size + value_size)
+        self._key = bytearray(key_size)
+        return True
+
+    def _compare(self):
+        """Compare the record buffer's key with the search key (-1, 0, 1)"""
+        record = self._record
+        key = self._key
+        for i in range(self.key_size):
+            if record[i] != key[i]:
+                return -1 if record[i] < key[i] else 1
+        return 0
+
+    def _search(self):
+        """Binary search for self._key, leaves the match in self._record"""
+        f = self._file
+        record = self._record
+        record_size = len(record)
+        lo = 0
+        hi = self.count - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            f.seek(HEADER_SIZE + mid * record_size)
+            f.readinto(record)
+            self.reads += 1
+            order = self._compare()
+            if order == 0:
+                return True
+            if order < 0:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return False
+
+    def lookup(self, key):
+        """
+        Find the value stored for a key.
+
+        Args:
+            key: Key string (matched exactly, callers normalise case)
+
+        Returns:
+            bytes value, or None if not found
+        """
+        cache = self._cache
+        for i in range(len(cache)):
+            if cache[i][0] == key:
+                entry = cache[i]
+                if i:
+                    cache.pop(i)
+                    cache.insert(0, entry)
+                return entry[1]
+
+        if not key or not self._open():
+            return None
+        packed = pack_key(key, self.key_size)
+        if packed is None:
+            return None
+        self._key[:] = packed
+
+        value = None
+        if self._search():
+            value = bytes(self._record[self.key_size:])
+
+        # Misses are cached too, so unknown codes don't re-search every time
+        cache.insert(0, (key, value))
+        if len(cache) > self.cache_size:
+            cache.pop()
+        return value
+
+    def text(self, key, default=None):
+        """Look up a NUL-padded text value"""
+        value = self.lookup(key)
+        if value is None:
+            return default
+        return text_value(value)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
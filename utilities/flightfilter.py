@@ -0,0 +1,235 @@
+# Declarative flight filter (FLIGHT_FILTER in config.py), compiled once
+# into a single predicate
+#
+#   FLIGHT_FILTER = {
+#       "airline": ("BAW", "EZY"),     # callsign prefixes
+#       "type": ("A320", "A20N"),      # aircraft type codes
+#       "altitude": (1000, 20000),     # feet, low < altitude < high (None = open)
+#       "speed": (None, 300),          # knots, low < speed < high
+#       "squawk": ("7500", "7600", "7700"),  # ints are read as 4-digit codes
+#       "vertical": "climbing",        # "climbing", "descending" or "level"
+#       "any": [{..}, {..}],           # at least one sub-filter matches
+#       "not": {..},                   # the sub-filter doesn't match
+#       "zone": ("home", "approach"),  # watch zones / geofences that count
+#   }
+#
+# Every key given must match. The tests are ordered by estimated cost over
+# the fraction of flights each rejects, so cheap, selective tests (squawk
+# set, type list) run before ones most flights pass (altitude band), and
+# a flight is usually rejected by the first test it meets.
+#
+# The same filter compiles against flight dicts (FLIGHT_FIELDS) or raw
+# FR24 feed rows (FR24_FIELDS) - fields are read with f[key] either way -
+# so the FR24 parser and the streaming feeds drop non-matching aircraft
+# before a flight dict is built or copied. "zone" is not a field test: the
+# watch zone index applies it (see Overhead.in_watch_zones).
+
+# Field name -> key into a flight dict / track
+FLIGHT_FIELDS = {
+    "callsign": "callsign",
+    "type": "aircraft_type",
+    "altitude": "altitude",
+    "speed": "velocity",
+    "vertical_speed": "vertical_speed",
+    "squawk": "squawk",
+}
+
+# Field name -> index into an FR24 feed row (see flight_from_fr24)
+FR24_FIELDS = {
+    "callsign": 16,
+    "type": 8,
+    "altitude": 4,
+    "speed": 5,
+    "vertical_speed": 15,
+    "squawk": 6,
+}
+
+# Rough share of flights a band covers (for ordering only)
+ALTITUDE_RANGE = 45000      # feet
+SPEED_RANGE = 600           # knots
+
+VERTICAL = ("climbing", "descending", "level")
+
+
+def _text_set(values, upper=True):
+    if isinstance(values, str):
+        values = (values,)
+    return set(v.strip().upper() if upper else v.strip() for v in values)
+
+
+def _squawk_set(values):
+    """Squawk codes as the feeds send them: 4-digit strings (7700 -> "7700")"""
+    if isinstance(values, (str, int)):
+        values = (values,)
+    return set("%04d" % v if isinstance(v, int) else v.strip() for v in values)
+
+
+def _band_pass(low, high, span):
+    low = 0 if low is None else low
+    high = span if high is None else high
+    return max(0.0, min(1.0, (high - low) / span))
+
+
+def _set_test(key, values, share, normalise=True):
+    """Field value in a set (type codes compared trimmed and upper case)"""
+    if normalise:
+        def test(f):
+            return (f[key] or "").strip().upper() in values
+    else:
+        def test(f):
+            return f[key] in values
+    return test, 1, min(1.0, share * len(values))
+
+
+def _airline_test(key, prefixes):
+    """Callsign starts with one of the prefixes - one slice per prefix length"""
+    prefixes = _text_set(prefixes)
+    lengths = tuple(sorted(set(len(p) for p in prefixes)))
+
+    def test(f):
+        callsign = f[key] or ""
+        for n in lengths:
+            if callsign[:n].upper() in prefixes:
+                return True
+        return False
+    return test, 1 + len(lengths), min(1.0, 0.05 * len(prefixes))
+
+
+def _band_test(key, band, span):
+    """low < value < high, either end None for open"""
+    low, high = band
+    if low is None and high is None:
+        return None
+    if low is None:
+        def test(f):
+            return (f[key] or 0) < high
+    elif high is None:
+        def test(f):
+            return (f[key] or 0) > low
+    else:
+        def test(f):
+            return low < (f[key] or 0) < high
+    return test, 1, _band_pass(low, high, span)
+
+
+def _vertical_test(key, direction):
+    """Sign of the vertical speed, as the display's climb/descend arrow"""
+    if direction not in VERTICAL:
+        raise ValueError(f"vertical must be one of {', '.join(VERTICAL)}, not '{direction}'")
+    if direction == "climbing":
+        def test(f):
+            return (f[key] or 0) > 0
+    elif direction == "descending":
+        def test(f):
+            return (f[key] or 0) < 0
+    else:
+        def test(f):
+            return not f[key]
+    return test, 1, 0.4
+
+
+def _all(tests):
+    """One predicate running tests in order, stopping at the first miss"""
+    if len(tests) == 1:
+        return tests[0]
+    tests = tuple(tests)
+
+    def test(f):
+        for t in tests:
+            if not t(f):
+                return False
+        return True
+    return test
+
+
+def _compile(spec, fields):
+    """
+    Tests for one filter dict, best order first.
+
+    Returns:
+        (predicate or None, cost, pass rate)
+    """
+    tests = []
+    for name, value in spec.items():
+        if name == "zone":
+            continue  # watch zone index, not a field test
+        if name == "airline":
+            built = _airline_test(fields["callsign"], value)
+        elif name == "type":
+            built = _set_test(fields["type"], _text_set(value), 0.05)
+        elif name == "squawk":
+            built = _set_test(fields["squawk"], _squawk_set(value), 0.002, normalise=False)
+        elif name == "altitude":
+            built = _band_test(fields["altitude"], value, ALTITUDE_RANGE)
+        elif name == "speed":
+            built = _band_test(fields["speed"], value, SPEED_RANGE)
+        elif name == "vertical":
+            built = _vertical_test(fields["vertical_speed"], value)
+        elif name == "any":
+            built = _any(value, fields)
+        elif name == "not":
+            inner, cost, rate = _compile(value, fields)
+            if inner is None:
+                raise ValueError("'not' needs at least one field test (an empty one would exclude every flight)")
+            built = (lambda f: not inner(f)), cost, 1.0 - rate
+        else:
+            raise ValueError(f"unknown filter key '{name}'")
+        if built is not None:
+            tests.append(built)
+
+    if not tests:
+        return None, 0, 1.0
+    # Cheapest per flight rejected first (cost / share rejected)
+    tests.sort(key=lambda t: t[1] / max(1.0 - t[2], 0.001))
+    cost = 0
+    rate = 1.0
+    for _, c, r in tests:
+        cost += c * rate
+        rate *= r
+    return _all([t[0] for t in tests]), cost, rate
+
+
+def _any(specs, fields):
+    """At least one sub-filter matches"""
+    parts = [_compile(spec, fields) for spec in specs]
+    if not parts or any(p[0] is None for p in parts):
+        raise ValueError("'any' needs sub-filters that each have a field test (an empty one matches every flight)")
+    parts.sort(key=lambda p: p[1] / max(p[2], 0.001))  # likeliest match per cost first
+    predicates = tuple(p[0] for p in parts)
+    miss = 1.0
+    for _, _, r in parts:
+        miss *= 1.0 - r
+
+    def test(f):
+        for p in predicates:
+            if p(f):
+                return True
+        return False
+    return test, sum(p[1] for p in parts), 1.0 - miss
+
+
+def compile_filter(spec, fields=FLIGHT_FIELDS):
+    """
+    Compile a filter dict into one predicate.
+
+    Args:
+        spec: Filter dict (see module comment), or None
+        fields: FLIGHT_FIELDS for flight dicts, FR24_FIELDS for feed rows
+
+    Returns:
+        predicate(flight) -> bool, or None when nothing needs testing
+
+    Raises:
+        ValueError: Unknown key or vertical direction, or an empty 'any'/'not'
+    """
+    if not spec:
+        return None
+    return _compile(spec, fields)[0]
+
+
+def filter_zones(spec):
+    """Watch zone names the filter allows (None = every zone)"""
+    if not spec or not spec.get("zone"):
+        return None
+    zones = spec["zone"]
+    return set((zones,) if isinstance(zones, str) else zones)
@@ -0,0 +1,104 @@
+# Polygon geofences for Interstate 75 W
+# Point-in-polygon by ray casting against an edge table built once at load
+#
+# Vertices are converted to 1e-5 degree integers (as utilities/modes.py)
+# and then to grid units relative to the polygon's bounding box, shifted
+# down until the box fits in 2**GEOFENCE_BITS units. Every product in the
+# crossing test is then below 2**28 - a small int on MicroPython - so a
+# test allocates no floats or big ints once the point is converted. The
+# grid step is 2**shift * 1e-5 degrees: about 1 m for a box under 0.16
+# degrees, 35 m for one 5 degrees across.
+#
+# Each edge is stored as (y0, y1, x0, dx, dy) with y0 < y1; the crossing
+# x at py is x0 + (py - y0) * dx / dy, compared without dividing. Edges
+# are bucketed into horizontal bands (at least GEOFENCE_BANDS, about
+# GEOFENCE_BAND_EDGES edges each) so a point only meets the edges spanning
+# its own band, and a bounding-box check - on the float position, which
+# compares without allocating - turns most aircraft away before anything
+# is converted.
+
+GEOFENCE_BITS = 14          # bounding box span in grid units (< 2**14)
+GEOFENCE_BANDS = 16         # minimum horizontal bands in the edge table
+GEOFENCE_BAND_EDGES = 4     # edges per band to aim for on large polygons
+
+
+def to_e5(degrees):
+    """Degrees to 1e-5 degree integer units"""
+    return round(degrees * 100000)
+
+
+class Geofence:
+    """
+    A polygon area flights are kept in.
+
+    Args:
+        points: [(lat, lon), ...] vertices in order, at least three; the
+            last is joined back to the first
+        name: Label used as the watch zone id
+    """
+
+    def __init__(self, points, name=""):
+        if len(points) < 3:
+            raise ValueError(f"geofence '{name}' needs at least 3 points")
+        self.name = name
+        lats = [to_e5(p[0]) for p in points]
+        lons = [to_e5(p[1]) for p in points]
+        self.south = min(lats)
+        self.north = max(lats)
+        self.west = min(lons)
+        self.east = max(lons)
+
+        shift = 0
+        while max(self.north - self.south, self.east - self.west) >> shift >= 1 << GEOFENCE_BITS:
+            shift += 1
+        self.shift = shift
+        ys = [(lat - self.south) >> shift for lat in lats]
+        xs = [(lon - self.west) >> shift for lon in lons]
+
+        edges = []
+        for i in range(len(points)):
+            x0, y0 = xs[i - 1], ys[i - 1]
+            x1, y1 = xs[i], ys[i]
+            if y0 == y1:
+                continue  # horizontal edges never cross a horizontal ray
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+            edges.append((y0, y1, x0, x1 - x0, y1 - y0))
+
+        # Band b holds the edges overlapping rows [b * band, (b + 1) * band)
+        bands = max(GEOFENCE_BANDS, len(edges) // GEOFENCE_BAND_EDGES)
+        self._band = ((self.north - self.south) >> shift) // bands + 1
+        self._bands = []
+        for b in range(bands):
+            low = b * self._band
+            high = low + self._band
+            self._bands.append(tuple(e for e in edges if e[0] < high and e[1] > low))
+        self.edges = len(edges)
+
+        # Bounding box in degrees for the early-out
+        self._box = (self.south / 100000, self.north / 100000, self.west / 100000, self.east / 100000)
+
+    @property
+    def zone(self):
+        """Bounding box as a tl/br zone dict"""
+        south, north, west, east = self._box
+        return {"tl_y": north, "tl_x": west, "br_y": south, "br_x": east}
+
+    def contains_e5(self, lat_e5, lon_e5):
+        """Point-in-polygon for a position in 1e-5 degree units"""
+        if not (self.south <= lat_e5 <= self.north and self.west <= lon_e5 <= self.east):
+            return False
+        py = (lat_e5 - self.south) >> self.shift
+        px = (lon_e5 - self.west) >> self.shift
+        inside = False
+        for y0, y1, x0, dx, dy in self._bands[py // self._band]:
+            if y0 <= py < y1 and (px - x0) * dy < (py - y0) * dx:
+                inside = not inside
+        return inside
+
+    def contains(self, lat, lon):
+        """Point-in-polygon for a position in degrees"""
+        box = self._box
+        if not (box[0] <= lat <= box[1] and box[2] <= lon <= box[3]):
+            return False
+        return self.contains_e5(round(lat * 100000), round(lon * 100000))
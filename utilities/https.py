@@ -5,6 +5,38 @@ import socket
 import ssl
 import json
 
+# Optional stand-in server for load testing (see emulator/fakeapi.py).
+# When set, every https_get is sent to this host:port instead - as plain
+# HTTP, skipping the TLS handshake, unless API_OVERRIDE_TLS is set and the
+# stand-in serves TLS (python -m emulator.fakeapi --tls). Then the request
+# goes through the same wrap_socket/SNI path as the real APIs.
+try:
+    from config import API_OVERRIDE_HOST, API_OVERRIDE_PORT
+except ImportError:
+    API_OVERRIDE_HOST = None
+    API_OVERRIDE_PORT = 8080
+
+try:
+    from config import API_OVERRIDE_TLS
+except ImportError:
+    API_OVERRIDE_TLS = False
+
+
+def set_api_override(host, port=8080, tls=False):
+    """
+    Point all HTTPS API calls at a local stand-in (None to disable).
+
+    Args:
+        host: Stand-in host, or None for the real APIs
+        port: Stand-in port
+        tls: The stand-in serves TLS - keep https_get on its TLS path
+            (otherwise requests go as plain HTTP)
+    """
+    global API_OVERRIDE_HOST, API_OVERRIDE_PORT, API_OVERRIDE_TLS
+    API_OVERRIDE_HOST = host
+    API_OVERRIDE_PORT = port
+    API_OVERRIDE_TLS = tls
+
 
 def decode_chunked(data):
     """
@@ -65,6 +97,13 @@ def https_get(host, path, timeout=10):
     Returns:
         Response body as string, or None on error
     """
+    connect_host, port = host, 443
+    if API_OVERRIDE_HOST:
+        if not API_OVERRIDE_TLS:
+            return http_get(API_OVERRIDE_HOST, path, timeout, port=API_OVERRIDE_PORT)
+        # TLS stand-in: only the address changes, SNI and Host stay the API's
+        connect_host, port = API_OVERRIDE_HOST, API_OVERRIDE_PORT
+
     s = None
     ss = None
 
@@ -72,7 +111,7 @@ def https_get(host, path, timeout=10):
         # Create socket and connect
         s = socket.socket()
         s.settimeout(timeout)
-        addr = socket.getaddrinfo(host, 443)[0][-1]
+        addr = socket.getaddrinfo(connect_host, port)[0][-1]
         s.connect(addr)
 
         # Wrap with SSL - include server_hostname for SNI (Server Name Indication)
@@ -203,7 +242,7 @@ def https_get_json(host, path, timeout=10):
     return None
 
 
-def http_get(host, path, timeout=10):
+def http_get(host, path, timeout=10, port=80):
     """
     Make a plain HTTP (non-SSL) GET request and return the response body.
 
@@ -211,6 +250,7 @@ def http_get(host, path, timeout=10):
         host: Hostname (e.g., "api.example.com")
         path: URL path (e.g., "/api/data")
         timeout: Socket timeout in seconds
+        port: TCP port
 
     Returns:
         Response body as string, or None on error
@@ -221,7 +261,7 @@ def http_get(host, path, timeout=10):
         # Create socket and connect (port 80 for HTTP)
         s = socket.socket()
         s.settimeout(timeout)
-        addr = socket.getaddrinfo(host, 80)[0][-1]
+        addr = socket.getaddrinfo(host, port)[0][-1]
         s.connect(addr)
 
         # Send HTTP request
@@ -274,7 +314,7 @@ def http_get(host, path, timeout=10):
                         return http_get(new_host, new_path, timeout)
                     # Relative redirect
                     elif new_url.startswith("/"):
-                        return http_get(host, new_url, timeout)
+                        return http_get(host, new_url, timeout, port)
             print(f"HTTP redirect but no location header")
             return None
 
@@ -302,7 +342,7 @@ def http_get(host, path, timeout=10):
                 pass
 
 
-def http_get_json(host, path, timeout=10):
+def http_get_json(host, path, timeout=10, port=80):
     """
     Make a plain HTTP GET request and return parsed JSON.
 
@@ -310,11 +350,12 @@ def http_get_json(host, path, timeout=10):
         host: Hostname
         path: URL path
         timeout: Socket timeout
+        port: TCP port
 
     Returns:
         Parsed JSON as dict/list, or None on error
     """
-    body = http_get(host, path, timeout)
+    body = http_get(host, path, timeout, port)
     if body:
         try:
             return json.loads(body)
@@ -0,0 +1,264 @@
+# Mode S extended squitter (DF17) decoding for Interstate 75 W
+# Integer-only so the per-message path allocates nothing on MicroPython
+#
+# Positions are fixed point in 1e-5 degree units (about 1 m) so every
+# intermediate stays a small int (< 2**30). Messages are passed as a 14
+# byte buffer; fields are read with shifts and masks, never sliced.
+#
+# References: ICAO Annex 10 Vol IV, DO-260B, and "The 1090MHz Riddle"
+# (Junzi Sun) for the CPR equations and test messages.
+
+import math
+from array import array
+
+# -- CRC ------------------------------------------------------------------
+
+CRC_POLY = 0xFFF409
+
+
+def _crc_table():
+    table = array("L", [0] * 256)
+    for i in range(256):
+        crc = i << 16
+        for _ in range(8):
+            crc = ((crc << 1) ^ CRC_POLY) if crc & 0x800000 else (crc << 1)
+        table[i] = crc & 0xFFFFFF
+    return table
+
+
+CRC_TABLE = _crc_table()
+
+
+def crc_ok(msg):
+    """Check the 24-bit parity of a 112-bit message (DF17: PI with no address overlay)"""
+    table = CRC_TABLE
+    crc = 0
+    for i in range(11):
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[((crc >> 16) ^ msg[i]) & 0xFF]
+    return crc == (msg[11] << 16) | (msg[12] << 8) | msg[13]
+
+
+# -- Identification -------------------------------------------------------
+
+CALLSIGN_CHARS = b"#ABCDEFGHIJKLMNOPQRSTUVWXYZ##### ###############0123456789######"
+
+
+def decode_callsign(msg, out):
+    """Unpack the eight 6-bit characters of an identification message into out (bytearray(8))"""
+    chars = CALLSIGN_CHARS
+    for half in (0, 1):
+        i = 5 + half * 3
+        bits = (msg[i] << 16) | (msg[i + 1] << 8) | msg[i + 2]
+        o = half * 4
+        out[o] = chars[(bits >> 18) & 63]
+        out[o + 1] = chars[(bits >> 12) & 63]
+        out[o + 2] = chars[(bits >> 6) & 63]
+        out[o + 3] = chars[bits & 63]
+
+
+# -- Altitude -------------------------------------------------------------
+
+def decode_altitude(msg):
+    """Barometric altitude (ft) of an airborne position message, None if not 25 ft coded"""
+    alt = (msg[5] << 4) | (msg[6] >> 4)
+    if not alt & 0x10:
+        return None  # Gillham (100 ft) coding - rare on DF17, not decoded
+    n = ((alt & 0xFE0) >> 1) | (alt & 0x0F)
+    return n * 25 - 1000
+
+
+# -- Velocity -------------------------------------------------------------
+
+# atan(i / 256) in tenths of a degree, for heading without floats
+ATAN_TABLE = array("H", [int(math.degrees(math.atan(i / 256)) * 10 + 0.5) for i in range(257)])
+
+
+def isqrt(n):
+    """Integer square root (Newton's method, small ints only)"""
+    if n < 2:
+        return n
+    x = 4096 if n < 16777216 else n
+    y = (x + n // x) >> 1
+    while y < x:
+        x = y
+        y = (x + n // x) >> 1
+    return x
+
+
+def heading(vx, vy):
+    """Track angle in degrees (0 = north, clockwise) of an east/north vector"""
+    ax = -vx if vx < 0 else vx
+    ay = -vy if vy < 0 else vy
+    if ax == 0 and ay == 0:
+        return 0
+    if ax <= ay:
+        angle = ATAN_TABLE[(ax << 8) // ay]
+    else:
+        angle = 900 - ATAN_TABLE[(ay << 8) // ax]
+    if vy < 0:
+        angle = 1800 + angle if vx < 0 else 1800 - angle
+    elif vx < 0:
+        angle = 3600 - angle
+    return ((angle + 5) // 10) % 360
+
+
+def decode_velocity(msg, track):
+    """
+    Apply an airborne velocity message (TC 19, ground speed subtypes) to a track.
+
+    Returns:
+        True if the track was updated
+    """
+    subtype = msg[4] & 7
+    if subtype != 1 and subtype != 2:
+        return False  # airspeed subtypes carry no ground track
+    vew = ((msg[5] & 3) << 8) | msg[6]
+    vns = ((msg[7] & 0x7F) << 3) | (msg[8] >> 5)
+    if vew == 0 or vns == 0:
+        return False
+    vx = vew - 1
+    vy = vns - 1
+    if subtype == 2:  # supersonic scale
+        vx <<= 2
+        vy <<= 2
+    if msg[5] & 0x04:
+        vx = -vx
+    if msg[7] & 0x80:
+        vy = -vy
+
+    # Round to the nearest knot
+    track["velocity"] = (isqrt(4 * (vx * vx + vy * vy)) + 1) >> 1
+    track["heading"] = heading(vx, vy)
+
+    vr = ((msg[8] & 7) << 6) | (msg[9] >> 2)
+    if vr:
+        rate = (vr - 1) * 64
+        track["vertical_speed"] = -rate if msg[8] & 0x08 else rate
+    return True
+
+
+# -- Compact Position Reporting (airborne) --------------------------------
+
+CPR_MAX = 1 << 17
+CPR_HALF = 1 << 16
+DEG_E5 = 100000
+_A = 140625  # one CPR step of a single zone is 360e5 / 2**17 = _A / 512 (1e-5 degrees)
+
+# Latitudes (1e-5 degrees, ascending) where the number of longitude zones
+# drops by one: NL is 59 below the first, 1 above the last
+NL_TABLE = array("l", [
+    int(math.degrees(math.acos(math.sqrt(
+        (1 - math.cos(math.pi / 30)) / (1 - math.cos(2 * math.pi / zones))
+    ))) * DEG_E5)
+    for zones in range(59, 1, -1)
+])
+
+
+def nl(lat_e5):
+    """Number of longitude zones at a latitude"""
+    if lat_e5 < 0:
+        lat_e5 = -lat_e5
+    table = NL_TABLE
+    lo = 0
+    hi = len(table)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if table[mid] <= lat_e5:
+            lo = mid + 1
+        else:
+            hi = mid
+    return 59 - lo
+
+
+def _to_e5(units, zones):
+    """CPR units (360 / (zones * 2**17) degrees each) to 1e-5 degrees"""
+    negative = units < 0
+    if negative:
+        units = -units
+    b = zones * 512
+    q = units // b
+    r = units % b
+    # units * _A // b, split so no product reaches 2**30
+    value = q * _A + r * (_A // b) + (r * (_A % b)) // b
+    return -value if negative else value
+
+
+def cpr_global(track, odd_newest):
+    """
+    Globally unambiguous decode of the track's even/odd CPR pair.
+
+    The caller checks the two frames arrived within 10 s of each other.
+    Reads cpr_lat0/cpr_lon0 (even) and cpr_lat1/cpr_lon1 (odd) and writes
+    lat_e5/lon_e5.
+
+    Args:
+        track: Track dict
+        odd_newest: True if the odd frame is the more recent one
+
+    Returns:
+        False if the frames straddle a latitude zone boundary (no fix)
+    """
+    lat0 = track["cpr_lat0"]
+    lat1 = track["cpr_lat1"]
+    lon0 = track["cpr_lon0"]
+    lon1 = track["cpr_lon1"]
+
+    j = (59 * lat0 - 60 * lat1 + CPR_HALF) >> 17
+    rlat0 = _to_e5((j % 60) * CPR_MAX + lat0, 60)
+    rlat1 = _to_e5((j % 59) * CPR_MAX + lat1, 59)
+    if rlat0 >= 270 * DEG_E5:
+        rlat0 -= 360 * DEG_E5
+    if rlat1 >= 270 * DEG_E5:
+        rlat1 -= 360 * DEG_E5
+    zones = nl(rlat0)
+    if zones != nl(rlat1):
+        return False
+
+    if odd_newest:
+        lat = rlat1
+        ni = zones - 1 if zones > 1 else 1
+        lon = lon1
+    else:
+        lat = rlat0
+        ni = zones
+        lon = lon0
+    m = (lon0 * (zones - 1) - lon1 * zones + CPR_HALF) >> 17
+    lon_e5 = _to_e5((m % ni) * CPR_MAX + lon, ni)
+    if lon_e5 >= 180 * DEG_E5:
+        lon_e5 -= 360 * DEG_E5
+    track["lat_e5"] = lat
+    track["lon_e5"] = lon_e5
+    return True
+
+
+class CprReference:
+    """
+    Local (single frame) CPR decode against a fixed reference position.
+
+    Correct for aircraft within about 180 NM of the reference - always
+    true for a receiver's own traffic. The reference is converted to CPR
+    units once, here, so decoding is integer-only.
+    """
+
+    def __init__(self, lat, lon):
+        self.lat_units = array("l", [
+            int(math.floor(lat / (360 / (60 - odd)) * CPR_MAX)) for odd in (0, 1)
+        ])
+        # Longitude units depend on the zone count at the decoded latitude
+        self.lon_units = array("l", [0] + [
+            int(math.floor(lon / (360 / ni) * CPR_MAX)) for ni in range(1, 60)
+        ])
+
+    def decode(self, track, lat_cpr, lon_cpr, odd):
+        """Decode one frame's 17-bit lat/lon into the track's lat_e5/lon_e5"""
+        ref = self.lat_units[odd]
+        j = (ref >> 17) + (((ref & (CPR_MAX - 1)) + CPR_HALF - lat_cpr) >> 17)
+        lat = _to_e5(j * CPR_MAX + lat_cpr, 60 - odd)
+
+        ni = nl(lat) - odd
+        if ni < 1:
+            ni = 1
+        ref = self.lon_units[ni]
+        m = (ref >> 17) + (((ref & (CPR_MAX - 1)) + CPR_HALF - lon_cpr) >> 17)
+        track["lat_e5"] = lat
+        track["lon_e5"] = _to_e5(m * CPR_MAX + lon_cpr, ni)
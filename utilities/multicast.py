@@ -0,0 +1,269 @@
+# UDP multicast link between the panels of a multi-panel wall
+# One panel (MULTICAST_ROLE = "leader") fetches as usual and publishes what
+# it shows; the others ("follower") make no fetches of their own and show
+# the leader's flights from the frame they arrive.
+#
+# Datagram layout (little endian):
+#     header   "FTM" version(B) kind(B) seq(H) part(B) parts(B) time(I) count(B)
+#     kind 1   flights: count flights in utilities/snapshot.py layout.
+#              A flight set too big for one datagram is split into parts
+#              sharing its seq; time is the leader's last fetch
+#     kind 2   forecast in snapshot layout; time is its fetch time
+#
+# The current flight set is re-sent every MULTICAST_REPEAT seconds and the
+# forecast every MULTICAST_FORECAST_REPEAT, so a lost datagram or a panel
+# that joins late catches up without any acknowledgements. A follower that
+# hears nothing for MULTICAST_LEADER_TIMEOUT goes back to fetching itself.
+
+import socket
+import struct
+import time
+
+from utilities.snapshot import pack_flight, unpack_flight, pack_forecast, unpack_forecast
+
+try:
+    from config import MULTICAST_ROLE
+except ImportError:
+    MULTICAST_ROLE = None   # "leader", "follower" or None (off)
+
+try:
+    from config import MULTICAST_GROUP, MULTICAST_PORT
+except ImportError:
+    MULTICAST_GROUP = "239.255.70.84"   # administratively scoped (site-local)
+    MULTICAST_PORT = 30200
+
+MULTICAST_DATAGRAM = 1200       # payload cap - one unfragmented frame on any LAN
+MULTICAST_BUFFER = 2048         # receive size (a lone oversized flight still fits)
+MULTICAST_READS_PER_POLL = 8    # cap on datagrams read per poll()
+MULTICAST_REPEAT = 5            # seconds between repeats of the current flight set
+MULTICAST_FORECAST_REPEAT = 60  # seconds between repeats of the forecast
+MULTICAST_LEADER_TIMEOUT = 30   # follower fetches for itself after this much silence
+MULTICAST_TTL = 1               # never leave the local network
+
+MAGIC = b"FTM"
+VERSION = 1
+KIND_FLIGHTS = 1
+KIND_FORECAST = 2
+
+_HEADER = "<3sBBHBBIB"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+
+
+def _ip_bytes(address):
+    """Dotted quad to 4 bytes (MicroPython has no inet_aton)"""
+    return bytes(int(part) for part in address.split("."))
+
+
+def _set_ip_option(s, name, value):
+    """IPPROTO_IP socket option the port may not have. Returns True if it was set."""
+    option = getattr(socket, name, None)
+    if option is None:
+        print(f"Multicast: {name} not supported here, left at the default")
+        return False
+    try:
+        s.setsockopt(socket.IPPROTO_IP, option, value)
+    except (OSError, ValueError) as e:
+        print(f"Multicast: {name} not set ({e}), left at the default")
+        return False
+    return True
+
+
+def flight_datagrams(flights, seq, fetched_at):
+    """
+    Datagrams carrying one flight set, as few as fit MULTICAST_DATAGRAM.
+
+    Returns:
+        List of bytes
+    """
+    batches = []
+    batch = []
+    size = _HEADER_SIZE
+    for flight in flights:
+        packed = pack_flight(flight)
+        if batch and size + len(packed) > MULTICAST_DATAGRAM:
+            batches.append(batch)
+            batch = []
+            size = _HEADER_SIZE
+        batch.append(packed)
+        size += len(packed)
+    batches.append(batch)  # an empty set is still one (empty) datagram
+
+    return [
+        struct.pack(
+            _HEADER, MAGIC, VERSION, KIND_FLIGHTS, seq, part, len(batches),
+            int(fetched_at), len(batch),
+        ) + b"".join(batch)
+        for part, batch in enumerate(batches)
+    ]
+
+
+def forecast_datagram(forecast, weather_time):
+    """Datagram carrying the forecast table"""
+    return struct.pack(
+        _HEADER, MAGIC, VERSION, KIND_FORECAST, 0, 0, 1, int(weather_time), 0,
+    ) + pack_forecast(forecast, weather_time)
+
+
+class MulticastLink:
+    """
+    One panel's end of the link - publishing (leader) or listening (follower).
+
+    Leader: publish() every frame with what the panel shows; a new flight
+    list object is sent at once, otherwise the current one is repeated on
+    a timer. Follower: poll() every frame; it returns True when a complete
+    new flight set has arrived (self.flights, self.fetched_at).
+    """
+
+    def __init__(self, role=MULTICAST_ROLE, group=MULTICAST_GROUP, port=MULTICAST_PORT,
+                 interface="0.0.0.0"):
+        self.leader = role == "leader"
+        self.group = group
+        self.port = port
+        self._addr = socket.getaddrinfo(group, port)[0][-1]
+        self._sock = self._open(interface)
+
+        # Leader: what was last published
+        self.seq = int(time.time()) & 0xFFFF  # a restarted leader won't repeat the last seq
+        self._shown = None
+        self._flight_datagrams = ()
+        self._flights_sent = 0
+        self._forecast_time = None
+        self._forecast_datagram = None
+        self._forecast_sent = 0
+
+        # Follower: last complete flight set and forecast
+        self.flights = None
+        self.fetched_at = 0
+        self.forecast = None
+        self.forecast_time = 0
+        self._pending_seq = None
+        self._pending = []
+        self._heard = None
+
+        # Counters
+        self.sent = 0
+        self.received = 0
+        self.bad = 0
+
+    def _open(self, interface):
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if self.leader:
+            # Optional - MicroPython's lwIP sockets define neither constant;
+            # lwIP then sends on its default netif with its default TTL
+            _set_ip_option(s, "IP_MULTICAST_TTL", MULTICAST_TTL)
+            if interface != "0.0.0.0":
+                _set_ip_option(s, "IP_MULTICAST_IF", _ip_bytes(interface))
+        else:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(socket.getaddrinfo("0.0.0.0", self.port)[0][-1])
+            s.setsockopt(
+                socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
+                _ip_bytes(self.group) + _ip_bytes(interface),
+            )
+        s.setblocking(False)
+        print(f"Multicast: {'leading' if self.leader else 'following'} on {self.group}:{self.port}")
+        return s
+
+    def close(self):
+        self._sock.close()
+
+    def _send(self, datagrams):
+        for data in datagrams:
+            try:
+                self._sock.sendto(data, self._addr)
+                self.sent += 1
+            except OSError as e:
+                print(f"Multicast: send failed: {e}")
+                return
+
+    def publish(self, shown, fetched_at, forecast, weather_time):
+        """
+        Leader: send the flights on the panel and the forecast when they change,
+        and repeat them on a timer.
+        """
+        now = time.time()
+        if shown is not self._shown:
+            self._shown = shown
+            self.seq = (self.seq + 1) & 0xFFFF
+            self._flight_datagrams = flight_datagrams(shown, self.seq, fetched_at)
+            self._flights_sent = 0
+        if now - self._flights_sent >= MULTICAST_REPEAT:
+            self._send(self._flight_datagrams)
+            self._flights_sent = now
+
+        if forecast is None:
+            return
+        if weather_time != self._forecast_time:
+            self._forecast_time = weather_time
+            self._forecast_datagram = forecast_datagram(forecast, weather_time)
+            self._forecast_sent = 0
+        if now - self._forecast_sent >= MULTICAST_FORECAST_REPEAT:
+            self._send((self._forecast_datagram,))
+            self._forecast_sent = now
+
+    def poll(self):
+        """Follower: read waiting datagrams, True when a new flight set is complete"""
+        now = time.time()
+        if self._heard is None:
+            self._heard = now  # the leader gets a full timeout from the first poll
+        complete = False
+        for _ in range(MULTICAST_READS_PER_POLL):
+            try:
+                data = self._sock.recv(MULTICAST_BUFFER)
+            except OSError:
+                break  # nothing waiting
+            if self._receive(data, now):
+                complete = True
+        return complete
+
+    def _receive(self, data, now):
+        if len(data) < _HEADER_SIZE:
+            self.bad += 1
+            return False
+        magic, version, kind, seq, part, parts, stamp, count = struct.unpack_from(_HEADER, data, 0)
+        if magic != MAGIC or version != VERSION or part >= parts:
+            self.bad += 1
+            return False
+        self._heard = now
+
+        try:
+            if kind == KIND_FORECAST:
+                if stamp != self.forecast_time:
+                    forecast, weather_time, _ = unpack_forecast(data, _HEADER_SIZE)
+                    if forecast is not None:
+                        self.forecast = forecast
+                        self.forecast_time = weather_time
+                return False
+            if kind != KIND_FLIGHTS or (seq == self.seq and self.flights is not None):
+                return False  # unknown, or a repeat of the set we have
+
+            flights = []
+            pos = _HEADER_SIZE
+            for _ in range(count):
+                flight, pos = unpack_flight(data, pos)
+                flights.append(flight)
+        except Exception:
+            self.bad += 1
+            return False
+
+        if seq != self._pending_seq or len(self._pending) != parts:
+            self._pending_seq = seq
+            self._pending = [None] * parts
+        self._pending[part] = flights
+        if None in self._pending:
+            return False
+
+        self.flights = [flight for batch in self._pending for flight in batch]
+        self.seq = seq
+        self.fetched_at = stamp
+        self._pending_seq = None
+        self._pending = []
+        self.received += 1
+        return True
+
+    @property
+    def following(self):
+        """Follower: True unless the leader has gone quiet"""
+        if self.leader:
+            return False
+        return self._heard is None or time.time() - self._heard <= MULTICAST_LEADER_TIMEOUT
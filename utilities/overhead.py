@@ -1,11 +1,25 @@
 # Flight data fetching for Interstate 75 W
-# Uses FlightRadar24 API with airplanes.live as fallback
+# Uses FlightRadar24 API with airplanes.live as fallback, or a local
+# ADS-B receiver (Beast or BaseStation feed, or aircraft.json) or a LAN
+# relay when one is configured
 
 import time
 import math
 import json
+import socket
+import select
 
 from utilities.https import https_get_json, https_get, http_get_json
+from utilities.flashtable import FlashTable
+from utilities.airports import city, route_info
+from utilities.icao import country_for_icao
+from utilities.multicast import MulticastLink, MULTICAST_ROLE
+from utilities.zones import ZoneIndex, union_zone
+from utilities.geofence import Geofence
+from utilities.flightfilter import FR24_FIELDS, compile_filter, filter_zones
+from utilities.modes import (
+    CprReference, cpr_global, crc_ok, decode_altitude, decode_callsign, decode_velocity,
+)
 
 # Configuration
 try:
@@ -24,6 +38,29 @@ except ImportError:
     ZONE_DEFAULT = {"tl_y": 52.0, "tl_x": -2.0, "br_y": 51.0, "br_x": 0.0}
     LOCATION_DEFAULT = [51.509865, -0.118092, 6371]  # London
 
+# Several areas watched at once (home, office, the airport approach...).
+# Each is {"name": .., "zone": {tl_y, tl_x, br_y, br_x}, "home": [lat, lon, 6371]};
+# "home" ranks flights in that zone and defaults to the zone's centre.
+try:
+    from config import WATCH_ZONES
+except ImportError:
+    WATCH_ZONES = None      # just ZONE_HOME around LOCATION_HOME
+
+# Polygon areas, e.g. under an approach path: {"name": .., "points":
+# [(lat, lon), ...], "home": [..]}. Watched alongside WATCH_ZONES, or
+# instead of ZONE_HOME when WATCH_ZONES is not set.
+try:
+    from config import GEOFENCES
+except ImportError:
+    GEOFENCES = None
+
+# Which flights to show - see utilities/flightfilter.py. MIN_ALTITUDE and
+# MAX_ALTITUDE apply unless it sets its own "altitude" band.
+try:
+    from config import FLIGHT_FILTER
+except ImportError:
+    FLIGHT_FILTER = None
+
 
 # Constants
 MAX_FLIGHT_LOOKUP = 5
@@ -34,10 +71,76 @@ BLANK_FIELDS = ["", "N/A", "NONE", None]
 FR24_HOST = "data-cloud.flightradar24.com"
 FR24_PATH = "/zones/fcgi/feed.js"
 
+# ICAO airline designator -> operator name, on flash (see tools/build_tables.py)
+AIRLINES_FILE = "data/airlines.bin"
+_airlines = FlashTable(AIRLINES_FILE)
+
 # Airplanes.live API (free, 1 req/sec rate limit, ADS-B Exchange v2 compatible)
 AIRPLANES_HOST = "api.airplanes.live"
 AIRPLANES_PATH = "/v2/point"  # /lat/lon/radius format
 
+# Local ADS-B receiver (dump1090/readsb BaseStation output on the LAN)
+try:
+    from config import SBS_HOST, SBS_PORT
+except ImportError:
+    SBS_HOST = None     # e.g. "192.168.1.50" - None disables the local feed
+    SBS_PORT = 30003
+
+# Raw Mode S from the receiver (Beast binary output) - decoded here
+try:
+    from config import BEAST_HOST, BEAST_PORT
+except ImportError:
+    BEAST_HOST = None   # None disables the Beast feed
+    BEAST_PORT = 30005
+
+# Streaming feeds (BaseStation and Beast)
+FEED_BUFFER_SIZE = 2048     # fixed receive buffer (bytes)
+FEED_READS_PER_POLL = 8     # cap on buffer fills per poll() call
+FEED_TRACK_TIMEOUT = 60     # seconds without a message before a track is dropped
+FEED_LIVE_SECONDS = 10      # feed counts as live if a message arrived this recently
+FEED_MAX_TRACKS = 150       # bound on each track store
+FEED_CONNECT_TIMEOUT = 2    # seconds (LAN only)
+FEED_BACKOFF_MIN = 2        # seconds before the first reconnect attempt
+FEED_BACKOFF_MAX = 60       # reconnect delay cap (seconds)
+CPR_PAIR_SECONDS = 10       # max age gap of an even/odd pair for a global decode
+
+# Beast frame: 0x1a, type, 6 byte MLAT timestamp, signal level, message.
+# A 0x1a inside a frame is sent twice.
+BEAST_ESCAPE = 0x1A
+BEAST_MODE_AC = 0x31        # 2 byte message
+BEAST_MODE_S_SHORT = 0x32   # 7 byte message
+BEAST_MODE_S_LONG = 0x33    # 14 byte message (extended squitter)
+BEAST_HEADER = 7            # timestamp + signal
+
+# Local receiver's aircraft.json (dump1090-fa: port 8080, readsb/tar1090:
+# port 80 and path "/tar1090/data/aircraft.json")
+try:
+    from config import RECEIVER_HOST, RECEIVER_PORT, RECEIVER_PATH
+except ImportError:
+    RECEIVER_HOST = None    # None disables polling the receiver
+    RECEIVER_PORT = 8080
+    RECEIVER_PATH = "/data/aircraft.json"
+
+RECEIVER_POLL_INTERVAL = 2  # seconds between polls
+# Seconds between rebuilds of the shown flights from a live LAN source
+# (Overhead.refresh_local) - no network, so far more often than a fetch
+LOCAL_REFRESH_INTERVAL = RECEIVER_POLL_INTERVAL
+RECEIVER_TIMEOUT = 2        # seconds a whole transfer may take (LAN only)
+RECEIVER_LIVE_SECONDS = 10  # receiver counts as live if its clock moved this recently
+RECEIVER_MAX_AIRCRAFT = 150
+
+# LAN relay (python -m relay) fetching once for a fleet of displays
+try:
+    from config import RELAY_HOST, RELAY_PORT
+except ImportError:
+    RELAY_HOST = None       # None disables the relay
+    RELAY_PORT = 30100
+
+try:
+    from config import TEMPERATURE_UNITS
+except ImportError:
+    TEMPERATURE_UNITS = "metric"  # forecast units requested from the relay
+
 
 
 def meters_to_feet(meters):
@@ -78,22 +181,22 @@ def distance_from_flight_to_home(flight_data, home=None):
         return 1e6  # Return far away on error
 
 
-def fetch_flights_fr24(zone):
+def airline_for_callsign(callsign):
     """
-    Fetch flights within a geographic zone from FlightRadar24.
+    Operator name from an ICAO callsign's three-letter prefix.
 
-    Args:
-        zone: Dict with tl_y, tl_x, br_y, br_x (top-left, bottom-right lat/lon)
-
-    Returns:
-        Tuple of (flights list, success bool)
-        - flights: List of flight dictionaries
-        - success: True if API call succeeded (even if 0 flights), False on error
+    Returns "" for registrations and other callsigns without a prefix.
     """
+    if len(callsign) < 4 or not callsign[:3].isalpha() or not callsign[3].isdigit():
+        return ""
+    return _airlines.text(callsign[:3].upper(), "")
+
+
+def fr24_path(zone):
+    """FR24 feed request path for a zone (tl_y, tl_x, br_y, br_x)"""
     # FR24 bounds format: y1,y2,x1,x2 (tl_y, br_y, tl_x, br_x)
     bounds = f"{zone['tl_y']},{zone['br_y']},{zone['tl_x']},{zone['br_x']}"
-
-    path = (
+    return (
         f"{FR24_PATH}"
         f"?bounds={bounds}"
         f"&faa=1&satellite=1&mlat=1&flarm=1&adsb=1"
@@ -101,59 +204,88 @@ def fetch_flights_fr24(zone):
         f"&stats=0"
     )
 
+
+def flight_from_fr24(key, val):
+    """
+    Convert one FR24 feed entry to a flight dict.
+
+    FR24 returns dict with flight IDs as keys. Each flight is an array:
+    [icao24, lat, lon, track, altitude, speed, squawk, radar, type,
+    registration, timestamp, origin, destination, flight_number,
+    on_ground, vertical_speed, callsign, ...]
+
+    Returns:
+        Flight dict, or None for non-flight keys (like 'full_count',
+        'version'), aircraft on the ground or without a position
+    """
+    if not isinstance(val, list) or len(val) < 17:
+        return None
+
+    try:
+        lat = val[1]
+        lon = val[2]
+        altitude_ft = val[4] or 0
+        vertical_speed = val[15] or 0
+        callsign = (val[16] or "").strip()
+        flight_number = (val[13] or "").strip()
+        origin = (val[11] or "").strip()
+        destination = (val[12] or "").strip()
+        aircraft_type = (val[8] or "").strip()
+        registration = (val[9] or "").strip()
+
+        # Skip if on ground or no position
+        if val[14] or lat is None or lon is None:
+            return None
+
+        return {
+            "id": key,
+            "icao": val[0] or "",
+            "lat": float(lat),
+            "lon": float(lon),
+            "altitude": int(altitude_ft),
+            "callsign": callsign,
+            "flight_number": flight_number,
+            "origin": origin,
+            "destination": destination,
+            "aircraft_type": aircraft_type,
+            "registration": registration,
+            "vertical_speed": int(vertical_speed),
+            "velocity": val[5] or 0,
+            "heading": val[3] or 0,
+            "squawk": val[6] or "",
+        }
+    except (ValueError, TypeError, IndexError):
+        return None
+
+
+def fetch_flights_fr24(zone, keep_row=None):
+    """
+    Fetch flights within a geographic zone from FlightRadar24.
+
+    Args:
+        zone: Dict with tl_y, tl_x, br_y, br_x (top-left, bottom-right lat/lon)
+        keep_row: Optional filter predicate over raw feed rows (FR24_FIELDS);
+            rows it rejects are never converted
+
+    Returns:
+        Tuple of (flights list, success bool)
+        - flights: List of flight dictionaries
+        - success: True if API call succeeded (even if 0 flights), False on error
+    """
     flights = []
 
     try:
-        data = https_get_json(FR24_HOST, path, timeout=15)
+        data = https_get_json(FR24_HOST, fr24_path(zone), timeout=15)
         if data is None:
             print("FR24 error: no response")
             return ([], False)
 
-        # FR24 returns dict with flight IDs as keys
-        # Each flight is an array: [icao24, lat, lon, track, altitude, speed,
-        #   squawk, radar, type, registration, timestamp, origin, destination,
-        #   flight_number, on_ground, vertical_speed, callsign, ...]
         for key, val in data.items():
-            # Skip non-flight keys (like 'full_count', 'version', etc)
-            if not isinstance(val, list) or len(val) < 17:
+            if keep_row is not None and isinstance(val, list) and len(val) >= 17 and not keep_row(val):
                 continue
-
-            try:
-                lat = val[1]
-                lon = val[2]
-                altitude_ft = val[4] or 0
-                vertical_speed = val[15] or 0
-                callsign = (val[16] or "").strip()
-                flight_number = (val[13] or "").strip()
-                origin = (val[11] or "").strip()
-                destination = (val[12] or "").strip()
-                aircraft_type = (val[8] or "").strip()
-                registration = (val[9] or "").strip()
-
-                # Skip if on ground or no position
-                if val[14] or lat is None or lon is None:
-                    continue
-
-                flight = {
-                    "id": key,
-                    "icao": val[0] or "",
-                    "lat": float(lat),
-                    "lon": float(lon),
-                    "altitude": int(altitude_ft),
-                    "callsign": callsign,
-                    "flight_number": flight_number,
-                    "origin": origin,
-                    "destination": destination,
-                    "aircraft_type": aircraft_type,
-                    "registration": registration,
-                    "vertical_speed": int(vertical_speed),
-                    "velocity": val[5] or 0,
-                    "heading": val[3] or 0,
-                    "squawk": val[6] or "",
-                }
+            flight = flight_from_fr24(key, val)
+            if flight is not None:
                 flights.append(flight)
-            except (ValueError, TypeError, IndexError):
-                continue
 
         print(f"FR24 returned {len(flights)} aircraft")
         return (flights, True)
@@ -163,6 +295,56 @@ def fetch_flights_fr24(zone):
         return ([], False)
 
 
+def flight_from_readsb(ac):
+    """
+    Convert one readsb/ADS-B Exchange v2 aircraft record to a flight dict.
+
+    Used for airplanes.live and a local receiver's aircraft.json, which
+    share the schema.
+
+    Returns:
+        Flight dict, or None if the aircraft has no position or is on the ground
+    """
+    try:
+        lat = ac.get("lat")
+        lon = ac.get("lon")
+
+        # Skip if no position or on ground
+        if lat is None or lon is None:
+            return None
+        if ac.get("ground", False) or ac.get("gnd", False):
+            return None
+
+        # Get altitude (baro or geometric)
+        alt_baro = ac.get("alt_baro", 0)
+        if alt_baro == "ground":
+            return None
+        altitude = int(alt_baro) if alt_baro else ac.get("alt_geom", 0) or 0
+
+        callsign = (ac.get("flight") or ac.get("r") or "").strip()
+        vertical_rate = ac.get("baro_rate") or ac.get("geom_rate") or 0
+
+        return {
+            "id": ac.get("hex", ""),
+            "icao": ac.get("hex", ""),
+            "lat": float(lat),
+            "lon": float(lon),
+            "altitude": altitude,
+            "callsign": callsign,
+            "vertical_speed": int(vertical_rate),
+            "velocity": ac.get("gs", 0) or 0,  # ground speed
+            "heading": ac.get("track", 0) or 0,
+            "squawk": ac.get("squawk", ""),
+            "aircraft_type": ac.get("t", ""),  # aircraft type code
+            "registration": ac.get("r", ""),
+            # ADS-B doesn't provide origin/destination
+            "origin": "",
+            "destination": "",
+        }
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
 def fetch_flights_airplanes_live(zone):
     """
     Fetch flights from airplanes.live API (ADS-B Exchange v2 compatible).
@@ -196,45 +378,9 @@ def fetch_flights_airplanes_live(zone):
         if data and "ac" in data:
             # ADS-B Exchange v2 format
             for ac in data["ac"]:
-                try:
-                    lat = ac.get("lat")
-                    lon = ac.get("lon")
-
-                    # Skip if no position or on ground
-                    if lat is None or lon is None:
-                        continue
-                    if ac.get("ground", False) or ac.get("gnd", False):
-                        continue
-
-                    # Get altitude (baro or geometric)
-                    alt_baro = ac.get("alt_baro", 0)
-                    if alt_baro == "ground":
-                        continue
-                    altitude = int(alt_baro) if alt_baro else ac.get("alt_geom", 0) or 0
-
-                    callsign = (ac.get("flight") or ac.get("r") or "").strip()
-                    vertical_rate = ac.get("baro_rate") or ac.get("geom_rate") or 0
-
-                    flight = {
-                        "id": ac.get("hex", ""),
-                        "icao": ac.get("hex", ""),
-                        "lat": float(lat),
-                        "lon": float(lon),
-                        "altitude": altitude,
-                        "callsign": callsign,
-                        "vertical_speed": int(vertical_rate),
-                        "velocity": ac.get("gs", 0) or 0,  # ground speed
-                        "heading": ac.get("track", 0) or 0,
-                        "squawk": ac.get("squawk", ""),
-                        "aircraft_type": ac.get("t", ""),  # aircraft type code
-                        "registration": ac.get("r", ""),
-                        # ADS-B doesn't provide origin/destination
-                        "origin": "",
-                        "destination": "",
-                    }
+                flight = flight_from_readsb(ac)
+                if flight is not None:
                     flights.append(flight)
-                except (ValueError, TypeError, KeyError):
-                    continue
 
             print(f"airplanes.live returned {len(flights)} aircraft")
 
@@ -244,20 +390,960 @@ def fetch_flights_airplanes_live(zone):
     return flights
 
 
-def fetch_flights_in_zone(zone):
+def _sbs_int(value):
+    """Integer from a BaseStation numeric field (may carry decimals)"""
+    return int(float(value))
+
+
+def parse_sbs_line(line):
+    """
+    Split one BaseStation (SBS-1) line into fields.
+
+    Args:
+        line: Line as str, without the line ending
+
+    Returns:
+        List of fields for a MSG line with a valid hex ident, or None
+    """
+    if not line.startswith("MSG,"):
+        return None
+    fields = line.split(",")
+    if len(fields) < 22 or len(fields[4]) != 6:
+        return None
+    return fields
+
+
+def update_sbs_track(track, fields, now):
+    """
+    Apply the non-empty fields of one MSG line to a track in place.
+
+    MSG types carry different subsets (1 identity, 2/3 position, 4
+    velocity, 5/6/7 altitude and squawk, 8 ground flag); empty fields
+    leave the last known value alone.
+    """
+    value = fields[10].strip()
+    if value:
+        track["callsign"] = value
+    value = fields[11]
+    if value:
+        track["altitude"] = _sbs_int(value)
+    value = fields[12]
+    if value:
+        track["velocity"] = _sbs_int(value)
+    value = fields[13]
+    if value:
+        track["heading"] = _sbs_int(value)
+    if fields[14] and fields[15]:
+        track["lat"] = float(fields[14])
+        track["lon"] = float(fields[15])
+        track["position_time"] = now
+    value = fields[16]
+    if value:
+        track["vertical_speed"] = _sbs_int(value)
+    value = fields[17]
+    if value:
+        track["squawk"] = value
+    value = fields[21]
+    if value:
+        track["ground"] = value not in ("0", "")
+    track["seen"] = now
+
+
+def new_track(icao):
+    """Empty track in the same shape as the API flight dicts"""
+    return {
+        "id": icao,
+        "icao": icao,
+        "lat": None,
+        "lon": None,
+        "altitude": 0,
+        "callsign": "",
+        "vertical_speed": 0,
+        "velocity": 0,
+        "heading": 0,
+        "squawk": "",
+        "aircraft_type": "",
+        "registration": "",
+        "origin": "",
+        "destination": "",
+        "ground": False,
+        "seen": 0,
+        "position_time": 0,
+    }
+
+
+def in_zone(flight, zone):
+    """Check a flight's position against a tl/br lat/lon zone"""
+    lat = flight.get("lat")
+    lon = flight.get("lon")
+    if lat is None or lon is None:
+        return False
+    return zone["br_y"] <= lat <= zone["tl_y"] and zone["tl_x"] <= lon <= zone["br_x"]
+
+
+class StreamSource:
+    """
+    Base for receiver feeds that stream over a persistent TCP connection.
+
+    poll(), called every frame, reads whatever has arrived into a fixed
+    receive buffer and hands it to _consume(); subclasses decode it into
+    self.tracks and set _last_message. A dropped connection is retried
+    with exponential backoff.
+    """
+
+    name = "Feed"
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.tracks = {}
+        self.keep = None    # flight filter predicate, set by Overhead
+
+        self._buffer = bytearray(FEED_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._fill = 0
+        self._sock = None
+        self._read = None
+        self._next_attempt = 0
+        self._backoff = FEED_BACKOFF_MIN
+        self._last_message = 0
+
+        # Counters
+        self.messages = 0
+        self.overflows = 0
+        self.connects = 0
+
+    def _connect(self, now):
+        """Open the feed socket (short blocking connect, then non-blocking)"""
+        if now < self._next_attempt:
+            return False
+        s = socket.socket()
+        try:
+            s.settimeout(FEED_CONNECT_TIMEOUT)
+            s.connect(socket.getaddrinfo(self.host, self.port)[0][-1])
+            s.setblocking(False)
+        except OSError as e:
+            s.close()
+            print(f"{self.name}: connect to {self.host}:{self.port} failed: {e}, retry in {self._backoff}s")
+            self._next_attempt = now + self._backoff
+            self._backoff = min(self._backoff * 2, FEED_BACKOFF_MAX)
+            return False
+
+        self._sock = s
+        # CPython sockets have recv_into, MicroPython's have readinto
+        self._read = getattr(s, "recv_into", None) or s.readinto
+        self._fill = 0
+        self._backoff = FEED_BACKOFF_MIN
+        self.connects += 1
+        print(f"{self.name}: connected to {self.host}:{self.port}")
+        return True
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._read = None
+
+    def _drop(self, reason):
+        print(f"{self.name}: connection lost ({reason})")
+        self.close()
+        self._next_attempt = time.time() + self._backoff
+
+    def poll(self):
+        """Read whatever has arrived and update the track store"""
+        now = time.time()
+        if self._sock is None and not self._connect(now):
+            return
+
+        for _ in range(FEED_READS_PER_POLL):
+            if self._fill == FEED_BUFFER_SIZE:
+                # A record longer than the whole buffer - discard it
+                self.overflows += 1
+                self._fill = 0
+            try:
+                count = self._read(self._view[self._fill:])
+            except OSError as e:
+                if e.args and e.args[0] in (11, 35):  # EAGAIN/EWOULDBLOCK - drained
+                    break
+                self._drop(e)
+                return
+            if count is None:  # MicroPython non-blocking, nothing waiting
+                break
+            if count == 0:
+                self._closed(now)
+                return
+            self._fill += count
+            self._consume(now)
+            if self._sock is None:
+                return  # closed while consuming
+
+    def _closed(self, now):
+        """The other end closed the connection"""
+        self._drop("closed by receiver")
+
+    def _consume(self, now):
+        """
+        Decode self._view[:self._fill], leaving any partial record in place.
+
+        Subclasses decode their format here; the base class keeps nothing.
+        """
+        self._fill = 0
+
+    def _consume_lines(self, now):
+        """Pass every complete line in the buffer to _apply(), keep the partial tail"""
+        data = bytes(self._view[:self._fill])
+        pos = 0
+        while True:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                break
+            self._apply(data[pos:end], now)
+            pos = end + 1
+        rest = self._fill - pos
+        if pos and rest:
+            self._view[:rest] = data[pos:]
+        self._fill = rest
+
+    def _track_room(self, now):
+        """True if another track fits in the store (pruning if needed)"""
+        if len(self.tracks) < FEED_MAX_TRACKS:
+            return True
+        self.prune(now)
+        return len(self.tracks) < FEED_MAX_TRACKS
+
+    def prune(self, now=None):
+        """Drop tracks that have gone quiet"""
+        if now is None:
+            now = time.time()
+        for key in [k for k, t in self.tracks.items() if now - t["seen"] > FEED_TRACK_TIMEOUT]:
+            del self.tracks[key]
+
+    @property
+    def live(self):
+        """True while connected and messages are arriving"""
+        return self._sock is not None and time.time() - self._last_message <= FEED_LIVE_SECONDS
+
+    def flights(self, zone):
+        """Airborne tracks with a position inside the zone that pass the filter"""
+        self.prune()
+        keep = self.keep
+        return [
+            t for t in self.tracks.values()
+            if not t["ground"] and in_zone(t, zone) and (keep is None or keep(t))
+        ]
+
+
+class SbsSource(StreamSource):
+    """
+    Streaming BaseStation (port 30003) feed from a LAN receiver.
+
+    Complete lines in the receive buffer are parsed and applied in place
+    to a track store keyed by ICAO hex; a partial line at the end is moved
+    to the front of the buffer for the next read.
+    """
+
+    name = "SBS"
+
+    def __init__(self, host, port=SBS_PORT):
+        StreamSource.__init__(self, host, port)
+        self.bad_lines = 0
+
+    def _consume(self, now):
+        self._consume_lines(now)
+
+    def _apply(self, line, now):
+        """Parse one raw line into the track store"""
+        try:
+            fields = parse_sbs_line(line.decode().rstrip("\r"))
+            if fields is None:
+                self.bad_lines += 1
+                return
+            icao = fields[4].upper()
+            track = self.tracks.get(icao)
+            if track is None:
+                if not self._track_room(now):
+                    return
+                track = new_track(icao)
+                self.tracks[icao] = track
+            update_sbs_track(track, fields, now)
+        except (ValueError, IndexError, UnicodeError):
+            self.bad_lines += 1
+            return
+        self.messages += 1
+        self._last_message = now
+
+
+def new_beast_track(address):
+    """Track for a Beast feed aircraft - every key the decoder writes exists up front"""
+    track = new_track("%06X" % address)
+    track["lat_e5"] = None
+    track["lon_e5"] = None
+    track["cpr_lat0"] = 0
+    track["cpr_lon0"] = 0
+    track["cpr_time0"] = -CPR_PAIR_SECONDS - 1
+    track["cpr_lat1"] = 0
+    track["cpr_lon1"] = 0
+    track["cpr_time1"] = -CPR_PAIR_SECONDS - 1
+    track["callsign_raw"] = b""
+    return track
+
+
+class BeastSource(StreamSource):
+    """
+    Raw Mode S from a receiver's Beast binary output (port 30005).
+
+    Frames are unescaped byte by byte into one preallocated 14 byte message
+    buffer, with the unescape state carried across reads, and DF17 extended
+    squitters are decoded straight into a track store keyed by the 24-bit
+    address: identification, airborne position (CPR, global from an
+    even/odd pair or local against the home location) and velocity.
+    Decoding is integer-only (see utilities/modes.py) and tracks are
+    created with every key they will need, so steady-state messages
+    allocate nothing.
+    """
+
+    name = "Beast"
+
+    def __init__(self, host, port=BEAST_PORT, home=None):
+        StreamSource.__init__(self, host, port)
+        home = home or LOCATION_DEFAULT
+        self._cpr = CprReference(home[0], home[1])
+        self._msg = bytearray(14)
+        self._callsign = bytearray(8)
+
+        # Unescape state
+        self._state = 0     # 0 idle, 1 after escape, 2 in frame, 3 escape in frame
+        self._need = 0
+        self._pos = 0
+        self._keep = False
+
+        # Counters
+        self.frames = 0
+        self.bad_crc = 0
+        self.positions = 0
+
+    def _consume(self, now):
+        """Unescape every byte received, decoding each complete long frame"""
+        buf = self._buffer
+        msg = self._msg
+        state = self._state
+        need = self._need
+        pos = self._pos
+        keep = self._keep
+
+        for i in range(self._fill):
+            b = buf[i]
+            if state == 3:
+                if b == BEAST_ESCAPE:
+                    state = 2           # doubled escape - a 0x1a data byte
+                else:
+                    state = 1           # frame cut short, b is the next type
+            elif state == 2:
+                if b == BEAST_ESCAPE:
+                    state = 3
+                    continue
+            elif state == 0:
+                if b == BEAST_ESCAPE:
+                    state = 1
+                continue
+
+            if state == 1:
+                if b == BEAST_MODE_S_LONG:
+                    need = BEAST_HEADER + 14
+                    keep = True
+                elif b == BEAST_MODE_S_SHORT:
+                    need = BEAST_HEADER + 7
+                    keep = False
+                elif b == BEAST_MODE_AC:
+                    need = BEAST_HEADER + 2
+                    keep = False
+                else:
+                    state = 0           # status frame or noise - resync
+                    continue
+                pos = 0
+                state = 2
+                continue
+
+            if keep and pos >= BEAST_HEADER:
+                msg[pos - BEAST_HEADER] = b
+            pos += 1
+            if pos == need:
+                state = 0
+                self.frames += 1
+                if keep:
+                    self._decode(now)
+
+        self._state = state
+        self._need = need
+        self._pos = pos
+        self._keep = keep
+        self._fill = 0
+
+    def _decode(self, now):
+        """Apply one 112-bit message to the track store"""
+        msg = self._msg
+        if msg[0] >> 3 != 17:
+            return
+        if not crc_ok(msg):
+            self.bad_crc += 1
+            return
+
+        address = (msg[1] << 16) | (msg[2] << 8) | msg[3]
+        track = self.tracks.get(address)
+        if track is None:
+            if not self._track_room(now):
+                return
+            track = new_beast_track(address)
+            self.tracks[address] = track
+
+        tc = msg[4] >> 3
+        if 1 <= tc <= 4:
+            callsign = self._callsign
+            decode_callsign(msg, callsign)
+            if callsign != track["callsign_raw"]:
+                raw = bytes(callsign)
+                track["callsign_raw"] = raw
+                track["callsign"] = raw.decode().replace("#", "").strip()
+        elif 9 <= tc <= 18:
+            self._position(msg, track, now)
+        elif tc == 19:
+            decode_velocity(msg, track)
+
+        track["seen"] = now
+        self.messages += 1
+        self._last_message = now
+
+    def _position(self, msg, track, now):
+        """Airborne position: altitude, then CPR global if a fresh pair exists, else local"""
+        altitude = decode_altitude(msg)
+        if altitude is not None:
+            track["altitude"] = altitude
+
+        odd = (msg[6] >> 2) & 1
+        lat = ((msg[6] & 3) << 15) | (msg[7] << 7) | (msg[8] >> 1)
+        lon = ((msg[8] & 1) << 16) | (msg[9] << 8) | msg[10]
+        if odd:
+            track["cpr_lat1"] = lat
+            track["cpr_lon1"] = lon
+            track["cpr_time1"] = now
+            paired = now - track["cpr_time0"] <= CPR_PAIR_SECONDS
+        else:
+            track["cpr_lat0"] = lat
+            track["cpr_lon0"] = lon
+            track["cpr_time0"] = now
+            paired = now - track["cpr_time1"] <= CPR_PAIR_SECONDS
+
+        if not (paired and cpr_global(track, odd == 1)):
+            self._cpr.decode(track, lat, lon, odd)
+        track["position_time"] = now
+        self.positions += 1
+
+    def flights(self, zone):
+        """Tracks with a position inside the zone, as flight dicts"""
+        self.prune()
+        keep = self.keep
+        flights = []
+        for track in self.tracks.values():
+            if track["lat_e5"] is None or (keep is not None and not keep(track)):
+                continue
+            flight = dict(track)
+            flight["lat"] = track["lat_e5"] / 100000
+            flight["lon"] = track["lon_e5"] / 100000
+            if in_zone(flight, zone):
+                flights.append(flight)
+        return flights
+
+
+def _json_ready(value):
+    """Config values as JSON can carry them (sets and tuples become lists)"""
+    if isinstance(value, dict):
+        return {k: _json_ready(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_json_ready(v) for v in value]
+    return value
+
+
+class RelaySource(StreamSource):
+    """
+    Flights and the weather forecast pushed by a relay on the LAN.
+
+    On connect the display sends its view - zone, home, altitude limits,
+    flight filter, watch zones, how many flights it shows and its forecast
+    units - as one JSON line.
+    The relay (python -m relay) answers with the flights in that view and
+    from then on only what changes after each of its upstream fetches.
+    Messages are JSON lines, see relay/server.py.
+    """
+
+    name = "Relay"
+
+    def __init__(self, host, port=RELAY_PORT, zone=None, home=None, units=TEMPERATURE_UNITS,
+                 flight_filter=None, watch=None):
+        StreamSource.__init__(self, host, port)
+        view = {
+            "zone": zone or ZONE_DEFAULT,
+            "home": home or LOCATION_DEFAULT,
+            "min_altitude": MIN_ALTITUDE,
+            "max_altitude": MAX_ALTITUDE,
+            "limit": MAX_FLIGHT_LOOKUP,
+            "units": units,
+        }
+        if flight_filter:
+            view["filter"] = _json_ready(flight_filter)
+        if watch:
+            # Nearest flights per watch zone (inside the polygon for a
+            # geofence), not just to the main home
+            view["zones"] = []
+            for w in watch:
+                entry = {"name": w["name"], "zone": w["zone"], "home": w["home"]}
+                if "points" in w:
+                    entry["points"] = _json_ready(w["points"])
+                view["zones"].append(entry)
+        self._hello = (json.dumps(view) + "\n").encode()
+
+        # Last complete forecast table (see scenes/weather.py fetch_forecast)
+        self.forecast = None
+        self.forecast_time = 0
+        self._forecast_fields = {}
+
+        self.seq = None     # sequence number of the last complete update
+        self.bad_lines = 0
+
+    def _connect(self, now):
+        """Connect and send the view; the relay replies with all of it"""
+        if not StreamSource._connect(self, now):
+            return False
+        try:
+            self._sock.send(self._hello)
+        except OSError as e:
+            self._drop(e)
+            return False
+        self.tracks = {}
+        self.seq = None
+        return True
+
+    def _consume(self, now):
+        self._consume_lines(now)
+
+    def _apply(self, line, now):
+        """Apply one relay message"""
+        try:
+            msg = json.loads(line.decode())
+            kind = msg["t"]
+            if kind == "set":
+                flight = msg["f"]
+                if flight["id"] in self.tracks or len(self.tracks) < FEED_MAX_TRACKS:
+                    self.tracks[flight["id"]] = flight
+            elif kind == "upd":
+                flight = self.tracks.get(msg["id"])
+                if flight is not None:
+                    flight.update(msg["f"])
+            elif kind == "del":
+                self.tracks.pop(msg["id"], None)
+            elif kind == "sync":
+                self.seq = msg["seq"]
+            elif kind == "wx":
+                self._forecast_fields[msg["k"]] = msg["v"]
+            elif kind == "wxend":
+                self.forecast = self._forecast_fields
+                self.forecast_time = msg["time"]
+                self._forecast_fields = {}
+        except (ValueError, KeyError, TypeError, UnicodeError):
+            self.bad_lines += 1
+            return
+        self.messages += 1
+        self._last_message = now
+
+    def prune(self, now=None):
+        pass  # the relay removes flights that leave the view
+
+    @property
+    def live(self):
+        """True once the view has arrived, while the relay's upstream is healthy"""
+        return (
+            self._sock is not None and self.seq is not None
+            and time.time() - self._last_message <= FEED_LIVE_SECONDS
+        )
+
+    def flights(self, zone):
+        """Flights in the relay's view of this display that pass the filter"""
+        keep = self.keep
+        return [f for f in self.tracks.values() if in_zone(f, zone) and (keep is None or keep(f))]
+
+
+def _json_number(line, key):
+    """Raw text of a top-level "key" : value pair on a line, or None"""
+    pos = line.find(key)
+    if pos < 0:
+        return None
+    pos = line.find(":", pos + len(key))
+    if pos < 0:
+        return None
+    end = pos + 1
+    while end < len(line) and line[end] not in ",}":
+        end += 1
+    return line[pos + 1:end].strip()
+
+
+class ReceiverSource(StreamSource):
+    """
+    Polls a LAN receiver's aircraft.json (readsb/dump1090 schema).
+
+    Each poll is one HTTP/1.0 transfer on a non-blocking socket, advanced
+    a little every frame by poll() through the StreamSource receive buffer,
+    so a slow or dead receiver never stalls the display. The file is
+    parsed a line at a time (receivers write one aircraft per line) and
+    each record is filtered on its own, so only the flights kept are ever
+    held. The "now" and "messages" counters at the top of the file are
+    checked first: if neither moved since the last poll the transfer is
+    abandoned before any aircraft is parsed. A file written on one line is
+    only read while it fits in the receive buffer.
+
+    A transfer that fails or takes longer than RECEIVER_TIMEOUT is dropped
+    and the next one waits out the reconnect backoff.
+    """
+
+    name = "Receiver"
+
+    def __init__(self, host, port=RECEIVER_PORT, path=RECEIVER_PATH):
+        StreamSource.__init__(self, host, port)
+        self.path = path
+        self.aircraft = []
+        self._request = (
+            f"GET {path} HTTP/1.0\r\n"
+            f"Host: {host}\r\n"
+            "User-Agent: FlightTracker/1.0\r\n"
+            "Accept: application/json\r\n"
+            "\r\n"
+        ).encode()
+
+        self._addr = None
+        self._writable = None
+        self._last_poll = 0
+        self._started = 0
+        self._counters = None
+        self._counters_changed = 0
+
+        # Transfer in progress
+        self._state = None  # "connect", "status", "headers", "body", "end"
+        self._header = [None, None]
+        self._pending = None
+
+        # Counters
+        self.polls = 0
+        self.skipped = 0
+        self.parsed = 0
+        self.errors = 0
+
+    def _connect(self, now):
+        """Start a non-blocking connect for one transfer"""
+        if now < self._next_attempt:
+            return False
+        s = socket.socket()
+        try:
+            if self._addr is None:
+                self._addr = socket.getaddrinfo(self.host, self.port)[0][-1]
+            s.setblocking(False)
+            try:
+                s.connect(self._addr)
+            except OSError as e:
+                if not e.args or e.args[0] not in (115, 36):  # EINPROGRESS (Linux/lwIP, macOS)
+                    raise
+        except OSError as e:
+            s.close()
+            self._fail(now, e)
+            return False
+
+        self._sock = s
+        self._read = getattr(s, "recv_into", None) or s.readinto
+        self._writable = select.poll()
+        self._writable.register(s, select.POLLOUT)
+        self._fill = 0
+        self._started = now
+        self._state = "connect"
+        self._header = [None, None]
+        self._pending = None
+        return True
+
+    def _fail(self, now, reason):
+        """Give up on this transfer and back off before the next"""
+        print(f"Receiver: {self.host}:{self.port} {reason}, retry in {self._backoff}s")
+        self.errors += 1
+        self._finish()
+        self._next_attempt = now + self._backoff
+        self._backoff = min(self._backoff * 2, FEED_BACKOFF_MAX)
+
+    def _finish(self):
+        self.close()
+        self._writable = None
+        self._state = None
+        self._pending = None
+
+    def poll(self):
+        """Advance the current transfer, or start one if the poll interval has passed"""
+        now = time.time()
+        if self._sock is None:
+            if now - self._last_poll < RECEIVER_POLL_INTERVAL or not self._connect(now):
+                return
+            self._last_poll = now
+            self.polls += 1
+
+        if now - self._started > RECEIVER_TIMEOUT:
+            self._fail(now, "timed out")
+            return
+        if self._state == "connect":
+            if not self._writable.poll(0):
+                return  # still connecting
+            try:
+                self._sock.send(self._request)
+            except OSError as e:
+                self._fail(now, e)
+                return
+            self._state = "status"
+        StreamSource.poll(self)
+
+    def _consume(self, now):
+        self._consume_lines(now)
+
+    def _apply(self, line, now):
+        """One line of the HTTP response"""
+        state = self._state
+        if state == "body":
+            self._body_line(line.decode().strip(), now)
+        elif state == "headers":
+            line = line.strip().lower()
+            if not line:
+                self._state = "body"
+            elif line.startswith(b"transfer-encoding:") and b"chunked" in line:
+                self._fail(now, "sent a chunked response")
+        elif state == "status":
+            if b" 200" not in line:
+                self._fail(now, f"answered {line.decode().strip()}")
+            else:
+                self._state = "headers"
+        # None (abandoned) or "end" - ignore the rest
+
+    def _body_line(self, line, now):
+        """One line of aircraft.json"""
+        aircraft = self._pending
+        try:
+            if aircraft is None:
+                # Header: "now" and "messages" come before the aircraft
+                header = self._header
+                if header[0] is None:
+                    header[0] = _json_number(line, '"now"')
+                if header[1] is None:
+                    header[1] = _json_number(line, '"messages"')
+                if '"aircraft"' not in line:
+                    return
+                counters = tuple(header)
+                if counters == self._counters:
+                    self.skipped += 1
+                    self._finish()
+                    self._backoff = FEED_BACKOFF_MIN
+                    return
+                self._counters = counters
+                self._counters_changed = now
+                self._pending = aircraft = []
+                if line.endswith("}"):
+                    # Whole file on one line (compact writers)
+                    self._add_all(aircraft, json.loads(line).get("aircraft", ()))
+                    self._state = "end"
+                return
+
+            if line.startswith("]"):
+                self._state = "end"
+                return
+            if not line.startswith("{"):
+                return
+            if line.endswith(","):
+                line = line[:-1]
+            self._add(aircraft, flight_from_readsb(json.loads(line)))
+        except ValueError as e:
+            self._fail(now, f"sent bad aircraft.json: {e}")
+
+    def _closed(self, now):
+        """End of the response - keep the aircraft if the whole list arrived"""
+        if self._state != "end":
+            self._fail(now, "closed the connection mid-file")
+            return
+        self.aircraft = self._pending
+        self.parsed += 1
+        self._backoff = FEED_BACKOFF_MIN
+        self._finish()
+
+    def _add(self, aircraft, flight):
+        """Keep a parsed aircraft if it passes the filter and there is room"""
+        if flight is not None and len(aircraft) < RECEIVER_MAX_AIRCRAFT and (
+                self.keep is None or self.keep(flight)):
+            aircraft.append(flight)
+
+    def _add_all(self, aircraft, records):
+        for record in records:
+            self._add(aircraft, flight_from_readsb(record))
+
+    def prune(self, now=None):
+        pass  # each complete transfer replaces the aircraft
+
+    @property
+    def live(self):
+        """True while the receiver's clock or message count keeps moving"""
+        return self._counters is not None and time.time() - self._counters_changed <= RECEIVER_LIVE_SECONDS
+
+    def flights(self, zone):
+        """Airborne aircraft inside the zone from the last parse"""
+        return [f for f in self.aircraft if in_zone(f, zone)]
+
+
+def watch_zones(watch=None, fences=None):
+    """
+    Watch zones with a home each (WATCH_ZONES and GEOFENCES, or ZONE_HOME alone).
+
+    A geofence becomes a zone of its bounding box with the polygon under
+    "fence"; the grid index finds candidates by box and the polygon
+    test has the final say.
+
+    Returns:
+        List of {"name", "zone", "home"} dicts, plus "fence" and its
+        "points" for geofences
+    """
+    if watch is None:
+        watch = WATCH_ZONES
+    if fences is None:
+        fences = GEOFENCES
+    if not watch and not fences:
+        return [{"name": "home", "zone": ZONE_DEFAULT, "home": LOCATION_DEFAULT}]
+
+    entries = [(entry, entry["zone"], None) for entry in watch or ()]
+    for entry in fences or ():
+        fence = Geofence(entry["points"], entry.get("name", ""))
+        entries.append((entry, fence.zone, fence))
+
+    zones = []
+    for i, (entry, zone, fence) in enumerate(entries):
+        home = entry.get("home") or [
+            (zone["tl_y"] + zone["br_y"]) / 2, (zone["tl_x"] + zone["br_x"]) / 2, EARTH_RADIUS_KM,
+        ]
+        name = entry.get("name") or f"zone{i + 1}"
+        zones.append({"name": name, "zone": zone, "home": home})
+        if fence is not None:
+            zones[-1]["fence"] = fence
+            zones[-1]["points"] = entry["points"]   # for a LAN relay's copy
+    return zones
+
+
+def flight_record(flight):
+    """
+    What the display keeps of a flight: the fields the scenes draw, with
+    the airline, country, cities and route looked up.
+    """
+    callsign = flight.get("callsign", "")
+    if callsign and callsign.upper() in BLANK_FIELDS:
+        callsign = ""
+
+    flight_number = flight.get("flight_number", "")
+    if flight_number and flight_number.upper() in BLANK_FIELDS:
+        flight_number = ""
+
+    # Use aircraft_type from FR24, fall back to ICAO code
+    plane = flight.get("aircraft_type", "") or flight.get("icao", "").upper()
+    origin = flight.get("origin", "")
+    destination = flight.get("destination", "")
+
+    route_km, eta = route_info(
+        origin, destination,
+        flight.get("lat"), flight.get("lon"), flight.get("velocity", 0),
+    )
+
+    return {
+        "plane": plane,
+        "origin": origin,
+        "destination": destination,
+        "vertical_speed": flight.get("vertical_speed", 0),
+        "altitude": flight.get("altitude", 0),
+        "velocity": flight.get("velocity", 0),
+        "heading": flight.get("heading", 0),
+        "callsign": callsign,
+        "flight_number": flight_number,
+        "airline": airline_for_callsign(callsign),
+        "country": country_for_icao(flight.get("icao", "")),
+        "origin_city": city(origin),
+        "destination_city": city(destination),
+        "route_km": route_km,
+        "eta": eta,
+        "squawk": flight.get("squawk", ""),
+    }
+
+
+def restored_record(flight):
+    """
+    A flight from a warm-start snapshot as flight_record() builds it: the
+    cities and route length the snapshot doesn't store are looked up again.
+    The ETA needs a position, so it stays unknown until the first fetch.
+    """
+    record = dict(flight)
+    origin = record.get("origin", "")
+    destination = record.get("destination", "")
+    record["origin_city"] = city(origin)
+    record["destination_city"] = city(destination)
+    record["route_km"] = route_info(origin, destination)[0]
+    record["eta"] = None
+    return record
+
+
+def compile_flight_filter(spec):
+    """
+    FLIGHT_FILTER compiled for flight dicts and for raw FR24 rows.
+
+    MIN_ALTITUDE/MAX_ALTITUDE become the altitude band unless the filter
+    has its own. A filter that doesn't compile is reported and replaced by
+    the altitude band alone.
+
+    Returns:
+        (predicate, FR24 row predicate, allowed watch zone names or None,
+        the filter dict compiled - sent on to a LAN relay)
+    """
+    spec = dict(spec or {})
+    if "altitude" not in spec:
+        spec["altitude"] = (MIN_ALTITUDE, MAX_ALTITUDE)
+    try:
+        return compile_filter(spec), compile_filter(spec, FR24_FIELDS), filter_zones(spec), spec
+    except (ValueError, TypeError, KeyError) as e:
+        print(f"Filter: {e} - using the altitude limits only")
+        spec = {"altitude": (MIN_ALTITUDE, MAX_ALTITUDE)}
+        return compile_filter(spec), compile_filter(spec, FR24_FIELDS), None, spec
+
+
+def fetch_flights_in_zone(zone, local_sources=(), keep=None, keep_row=None):
     """
     Fetch flights with fallbacks:
-    1. FlightRadar24 (primary - includes origin/destination)
-    2. airplanes.live (fallback - ADS-B data only, only used if FR24 errors)
+    1. Local sources (Beast feed, SBS feed, aircraft.json, then the LAN
+       relay) - the first one that is live answers without any internet fetch
+    2. FlightRadar24 (primary internet source - includes origin/destination)
+    3. airplanes.live (fallback - ADS-B data only, only used if FR24 errors)
+
+    keep/keep_row are the compiled flight filter over flight dicts and raw
+    FR24 rows; local sources apply their own (see Overhead).
     """
+    for source in local_sources:
+        if source.live:
+            flights = source.flights(zone)
+            print(f"{type(source).__name__}: {len(flights)} flights in zone")
+            return flights
+
     # Try FR24 first (has origin/destination airports)
-    flights, success = fetch_flights_fr24(zone)
+    flights, success = fetch_flights_fr24(zone, keep_row)
 
     # Only fall back to airplanes.live if FR24 had an error
     # (not just 0 flights - that's a valid response)
     if not success:
         print("FR24 failed, trying airplanes.live fallback...")
         flights = fetch_flights_airplanes_live(zone)
+        if keep is not None:
+            flights = [f for f in flights if keep(f)]
 
     return flights
 
@@ -277,6 +1363,50 @@ class Overhead:
         self._last_fetch = 0
         self._fetch_interval = FLIGHT_POLL_INTERVAL
 
+        # Source health, persisted in the warm-start snapshot
+        self._failures = 0
+
+        # True while showing flights restored from the snapshot
+        self._stale = False
+
+        # Receiver on the LAN - streaming feeds and/or aircraft.json, all
+        # kept current by poll_local()
+        self.beast = BeastSource(BEAST_HOST, BEAST_PORT) if BEAST_HOST else None
+        self.sbs = SbsSource(SBS_HOST, SBS_PORT) if SBS_HOST else None
+        self.receiver = ReceiverSource(RECEIVER_HOST, RECEIVER_PORT, RECEIVER_PATH) if RECEIVER_HOST else None
+
+        # Watch zones, fetched as one box and told apart by a grid index
+        self.watch = watch_zones()
+        self.zones = ZoneIndex({w["name"]: w["zone"] for w in self.watch})
+        self._homes = {w["name"]: w["home"] for w in self.watch}
+        self._fences = {w["name"]: w["fence"] for w in self.watch if "fence" in w}
+        self.fetch_zone = union_zone([w["zone"] for w in self.watch])
+
+
+        # Panels in one room sharing a single panel's fetches (see share())
+        self.multicast = None
+        if MULTICAST_ROLE:
+            try:
+                self.multicast = MulticastLink()
+            except OSError as e:
+                print(f"Multicast: setup failed ({e}) - fetching alone")
+
+        # Flight filter, compiled once and run inside every parser
+        self.keep, self.keep_row, self._allowed_zones, spec = compile_flight_filter(FLIGHT_FILTER)
+
+        # Relay fetching for the whole fleet - also carries the forecast.
+        # It applies the filter before cutting the view to the nearest
+        # flights, and cuts each watch zone around its own home, so neither
+        # a filtered display nor a distant zone loses flights to the cut
+        self.relay = None
+        if RELAY_HOST:
+            self.relay = RelaySource(
+                RELAY_HOST, RELAY_PORT, zone=self.fetch_zone, flight_filter=spec, watch=self.watch,
+            )
+
+        for source in self.local_sources():
+            source.keep = self.keep
+
     def grab_data(self):
         """Fetch flight data (synchronous version)"""
         self._processing = True
@@ -286,8 +1416,8 @@ class Overhead:
 
         try:
             # Fetch all flights in zone
-            flights = fetch_flights_in_zone(ZONE_DEFAULT)
-            print(f"Found {len(flights)} flights in zone")
+            flights = fetch_flights_in_zone(self.fetch_zone, self.local_sources(), self.keep, self.keep_row)
+            print(f"Found {len(flights)} flights in zone matching the filter")
 
             # If no flights from API, leave data empty (display will show clock/weather)
             if len(flights) == 0:
@@ -295,63 +1425,157 @@ class Overhead:
                 self._data = []
                 self._new_data = True
                 self._last_fetch = time.time()
+                self._failures = 0
+                self._stale = False
                 self._processing = False
                 return
 
-            # Filter by altitude
-            min_alt = MIN_ALTITUDE
-            max_alt = MAX_ALTITUDE
-            flights = [
-                f for f in flights
-                if min_alt < f.get("altitude", 0) < max_alt
-            ]
-            print(f"After altitude filter: {len(flights)} flights")
-
-            # Sort by distance from home
-            flights = sorted(
-                flights,
-                key=lambda f: distance_from_flight_to_home(f)
-            )
+            # Keep flights inside a watch zone, nearest its zone's home first
+            flights = self.in_watch_zones(flights)
+            if len(self.watch) > 1:
+                print(f"In watch zones: {len(flights)} flights")
 
             # Take closest flights
             for flight in flights[:MAX_FLIGHT_LOOKUP]:
-                callsign = flight.get("callsign", "")
-                if callsign and callsign.upper() in BLANK_FIELDS:
-                    callsign = ""
-
-                flight_number = flight.get("flight_number", "")
-                if flight_number and flight_number.upper() in BLANK_FIELDS:
-                    flight_number = ""
-
-                # Use aircraft_type from FR24, fall back to ICAO code
-                plane = flight.get("aircraft_type", "") or flight.get("icao", "").upper()
-                origin = flight.get("origin", "")
-                destination = flight.get("destination", "")
-
-                print(f"Flight: {flight_number or callsign} {plane} {origin}->{destination} @{flight.get('altitude', 0)}ft")
-
-                data.append({
-                    "plane": plane,
-                    "origin": origin,
-                    "destination": destination,
-                    "vertical_speed": flight.get("vertical_speed", 0),
-                    "altitude": flight.get("altitude", 0),
-                    "velocity": flight.get("velocity", 0),
-                    "heading": flight.get("heading", 0),
-                    "callsign": callsign,
-                    "flight_number": flight_number,
-                })
+                record = flight_record(flight)
+                print(f"Flight: {record['flight_number'] or record['callsign']} {record['airline']} {record['plane']} "
+                      f"{record['origin']}->{record['destination']} @{record['altitude']}ft")
+                data.append(record)
 
             self._data = data
             self._new_data = True
             self._last_fetch = time.time()
+            self._failures = 0
+            self._stale = False
 
         except Exception as e:
             print(f"Error grabbing flight data: {e}")
             self._new_data = False
+            self._failures += 1
 
         self._processing = False
 
+    def refresh_local(self):
+        """
+        Rebuild the flight list from a live LAN source, between fetches.
+
+        No network is involved - the source already holds its tracks - so
+        the display calls this every LOCAL_REFRESH_INTERVAL and a
+        receiver's positions reach the screen in seconds rather than at
+        the next FLIGHT_POLL_INTERVAL fetch.
+
+        Returns:
+            True if a live source answered (the list is then new data)
+        """
+        if self._processing:
+            return False
+        for source in self.local_sources():
+            if source.live:
+                break
+        else:
+            return False
+
+        flights = self.in_watch_zones(source.flights(self.fetch_zone))
+        self._data = [flight_record(f) for f in flights[:MAX_FLIGHT_LOOKUP]]
+        self._new_data = True
+        self._last_fetch = time.time()
+        self._failures = 0
+        self._stale = False
+        return True
+
+    def in_watch_zones(self, flights):
+        """
+        Flights inside any watch zone, sorted by distance to the home of the
+        nearest zone they are in.
+
+        The zone index keeps each aircraft's cell between fetches, so one
+        that hasn't left an interior cell costs no zone tests at all. Only
+        aircraft inside a geofence's bounding box meet its polygon test.
+        """
+        seen = {}
+        ranked = []
+        for flight in flights:
+            lat = flight.get("lat")
+            lon = flight.get("lon")
+            if lat is None or lon is None:
+                continue
+            key = flight.get("id") or flight.get("icao")
+            seen[key] = True
+            zones = self.zones.move(key, lat, lon)
+            if zones and self._allowed_zones is not None:
+                zones = [z for z in zones if z in self._allowed_zones]
+            if zones and self._fences:
+                fences = self._fences
+                zones = [z for z in zones if z not in fences or fences[z].contains(lat, lon)]
+            if zones:
+                distance = min(distance_from_flight_to_home(flight, self._homes[z]) for z in zones)
+                ranked.append((distance, flight))
+        self.zones.retain(seen)
+        ranked.sort(key=lambda pair: pair[0])
+        return [flight for _, flight in ranked]
+
+    def local_sources(self):
+        """Configured LAN sources in priority order"""
+        sources = (self.beast, self.sbs, self.receiver, self.relay)
+        return [source for source in sources if source is not None]
+
+    def poll_local(self):
+        """Keep the LAN sources current (cheap when nothing has changed)"""
+        for source in self.local_sources():
+            source.poll()
+
+    def share(self, shown, forecast, weather_time):
+        """
+        Keep the panels of a multi-panel wall in step (call every frame).
+
+        The leader publishes the flights it is showing and its forecast; a
+        follower takes the leader's flights as if it had fetched them.
+
+        Args:
+            shown: Flights on this panel now
+            forecast, weather_time: This panel's forecast table (leader only)
+
+        Returns:
+            True if a follower received a new flight set
+        """
+        link = self.multicast
+        if link.leader:
+            link.publish(shown, self._last_fetch, forecast, weather_time)
+            return False
+        if not link.poll():
+            return False
+        self._data = link.flights
+        self._new_data = True
+        self._last_fetch = link.fetched_at
+        self._failures = 0
+        self._stale = False
+        return True
+
+    @property
+    def following(self):
+        """True while a lead panel supplies flights and weather - make no fetches"""
+        return self.multicast is not None and self.multicast.following
+
+    def pushed_forecast(self):
+        """
+        Newest forecast pushed by the LAN relay or the lead panel.
+
+        Returns:
+            (forecast, fetch time), or (None, 0) if nothing was pushed
+        """
+        best = (None, 0)
+        for source in (self.relay, self.multicast):
+            if source is not None and source.forecast_time > best[1]:
+                best = (source.forecast, source.forecast_time)
+        return best
+
+    def restore(self, flights, last_fetch, failures):
+        """Show flights from a warm-start snapshot until the first fetch"""
+        self._data = [restored_record(f) for f in flights]
+        self._last_fetch = last_fetch
+        self._failures = failures
+        self._stale = True
+
     @property
     def new_data(self):
         return self._new_data
@@ -365,6 +1589,23 @@ class Overhead:
         self._new_data = False
         return self._data
 
+    @property
+    def flights(self):
+        """Current flights without marking them as read"""
+        return self._data
+
+    @property
+    def last_fetch(self):
+        return self._last_fetch
+
+    @property
+    def failures(self):
+        return self._failures
+
+    @property
+    def stale(self):
+        return self._stale
+
     @property
     def data_is_empty(self):
         return len(self._data) == 0
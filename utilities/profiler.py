@@ -0,0 +1,173 @@
+# Frame-time profiler for Interstate 75 W
+# Records per-keyframe and whole-frame timings in fixed-bucket histograms
+#
+# All storage is preallocated when the profiler is created, so recording a
+# sample never allocates. This keeps it cheap enough to leave enabled.
+
+import sys
+from array import array
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    # CPython host (benchmarks/emulator)
+    import time
+
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+try:
+    import select
+except ImportError:
+    select = None
+
+# Histogram bucket upper edges in microseconds (last bucket is overflow)
+BUCKET_EDGES_US = (
+    100, 250, 500, 1000, 2000, 4000, 8000,
+    16000, 32000, 64000, 128000, 256000, 1000000,
+)
+NUM_BUCKETS = len(BUCKET_EDGES_US) + 1
+
+# Serial commands
+CMD_REPORT = "p"
+CMD_RESET = "r"
+
+# How often (in frames) to check the serial port for a command
+SERIAL_POLL_FRAMES = 10
+
+
+class FrameProfiler:
+    """
+    Fixed-bucket histograms of keyframe and frame execution time.
+
+    Slot 0 .. n-1 hold the keyframes (in Animator registration order),
+    slot n holds the whole frame: every Animator.step(), including the
+    scheduling and the frames where no keyframe was due.
+    """
+
+    def __init__(self, names, budget_us):
+        self.names = tuple(names)
+        self.budget_us = int(budget_us)
+        slots = len(self.names) + 1
+        self._frame_slot = slots - 1
+
+        self._hist = array("L", [0] * (slots * NUM_BUCKETS))
+        self._calls = array("L", [0] * slots)
+        self._max_us = array("L", [0] * slots)
+        # Totals are split into seconds + remainder so they stay small ints
+        self._total_s = array("L", [0] * slots)
+        self._total_us = array("L", [0] * slots)
+        self.overruns = 0
+        self.worst_overrun_us = 0
+
+        self._poll = None
+        self._poll_countdown = SERIAL_POLL_FRAMES
+        if select is not None:
+            try:
+                self._poll = select.poll()
+                self._poll.register(sys.stdin, select.POLLIN)
+            except Exception:
+                self._poll = None
+
+    def record(self, slot, elapsed_us):
+        """Add one sample for a slot"""
+        edges = BUCKET_EDGES_US
+        bucket = 0
+        while bucket < len(edges) and elapsed_us > edges[bucket]:
+            bucket += 1
+        self._hist[slot * NUM_BUCKETS + bucket] += 1
+
+        self._calls[slot] += 1
+        if elapsed_us > self._max_us[slot]:
+            self._max_us[slot] = elapsed_us
+        total = self._total_us[slot] + elapsed_us
+        while total >= 1000000:
+            total -= 1000000
+            self._total_s[slot] += 1
+        self._total_us[slot] = total
+
+    def record_frame(self, elapsed_us):
+        """Add one whole-frame sample and track budget overruns"""
+        self.record(self._frame_slot, elapsed_us)
+        if elapsed_us > self.budget_us:
+            self.overruns += 1
+            over = elapsed_us - self.budget_us
+            if over > self.worst_overrun_us:
+                self.worst_overrun_us = over
+
+    def reset(self):
+        """Clear all samples"""
+        for buf in (self._hist, self._calls, self._max_us, self._total_s, self._total_us):
+            for i in range(len(buf)):
+                buf[i] = 0
+        self.overruns = 0
+        self.worst_overrun_us = 0
+
+    def _percentile_edge(self, slot, fraction):
+        """Upper bucket edge below which `fraction` of samples fall"""
+        calls = self._calls[slot]
+        if not calls:
+            return 0
+        target = calls * fraction
+        seen = 0
+        base = slot * NUM_BUCKETS
+        for bucket in range(NUM_BUCKETS):
+            seen += self._hist[base + bucket]
+            if seen >= target:
+                if bucket < len(BUCKET_EDGES_US):
+                    return BUCKET_EDGES_US[bucket]
+                break
+        return self._max_us[slot]
+
+    def _row(self, name, slot):
+        calls = self._calls[slot]
+        total_us = self._total_s[slot] * 1000000 + self._total_us[slot]
+        mean = total_us // calls if calls else 0
+        return (
+            f"{name[:20]:<20} {calls:>8} {total_us // 1000:>9} {mean:>8} "
+            f"{self._percentile_edge(slot, 0.5):>8} "
+            f"{self._percentile_edge(slot, 0.9):>8} "
+            f"{self._percentile_edge(slot, 0.99):>8} "
+            f"{self._max_us[slot]:>8}"
+        )
+
+    def report(self):
+        """Print a timing table over serial"""
+        print("=" * 86)
+        print(
+            f"{'keyframe':<20} {'calls':>8} {'total_ms':>9} {'mean_us':>8} "
+            f"{'p50<us':>8} {'p90<us':>8} {'p99<us':>8} {'max_us':>8}"
+        )
+        print("-" * 86)
+        for slot, name in enumerate(self.names):
+            if self._calls[slot]:
+                print(self._row(name, slot))
+        print("-" * 86)
+        print(self._row("(frame, every step)", self._frame_slot))
+        frames = self._calls[self._frame_slot]
+        pct = (100 * self.overruns // frames) if frames else 0
+        print(
+            f"Budget {self.budget_us}us: {self.overruns} overruns ({pct}%), "
+            f"worst +{self.worst_overrun_us}us"
+        )
+        print("=" * 86)
+
+    def poll_serial(self):
+        """Check for a serial command ('p' = report, 'r' = reset) without blocking"""
+        self._poll_countdown -= 1
+        if self._poll_countdown > 0 or self._poll is None:
+            return
+        self._poll_countdown = SERIAL_POLL_FRAMES
+
+        while self._poll.poll(0):
+            ch = sys.stdin.read(1)
+            if not ch:
+                break
+            if ch == CMD_REPORT:
+                self.report()
+            elif ch == CMD_RESET:
+                self.reset()
+                print("Profiler: reset")
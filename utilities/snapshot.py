@@ -0,0 +1,320 @@
+# Warm-start snapshot for Interstate 75 W
+# Persists the last flights, weather and source health to flash so the
+# panel has something to show straight after a power blip.
+#
+# Binary layout (little endian):
+#     header   "FTS" version(B) saved_at(I) flights(B) has_forecast(B)
+#              last_fetch(I) failures(H)
+#     flight   altitude(i) vertical_speed(i) velocity(H) heading(H)
+#              then 8 strings, each length(B) + utf-8 bytes: plane origin
+#              destination callsign flight_number airline squawk country
+#     forecast fetched_at(I) first_hour(I) hours(B) days(B)
+#              per hour: temperature(f) wind_speed(f) wind_direction(H)
+#                        weather_code(B) humidity(B) rain_probability(B)
+#              per day:  time(I) temp_high(f) temp_low(f)
+#              (NaN = missing)
+#
+# Writes go to a temp file that is renamed over the snapshot, so a reset
+# mid-write leaves the previous snapshot intact. They are skipped when
+# nothing changed and throttled to one per SNAPSHOT_INTERVAL to limit
+# flash wear.
+#
+# Flights are only restored within SNAPSHOT_MAX_AGE of saved_at, and the
+# forecast while its hours still cover the present. The board has no RTC
+# battery, so after a power-off the clock reads behind saved_at until NTP
+# sets it; the age is then judged again (see expire).
+
+import os
+import struct
+import time
+
+try:
+    from config import SNAPSHOT_INTERVAL
+except ImportError:
+    SNAPSHOT_INTERVAL = 300  # seconds between flash writes
+
+try:
+    from config import SNAPSHOT_MAX_AGE
+except ImportError:
+    SNAPSHOT_MAX_AGE = 900  # seconds a snapshot's flights are worth showing
+
+SNAPSHOT_FILE = "snapshot.bin"
+SNAPSHOT_TEMP = "snapshot.tmp"
+
+MAGIC = b"FTS"
+VERSION = 4
+
+_HEADER = "<3sBIBBIH"
+_FLIGHT = "<iiHH"
+_FORECAST = "<IIBB"
+_HOUR = "<ffHBBB"
+_DAY = "<Iff"
+_FLIGHT_STRINGS = ("plane", "origin", "destination", "callsign", "flight_number", "airline", "squawk", "country")
+
+_NAN = float("nan")
+
+
+def _float(value):
+    return _NAN if value is None else float(value)
+
+
+def _int(value):
+    return int(value or 0)
+
+
+def _optional(value):
+    # NaN is the only value not equal to itself; round away float32 noise
+    return None if value != value else round(value, 1)
+
+
+def pack_flight(flight):
+    """One flight dict (as built by Overhead.grab_data) in snapshot layout"""
+    parts = [struct.pack(
+        _FLIGHT,
+        _int(flight.get("altitude")),
+        _int(flight.get("vertical_speed")),
+        _int(flight.get("velocity")) & 0xFFFF,
+        _int(flight.get("heading")) & 0xFFFF,
+    )]
+    for key in _FLIGHT_STRINGS:
+        text = (flight.get(key) or "").encode()[:255]
+        parts.append(bytes((len(text),)))
+        parts.append(text)
+    return b"".join(parts)
+
+
+def unpack_flight(buf, pos):
+    """
+    Read one flight packed by pack_flight.
+
+    Returns:
+        (flight dict, position after it)
+    """
+    altitude, vertical_speed, velocity, heading = struct.unpack_from(_FLIGHT, buf, pos)
+    pos += struct.calcsize(_FLIGHT)
+    flight = {
+        "altitude": altitude,
+        "vertical_speed": vertical_speed,
+        "velocity": velocity,
+        "heading": heading,
+    }
+    for key in _FLIGHT_STRINGS:
+        length = buf[pos]
+        flight[key] = bytes(buf[pos + 1:pos + 1 + length]).decode()
+        pos += 1 + length
+    return flight, pos
+
+
+def pack_forecast(forecast, weather_time):
+    """Forecast table from fetch_forecast in snapshot layout"""
+    hours = min(len(forecast["temperature"]), 255)
+    days = min(len(forecast["daily_time"]), 255)
+    parts = [struct.pack(_FORECAST, int(weather_time), int(forecast["time"]), hours, days)]
+    for i in range(hours):
+        parts.append(struct.pack(
+            _HOUR,
+            _float(forecast["temperature"][i]),
+            _float(forecast["wind_speed"][i]),
+            _int(forecast["wind_direction"][i]),
+            _int(forecast["weather_code"][i]),
+            _int(forecast["humidity"][i]),
+            _int(forecast["rain_probability"][i]),
+        ))
+    for i in range(days):
+        parts.append(struct.pack(
+            _DAY,
+            int(forecast["daily_time"][i]),
+            _float(forecast["temp_high"][i]),
+            _float(forecast["temp_low"][i]),
+        ))
+    return b"".join(parts)
+
+
+def unpack_forecast(buf, pos):
+    """
+    Read a forecast packed by pack_forecast.
+
+    Returns:
+        (forecast or None if it has no hours or days, fetch time, position after it)
+    """
+    weather_time, first_hour, hours, days = struct.unpack_from(_FORECAST, buf, pos)
+    pos += struct.calcsize(_FORECAST)
+    forecast = {
+        "time": first_hour,
+        "temperature": [], "wind_speed": [], "wind_direction": [],
+        "weather_code": [], "humidity": [], "rain_probability": [],
+        "daily_time": [], "temp_high": [], "temp_low": [],
+    }
+    hour_size = struct.calcsize(_HOUR)
+    for _ in range(hours):
+        temperature, wind_speed, wind_direction, weather_code, humidity, rain = \
+            struct.unpack_from(_HOUR, buf, pos)
+        pos += hour_size
+        forecast["temperature"].append(_optional(temperature))
+        forecast["wind_speed"].append(_optional(wind_speed))
+        forecast["wind_direction"].append(wind_direction)
+        forecast["weather_code"].append(weather_code)
+        forecast["humidity"].append(humidity)
+        forecast["rain_probability"].append(rain)
+    day_size = struct.calcsize(_DAY)
+    for _ in range(days):
+        day_time, temp_high, temp_low = struct.unpack_from(_DAY, buf, pos)
+        pos += day_size
+        forecast["daily_time"].append(day_time)
+        forecast["temp_high"].append(_optional(temp_high))
+        forecast["temp_low"].append(_optional(temp_low))
+    if not hours or not days:
+        forecast = None
+    return forecast, weather_time, pos
+
+
+def encode(flights, forecast, weather_time, last_fetch, failures):
+    """
+    Pack flights, the weather forecast and source health into snapshot bytes.
+
+    Args:
+        flights: List of flight dicts as built by Overhead.grab_data
+        forecast: Forecast table from fetch_forecast, or None
+        weather_time: Epoch seconds the forecast was fetched
+        last_fetch: Epoch seconds of the last successful flight fetch
+        failures: Consecutive failed flight fetches
+
+    Returns:
+        bytes
+    """
+    parts = [struct.pack(
+        _HEADER, MAGIC, VERSION, int(time.time()), len(flights),
+        1 if forecast else 0, int(last_fetch), min(failures, 0xFFFF),
+    )]
+    for flight in flights:
+        parts.append(pack_flight(flight))
+    if forecast:
+        parts.append(pack_forecast(forecast, weather_time))
+    return b"".join(parts)
+
+
+def decode(buf):
+    """
+    Unpack snapshot bytes.
+
+    Returns:
+        dict with saved_at, flights, forecast, weather_time, last_fetch and
+        failures, or None if the data is not a valid snapshot
+    """
+    try:
+        magic, version, saved_at, count, has_forecast, last_fetch, failures = \
+            struct.unpack_from(_HEADER, buf, 0)
+        if magic != MAGIC or version != VERSION:
+            return None
+        pos = struct.calcsize(_HEADER)
+
+        flights = []
+        for _ in range(count):
+            flight, pos = unpack_flight(buf, pos)
+            flights.append(flight)
+
+        forecast = None
+        weather_time = 0
+        if has_forecast:
+            forecast, weather_time, pos = unpack_forecast(buf, pos)
+    except Exception:
+        return None
+
+    return {
+        "saved_at": saved_at,
+        "flights": flights,
+        "forecast": forecast,
+        "weather_time": weather_time,
+        "last_fetch": last_fetch,
+        "failures": failures,
+    }
+
+
+def expire(snapshot, now):
+    """
+    Drop what a decoded snapshot has outlived, going by its saved_at.
+
+    Flights older than SNAPSHOT_MAX_AGE are dropped, and the forecast once
+    its last hour has passed.
+
+    Args:
+        snapshot: decode() output, changed in place
+        now: Epoch seconds
+
+    Returns:
+        bool: False if the clock is behind saved_at (not set since
+        power-up), when the age can't be told yet
+    """
+    age = now - snapshot["saved_at"]
+    if age < 0:
+        return False
+    if age > SNAPSHOT_MAX_AGE:
+        snapshot["flights"] = []
+    forecast = snapshot["forecast"]
+    if forecast is not None and now >= forecast["time"] + 3600 * len(forecast["temperature"]):
+        snapshot["forecast"] = None
+    return True
+
+
+class Snapshot:
+    """
+    Throttled, atomic snapshot writer/reader.
+
+    save() keeps the last bytes written so unchanged state never touches
+    flash; changed state is written at most once per interval.
+    """
+
+    def __init__(self, path=SNAPSHOT_FILE, temp_path=SNAPSHOT_TEMP, interval=SNAPSHOT_INTERVAL):
+        self.path = path
+        self.temp_path = temp_path
+        self.interval = interval
+        self._last_bytes = None
+        self._last_write = None
+        self.writes = 0
+
+    def load(self):
+        """Read the snapshot from flash, returns decode() output or None"""
+        try:
+            with open(self.path, "rb") as f:
+                buf = f.read()
+        except OSError:
+            return None
+        snapshot = decode(buf)
+        if snapshot is not None:
+            self._last_bytes = buf
+        return snapshot
+
+    def save(self, flights, forecast, weather_time, last_fetch, failures, force=False):
+        """
+        Write the snapshot if it changed and the interval has passed.
+
+        Returns:
+            bool: True if flash was written
+        """
+        buf = encode(flights, forecast, weather_time, last_fetch, failures)
+        # Bytes 4-8 are saved_at - ignore them when looking for changes
+        if self._last_bytes is not None and buf[8:] == self._last_bytes[8:]:
+            return False
+
+        now = time.time()
+        if not force and self._last_write is not None and now - self._last_write < self.interval:
+            return False
+
+        try:
+            with open(self.temp_path, "wb") as f:
+                f.write(buf)
+            try:
+                os.rename(self.temp_path, self.path)
+            except OSError:
+                # FAT won't rename over an existing file
+                os.remove(self.path)
+                os.rename(self.temp_path, self.path)
+        except OSError as e:
+            print(f"Snapshot: write failed: {e}")
+            return False
+
+        self._last_bytes = buf
+        self._last_write = now
+        self.writes += 1
+        print(f"Snapshot: saved {len(flights)} flights, {len(buf)} bytes")
+        return True
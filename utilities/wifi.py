@@ -1,8 +1,8 @@
 # WiFi connection utilities for Interstate 75 W
 import time
+import json
 import network
-
-from utilities.audio import get_player
+import ntptime
 
 # Try to import credentials (primary and fallback)
 try:
@@ -17,75 +17,29 @@ except ImportError:
     WIFI_SSID_FALLBACK = ""
     WIFI_PASSWORD_FALLBACK = ""
 
+# Last successful network, tried first when rejoining (no passwords stored)
+WIFI_CACHE_FILE = "wifi_cache.json"
 
-def _try_connect(wlan, ssid, password, max_wait):
-    """Attempt to connect to a single network. Returns True on success."""
-    print(f"Connecting to {ssid}...")
-    wlan.connect(ssid, password)
-
-    while max_wait > 0:
-        status = wlan.status()
-        if status < 0 or status >= 3:
-            break
-        max_wait -= 1
-        print(f"Waiting for connection... ({max_wait}s)")
-        time.sleep(1)
-
-    return wlan.status() == 3
-
+# Supervisor timing (milliseconds)
+LINK_CHECK_MS = 250         # how often poll() actually queries the radio
+JOIN_TIMEOUT_MS = 10000     # give up on a join attempt after this long
+BACKOFF_MIN_MS = 1000       # first retry delay after a failed attempt
+BACKOFF_MAX_MS = 60000      # retry delay cap
 
-def connect_wifi(ssid=None, password=None, max_wait=10):
-    """
-    Connect to WiFi network with fallback support.
-
-    Args:
-        ssid: WiFi network name (uses secrets.py if not provided)
-        password: WiFi password (uses secrets.py if not provided)
-        max_wait: Maximum seconds to wait for connection
+# CYW43 link status codes
+STAT_GOT_IP = 3
 
-    Returns:
-        bool: True if connected, False otherwise
-    """
-    if ssid is None:
-        ssid = WIFI_SSID
-    if password is None:
-        password = WIFI_PASSWORD
 
-    if not ssid:
-        print("WiFi SSID not configured in secrets.py")
-        return False
-
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(True)
-
-    # Turn off power saving for better reliability
-    wlan.config(pm=0xa11140)
-
-    # Try primary network
-    if _try_connect(wlan, ssid, password, max_wait):
-        print(f"Connected! IP: {wlan.ifconfig()[0]}")
-    elif WIFI_SSID_FALLBACK:
-        # Try fallback network
-        print(f"Primary network failed, trying fallback...")
-        wlan.disconnect()
-        time.sleep(1)
-        if _try_connect(wlan, WIFI_SSID_FALLBACK, WIFI_PASSWORD_FALLBACK, max_wait):
-            print(f"Connected to fallback! IP: {wlan.ifconfig()[0]}")
-        else:
-            print(f"Failed to connect to fallback (status: {wlan.status()})")
-            return False
-    else:
-        print(f"Failed to connect to WiFi (status: {wlan.status()})")
-        return False
-
-    # Play bing-bong on successful connection
+def sync_time():
+    """Sync RTC with NTP server"""
+    print("Syncing time with NTP...")
     try:
-        player = get_player()
-        player.play_bing_bong()
+        ntptime.settime()
+        print("Time synced successfully")
+        return True
     except Exception as e:
-        print(f"Audio notification failed: {e}")
-
-    return True
+        print(f"Failed to sync time: {e}")
+        return False
 
 
 def is_connected():
@@ -107,3 +61,253 @@ def disconnect():
     wlan = network.WLAN(network.STA_IF)
     wlan.disconnect()
     wlan.active(False)
+
+
+def _load_cache():
+    """Load the last successful network from persistent storage"""
+    try:
+        with open(WIFI_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except:
+        return {}
+
+
+def _save_cache(cache):
+    """Save the last successful network to persistent storage"""
+    try:
+        with open(WIFI_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except Exception as e:
+        print(f"WiFi: failed to save cache: {e}")
+
+
+def _password_for(ssid):
+    """Look up the configured password for an SSID"""
+    if ssid == WIFI_SSID:
+        return WIFI_PASSWORD
+    if ssid == WIFI_SSID_FALLBACK:
+        return WIFI_PASSWORD_FALLBACK
+    return None
+
+
+class WifiSupervisor:
+    """
+    Keeps the WiFi link up without blocking the display loop.
+
+    Call poll() every frame. It checks the link at most every LINK_CHECK_MS,
+    and when the link drops it rejoins in the background: each attempt is
+    started with a non-blocking connect() and checked on later polls, with
+    exponential backoff between failures. The last network that worked
+    (SSID, BSSID and channel) is tried first for a fast rejoin; if that
+    pinned attempt fails the AP may have been replaced or moved, so the
+    cached BSSID and channel are dropped and the same SSID is tried again
+    unpinned before moving on to the next network.
+    """
+
+    def __init__(self, on_connect=None):
+        self.wlan = network.WLAN(network.STA_IF)
+        self._cache = _load_cache()
+
+        # Called (from poll) each time the link comes up
+        self.on_connect = on_connect
+
+        self._up = False
+        self._joining = False
+        self._join_started = 0
+        self._join_ssid = None
+        self._join_pinned = False
+        self._next_attempt = 0
+        self._backoff_ms = BACKOFF_MIN_MS
+        self._candidate = 0
+        self._last_check = 0
+        self._down_since = None
+
+        # Counters
+        self.disconnects = 0
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.downtime_ms = 0
+        self.last_reconnect_ms = 0
+
+    def _candidates(self):
+        """Networks to try as (ssid, bssid, channel), cached last-good network first"""
+        networks = []
+        cached = self._cache.get("ssid")
+        if cached and _password_for(cached) is not None:
+            networks.append((cached, self._cache.get("bssid"), self._cache.get("channel")))
+        for ssid in (WIFI_SSID, WIFI_SSID_FALLBACK):
+            if ssid and ssid != cached:
+                networks.append((ssid, None, None))
+        return networks
+
+    def _connect_pinned(self, ssid, password, bssid, channel):
+        """Join a known AP directly, as far as this port's connect() allows"""
+        try:
+            bssid = bytes.fromhex(bssid)
+        except (TypeError, ValueError):
+            self.wlan.connect(ssid, password)
+            return
+        if channel is not None:
+            try:
+                self.wlan.connect(ssid, password, bssid=bssid, channel=channel)
+                return
+            except TypeError:
+                pass  # no channel argument on this port
+        try:
+            self.wlan.connect(ssid, password, bssid=bssid)
+        except TypeError:
+            self.wlan.connect(ssid, password)
+
+    def _forget_ap(self):
+        """Drop the cached BSSID/channel, keeping the SSID first in line"""
+        cache = {"ssid": self._cache.get("ssid")}
+        if cache != self._cache:
+            self._cache = cache
+            _save_cache(cache)
+
+    def _begin_join(self, now):
+        """Start a non-blocking join to the next candidate network"""
+        candidates = self._candidates()
+        if not candidates:
+            print("WiFi SSID not configured in secrets.py")
+            self._next_attempt = time.ticks_add(now, BACKOFF_MAX_MS)
+            return
+
+        ssid, bssid, channel = candidates[self._candidate % len(candidates)]
+        password = _password_for(ssid)
+        pinned = " (cached AP)" if bssid else ""
+        print(f"WiFi: joining {ssid}{pinned}...")
+        try:
+            if bssid:
+                self._connect_pinned(ssid, password, bssid, channel)
+            else:
+                self.wlan.connect(ssid, password)
+        except OSError as e:
+            print(f"WiFi: connect failed: {e}")
+
+        self._joining = True
+        self._join_ssid = ssid
+        self._join_pinned = bool(bssid)
+        self._join_started = now
+
+    def _join_failed(self, now, status):
+        """Back off before the next attempt, trying the next network"""
+        self.failed_attempts += 1
+        self._joining = False
+        if self._join_pinned:
+            # The AP may have been replaced or moved: the same network is
+            # tried next without the stale BSSID/channel
+            self._forget_ap()
+        else:
+            self._candidate += 1
+        try:
+            self.wlan.disconnect()
+        except OSError:
+            pass
+        print(f"WiFi: join to {self._join_ssid} failed (status: {status}), retry in {self._backoff_ms}ms")
+        self._next_attempt = time.ticks_add(now, self._backoff_ms)
+        self._backoff_ms = min(self._backoff_ms * 2, BACKOFF_MAX_MS)
+
+    def _joined(self, now):
+        """Record a successful join"""
+        self._up = True
+        self._joining = False
+        self._candidate = 0
+        self._backoff_ms = BACKOFF_MIN_MS
+
+        if self._down_since is not None:
+            outage = time.ticks_diff(now, self._down_since)
+            self.downtime_ms += outage
+            self.last_reconnect_ms = outage
+            self.reconnects += 1
+            self._down_since = None
+            print(
+                f"WiFi: reconnected to {self._join_ssid} after {outage}ms "
+                f"(reconnects: {self.reconnects}, total downtime: {self.downtime_ms}ms)"
+            )
+        else:
+            print(f"WiFi: connected to {self._join_ssid}, IP: {self.wlan.ifconfig()[0]}")
+
+        self._remember(self._join_ssid)
+
+        if self.on_connect is not None:
+            self.on_connect()
+
+    def _remember(self, ssid):
+        """Cache SSID/BSSID/channel of the current network if it changed"""
+        cache = {"ssid": ssid}
+        for key in ("bssid", "channel"):
+            try:
+                value = self.wlan.config(key)
+            except (ValueError, OSError, TypeError):
+                continue
+            if isinstance(value, (bytes, bytearray)):
+                value = value.hex()
+            if value is not None:
+                cache[key] = value
+        if cache != self._cache:
+            self._cache = cache
+            _save_cache(cache)
+
+    def start(self):
+        """Activate the radio and begin joining (returns immediately)"""
+        self.wlan.active(True)
+        # Turn off power saving for better reliability
+        try:
+            self.wlan.config(pm=0xa11140)
+        except (ValueError, OSError):
+            pass
+
+        now = time.ticks_ms()
+        self._last_check = now
+        if self.wlan.isconnected():
+            # Already joined (e.g. kept across a soft reset)
+            self._join_ssid = self.wlan.config("ssid")
+            self._joined(now)
+        else:
+            self._begin_join(now)
+
+    def poll(self):
+        """Cheap per-frame check; drives reconnects. Returns True if the link is up."""
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self._last_check) < LINK_CHECK_MS:
+            return self._up
+        self._last_check = now
+
+        if self._up:
+            if not self.wlan.isconnected():
+                self._up = False
+                self.disconnects += 1
+                self._down_since = now
+                self._next_attempt = now
+                print("WiFi: link lost, fetches suspended")
+            return self._up
+
+        if self._joining:
+            status = self.wlan.status()
+            if status == STAT_GOT_IP:
+                self._joined(now)
+            elif status < 0 or time.ticks_diff(now, self._join_started) > JOIN_TIMEOUT_MS:
+                self._join_failed(now, status)
+        elif time.ticks_diff(now, self._next_attempt) >= 0:
+            self._begin_join(now)
+
+        return self._up
+
+    @property
+    def connected(self):
+        return self._up
+
+    def stats(self):
+        """Downtime and reconnect counters"""
+        downtime = self.downtime_ms
+        if self._down_since is not None:
+            downtime += time.ticks_diff(time.ticks_ms(), self._down_since)
+        return {
+            "connected": self._up,
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "downtime_ms": downtime,
+            "last_reconnect_ms": self.last_reconnect_ms,
+        }
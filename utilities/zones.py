@@ -0,0 +1,179 @@
+# Uniform lat/lon grid index over many watch zones
+# Maps an aircraft position to the zones containing it by looking up one
+# grid cell, instead of testing the position against every zone.
+#
+# Each zone (tl_y/tl_x/br_y/br_x box) is registered in every cell it
+# overlaps. A cell the zone covers completely is marked interior, so a
+# position there needs no comparison at all; only cells on a zone's edge
+# fall back to the box test. Tracked aircraft remember their cell and
+# zones, so move() costs one division per axis and, while the aircraft
+# stays inside an interior-only cell, nothing else.
+#
+# Used by Overhead for the device's WATCH_ZONES and by the relay for its
+# subscribers' zones.
+
+ZONE_CELL_DEG = 0.25        # grid cell size (degrees of latitude and longitude)
+_ROW = 100000               # cell key = row * _ROW + column (columns < 360 / cell)
+
+
+def union_zone(zones):
+    """Bounding box covering every zone"""
+    return {
+        "tl_y": max(z["tl_y"] for z in zones),
+        "tl_x": min(z["tl_x"] for z in zones),
+        "br_y": min(z["br_y"] for z in zones),
+        "br_x": max(z["br_x"] for z in zones),
+    }
+
+
+def zone_contains(zone, lat, lon):
+    """Box test, inclusive of the edges as in_zone()"""
+    return zone["br_y"] <= lat <= zone["tl_y"] and zone["tl_x"] <= lon <= zone["br_x"]
+
+
+class ZoneIndex:
+    """
+    Zones bucketed into grid cells, plus the aircraft tracked against them.
+
+    Zone ids and track keys are any hashable values (names, flight ids,
+    subscriber objects).
+    """
+
+    def __init__(self, zones=None, cell=ZONE_CELL_DEG):
+        self.cell = cell
+        self.zones = {}         # zone id -> zone
+        self._cells = {}        # cell key -> (interior zone ids, ((zone id, zone), ...) on an edge)
+        self._tracks = {}       # track key -> [cell key, zone ids, lat, lon]
+        self._members = {}      # zone id -> set of track keys
+        if zones:
+            for zone_id, zone in zones.items():
+                self.add_zone(zone_id, zone)
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def _row(self, lat):
+        return int((lat + 90) / self.cell)
+
+    def _col(self, lon):
+        return int((lon + 180) / self.cell)
+
+    def _key(self, lat, lon):
+        return int((lat + 90) / self.cell) * _ROW + int((lon + 180) / self.cell)
+
+    def _span(self, zone):
+        """Cells the zone overlaps, with whether it covers each completely"""
+        cell = self.cell
+        for row in range(self._row(zone["br_y"]), self._row(zone["tl_y"]) + 1):
+            south = row * cell - 90
+            rows_inside = south > zone["br_y"] and south + cell < zone["tl_y"]
+            for col in range(self._col(zone["tl_x"]), self._col(zone["br_x"]) + 1):
+                west = col * cell - 180
+                yield row * _ROW + col, rows_inside and west > zone["tl_x"] and west + cell < zone["br_x"]
+
+    def add_zone(self, zone_id, zone):
+        """Register a zone (replacing one with the same id) and place tracked aircraft in it"""
+        if zone_id in self.zones:
+            self.remove_zone(zone_id)
+        self.zones[zone_id] = zone
+        for key, interior in self._span(zone):
+            inner, edge = self._cells.get(key, ((), ()))
+            if interior:
+                inner = inner + (zone_id,)
+            else:
+                edge = edge + ((zone_id, zone),)
+            self._cells[key] = (inner, edge)
+
+        members = set()
+        for track_key, track in self._tracks.items():
+            if zone_contains(zone, track[2], track[3]):
+                track[1] = track[1] + (zone_id,)
+                members.add(track_key)
+        self._members[zone_id] = members
+
+    def remove_zone(self, zone_id):
+        """Forget a zone and drop it from every tracked aircraft"""
+        zone = self.zones.pop(zone_id, None)
+        if zone is None:
+            return
+        for key, _ in self._span(zone):
+            inner, edge = self._cells[key]
+            inner = tuple(z for z in inner if z != zone_id)
+            edge = tuple(e for e in edge if e[0] != zone_id)
+            if inner or edge:
+                self._cells[key] = (inner, edge)
+            else:
+                del self._cells[key]
+        for track_key in self._members.pop(zone_id):
+            track = self._tracks[track_key]
+            track[1] = tuple(z for z in track[1] if z != zone_id)
+
+    def zones_at(self, lat, lon):
+        """
+        Zones containing a position.
+
+        Returns:
+            Tuple of zone ids (empty outside every zone)
+        """
+        cell = self._cells.get(self._key(lat, lon))
+        if cell is None:
+            return ()
+        inner, edge = cell
+        if not edge:
+            return inner
+        return inner + tuple(zone_id for zone_id, zone in edge if zone_contains(zone, lat, lon))
+
+    def move(self, track_key, lat, lon):
+        """
+        Track an aircraft's new position, updating zone membership.
+
+        Returns:
+            Tuple of the zone ids it is now inside
+        """
+        key = self._key(lat, lon)
+        track = self._tracks.get(track_key)
+        if track is not None:
+            if track[0] == key and not self._cells.get(key, ((), ()))[1]:
+                track[2] = lat
+                track[3] = lon
+                return track[1]  # same cell and every zone there covers it
+            old = track[1]
+        else:
+            old = ()
+
+        zones = self.zones_at(lat, lon)
+        if zones != old:
+            for zone_id in old:
+                if zone_id not in zones:
+                    self._members[zone_id].discard(track_key)
+            for zone_id in zones:
+                self._members[zone_id].add(track_key)
+        if track is None:
+            self._tracks[track_key] = [key, zones, lat, lon]
+        else:
+            track[0] = key
+            track[1] = zones
+            track[2] = lat
+            track[3] = lon
+        return zones
+
+    def remove(self, track_key):
+        """Stop tracking an aircraft"""
+        track = self._tracks.pop(track_key, None)
+        if track is not None:
+            for zone_id in track[1]:
+                self._members[zone_id].discard(track_key)
+
+    def retain(self, track_keys):
+        """Stop tracking every aircraft not in track_keys (a set or dict)"""
+        for track_key in [k for k in self._tracks if k not in track_keys]:
+            self.remove(track_key)
+
+    def zones_of(self, track_key):
+        """Zones a tracked aircraft was last placed in"""
+        track = self._tracks.get(track_key)
+        return track[1] if track is not None else ()
+
+    def members(self, zone_id):
+        """Track keys currently inside a zone"""
+        return self._members.get(zone_id, ())